@@ -21,7 +21,7 @@
 import argparse
 import asyncio
 
-from telegram_periodic_msg_bot import PeriodicMsgBot, __version__
+from telegram_periodic_msg_bot import PeriodicMsgBot, ShardFront, __version__
 
 
 DEF_CONFIG_FILE = "conf/config.ini"
@@ -34,7 +34,7 @@ class ArgumentsParser:
     parser: argparse.ArgumentParser
 
     def __init__(self) -> None:
-        """Initialize the argument parser with configuration file option."""
+        """Initialize the argument parser with configuration file and shards options."""
         self.parser = argparse.ArgumentParser()
         self.parser.add_argument(
             "-c", "--config",
@@ -42,6 +42,12 @@ class ArgumentsParser:
             default=DEF_CONFIG_FILE,
             help="configuration file"
         )
+        self.parser.add_argument(
+            "-s", "--shards",
+            type=int,
+            default=0,
+            help="number of worker processes the chats are sharded across (0 to run in a single process)"
+        )
 
     def Parse(self) -> argparse.Namespace:
         """
@@ -77,8 +83,11 @@ async def main():
     args_parser = ArgumentsParser()
     args = args_parser.Parse()
 
-    bot = PeriodicMsgBot(args.config)
-    await bot.Run()
+    if args.shards > 0:
+        await ShardFront(args.config, args.shards).Run()
+    else:
+        bot = PeriodicMsgBot(args.config)
+        await bot.Run()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,508 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# Hot paths benchmark: operations per second and memory allocated per operation of the bot hot paths
+#
+# Usage (from the repository root):
+#   python benchmarks/hot_paths_benchmark.py [-t TASKS_NUM_LIST] [-o OUTPUT_FILE]
+#
+import argparse
+import asyncio
+import functools
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List
+
+import pyrogram
+from pyrogram.enums import ChatMemberStatus
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from telegram_periodic_msg_bot._version import __version__  # noqa: E402
+from telegram_periodic_msg_bot.bot.bot_config import BotConfig  # noqa: E402
+from telegram_periodic_msg_bot.bot.bot_config_types import BotConfigTypes  # noqa: E402
+from telegram_periodic_msg_bot.bot.bot_handlers_config import BotCommandsConfig  # noqa: E402
+from telegram_periodic_msg_bot.command.command_data import CommandData  # noqa: E402
+from telegram_periodic_msg_bot.command.command_dispatcher import CommandDispatcher, CommandTypes  # noqa: E402
+from telegram_periodic_msg_bot.command.command_router import CommandRouter  # noqa: E402
+from telegram_periodic_msg_bot.config.config_file_sections_loader import ConfigFileSectionsLoader  # noqa: E402
+from telegram_periodic_msg_bot.config.config_object import ConfigObject  # noqa: E402
+from telegram_periodic_msg_bot.fake.fake_client import FakeClient  # noqa: E402
+from telegram_periodic_msg_bot.fake.fake_client_behavior import FakeClientBehavior  # noqa: E402
+from telegram_periodic_msg_bot.logger.logger import Logger  # noqa: E402
+from telegram_periodic_msg_bot.message.message_deleter import MessageDeleter  # noqa: E402
+from telegram_periodic_msg_bot.message.message_rate_limiter import MessageRateLimiter  # noqa: E402
+from telegram_periodic_msg_bot.message.message_retry_handler import MessageRetryHandler  # noqa: E402
+from telegram_periodic_msg_bot.message.message_sender import MessageSender  # noqa: E402
+from telegram_periodic_msg_bot.message.message_splitter import MessageSplitter  # noqa: E402
+from telegram_periodic_msg_bot.misc.chat_admins_cache import ChatAdminsCache  # noqa: E402
+from telegram_periodic_msg_bot.misc.chat_members import ChatMembersList  # noqa: E402
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_scheduler import PeriodicMsgScheduler  # noqa: E402
+from telegram_periodic_msg_bot.translator.translation_loader import TranslationLoader  # noqa: E402
+from telegram_periodic_msg_bot.translator.translation_packs import TranslationPacks  # noqa: E402
+
+
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app", "conf", "config.ini")
+"""Configuration file used as a base."""
+
+TASKS_PER_CHAT = 100
+"""Number of tasks in each chat for the scheduler benchmarks."""
+
+BENCHMARK_USER_ID = 2
+"""ID of the user sending the commands, administrator of every chat."""
+
+# Run function of a benchmark, returning the number of executed operations
+BenchmarkRunType = Callable[[], Awaitable[int]]
+# Setup function of a benchmark, returning a new run function
+BenchmarkSetupType = Callable[[], Awaitable[BenchmarkRunType]]
+# Scheduler operation, returning the number of executed operations
+SchedulerOpType = Callable[[PeriodicMsgScheduler, List[pyrogram.types.Chat], int], int]
+
+
+class ArgumentsParser:
+    """Parser for command-line arguments."""
+
+    parser: argparse.ArgumentParser
+
+    def __init__(self) -> None:
+        """Initialize the argument parser."""
+        self.parser = argparse.ArgumentParser(description="Measure the operations per second and the memory allocated "
+                                                          "per operation of the bot hot paths")
+        self.parser.add_argument("-t", "--tasks", type=str, default="1000,10000,100000",
+                                 help="comma-separated numbers of tasks for the scheduler benchmarks")
+        self.parser.add_argument("-n", "--ops", type=int, default=10000,
+                                 help="number of operations for the other benchmarks")
+        self.parser.add_argument("-o", "--output", type=str, help="JSON file the results are written to")
+
+    def Parse(self) -> argparse.Namespace:
+        """
+        Parse command-line arguments.
+
+        Returns:
+            Parsed arguments namespace
+        """
+        return self.parser.parse_args()
+
+
+def create_client() -> FakeClient:
+    """
+    Create a fake client answering immediately, without rate limits and with the benchmark user as administrator.
+
+    Returns:
+        Fake client.
+    """
+    return FakeClient(FakeClientBehavior(chat_rate_per_min=0,
+                                         global_rate_per_sec=0,
+                                         admin_user_ids={BENCHMARK_USER_ID}))
+
+
+@functools.lru_cache(maxsize=None)
+def load_config() -> ConfigObject:
+    """
+    Load the configuration once, it's shared by all the benchmarks (that run one at a time).
+
+    Returns:
+        Configuration object.
+    """
+    return ConfigFileSectionsLoader.Load(CONFIG_FILE, BotConfig)
+
+
+class BenchmarkContext:
+    """Bot components created on the benchmark client."""
+
+    config: ConfigObject
+    logger: Logger
+    translator: TranslationPacks
+    client: FakeClient
+    message_sender: MessageSender
+    message_deleter: MessageDeleter
+
+    def __init__(self,
+                 tasks_num: int) -> None:
+        """
+        Initialize the components.
+
+        Args:
+            tasks_num: Maximum number of tasks.
+        """
+        self.config = load_config()
+        self.config.SetValue(BotConfigTypes.TASKS_MAX_NUM, tasks_num)
+        self.config.SetValue(BotConfigTypes.TASKS_DB_ENABLED, False)
+        self.config.SetValue(BotConfigTypes.HA_ENABLED, False)
+        self.config.SetValue(BotConfigTypes.LOG_LEVEL, "WARNING")
+        self.config.SetValue(BotConfigTypes.LOG_CONSOLE_ENABLED, False)
+        self.config.SetValue(BotConfigTypes.LOG_FILE_ENABLED, False)
+
+        self.logger = Logger(self.config)
+        self.translator = TranslationPacks(self.logger, None, None, 1)
+        self.client = create_client()
+        retry_handler = MessageRetryHandler(self.logger, 0, 1.0, 1.0, 0)
+        # Limits high enough to never throttle
+        self.message_sender = MessageSender(self.client,
+                                            self.logger,
+                                            MessageRateLimiter(1e9, 1000000000, 1e9, 1000000000),
+                                            retry_handler)
+        self.message_deleter = MessageDeleter(self.client, self.logger, retry_handler)
+
+
+def create_chats(chats_num: int) -> List[pyrogram.types.Chat]:
+    """
+    Create chats.
+
+    Args:
+        chats_num: Number of chats.
+
+    Returns:
+        Chats.
+    """
+    return [pyrogram.types.Chat(id=-1000000000000 - i, type=pyrogram.enums.ChatType.SUPERGROUP)
+            for i in range(chats_num)]
+
+
+def create_text(length: int) -> str:
+    """
+    Create a text made of paragraphs and lines, like a real message.
+
+    Args:
+        length: Text length.
+
+    Returns:
+        Text.
+    """
+    paragraph = ("Lorem ipsum dolor sit amet, consectetur adipiscing elit.\n" * 5) + "\n"
+    return (paragraph * (length // len(paragraph) + 1))[:length]
+
+
+def create_scheduler(ctx: BenchmarkContext) -> PeriodicMsgScheduler:
+    """
+    Create a scheduler.
+
+    Args:
+        ctx: Benchmark context.
+
+    Returns:
+        Scheduler.
+    """
+    scheduler = PeriodicMsgScheduler(ctx.config, ctx.logger, ctx.translator, ctx.message_sender, ctx.message_deleter)
+    scheduler.Open()
+    return scheduler
+
+
+def start_tasks(scheduler: PeriodicMsgScheduler,
+                chats: List[pyrogram.types.Chat],
+                tasks_num: int) -> None:
+    """
+    Start tasks, spread across chats.
+
+    Args:
+        scheduler: Scheduler.
+        chats: Chats.
+        tasks_num: Number of tasks.
+    """
+    message = pyrogram.types.Message(id=0, text="/msgbot_task_start\nPeriodic announcement")
+    for i in range(tasks_num):
+        scheduler.Start(chats[i % len(chats)], 0, 1 + i % 24, (i // 24) % 24, str(i), message)
+
+
+def scheduler_start(scheduler: PeriodicMsgScheduler,
+                    chats: List[pyrogram.types.Chat],
+                    tasks_num: int) -> int:
+    """Start all the tasks on an empty scheduler."""
+    start_tasks(scheduler, chats, tasks_num)
+    return tasks_num
+
+
+def scheduler_stop(scheduler: PeriodicMsgScheduler,
+                   chats: List[pyrogram.types.Chat],
+                   tasks_num: int) -> int:
+    """Stop all the tasks one by one."""
+    for i in range(tasks_num):
+        scheduler.Stop(chats[i % len(chats)], 0, str(i))
+    return tasks_num
+
+
+def scheduler_get_jobs_in_chat(scheduler: PeriodicMsgScheduler,
+                               chats: List[pyrogram.types.Chat],
+                               _tasks_num: int) -> int:
+    """Get the tasks of each chat."""
+    for chat in chats:
+        scheduler.GetJobsInChat(chat)
+    return len(chats)
+
+
+def scheduler_stop_all(scheduler: PeriodicMsgScheduler,
+                       chats: List[pyrogram.types.Chat],
+                       _tasks_num: int) -> int:
+    """Stop all the tasks of each chat."""
+    for chat in chats:
+        scheduler.StopAll(chat)
+    return len(chats)
+
+
+def scheduler_benchmarks(tasks_num: int) -> Dict[str, BenchmarkSetupType]:
+    """
+    Get the scheduler benchmarks.
+
+    Args:
+        tasks_num: Number of tasks.
+
+    Returns:
+        Setup functions by benchmark name.
+    """
+    chats = create_chats(max(1, tasks_num // TASKS_PER_CHAT))
+
+    def create_setup(op: SchedulerOpType,
+                     with_tasks: bool) -> BenchmarkSetupType:
+        async def setup() -> BenchmarkRunType:
+            scheduler = create_scheduler(BenchmarkContext(tasks_num))
+            if with_tasks:
+                start_tasks(scheduler, chats, tasks_num)
+
+            async def run() -> int:
+                ops_num = op(scheduler, chats, tasks_num)
+                scheduler.Close()
+                return ops_num
+            return run
+        return setup
+
+    return {
+        "scheduler_start": create_setup(scheduler_start, False),
+        "scheduler_stop": create_setup(scheduler_stop, True),
+        "scheduler_get_jobs_in_chat": create_setup(scheduler_get_jobs_in_chat, True),
+        "scheduler_stop_all": create_setup(scheduler_stop_all, True),
+    }
+
+
+def message_benchmarks(ops_num: int,
+                       msg_len: int) -> Dict[str, BenchmarkSetupType]:
+    """
+    Get the message benchmarks.
+
+    Args:
+        ops_num: Number of operations.
+        msg_len: Message length.
+
+    Returns:
+        Setup functions by benchmark name.
+    """
+    text = create_text(msg_len)
+    chat = create_chats(1)[0]
+
+    async def setup_split() -> BenchmarkRunType:
+        async def run() -> int:
+            for _ in range(ops_num):
+                MessageSplitter.Split(text)
+            return ops_num
+        return run
+
+    async def setup_send() -> BenchmarkRunType:
+        ctx = BenchmarkContext(1)
+
+        async def run() -> int:
+            for _ in range(ops_num):
+                await ctx.message_sender.SendMessage(chat, 0, text)
+            return ops_num
+        return run
+
+    return {
+        "message_split": setup_split,
+        "message_send": setup_send,
+    }
+
+
+def command_benchmarks(ops_num: int) -> Dict[str, BenchmarkSetupType]:
+    """
+    Get the command benchmarks.
+
+    Args:
+        ops_num: Number of operations.
+
+    Returns:
+        Setup functions by benchmark name.
+    """
+    chat = create_chats(1)[0]
+    user = pyrogram.types.User(id=BENCHMARK_USER_ID)
+
+    def create_message(text: str) -> pyrogram.types.Message:
+        return pyrogram.types.Message(id=1, chat=chat, from_user=user, text=text)
+
+    async def setup_parse() -> BenchmarkRunType:
+        client = create_client()
+        router = CommandRouter(BotCommandsConfig)
+        message = create_message("/msgbot_task_start msg_id 8 0\nPeriodic announcement")
+
+        async def run() -> int:
+            for _ in range(ops_num):
+                await router.Match(client, message)
+                cmd_data = CommandData(message)
+                cmd_data.Params().GetAsInt(1)
+            return ops_num
+        return run
+
+    async def setup_dispatch() -> BenchmarkRunType:
+        ctx = BenchmarkContext(1)
+        dispatcher = CommandDispatcher(ctx.config,
+                                       ctx.logger,
+                                       ctx.translator,
+                                       ctx.message_sender,
+                                       ChatAdminsCache(ctx.client, ctx.logger, 300.0))
+        message = create_message("/alive")
+        message.command = ["alive"]
+
+        async def run() -> int:
+            for _ in range(ops_num):
+                await dispatcher.Dispatch(message, CommandTypes.ALIVE_CMD)
+            return ops_num
+        return run
+
+    return {
+        "command_parse": setup_parse,
+        "command_dispatch": setup_dispatch,
+    }
+
+
+def misc_benchmarks(ops_num: int) -> Dict[str, BenchmarkSetupType]:
+    """
+    Get the translation and chat members benchmarks.
+
+    Args:
+        ops_num: Number of operations.
+
+    Returns:
+        Setup functions by benchmark name.
+    """
+    async def setup_get_sentence() -> BenchmarkRunType:
+        translator = TranslationLoader(BenchmarkContext(1).logger)
+        translator.Load()
+
+        async def run() -> int:
+            for _ in range(ops_num):
+                translator.GetSentence("ALIVE_CMD")
+                translator.GetSentence("MESSAGE_TASK_START_OK_CMD", msg_id="msg_id", period=8, start=0)
+            return ops_num * 2
+        return run
+
+    async def setup_members_lookup() -> BenchmarkRunType:
+        members = ChatMembersList()
+        members.AddMultiple([
+            pyrogram.types.ChatMember(status=ChatMemberStatus.MEMBER, user=pyrogram.types.User(id=i, username=f"user{i}"))
+            for i in range(200)
+        ])
+
+        async def run() -> int:
+            for i in range(ops_num):
+                members.GetByUserId(i % 200)
+                members.GetByUsername(f"user{i % 200}")
+            return ops_num * 2
+        return run
+
+    return {
+        "translation_get_sentence": setup_get_sentence,
+        "chat_members_lookup": setup_members_lookup,
+    }
+
+
+async def measure(name: str,
+                  params: Dict[str, Any],
+                  setup: BenchmarkSetupType) -> Dict[str, Any]:
+    """
+    Run a benchmark twice, measuring time the first time and allocated memory the second time (tracing memory
+    slows down execution).
+
+    Args:
+        name: Benchmark name.
+        params: Benchmark parameters.
+        setup: Setup function of the benchmark.
+
+    Returns:
+        Benchmark result.
+    """
+    run = await setup()
+    gc.collect()
+    start_time = time.perf_counter()
+    ops_num = await run()
+    elapsed_time = time.perf_counter() - start_time
+
+    run = await setup()
+    gc.collect()
+    tracemalloc.start()
+    start_size = tracemalloc.get_traced_memory()[0]
+    await run()
+    end_size, peak_size = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        "name": name,
+        "params": params,
+        "ops": ops_num,
+        "seconds": elapsed_time,
+        "ops_per_sec": ops_num / elapsed_time,
+        "alloc_peak_bytes_per_op": (peak_size - start_size) / ops_num,
+        "alloc_net_bytes_per_op": (end_size - start_size) / ops_num,
+    }
+    params_str = ", ".join(f"{key}: {value}" for key, value in params.items())
+    print(f"{name}{f' ({params_str})' if params_str else ''}: {result['ops_per_sec']:,.0f} ops/s, "
+          f"memory per op: {result['alloc_peak_bytes_per_op']:,.0f} bytes peak, "
+          f"{result['alloc_net_bytes_per_op']:,.0f} bytes retained")
+    return result
+
+
+async def run_benchmark(args: argparse.Namespace) -> None:
+    """
+    Run the benchmark.
+
+    Args:
+        args: Parsed arguments.
+    """
+    results = []
+    for tasks_num in [int(tasks_num) for tasks_num in args.tasks.split(",")]:
+        for name, setup in scheduler_benchmarks(tasks_num).items():
+            results.append(await measure(name, {"tasks": tasks_num}, setup))
+    for msg_len in (4096, 40960):
+        for name, setup in message_benchmarks(args.ops // 10, msg_len).items():
+            results.append(await measure(name, {"length": msg_len}, setup))
+    for benchmarks in (command_benchmarks(args.ops), misc_benchmarks(args.ops)):
+        for name, setup in benchmarks.items():
+            results.append(await measure(name, {}, setup))
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as fout:
+            json.dump({
+                "version": __version__,
+                "python": platform.python_version(),
+                "timestamp": time.time(),
+                "results": results,
+            }, fout, indent=2)
+        print(f"Results written to {args.output}")
+
+
+def main() -> None:
+    """Main entry point."""
+    asyncio.run(run_benchmark(ArgumentsParser().Parse()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# Load test: the whole bot runs against a fake Telegram client on this machine, without any network, while
+# sending the messages of many tasks in test mode (i.e. every minute)
+#
+# Usage (from the repository root):
+#   python benchmarks/load_test.py [-c CHATS_NUM] [-t TASKS_PER_CHAT] [-d DURATION_SEC] [-l LATENCY_MS]
+#                                  [--flood-prob PROB] [--error-prob PROB] [--forbidden-chats CHATS_NUM]
+#                                  [-o OUTPUT_FILE]
+#
+import argparse
+import asyncio
+import configparser
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Any, Dict
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from telegram_periodic_msg_bot._version import __version__  # noqa: E402
+from telegram_periodic_msg_bot.fake.fake_client import FakeClient  # noqa: E402
+from telegram_periodic_msg_bot.fake.fake_client_behavior import FakeClientBehavior, FakeLatency  # noqa: E402
+from telegram_periodic_msg_bot.periodic_msg_bot import PeriodicMsgBot  # noqa: E402
+
+
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app", "conf", "config.ini")
+"""Configuration file used as a base."""
+
+ADMIN_USER_ID = 2
+"""ID of the user sending the commands, administrator of every chat."""
+
+FIRST_CHAT_ID = -1000000000000
+"""ID of the first chat, the next ones are decreasing."""
+
+LATENCY_SIGMA = 0.5
+"""Standard deviation of the latency logarithm."""
+
+
+class ArgumentsParser:
+    """Parser for command-line arguments."""
+
+    parser: argparse.ArgumentParser
+
+    def __init__(self) -> None:
+        """Initialize the argument parser."""
+        self.parser = argparse.ArgumentParser(description="Run the bot against a fake Telegram client for capacity "
+                                                          "and soak testing")
+        self.parser.add_argument("-c", "--chats", type=int, default=100, help="number of chats")
+        self.parser.add_argument("-t", "--tasks-per-chat", type=int, default=1, help="number of tasks in each chat")
+        self.parser.add_argument("-d", "--duration", type=float, default=150.0,
+                                 help="test duration in seconds, after the tasks are started")
+        self.parser.add_argument("-l", "--latency-ms", type=float, default=50.0,
+                                 help="median latency of the Telegram requests in milliseconds")
+        self.parser.add_argument("--flood-prob", type=float, default=0.0,
+                                 help="probability of a request failing with a random FloodWait")
+        self.parser.add_argument("--error-prob", type=float, default=0.0,
+                                 help="probability of a request failing with an internal server error")
+        self.parser.add_argument("--forbidden-chats", type=int, default=0,
+                                 help="number of chats where the bot cannot write or delete messages")
+        self.parser.add_argument("-o", "--output", type=str, help="JSON file the results are written to")
+
+    def Parse(self) -> argparse.Namespace:
+        """
+        Parse command-line arguments.
+
+        Returns:
+            Parsed arguments namespace
+        """
+        return self.parser.parse_args()
+
+
+def write_config(args: argparse.Namespace,
+                 work_dir: str) -> str:
+    """
+    Write the configuration file of the test, based on the default one.
+
+    Args:
+        args: Parsed arguments.
+        work_dir: Working directory.
+
+    Returns:
+        Configuration file path.
+    """
+    config = configparser.ConfigParser()
+    config.read(CONFIG_FILE)
+    config["app"]["app_test_mode"] = "True"
+    config["task"]["tasks_max_num"] = str(args.chats * args.tasks_per_chat)
+    config["task"]["tasks_db_file_name"] = os.path.join(work_dir, "tasks.db")
+    config["logging"]["log_level"] = "WARNING"
+    config["logging"]["log_file_enabled"] = "False"
+
+    config_file = os.path.join(work_dir, "config.ini")
+    with open(config_file, "w", encoding="utf-8") as fout:
+        config.write(fout)
+    return config_file
+
+
+def create_client(args: argparse.Namespace) -> FakeClient:
+    """
+    Create the fake client.
+
+    Args:
+        args: Parsed arguments.
+
+    Returns:
+        Fake client.
+    """
+    latency = FakeLatency.LogNormal(args.latency_ms / 1000.0, LATENCY_SIGMA)
+    return FakeClient(
+        FakeClientBehavior(
+            latencies={
+                "send_message": latency,
+                "delete_messages": latency,
+                "get_chat_member": latency,
+            },
+            flood_wait_prob=args.flood_prob,
+            error_prob=args.error_prob,
+            forbidden_chat_ids={FIRST_CHAT_ID - i for i in range(args.forbidden_chats)},
+            admin_user_ids={ADMIN_USER_ID},
+            seed=0
+        )
+    )
+
+
+async def start_tasks(args: argparse.Namespace,
+                      client: FakeClient) -> float:
+    """
+    Start the tasks by feeding the commands to the client, as if they were sent by an administrator.
+
+    Args:
+        args: Parsed arguments.
+        client: Fake client.
+
+    Returns:
+        Elapsed time in seconds.
+    """
+    start_time = time.perf_counter()
+    for i in range(args.chats):
+        chat_id = FIRST_CHAT_ID - i
+        await asyncio.gather(*[
+            client.FeedUpdate(
+                client.CreateMessage(chat_id,
+                                     ADMIN_USER_ID,
+                                     f"/msgbot_task_start load_{j} 1\nLoad test message {j} of chat {chat_id}")
+            )
+            for j in range(args.tasks_per_chat)
+        ])
+    return time.perf_counter() - start_time
+
+
+async def sample_sends(client: FakeClient,
+                       duration: float) -> Dict[str, float]:
+    """
+    Sample the messages sent every second.
+
+    Args:
+        client: Fake client.
+        duration: Sampling duration in seconds.
+
+    Returns:
+        Send rates.
+    """
+    start_sent_num = client.GetStats().sent_num.Value()
+    last_sent_num = start_sent_num
+    peak_rate = 0.0
+
+    end_time = time.monotonic() + duration
+    while time.monotonic() < end_time:
+        await asyncio.sleep(1.0)
+        sent_num = client.GetStats().sent_num.Value()
+        peak_rate = max(peak_rate, sent_num - last_sent_num)
+        last_sent_num = sent_num
+
+    return {
+        "sent": last_sent_num - start_sent_num,
+        "avg_sends_per_sec": (last_sent_num - start_sent_num) / duration,
+        "peak_sends_per_sec": peak_rate,
+    }
+
+
+async def run_test(args: argparse.Namespace) -> None:
+    """
+    Run the test.
+
+    Args:
+        args: Parsed arguments.
+    """
+    with tempfile.TemporaryDirectory() as work_dir:
+        client = create_client(args)
+        bot = PeriodicMsgBot(write_config(args, work_dir), client=client)
+        bot.metrics_registry.Register(client.GetStats)
+
+        try:
+            async with client:
+                bot._OnStart()
+                setup_time = await start_tasks(args, client)
+                print(f"Started {bot.periodic_msg_scheduler.GetStats().active_num.Value():,.0f} task(s) "
+                      f"in {setup_time:.2f}s, running for {args.duration:.0f}s...")
+                rates = await sample_sends(client, args.duration)
+        finally:
+            bot._OnStop()
+            bot.logger.Close()
+
+    stats = client.GetStats()
+    result: Dict[str, Any] = {
+        "params": vars(args),
+        "setup_seconds": setup_time,
+        **rates,
+        "deleted": stats.deleted_num.Value(),
+        "calls": stats.calls_num.Values(),
+        "flood_waits": stats.flood_waits_num.Values(),
+        "errors": stats.errors_num.Values(),
+        "update_errors": stats.update_errors_num.Values(),
+    }
+    print(f"Sent {result['sent']:,.0f} message(s): {result['avg_sends_per_sec']:,.1f} sends/s on average, "
+          f"{result['peak_sends_per_sec']:,.0f} sends/s at peak")
+    print(f"Deleted {result['deleted']:,.0f} message(s)")
+    print(f"Calls: {result['calls']}")
+    print(f"FloodWait errors: {result['flood_waits']}")
+    print(f"Errors: {result['errors']}")
+    print(f"Updates failed with an injected error: {result['update_errors']}")
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as fout:
+            json.dump({
+                "version": __version__,
+                "python": platform.python_version(),
+                "timestamp": time.time(),
+                "result": result,
+            }, fout, indent=2)
+        print(f"Results written to {args.output}")
+
+
+def main() -> None:
+    """Main entry point."""
+    asyncio.run(run_test(ArgumentsParser().Parse()))
+
+
+if __name__ == "__main__":
+    main()
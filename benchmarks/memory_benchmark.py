@@ -0,0 +1,156 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+#
+# Memory benchmark: bytes used per task by the scheduler
+#
+# Usage (from the repository root):
+#   python benchmarks/memory_benchmark.py [-n TASKS_NUM] [-c CHATS_NUM] [-b BODIES_NUM]
+#
+import argparse
+import asyncio
+import gc
+import os
+import sys
+import tracemalloc
+
+import pyrogram
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from telegram_periodic_msg_bot.bot.bot_config import BotConfig  # noqa: E402
+from telegram_periodic_msg_bot.bot.bot_config_types import BotConfigTypes  # noqa: E402
+from telegram_periodic_msg_bot.config.config_file_sections_loader import ConfigFileSectionsLoader  # noqa: E402
+from telegram_periodic_msg_bot.logger.logger import Logger  # noqa: E402
+from telegram_periodic_msg_bot.message.message_deleter import MessageDeleter  # noqa: E402
+from telegram_periodic_msg_bot.message.message_rate_limiter import MessageRateLimiter  # noqa: E402
+from telegram_periodic_msg_bot.message.message_retry_handler import MessageRetryHandler  # noqa: E402
+from telegram_periodic_msg_bot.message.message_sender import MessageSender  # noqa: E402
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_scheduler import PeriodicMsgScheduler  # noqa: E402
+from telegram_periodic_msg_bot.translator.translation_packs import TranslationPacks  # noqa: E402
+
+
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app", "conf", "config.ini")
+"""Configuration file used as a base."""
+
+
+class ArgumentsParser:
+    """Parser for command-line arguments."""
+
+    parser: argparse.ArgumentParser
+
+    def __init__(self) -> None:
+        """Initialize the argument parser."""
+        self.parser = argparse.ArgumentParser(description="Measure the memory used per task by the scheduler")
+        self.parser.add_argument("-n", "--tasks", type=int, default=100000, help="number of tasks")
+        self.parser.add_argument("-c", "--chats", type=int, default=1000, help="number of chats the tasks are spread across")
+        self.parser.add_argument("-b", "--bodies", type=int, default=10, help="number of distinct message bodies")
+
+    def Parse(self) -> argparse.Namespace:
+        """
+        Parse command-line arguments.
+
+        Returns:
+            Parsed arguments namespace
+        """
+        return self.parser.parse_args()
+
+
+def create_scheduler(tasks_num: int) -> PeriodicMsgScheduler:
+    """
+    Create a scheduler with a configuration suitable for the benchmark.
+
+    Args:
+        tasks_num: Number of tasks.
+
+    Returns:
+        Scheduler.
+    """
+    config = ConfigFileSectionsLoader.Load(CONFIG_FILE, BotConfig)
+    config.SetValue(BotConfigTypes.TASKS_MAX_NUM, tasks_num)
+    config.SetValue(BotConfigTypes.TASKS_DB_ENABLED, False)
+    config.SetValue(BotConfigTypes.HA_ENABLED, False)
+    config.SetValue(BotConfigTypes.LOG_LEVEL, "WARNING")
+    config.SetValue(BotConfigTypes.LOG_FILE_ENABLED, False)
+
+    logger = Logger(config)
+    translator = TranslationPacks(logger, None, None, 1)
+    # The client is never connected, messages are not sent during the benchmark
+    client = pyrogram.Client("benchmark", in_memory=True, no_updates=True)
+    retry_handler = MessageRetryHandler(logger, 0, 1.0, 1.0, 0)
+
+    scheduler = PeriodicMsgScheduler(
+        config,
+        logger,
+        translator,
+        MessageSender(client, logger, MessageRateLimiter(1.0, 1, 1.0, 1), retry_handler),
+        MessageDeleter(client, logger, retry_handler)
+    )
+    scheduler.Open()
+    return scheduler
+
+
+async def run_benchmark(args: argparse.Namespace) -> None:
+    """
+    Run the benchmark.
+
+    Args:
+        args: Parsed arguments.
+    """
+    scheduler = create_scheduler(args.tasks)
+    chats = [pyrogram.types.Chat(id=-1000000000000 - i, type=pyrogram.enums.ChatType.SUPERGROUP)
+             for i in range(args.chats)]
+    bodies = [f"/msgbot_task_start\nPeriodic announcement number {i}\n" + "Lorem ipsum dolor sit amet. " * 20
+              for i in range(args.bodies)]
+
+    gc.collect()
+    tracemalloc.start()
+    start_size = tracemalloc.get_traced_memory()[0]
+
+    for i in range(args.tasks):
+        scheduler.Start(chats[i % args.chats],
+                        0,
+                        1 + i % 24,
+                        (i // 24) % 24,
+                        str(i),
+                        pyrogram.types.Message(id=i, text=bodies[i % args.bodies]))
+
+    gc.collect()
+    used_size = tracemalloc.get_traced_memory()[0] - start_size
+    tracemalloc.stop()
+
+    print(f"Tasks: {args.tasks}, chats: {args.chats}, distinct bodies: {args.bodies}")
+    print(f"Distinct triggers: {scheduler.trigger_factory.Count()}")
+    print(f"Body store dedup ratio: {scheduler.GetBodyStoreStats().dedup_ratio.Value():.1f}")
+    print(f"Total memory: {used_size / (1024 * 1024):.1f} MiB")
+    print(f"Memory per task: {used_size / args.tasks:.0f} bytes")
+
+    scheduler.Close()
+
+
+def main() -> None:
+    """Main entry point."""
+    asyncio.run(run_benchmark(ArgumentsParser().Parse()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+#
+# Router benchmark: messages handled per second by the command handlers
+#
+# Usage (from the repository root):
+#   python benchmarks/router_benchmark.py [-n MESSAGES_NUM]
+#
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Any, List
+
+import pyrogram
+from pyrogram import filters
+from pyrogram.handlers import MessageHandler
+from pyrogram.handlers.handler import Handler
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from telegram_periodic_msg_bot.bot.bot_handlers_config import BotCommandsConfig, BotHandlersConfig  # noqa: E402
+from telegram_periodic_msg_bot.command.command_router import CommandRouter  # noqa: E402
+
+
+class ArgumentsParser:
+    """Parser for command-line arguments."""
+
+    parser: argparse.ArgumentParser
+
+    def __init__(self) -> None:
+        """Initialize the argument parser."""
+        self.parser = argparse.ArgumentParser(description="Measure the messages handled per second by the command handlers")
+        self.parser.add_argument("-n", "--messages", type=int, default=100000, help="number of messages for each traffic type")
+
+    def Parse(self) -> argparse.Namespace:
+        """
+        Parse command-line arguments.
+
+        Returns:
+            Parsed arguments namespace
+        """
+        return self.parser.parse_args()
+
+
+class BenchmarkClient:
+    """Client replacement, providing only the bot user needed by the filters."""
+
+    me: pyrogram.types.User
+
+    def __init__(self) -> None:
+        """Initialize the client."""
+        self.me = pyrogram.types.User(id=1, username="benchmark_bot")
+
+
+class BenchmarkBot:
+    """Bot replacement, counting the dispatched commands and messages instead of executing them."""
+
+    periodic_msg_scheduler: Any
+    handled_num: int
+
+    def __init__(self) -> None:
+        """Initialize the bot."""
+        self.periodic_msg_scheduler = None
+        self.handled_num = 0
+
+    async def DispatchCommand(self, *args: Any, **kwargs: Any) -> None:
+        """Count a dispatched command."""
+        self.handled_num += 1
+
+    async def HandleMessage(self, *args: Any, **kwargs: Any) -> None:
+        """Count a handled message."""
+        self.handled_num += 1
+
+
+def create_handlers(bot: BenchmarkBot,
+                    use_router: bool) -> List[Handler]:
+    """
+    Create the message handlers, in the same order they are added to the client.
+
+    Args:
+        bot: Bot.
+        use_router: True for a single router handler, False for a handler with a command filter for each command.
+
+    Returns:
+        Handlers.
+    """
+    def create_handler(handler_cfg, flt):
+        async def async_callback(client, message):
+            return await handler_cfg["callback"](bot, client, message)
+        return MessageHandler(async_callback, flt)
+
+    handlers: List[Handler] = []
+    if use_router:
+        router = CommandRouter(BotCommandsConfig)
+
+        async def route_callback(client, message):
+            return await router.GetCallback(message)(bot, client, message)
+
+        handlers.append(MessageHandler(route_callback, router.GetFilter()))
+    else:
+        for cmd_name, cmd_cfg in BotCommandsConfig.items():
+            cmd_filter = filters.command([cmd_name])
+            if cmd_cfg.get("filters") is not None:
+                cmd_filter = cmd_cfg["filters"] & cmd_filter
+            handlers.append(create_handler(cmd_cfg, cmd_filter))
+    handlers.extend(create_handler(handler_cfg, handler_cfg["filters"]) for handler_cfg in BotHandlersConfig[MessageHandler])
+
+    return handlers
+
+
+def create_messages(messages_num: int,
+                    commands: bool) -> List[pyrogram.types.Message]:
+    """
+    Create the messages of the benchmark.
+
+    Args:
+        messages_num: Number of messages.
+        commands: True for command messages (spread across all commands), False for ordinary chat messages.
+
+    Returns:
+        Messages.
+    """
+    chat = pyrogram.types.Chat(id=-1000000000000, type=pyrogram.enums.ChatType.SUPERGROUP)
+    user = pyrogram.types.User(id=2)
+    cmd_names = [cmd_name for cmd_name, cmd_cfg in BotCommandsConfig.items() if cmd_cfg.get("filters") is None]
+    texts = ([f"/{cmd_name} msg_id 8 0" for cmd_name in cmd_names] if commands
+             else ["Hello everyone, any news about the meeting?", "ok", "See you tomorrow at 10"])
+
+    return [pyrogram.types.Message(id=i, chat=chat, from_user=user, text=texts[i % len(texts)])
+            for i in range(messages_num)]
+
+
+async def handle_messages(handlers: List[Handler],
+                          messages: List[pyrogram.types.Message]) -> float:
+    """
+    Handle the messages like the client dispatcher (only the first matching handler is called).
+
+    Args:
+        handlers: Handlers.
+        messages: Messages.
+
+    Returns:
+        Messages handled per second.
+    """
+    client = BenchmarkClient()
+
+    start_time = time.perf_counter()
+    for message in messages:
+        for handler in handlers:
+            if await handler.check(client, message):
+                await handler.callback(client, message)
+                break
+    return len(messages) / (time.perf_counter() - start_time)
+
+
+async def run_benchmark(args: argparse.Namespace) -> None:
+    """
+    Run the benchmark.
+
+    Args:
+        args: Parsed arguments.
+    """
+    print(f"Messages: {args.messages} for each traffic type")
+    for traffic_name, commands in (("non-command", False), ("command", True)):
+        messages = create_messages(args.messages, commands)
+        for handlers_name, use_router in (("filter per command", False), ("router", True)):
+            bot = BenchmarkBot()
+            msg_per_sec = await handle_messages(create_handlers(bot, use_router), messages)
+            print(f"{traffic_name.capitalize()} traffic, {handlers_name}: {msg_per_sec:,.0f} msg/s "
+                  f"(dispatched: {bot.handled_num})")
+
+
+def main() -> None:
+    """Main entry point."""
+    asyncio.run(run_benchmark(ArgumentsParser().Parse()))
+
+
+if __name__ == "__main__":
+    main()
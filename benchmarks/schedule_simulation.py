@@ -0,0 +1,438 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# Schedule simulation: the bot runs on a virtual clock against a fake Telegram client, so that days of scheduling
+# are replayed as fast as the CPU allows, reporting the send timeline and any missed or duplicated fire
+#
+# Usage (from the repository root):
+#   python benchmarks/schedule_simulation.py [-t TASKS_NUM] [-c TASKS_PER_CHAT] [-d DAYS] [-l LATENCY_MS]
+#                                            [-s SEED] [-o OUTPUT_FILE]
+#
+import argparse
+import asyncio
+import configparser
+import datetime
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Union
+
+import pyrogram
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from telegram_periodic_msg_bot._version import __version__  # noqa: E402
+from telegram_periodic_msg_bot.fake.fake_client import FakeClient  # noqa: E402
+from telegram_periodic_msg_bot.fake.fake_client_behavior import FakeClientBehavior, FakeLatency  # noqa: E402
+from telegram_periodic_msg_bot.fake.fake_clock import FakeClock, FakeClockEventLoop  # noqa: E402
+from telegram_periodic_msg_bot.metrics.metrics import MetricHistogram, MetricsConst  # noqa: E402
+from telegram_periodic_msg_bot.periodic_msg_bot import PeriodicMsgBot  # noqa: E402
+
+
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app", "conf", "config.ini")
+"""Configuration file used as a base."""
+
+FIRST_CHAT_ID = -1000000000000
+"""ID of the first chat, the next ones are decreasing."""
+
+TASK_MSG_PREFIX = "Simulated message of task "
+"""Prefix of the task messages, followed by the task index."""
+
+SETUP_SEC = 60
+"""Seconds before the first simulated day in which the tasks are started."""
+
+DRAIN_SEC = 3600
+"""Seconds after the last simulated day in which the sends still pending are completed."""
+
+
+class ArgumentsParser:
+    """Parser for command-line arguments."""
+
+    parser: argparse.ArgumentParser
+
+    def __init__(self) -> None:
+        """Initialize the argument parser."""
+        self.parser = argparse.ArgumentParser(description="Simulate days of scheduling on a virtual clock and report "
+                                                          "the send timeline, missed and duplicated fires")
+        self.parser.add_argument("-t", "--tasks", type=int, default=100000, help="number of tasks")
+        self.parser.add_argument("-c", "--tasks-per-chat", type=int, default=10, help="number of tasks in each chat")
+        self.parser.add_argument("-d", "--days", type=int, default=7, help="number of simulated days")
+        self.parser.add_argument("-l", "--latency-ms", type=float, default=50.0,
+                                 help="latency of the Telegram requests in (virtual) milliseconds")
+        self.parser.add_argument("-s", "--seed", type=int, default=0, help="seed of the random task schedules")
+        self.parser.add_argument("-o", "--output", type=str,
+                                 help="JSON file the results (with the sends of each minute) are written to")
+
+    def Parse(self) -> argparse.Namespace:
+        """
+        Parse command-line arguments.
+
+        Returns:
+            Parsed arguments namespace
+        """
+        return self.parser.parse_args()
+
+
+class SendTimeline:
+    """
+    Timeline of the sends, checked against the expected fire times of the tasks.
+
+    Expected fire times are computed here from the task schedules, independently of the bot triggers.
+    Each send is attributed to the last expected fire time of its task, so a second send for the same fire time
+    is a duplicate and a fire time without any send is missed.
+    """
+
+    start_time: float
+    end_time: float
+    task_hours: List[int]
+    last_fire_times: List[float]
+    fired_num: int
+    duplicated_num: int
+    sends_per_min: List[int]
+    curr_sec: int
+    curr_sec_sends: int
+    peak_sends: int
+    peak_time: float
+    lateness: MetricHistogram
+
+    def __init__(self,
+                 start_time: float,
+                 end_time: float) -> None:
+        """
+        Initialize the timeline.
+
+        Args:
+            start_time: Start of the simulated time.
+            end_time: End of the simulated time, sends for later fire times are not checked.
+        """
+        self.start_time = start_time
+        self.end_time = end_time
+        self.task_hours = []
+        self.last_fire_times = []
+        self.fired_num = 0
+        self.duplicated_num = 0
+        self.sends_per_min = []
+        self.curr_sec = 0
+        self.curr_sec_sends = 0
+        self.peak_sends = 0
+        self.peak_time = start_time
+        self.lateness = MetricHistogram("sim_lateness_seconds",
+                                        "Difference between the send time and the expected fire time",
+                                        MetricsConst.SLOW_OP_TIME_BUCKETS)
+
+    def AddTask(self,
+                period: int,
+                start: int) -> int:
+        """
+        Add a task.
+
+        Args:
+            period: Period in hours.
+            start: Start hour.
+
+        Returns:
+            Task index.
+        """
+        hours = 0
+        for i in range(math.ceil(24 / period)):
+            hours |= 1 << ((start + i * period) % 24)
+        self.task_hours.append(hours)
+        self.last_fire_times.append(0.0)
+        return len(self.task_hours) - 1
+
+    def AddSend(self,
+                task_idx: int,
+                send_time: float) -> None:
+        """
+        Add a send.
+
+        Args:
+            task_idx: Task index.
+            send_time: Send time.
+        """
+        fire_time = self.__GetLastFireTime(task_idx, send_time)
+        if fire_time == self.last_fire_times[task_idx]:
+            self.duplicated_num += 1
+        else:
+            self.last_fire_times[task_idx] = fire_time
+            if fire_time < self.end_time:
+                self.fired_num += 1
+        self.lateness.Observe(send_time - fire_time)
+
+        minute = int((send_time - self.start_time) // 60)
+        while len(self.sends_per_min) <= minute:
+            self.sends_per_min.append(0)
+        self.sends_per_min[minute] += 1
+
+        sec = int(send_time)
+        if sec != self.curr_sec:
+            self.curr_sec = sec
+            self.curr_sec_sends = 0
+        self.curr_sec_sends += 1
+        if self.curr_sec_sends > self.peak_sends:
+            self.peak_sends = self.curr_sec_sends
+            self.peak_time = sec
+
+    def ExpectedNum(self) -> int:
+        """
+        Get the number of expected fire times of all the tasks.
+
+        Returns:
+            Number of expected fire times.
+        """
+        hour_counts = [0] * 24
+        hour_dt = datetime.datetime.fromtimestamp(self.start_time)
+        while hour_dt.timestamp() < self.end_time:
+            hour_counts[hour_dt.hour] += 1
+            hour_dt += datetime.timedelta(hours=1)
+
+        return sum(count
+                   for hours in self.task_hours
+                   for hour, count in enumerate(hour_counts)
+                   if hours & (1 << hour))
+
+    def __GetLastFireTime(self,
+                          task_idx: int,
+                          send_time: float) -> float:
+        """
+        Get the last expected fire time of a task before a send.
+
+        Args:
+            task_idx: Task index.
+            send_time: Send time.
+
+        Returns:
+            Expected fire time.
+        """
+        hours = self.task_hours[task_idx]
+        fire_dt = datetime.datetime.fromtimestamp(send_time).replace(minute=0, second=0, microsecond=0)
+        while not hours & (1 << fire_dt.hour):
+            fire_dt -= datetime.timedelta(hours=1)
+        return fire_dt.timestamp()
+
+
+class SimulationClient(FakeClient):
+    """Fake client adding the sent task messages to the timeline."""
+
+    timeline: SendTimeline
+
+    def __init__(self,
+                 behavior: FakeClientBehavior,
+                 clock: FakeClock,
+                 timeline: SendTimeline) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            behavior: Behavior of the client.
+            clock: Virtual clock.
+            timeline: Send timeline.
+        """
+        super().__init__(behavior, clock=clock)
+        self.timeline = timeline
+
+    async def send_message(self,
+                           chat_id: Union[int, str],
+                           text: str,
+                           message_thread_id: Optional[int] = None,
+                           **kwargs: object) -> pyrogram.types.Message:
+        """
+        Send a message, adding it to the timeline if sent by a task.
+
+        Args:
+            chat_id: Chat ID.
+            text: Message text.
+            message_thread_id: Topic ID.
+            **kwargs: Unused, kept for compatibility.
+
+        Returns:
+            Sent message.
+        """
+        msg = await super().send_message(chat_id, text, message_thread_id, **kwargs)
+        if text.startswith(TASK_MSG_PREFIX):
+            self.timeline.AddSend(int(text[len(TASK_MSG_PREFIX):]), self.clock.Time())
+        return msg
+
+
+def write_config(args: argparse.Namespace,
+                 work_dir: str) -> str:
+    """
+    Write the configuration file of the simulation, based on the default one.
+
+    Args:
+        args: Parsed arguments.
+        work_dir: Working directory.
+
+    Returns:
+        Configuration file path.
+    """
+    config = configparser.ConfigParser()
+    config.read(CONFIG_FILE)
+    config["app"]["app_test_mode"] = "False"
+    config["task"]["tasks_max_num"] = str(args.tasks)
+    config["task"]["tasks_db_enabled"] = "False"
+    config["ha"]["ha_enabled"] = "False"
+    config["logging"]["log_level"] = "ERROR"
+    config["logging"]["log_file_enabled"] = "False"
+
+    config_file = os.path.join(work_dir, "config.ini")
+    with open(config_file, "w", encoding="utf-8") as fout:
+        config.write(fout)
+    return config_file
+
+
+def start_tasks(args: argparse.Namespace,
+                bot: PeriodicMsgBot,
+                timeline: SendTimeline) -> None:
+    """
+    Start the tasks with random schedules.
+
+    Args:
+        args: Parsed arguments.
+        bot: Bot.
+        timeline: Send timeline.
+    """
+    rnd = random.Random(args.seed)
+    for i in range(args.tasks):
+        period = rnd.randint(1, 24)
+        start = rnd.randint(0, 23)
+        task_idx = timeline.AddTask(period, start)
+        chat = pyrogram.types.Chat(id=FIRST_CHAT_ID - i // args.tasks_per_chat,
+                                   type=pyrogram.enums.ChatType.SUPERGROUP)
+        message = pyrogram.types.Message(id=0,
+                                         text=f"/msgbot_task_start task_{i} {period} {start}\n"
+                                              f"{TASK_MSG_PREFIX}{task_idx}")
+        bot.periodic_msg_scheduler.Start(chat, 0, period, start, f"task_{i}", message)
+
+
+async def run_simulation(args: argparse.Namespace,
+                         clock: FakeClock,
+                         timeline: SendTimeline) -> Dict[str, Any]:
+    """
+    Run the simulation.
+
+    Args:
+        args: Parsed arguments.
+        clock: Virtual clock.
+        timeline: Send timeline.
+
+    Returns:
+        Simulation result.
+    """
+    with tempfile.TemporaryDirectory() as work_dir:
+        client = SimulationClient(
+            FakeClientBehavior(
+                latencies={
+                    "send_message": FakeLatency.Constant(args.latency_ms / 1000.0),
+                    "delete_messages": FakeLatency.Constant(args.latency_ms / 1000.0),
+                },
+                seed=args.seed
+            ),
+            clock,
+            timeline
+        )
+        bot = PeriodicMsgBot(write_config(args, work_dir), client=client, clock=clock)
+
+    wall_start_time = time.perf_counter()
+    try:
+        bot._OnStart()
+        start_tasks(args, bot, timeline)
+        print(f"Started {args.tasks:,} task(s) in {time.perf_counter() - wall_start_time:.2f}s")
+
+        for day in range(args.days):
+            day_start_time = time.perf_counter()
+            await asyncio.sleep(timeline.start_time + (day + 1) * 86400 - clock.Time())
+            sends_num = sum(timeline.sends_per_min[day * 1440:(day + 1) * 1440])
+            print(f"Day {day + 1}: {sends_num:,} send(s), simulated in {time.perf_counter() - day_start_time:.2f}s")
+        await asyncio.sleep(DRAIN_SEC)
+    finally:
+        bot._OnStop()
+        bot.logger.Close()
+
+    wall_time = time.perf_counter() - wall_start_time
+    expected_num = timeline.ExpectedNum()
+    engine_stats = bot.periodic_msg_scheduler.GetEngineStats()
+    client_stats = client.GetStats()
+    return {
+        "params": vars(args),
+        "wall_seconds": wall_time,
+        "speedup": (clock.Time() - timeline.start_time + SETUP_SEC) / wall_time,
+        "sends": sum(timeline.sends_per_min),
+        "expected_fires": expected_num,
+        "missed_fires": expected_num - timeline.fired_num,
+        "duplicated_fires": timeline.duplicated_num,
+        "peak_sends_per_sec": timeline.peak_sends,
+        "peak_time": datetime.datetime.fromtimestamp(timeline.peak_time).isoformat(),
+        "lateness_mean_seconds": timeline.lateness.Mean(),
+        "lateness_max_seconds": timeline.lateness.Max(),
+        "engine_fired": engine_stats.fired_num.Value(),
+        "engine_misfired": engine_stats.misfired_num.Value(),
+        "flood_waits": client_stats.flood_waits_num.Values(),
+        "errors": client_stats.errors_num.Values(),
+        "sends_per_min": timeline.sends_per_min,
+    }
+
+
+def main() -> None:
+    """Main entry point."""
+    args = ArgumentsParser().Parse()
+
+    # Start from the next midnight, a bit earlier to start the tasks
+    start_time = datetime.datetime.combine(datetime.date.today() + datetime.timedelta(days=1),
+                                           datetime.time()).timestamp()
+    clock = FakeClock(start_time - SETUP_SEC)
+    timeline = SendTimeline(start_time, start_time + args.days * 86400)
+
+    loop = FakeClockEventLoop(clock)
+    asyncio.set_event_loop(loop)
+    try:
+        result = loop.run_until_complete(run_simulation(args, clock, timeline))
+    finally:
+        loop.close()
+
+    print(f"Simulated {args.days} day(s) of {args.tasks:,} task(s) in {result['wall_seconds']:.2f}s "
+          f"({result['speedup']:,.0f}x real time)")
+    print(f"Sent {result['sends']:,} message(s), {result['peak_sends_per_sec']} sends/s at peak "
+          f"({result['peak_time']})")
+    print(f"Expected fires: {result['expected_fires']:,}, missed: {result['missed_fires']:,}, "
+          f"duplicated: {result['duplicated_fires']:,}")
+    print(f"Lateness: {result['lateness_mean_seconds']:.2f}s on average, {result['lateness_max_seconds']:.2f}s at most")
+    print(f"Engine fires: {result['engine_fired']:,.0f}, misfires: {result['engine_misfired']:,.0f}")
+    print(f"FloodWait errors: {result['flood_waits']}, errors: {result['errors']}")
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as fout:
+            json.dump({
+                "version": __version__,
+                "python": platform.python_version(),
+                "timestamp": time.time(),
+                "result": result,
+            }, fout, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
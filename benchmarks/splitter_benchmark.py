@@ -0,0 +1,209 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# Splitter benchmark: time taken by the message splitter for increasingly large messages, showing that it scales
+# linearly with the message length
+#
+# Usage (from the repository root):
+#   python benchmarks/splitter_benchmark.py [-l LENGTHS_LIST] [-m MAX_LEN] [-o OUTPUT_FILE]
+#
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from telegram_periodic_msg_bot._version import __version__  # noqa: E402
+from telegram_periodic_msg_bot.message.message_splitter import MessageSplitter, MessageSplitterConst  # noqa: E402
+
+
+MIN_TIME_SEC = 0.5
+"""Minimum time spent splitting messages of each length, for measuring short messages reliably."""
+
+# Function creating a message of the given length
+TextCreateType = Callable[[int], str]
+
+
+class ArgumentsParser:
+    """Parser for command-line arguments."""
+
+    parser: argparse.ArgumentParser
+
+    def __init__(self) -> None:
+        """Initialize the argument parser."""
+        self.parser = argparse.ArgumentParser(description="Measure the time taken by the message splitter for "
+                                                          "increasingly large messages")
+        self.parser.add_argument("-l", "--lengths", type=str, default="4096,65536,1048576,16777216",
+                                 help="comma-separated message lengths, in characters")
+        self.parser.add_argument("-m", "--max-len", type=int, default=MessageSplitterConst.MSG_MAX_LEN,
+                                 help="maximum length of a part")
+        self.parser.add_argument("-o", "--output", type=str, help="JSON file the results are written to")
+
+    def Parse(self) -> argparse.Namespace:
+        """
+        Parse command-line arguments.
+
+        Returns:
+            Parsed arguments namespace
+        """
+        return self.parser.parse_args()
+
+
+def repeat_text(text: str,
+                length: int) -> str:
+    """
+    Repeat a text up to a length.
+
+    Args:
+        text: Text.
+        length: Length.
+
+    Returns:
+        Repeated text.
+    """
+    return (text * (length // len(text) + 1))[:length]
+
+
+def create_plain_text(length: int) -> str:
+    """
+    Create a plain text made of paragraphs and lines, like a real message.
+
+    Args:
+        length: Text length.
+
+    Returns:
+        Text.
+    """
+    return repeat_text(("Lorem ipsum dolor sit amet, consectetur adipiscing elit.\n" * 5) + "\n", length)
+
+
+def create_html_text(length: int) -> str:
+    """
+    Create a text with HTML tags, entities and characters taking two UTF-16 code units.
+
+    Args:
+        length: Text length.
+
+    Returns:
+        Text.
+    """
+    return repeat_text("<b>Lorem ipsum</b> dolor sit amet &amp; <i>consectetur \U0001F600 adipiscing</i> elit, "
+                       "<a href=\"https://example.com\">sed do</a> eiusmod tempor.\n", length)
+
+
+def create_unbroken_text(length: int) -> str:
+    """
+    Create a text without any boundary, which is split at the maximum length.
+
+    Args:
+        length: Text length.
+
+    Returns:
+        Text.
+    """
+    return repeat_text("Loremipsumdolorsitamet", length)
+
+
+TEXT_TYPES: Dict[str, TextCreateType] = {
+    "plain": create_plain_text,
+    "html": create_html_text,
+    "unbroken": create_unbroken_text,
+}
+"""Types of messages, with the function creating them."""
+
+
+def measure(text_type: str,
+            msg: str,
+            max_len: int) -> Dict[str, Any]:
+    """
+    Measure the time taken for splitting a message, repeating it for at least the minimum time.
+
+    Args:
+        text_type: Message type.
+        msg: Message.
+        max_len: Maximum length of a part.
+
+    Returns:
+        Benchmark result.
+    """
+    runs_num = 0
+    parts_num = 0
+    start_time = time.perf_counter()
+    elapsed_time = 0.0
+    while elapsed_time < MIN_TIME_SEC:
+        parts_num = len(MessageSplitter.SplitRanges(msg, max_len))
+        runs_num += 1
+        elapsed_time = time.perf_counter() - start_time
+
+    return {
+        "type": text_type,
+        "length": len(msg),
+        "parts": parts_num,
+        "runs": runs_num,
+        "seconds_per_run": elapsed_time / runs_num,
+        "ns_per_char": elapsed_time / runs_num / len(msg) * 1e9,
+    }
+
+
+def run_benchmark(args: argparse.Namespace) -> None:
+    """
+    Run the benchmark.
+
+    Args:
+        args: Parsed arguments.
+    """
+    lengths = [int(length) for length in args.lengths.split(",")]
+    results: List[Dict[str, Any]] = []
+    for text_type, create_text in TEXT_TYPES.items():
+        base_ns_per_char = None
+        for length in lengths:
+            result = measure(text_type, create_text(length), args.max_len)
+            # Ratio to the time per character of the shortest message, that stays close to 1 when scaling linearly
+            if base_ns_per_char is None:
+                base_ns_per_char = result["ns_per_char"]
+            result["scaling"] = result["ns_per_char"] / base_ns_per_char
+            results.append(result)
+            print(f"{text_type.capitalize()} text, length {length:,}: {result['seconds_per_run'] * 1000:,.3f} ms, "
+                  f"{result['parts']:,} parts, {result['ns_per_char']:,.1f} ns/char (x{result['scaling']:.2f})")
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as fout:
+            json.dump({
+                "version": __version__,
+                "python": platform.python_version(),
+                "timestamp": time.time(),
+                "max_len": args.max_len,
+                "results": results,
+            }, fout, indent=2)
+        print(f"Results written to {args.output}")
+
+
+def main() -> None:
+    """Main entry point."""
+    run_benchmark(ArgumentsParser().Parse())
+
+
+if __name__ == "__main__":
+    main()
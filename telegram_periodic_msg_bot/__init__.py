@@ -3,3 +3,4 @@
 #
 from telegram_periodic_msg_bot._version import __version__
 from telegram_periodic_msg_bot.periodic_msg_bot import PeriodicMsgBot
+from telegram_periodic_msg_bot.shard.shard_front import ShardFront
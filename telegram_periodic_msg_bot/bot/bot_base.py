@@ -18,20 +18,47 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from typing import Any
+import multiprocessing
+from typing import Any, Dict, List, Optional, Type, Union
 
 import pyrogram
 from pyrogram import Client, idle
+from pyrogram.handlers import ChatMemberUpdatedHandler, MessageHandler
+from pyrogram.handlers.handler import Handler
 
 from telegram_periodic_msg_bot.bot.bot_config_types import BotConfigTypes
-from telegram_periodic_msg_bot.bot.bot_handlers_config_typing import BotHandlersConfigType
+from telegram_periodic_msg_bot.bot.bot_handlers_config_typing import BotCommandsConfigType, BotHandlersConfigType
 from telegram_periodic_msg_bot.command.command_dispatcher import CommandDispatcher, CommandTypes
+from telegram_periodic_msg_bot.command.command_router import CommandRouter
 from telegram_periodic_msg_bot.config.config_file_sections_loader import ConfigFileSectionsLoader
 from telegram_periodic_msg_bot.config.config_object import ConfigObject
 from telegram_periodic_msg_bot.config.config_typing import ConfigSectionsType
 from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.message.message_deleter import MessageDeleter
 from telegram_periodic_msg_bot.message.message_dispatcher import MessageDispatcher, MessageTypes
-from telegram_periodic_msg_bot.translator.translation_loader import TranslationLoader
+from telegram_periodic_msg_bot.message.message_rate_limiter import MessageRateLimiter
+from telegram_periodic_msg_bot.message.message_retry_handler import MessageRetryHandler
+from telegram_periodic_msg_bot.message.message_sender import MessageSender
+from telegram_periodic_msg_bot.metrics.metrics_registry import MetricsRegistry
+from telegram_periodic_msg_bot.metrics.metrics_server import MetricsServer
+from telegram_periodic_msg_bot.misc.chat_admins_cache import ChatAdminsCache
+from telegram_periodic_msg_bot.shard.shard_info import ShardInfo
+from telegram_periodic_msg_bot.shard.shard_updates_consumer import ShardUpdatesConsumer
+from telegram_periodic_msg_bot.translator.translation_packs import TranslationPacks
+from telegram_periodic_msg_bot.utils.clock import Clock
+
+
+# Updates forwarded by the front process in sharded mode
+BotUpdateType = Union[pyrogram.types.Message, pyrogram.types.ChatMemberUpdated]
+
+
+class BotBaseConst:
+    """Constants for bot base class."""
+
+    UPDATE_TYPE_TO_HANDLER_TYPE: Dict[Type[BotUpdateType], Type[Handler]] = {
+        pyrogram.types.Message: MessageHandler,
+        pyrogram.types.ChatMemberUpdated: ChatMemberUpdatedHandler,
+    }
 
 
 class BotBase:
@@ -43,49 +70,181 @@ class BotBase:
     """
 
     config: ConfigObject
+    shard_info: Optional[ShardInfo]
     logger: Logger
-    translator: TranslationLoader
+    translator: TranslationPacks
     client: pyrogram.Client
+    handlers: List[Handler]
+    retry_handler: MessageRetryHandler
+    message_sender: MessageSender
+    message_deleter: MessageDeleter
+    admins_cache: ChatAdminsCache
+    cmd_router: CommandRouter
     cmd_dispatcher: CommandDispatcher
     msg_dispatcher: MessageDispatcher
+    metrics_registry: MetricsRegistry
+    metrics_server: Optional[MetricsServer]
 
     def __init__(self,
                  config_file: str,
                  config_sections: ConfigSectionsType,
-                 handlers_config: BotHandlersConfigType) -> None:
+                 commands_config: BotCommandsConfigType,
+                 handlers_config: BotHandlersConfigType,
+                 shard_info: Optional[ShardInfo] = None,
+                 *,
+                 client: Optional[pyrogram.Client] = None,
+                 clock: Optional[Clock] = None) -> None:
         """
         Initialize the bot.
 
         Args:
             config_file: Path to the configuration file.
             config_sections: Configuration sections definition.
+            commands_config: Commands configuration for the bot.
             handlers_config: Handlers configuration for the bot.
+            shard_info: Information about the shard run by the bot, None if not sharded.
+            client: Client to use in place of the Telegram one (e.g. a fake client for load tests), None to
+                create it from the configuration.
+            clock: Clock giving the current time to the message sender (optional, the system clock if not specified).
         """
         self.config = ConfigFileSectionsLoader.Load(config_file, config_sections)
+        self.shard_info = shard_info
+        if shard_info is not None:
+            self.__SetShardConfig(shard_info)
         # Initialize logger
         self.logger = Logger(self.config)
         # Initialize translations
-        self.translator = TranslationLoader(self.logger)
-        self.translator.Load(self.config.GetValue(BotConfigTypes.APP_LANG_FILE))
+        self.translator = TranslationPacks(self.logger,
+                                           self.config.GetValue(BotConfigTypes.APP_LANG_FILE),
+                                           self.config.GetValue(BotConfigTypes.APP_LANG_FOLDER),
+                                           self.config.GetValue(BotConfigTypes.APP_LANG_CACHE_SIZE))
         # Initialize client
-        self.client = Client(
+        self.client = client if client is not None else Client(
             self.config.GetValue(BotConfigTypes.SESSION_NAME),
             api_id=self.config.GetValue(BotConfigTypes.API_ID),
             api_hash=self.config.GetValue(BotConfigTypes.API_HASH),
             bot_token=self.config.GetValue(BotConfigTypes.BOT_TOKEN),
+            # In sharded mode, updates are received by the front process and forwarded to the shards
+            no_updates=shard_info is not None,
         )
+        # Initialize message sender and deleter, shared so that all requests go through the same rate limiter
+        # and retry handler
+        self.retry_handler = MessageRetryHandler(
+            self.logger,
+            self.config.GetValue(BotConfigTypes.MESSAGE_RETRY_MAX_NUM),
+            self.config.GetValue(BotConfigTypes.MESSAGE_RETRY_BACKOFF_BASE_SEC),
+            self.config.GetValue(BotConfigTypes.MESSAGE_RETRY_BACKOFF_MAX_SEC),
+            self.config.GetValue(BotConfigTypes.MESSAGE_FLOOD_WAIT_MAX_SEC),
+            clock=clock
+        )
+        self.message_sender = MessageSender(
+            self.client,
+            self.logger,
+            MessageRateLimiter(
+                self.config.GetValue(BotConfigTypes.MESSAGE_RATE_GLOBAL_PER_SEC),
+                self.config.GetValue(BotConfigTypes.MESSAGE_RATE_GLOBAL_BURST),
+                self.config.GetValue(BotConfigTypes.MESSAGE_RATE_CHAT_PER_MIN) / 60.0,
+                self.config.GetValue(BotConfigTypes.MESSAGE_RATE_CHAT_BURST),
+                clock=clock
+            ),
+            self.retry_handler
+        )
+        self.message_deleter = MessageDeleter(self.client, self.logger, self.retry_handler)
+        self.admins_cache = ChatAdminsCache(self.client,
+                                            self.logger,
+                                            self.config.GetValue(BotConfigTypes.APP_ADMINS_CACHE_TTL_SEC))
         # Initialize helper classes
-        self.cmd_dispatcher = CommandDispatcher(self.config, self.logger, self.translator)
-        self.msg_dispatcher = MessageDispatcher(self.config, self.logger, self.translator)
+        self.cmd_router = CommandRouter(commands_config)
+        self.cmd_dispatcher = CommandDispatcher(self.config,
+                                                self.logger,
+                                                self.translator,
+                                                self.message_sender,
+                                                self.admins_cache)
+        self.msg_dispatcher = MessageDispatcher(self.config, self.logger, self.translator, self.message_sender)
         # Setup handlers
+        self.handlers = []
+        self._SetupCommandsHandler()
         self._SetupHandlers(handlers_config)
+        # Initialize metrics
+        self.metrics_registry = MetricsRegistry()
+        self.__RegisterStats()
+        self.metrics_server = (
+            MetricsServer(self.logger,
+                          self.metrics_registry,
+                          self.config.GetValue(BotConfigTypes.METRICS_HOST),
+                          self.config.GetValue(BotConfigTypes.METRICS_PORT))
+            if self.config.GetValue(BotConfigTypes.METRICS_ENABLED)
+            else None
+        )
         self.logger.GetLogger().info("Bot initialization completed")
 
     async def Run(self) -> None:
         """Run the bot and start processing messages."""
         self.logger.GetLogger().info("Bot started!\n")
-        async with self.client:
-            await idle()
+        try:
+            async with self.client:
+                self._OnStart()
+                await self.__StartMetricsServer()
+                await idle()
+        finally:
+            await self.__StopMetricsServer()
+            self._OnStop()
+            self.logger.Close()
+
+    async def RunShard(self,
+                       updates_queue: multiprocessing.Queue) -> None:
+        """
+        Run the bot as a shard, processing the updates forwarded by the front process.
+
+        Args:
+            updates_queue: Queue of the updates forwarded by the front process.
+        """
+        assert self.shard_info is not None
+
+        self.logger.GetLogger().info(f"Shard {self.shard_info.Index()} started!\n")
+        try:
+            async with self.client:
+                self._OnStart()
+                await self.__StartMetricsServer()
+                await ShardUpdatesConsumer(self.logger, updates_queue, self.HandleUpdate).Run()
+        finally:
+            await self.__StopMetricsServer()
+            self._OnStop()
+            self.logger.Close()
+
+    async def HandleUpdate(self,
+                           update: BotUpdateType) -> None:
+        """
+        Handle an update forwarded by the front process, like the client dispatcher would do.
+
+        Args:
+            update: Forwarded update.
+        """
+        handler_type = BotBaseConst.UPDATE_TYPE_TO_HANDLER_TYPE.get(type(update))
+        if handler_type is None:
+            return
+
+        update.bind(self.client)
+        # Only the first matching handler is called, as for handlers belonging to the same group
+        for handler in self.handlers:
+            if type(handler) is handler_type and await handler.check(self.client, update):
+                await handler.callback(self.client, update)
+                break
+
+    def _OnStart(self) -> None:
+        """Called when the client is connected, can be overridden to start background activities."""
+
+    def _OnStop(self) -> None:
+        """Called when the bot stops, can be overridden to release resources."""
+
+    def _SetupCommandsHandler(self) -> None:
+        """Set up the single handler routing all the commands, so that each message is checked only once."""
+        async def route_callback(client, message):
+            return await self.cmd_router.GetCallback(message)(self, client, message)
+
+        handler = MessageHandler(route_callback, self.cmd_router.GetFilter())
+        self.handlers.append(handler)
+        self.client.add_handler(handler)
 
     def _SetupHandlers(self,
                        handlers_config: BotHandlersConfigType) -> None:
@@ -102,7 +261,9 @@ class BotBase:
 
         for curr_hnd_type, curr_hnd_cfg in handlers_config.items():
             for handler_cfg in curr_hnd_cfg:
-                self.client.add_handler(create_handler(curr_hnd_type, handler_cfg))
+                handler = create_handler(curr_hnd_type, handler_cfg)
+                self.handlers.append(handler)
+                self.client.add_handler(handler)
         self.logger.GetLogger().info("Bot handlers set")
 
     async def DispatchCommand(self,
@@ -119,7 +280,7 @@ class BotBase:
             cmd_type: Type of command to dispatch.
             **kwargs: Additional arguments to pass to the command handler.
         """
-        await self.cmd_dispatcher.Dispatch(client, message, cmd_type, **kwargs)
+        await self.cmd_dispatcher.Dispatch(message, cmd_type, **kwargs)
 
     async def HandleMessage(self,
                             client: pyrogram.Client,
@@ -136,3 +297,65 @@ class BotBase:
             **kwargs: Additional arguments to pass to the message handler.
         """
         await self.msg_dispatcher.Dispatch(client, message, msg_type, **kwargs)
+
+    async def HandleChatMemberUpdated(self,
+                                      _client: pyrogram.Client,
+                                      update: pyrogram.types.ChatMemberUpdated) -> None:
+        """
+        Handle a chat member update by invalidating the cached administrator status of the member.
+
+        Args:
+            _client: Pyrogram client instance.
+            update: Chat member update.
+        """
+        member = update.new_chat_member or update.old_chat_member
+        if member is not None and member.user is not None:
+            self.admins_cache.Invalidate(update.chat.id, member.user.id)
+        else:
+            self.admins_cache.Invalidate(update.chat.id)
+
+    def __RegisterStats(self) -> None:
+        """Register the statistics of the bot components to the metrics registry."""
+        self.metrics_registry.Register(self.logger.GetStats)
+        self.metrics_registry.Register(self.translator.GetStats)
+        self.metrics_registry.Register(self.retry_handler.GetStats)
+        self.metrics_registry.Register(self.message_sender.rate_limiter.GetStats)
+        self.metrics_registry.Register(self.message_sender.GetStats)
+        self.metrics_registry.Register(self.message_deleter.GetStats)
+        self.metrics_registry.Register(self.admins_cache.GetStats)
+        self.metrics_registry.Register(self.cmd_router.GetStats)
+        self.metrics_registry.Register(self.cmd_dispatcher.GetStats)
+
+    async def __StartMetricsServer(self) -> None:
+        """Start the metrics server, if enabled."""
+        if self.metrics_server is not None:
+            await self.metrics_server.Start()
+
+    async def __StopMetricsServer(self) -> None:
+        """Stop the metrics server, if enabled."""
+        if self.metrics_server is not None:
+            await self.metrics_server.Stop()
+
+    def __SetShardConfig(self,
+                         shard_info: ShardInfo) -> None:
+        """
+        Adapt the configuration to the shard, so that shards don't share files and the global rate limit.
+
+        Args:
+            shard_info: Information about the shard run by the bot.
+        """
+        shards_num = shard_info.ShardsNum()
+
+        self.config.SetValue(BotConfigTypes.SESSION_NAME,
+                             shard_info.AddSuffix(self.config.GetValue(BotConfigTypes.SESSION_NAME)))
+        if self.config.IsValueSet(BotConfigTypes.LOG_FILE_NAME):
+            self.config.SetValue(BotConfigTypes.LOG_FILE_NAME,
+                                 shard_info.AddSuffix(self.config.GetValue(BotConfigTypes.LOG_FILE_NAME)))
+        # The front process listens on the configured port, shards on the following ones
+        if self.config.GetValue(BotConfigTypes.METRICS_ENABLED):
+            self.config.SetValue(BotConfigTypes.METRICS_PORT,
+                                 self.config.GetValue(BotConfigTypes.METRICS_PORT) + shard_info.Index() + 1)
+        self.config.SetValue(BotConfigTypes.MESSAGE_RATE_GLOBAL_PER_SEC,
+                             self.config.GetValue(BotConfigTypes.MESSAGE_RATE_GLOBAL_PER_SEC) / shards_num)
+        self.config.SetValue(BotConfigTypes.MESSAGE_RATE_GLOBAL_BURST,
+                             max(1, self.config.GetValue(BotConfigTypes.MESSAGE_RATE_GLOBAL_BURST) // shards_num))
@@ -22,6 +22,9 @@ import logging
 
 from telegram_periodic_msg_bot.bot.bot_config_types import BotConfigTypes
 from telegram_periodic_msg_bot.config.config_typing import ConfigSectionsType
+from telegram_periodic_msg_bot.logger.logger import LoggerMsgBodyModes
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_engine import PeriodicMsgMisfirePolicies
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_spreader import PeriodicMsgSpreadModes
 from telegram_periodic_msg_bot.utils.key_value_converter import KeyValueConverter
 from telegram_periodic_msg_bot.utils.utils import Utils
 
@@ -34,6 +37,24 @@ LoggingLevelConverter = KeyValueConverter({
     "CRITICAL": logging.CRITICAL,
 })
 
+SpreadModeConverter = KeyValueConverter({
+    "none": PeriodicMsgSpreadModes.NONE,
+    "hash": PeriodicMsgSpreadModes.HASH,
+    "balanced": PeriodicMsgSpreadModes.BALANCED,
+})
+
+MisfirePolicyConverter = KeyValueConverter({
+    "skip": PeriodicMsgMisfirePolicies.SKIP,
+    "run_late": PeriodicMsgMisfirePolicies.RUN_LATE,
+    "coalesce": PeriodicMsgMisfirePolicies.COALESCE,
+})
+
+MsgBodyModeConverter = KeyValueConverter({
+    "full": LoggerMsgBodyModes.FULL,
+    "truncated": LoggerMsgBodyModes.TRUNCATED,
+    "hash": LoggerMsgBodyModes.HASH,
+})
+
 
 BotConfig: ConfigSectionsType = {
     # Pyrogram
@@ -67,6 +88,25 @@ BotConfig: ConfigSectionsType = {
             "name": "app_lang_file",
             "def_val": None,
         },
+        {
+            "type": BotConfigTypes.APP_LANG_FOLDER,
+            "name": "app_lang_folder",
+            "def_val": None,
+        },
+        {
+            "type": BotConfigTypes.APP_LANG_CACHE_SIZE,
+            "name": "app_lang_cache_size",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 4,
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.APP_ADMINS_CACHE_TTL_SEC,
+            "name": "app_admins_cache_ttl_sec",
+            "conv_fct": Utils.StrToFloat,
+            "def_val": 300.0,
+            "valid_if": lambda cfg, val: val >= 0,
+        },
     ],
     # Task
     "task": [
@@ -77,6 +117,88 @@ BotConfig: ConfigSectionsType = {
             "def_val": 20,
             "valid_if": lambda cfg, val: val > 0,
         },
+        {
+            "type": BotConfigTypes.TASKS_WORKERS_NUM,
+            "name": "tasks_workers_num",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 4,
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.TASKS_SPREAD_MODE,
+            "name": "tasks_spread_mode",
+            "conv_fct": SpreadModeConverter.KeyToValue,
+            "print_fct": SpreadModeConverter.ValueToKey,
+            "def_val": PeriodicMsgSpreadModes.NONE,
+        },
+        {
+            "type": BotConfigTypes.TASKS_MISFIRE_POLICY,
+            "name": "tasks_misfire_policy",
+            "conv_fct": MisfirePolicyConverter.KeyToValue,
+            "print_fct": MisfirePolicyConverter.ValueToKey,
+            "def_val": PeriodicMsgMisfirePolicies.COALESCE,
+        },
+        {
+            "type": BotConfigTypes.TASKS_MISFIRE_GRACE_SEC,
+            "name": "tasks_misfire_grace_sec",
+            "conv_fct": Utils.StrToFloat,
+            "def_val": 60.0,
+            "valid_if": lambda cfg, val: val >= 0,
+        },
+        {
+            "type": BotConfigTypes.TASKS_MSG_COMPRESS_MIN_BYTES,
+            "name": "tasks_msg_compress_min_bytes",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 0,
+            "valid_if": lambda cfg, val: val >= 0,
+        },
+        {
+            "type": BotConfigTypes.TASKS_DB_ENABLED,
+            "name": "tasks_db_enabled",
+            "conv_fct": Utils.StrToBool,
+            "def_val": False,
+        },
+        {
+            "type": BotConfigTypes.TASKS_DB_FILE_NAME,
+            "name": "tasks_db_file_name",
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.TASKS_DB_ENABLED),
+        },
+        {
+            "type": BotConfigTypes.TASKS_DB_FLUSH_INTERVAL_SEC,
+            "name": "tasks_db_flush_interval_sec",
+            "conv_fct": Utils.StrToFloat,
+            "def_val": 1.0,
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.TASKS_DB_ENABLED),
+            "valid_if": lambda cfg, val: val > 0,
+        },
+    ],
+    # HA
+    "ha": [
+        {
+            "type": BotConfigTypes.HA_ENABLED,
+            "name": "ha_enabled",
+            "conv_fct": Utils.StrToBool,
+            "def_val": False,
+            # The lease is stored in the tasks database
+            "valid_if": lambda cfg, val: not val or cfg.GetValue(BotConfigTypes.TASKS_DB_ENABLED),
+        },
+        {
+            "type": BotConfigTypes.HA_LEASE_TTL_SEC,
+            "name": "ha_lease_ttl_sec",
+            "conv_fct": Utils.StrToFloat,
+            "def_val": 10.0,
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.HA_ENABLED),
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.HA_LEASE_RENEW_SEC,
+            "name": "ha_lease_renew_sec",
+            "conv_fct": Utils.StrToFloat,
+            "def_val": 2.0,
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.HA_ENABLED),
+            # The leader steps down two renewals before the lease expires, so at least a renewal shall be possible
+            "valid_if": lambda cfg, val: 0 < val <= cfg.GetValue(BotConfigTypes.HA_LEASE_TTL_SEC) / 3,
+        },
     ],
     # Message
     "message": [
@@ -87,6 +209,85 @@ BotConfig: ConfigSectionsType = {
             "def_val": 4000,
             "valid_if": lambda cfg, val: val > 0,
         },
+        {
+            "type": BotConfigTypes.MESSAGE_RATE_GLOBAL_PER_SEC,
+            "name": "message_rate_global_per_sec",
+            "conv_fct": Utils.StrToFloat,
+            "def_val": 25.0,
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.MESSAGE_RATE_GLOBAL_BURST,
+            "name": "message_rate_global_burst",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 5,
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.MESSAGE_RATE_CHAT_PER_MIN,
+            "name": "message_rate_chat_per_min",
+            "conv_fct": Utils.StrToFloat,
+            "def_val": 15.0,
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.MESSAGE_RATE_CHAT_BURST,
+            "name": "message_rate_chat_burst",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 5,
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.MESSAGE_RETRY_MAX_NUM,
+            "name": "message_retry_max_num",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 3,
+            "valid_if": lambda cfg, val: val >= 0,
+        },
+        {
+            "type": BotConfigTypes.MESSAGE_RETRY_BACKOFF_BASE_SEC,
+            "name": "message_retry_backoff_base_sec",
+            "conv_fct": Utils.StrToFloat,
+            "def_val": 1.0,
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.MESSAGE_RETRY_BACKOFF_MAX_SEC,
+            "name": "message_retry_backoff_max_sec",
+            "conv_fct": Utils.StrToFloat,
+            "def_val": 60.0,
+            "valid_if": lambda cfg, val: val >= cfg.GetValue(BotConfigTypes.MESSAGE_RETRY_BACKOFF_BASE_SEC),
+        },
+        {
+            "type": BotConfigTypes.MESSAGE_FLOOD_WAIT_MAX_SEC,
+            "name": "message_flood_wait_max_sec",
+            "conv_fct": Utils.StrToFloat,
+            "def_val": 300.0,
+            "valid_if": lambda cfg, val: val >= 0,
+        },
+    ],
+    # Metrics
+    "metrics": [
+        {
+            "type": BotConfigTypes.METRICS_ENABLED,
+            "name": "metrics_enabled",
+            "conv_fct": Utils.StrToBool,
+            "def_val": False,
+        },
+        {
+            "type": BotConfigTypes.METRICS_HOST,
+            "name": "metrics_host",
+            "def_val": "127.0.0.1",
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.METRICS_ENABLED),
+        },
+        {
+            "type": BotConfigTypes.METRICS_PORT,
+            "name": "metrics_port",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 9400,
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.METRICS_ENABLED),
+            "valid_if": lambda cfg, val: 0 < val < 65536,
+        },
     ],
     # Logging
     "logging": [
@@ -141,5 +342,41 @@ BotConfig: ConfigSectionsType = {
             "load_if": lambda cfg: (cfg.GetValue(BotConfigTypes.LOG_FILE_ENABLED) and
                                     cfg.GetValue(BotConfigTypes.LOG_FILE_USE_ROTATING)),
         },
+        {
+            "type": BotConfigTypes.LOG_QUEUE_ENABLED,
+            "name": "log_queue_enabled",
+            "conv_fct": Utils.StrToBool,
+            "def_val": False,
+        },
+        {
+            "type": BotConfigTypes.LOG_QUEUE_SIZE,
+            "name": "log_queue_size",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 10000,
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.LOG_QUEUE_ENABLED),
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.LOG_MSG_BODY_MODE,
+            "name": "log_msg_body_mode",
+            "conv_fct": MsgBodyModeConverter.KeyToValue,
+            "print_fct": MsgBodyModeConverter.ValueToKey,
+            "def_val": LoggerMsgBodyModes.FULL,
+        },
+        {
+            "type": BotConfigTypes.LOG_MSG_BODY_MAX_LEN,
+            "name": "log_msg_body_max_len",
+            "conv_fct": Utils.StrToInt,
+            "def_val": 100,
+            "load_if": lambda cfg: cfg.GetValue(BotConfigTypes.LOG_MSG_BODY_MODE) == LoggerMsgBodyModes.TRUNCATED,
+            "valid_if": lambda cfg, val: val > 0,
+        },
+        {
+            "type": BotConfigTypes.LOG_RATE_LIMIT_SEC,
+            "name": "log_rate_limit_sec",
+            "conv_fct": Utils.StrToFloat,
+            "def_val": 0.0,
+            "valid_if": lambda cfg, val: val >= 0,
+        },
     ],
 }
@@ -34,10 +34,37 @@ class BotConfigTypes(ConfigTypes):
     # App
     APP_TEST_MODE = auto()
     APP_LANG_FILE = auto()
+    APP_LANG_FOLDER = auto()
+    APP_LANG_CACHE_SIZE = auto()
+    APP_ADMINS_CACHE_TTL_SEC = auto()
     # Task
     TASKS_MAX_NUM = auto()
+    TASKS_WORKERS_NUM = auto()
+    TASKS_SPREAD_MODE = auto()
+    TASKS_MISFIRE_POLICY = auto()
+    TASKS_MISFIRE_GRACE_SEC = auto()
+    TASKS_MSG_COMPRESS_MIN_BYTES = auto()
+    TASKS_DB_ENABLED = auto()
+    TASKS_DB_FILE_NAME = auto()
+    TASKS_DB_FLUSH_INTERVAL_SEC = auto()
+    # HA
+    HA_ENABLED = auto()
+    HA_LEASE_TTL_SEC = auto()
+    HA_LEASE_RENEW_SEC = auto()
     # Message
     MESSAGE_MAX_LEN = auto()
+    MESSAGE_RATE_GLOBAL_PER_SEC = auto()
+    MESSAGE_RATE_GLOBAL_BURST = auto()
+    MESSAGE_RATE_CHAT_PER_MIN = auto()
+    MESSAGE_RATE_CHAT_BURST = auto()
+    MESSAGE_RETRY_MAX_NUM = auto()
+    MESSAGE_RETRY_BACKOFF_BASE_SEC = auto()
+    MESSAGE_RETRY_BACKOFF_MAX_SEC = auto()
+    MESSAGE_FLOOD_WAIT_MAX_SEC = auto()
+    # Metrics
+    METRICS_ENABLED = auto()
+    METRICS_HOST = auto()
+    METRICS_PORT = auto()
     # Logging
     LOG_LEVEL = auto()
     LOG_CONSOLE_ENABLED = auto()
@@ -47,3 +74,8 @@ class BotConfigTypes(ConfigTypes):
     LOG_FILE_APPEND = auto()
     LOG_FILE_MAX_BYTES = auto()
     LOG_FILE_BACKUP_CNT = auto()
+    LOG_QUEUE_ENABLED = auto()
+    LOG_QUEUE_SIZE = auto()
+    LOG_MSG_BODY_MODE = auto()
+    LOG_MSG_BODY_MAX_LEN = auto()
+    LOG_RATE_LIMIT_SEC = auto()
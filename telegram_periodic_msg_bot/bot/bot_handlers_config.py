@@ -19,114 +19,127 @@
 # THE SOFTWARE.
 
 from pyrogram import filters
-from pyrogram.handlers import MessageHandler
+from pyrogram.handlers import ChatMemberUpdatedHandler, MessageHandler
 
-from telegram_periodic_msg_bot.bot.bot_handlers_config_typing import BotHandlersConfigType
+from telegram_periodic_msg_bot.bot.bot_handlers_config_typing import BotCommandsConfigType, BotHandlersConfigType
 from telegram_periodic_msg_bot.command.command_dispatcher import CommandTypes
 from telegram_periodic_msg_bot.message.message_dispatcher import MessageTypes
 
 
+BotCommandsConfig: BotCommandsConfigType = {
+    "start": {
+        "callback": lambda self, client, message: self.DispatchCommand(client,
+                                                                       message,
+                                                                       CommandTypes.START_CMD),
+        "filters": filters.private,
+    },
+    "help": {
+        "callback": lambda self, client, message: self.DispatchCommand(client,
+                                                                       message,
+                                                                       CommandTypes.HELP_CMD),
+    },
+    "alive": {
+        "callback": lambda self, client, message: self.DispatchCommand(client,
+                                                                       message,
+                                                                       CommandTypes.ALIVE_CMD),
+    },
+    "msgbot_set_test_mode": {
+        "callback": lambda self, client, message: self.DispatchCommand(client,
+                                                                       message,
+                                                                       CommandTypes.SET_TEST_MODE_CMD),
+    },
+    "msgbot_is_test_mode": {
+        "callback": lambda self, client, message: self.DispatchCommand(client,
+                                                                       message,
+                                                                       CommandTypes.IS_TEST_MODE_CMD),
+    },
+    "msgbot_version": {
+        "callback": lambda self, client, message: self.DispatchCommand(client,
+                                                                       message,
+                                                                       CommandTypes.VERSION_CMD),
+    },
+    "msgbot_set_lang": {
+        "callback": (lambda self, client, message: self.DispatchCommand(client,
+                                                                        message,
+                                                                        CommandTypes.SET_LANG_CMD,
+                                                                        periodic_msg_scheduler=self.periodic_msg_scheduler)),
+    },
+    "msgbot_get_lang": {
+        "callback": lambda self, client, message: self.DispatchCommand(client,
+                                                                       message,
+                                                                       CommandTypes.GET_LANG_CMD),
+    },
+    "msgbot_task_start": {
+        "callback": (lambda self, client, message: self.DispatchCommand(client,
+                                                                        message,
+                                                                        CommandTypes.MESSAGE_TASK_START_CMD,
+                                                                        periodic_msg_scheduler=self.periodic_msg_scheduler)),
+    },
+    "msgbot_task_stop": {
+        "callback": (lambda self, client, message: self.DispatchCommand(client,
+                                                                        message,
+                                                                        CommandTypes.MESSAGE_TASK_STOP_CMD,
+                                                                        periodic_msg_scheduler=self.periodic_msg_scheduler)),
+    },
+    "msgbot_task_stop_all": {
+        "callback": (lambda self, client, message: self.DispatchCommand(client,
+                                                                        message,
+                                                                        CommandTypes.MESSAGE_TASK_STOP_ALL_CMD,
+                                                                        periodic_msg_scheduler=self.periodic_msg_scheduler)),
+    },
+    "msgbot_task_stop_all_topic": {
+        "callback": (lambda self, client, message: self.DispatchCommand(client,
+                                                                        message,
+                                                                        CommandTypes.MESSAGE_TASK_STOP_ALL_TOPIC_CMD,
+                                                                        periodic_msg_scheduler=self.periodic_msg_scheduler)),
+    },
+    "msgbot_task_pause": {
+        "callback": (lambda self, client, message: self.DispatchCommand(client,
+                                                                        message,
+                                                                        CommandTypes.MESSAGE_TASK_PAUSE_CMD,
+                                                                        periodic_msg_scheduler=self.periodic_msg_scheduler)),
+    },
+    "msgbot_task_resume": {
+        "callback": (lambda self, client, message: self.DispatchCommand(client,
+                                                                        message,
+                                                                        CommandTypes.MESSAGE_TASK_RESUME_CMD,
+                                                                        periodic_msg_scheduler=self.periodic_msg_scheduler)),
+    },
+    "msgbot_task_get": {
+        "callback": (lambda self, client, message: self.DispatchCommand(client,
+                                                                        message,
+                                                                        CommandTypes.MESSAGE_TASK_GET_CMD,
+                                                                        periodic_msg_scheduler=self.periodic_msg_scheduler)),
+    },
+    "msgbot_task_set": {
+        "callback": (lambda self, client, message: self.DispatchCommand(client,
+                                                                        message,
+                                                                        CommandTypes.MESSAGE_TASK_SET_CMD,
+                                                                        periodic_msg_scheduler=self.periodic_msg_scheduler)),
+    },
+    "msgbot_task_delete_last_msg": {
+        "callback": (lambda self, client, message: self.DispatchCommand(client,
+                                                                        message,
+                                                                        CommandTypes.MESSAGE_TASK_DELETE_LAST_MSG_CMD,
+                                                                        periodic_msg_scheduler=self.periodic_msg_scheduler)),
+    },
+    "msgbot_task_misfire_policy": {
+        "callback": (lambda self, client, message: self.DispatchCommand(client,
+                                                                        message,
+                                                                        CommandTypes.MESSAGE_TASK_MISFIRE_POLICY_CMD,
+                                                                        periodic_msg_scheduler=self.periodic_msg_scheduler)),
+    },
+    "msgbot_task_info": {
+        "callback": (lambda self, client, message: self.DispatchCommand(client,
+                                                                        message,
+                                                                        CommandTypes.MESSAGE_TASK_INFO_CMD,
+                                                                        periodic_msg_scheduler=self.periodic_msg_scheduler)),
+    },
+}
+
+
 BotHandlersConfig: BotHandlersConfigType = {
     MessageHandler: [
-        {
-            "callback": lambda self, client, message: self.DispatchCommand(client,
-                                                                           message,
-                                                                           CommandTypes.START_CMD),
-            "filters": filters.private & filters.command(["start"]),
-        },
-        {
-            "callback": lambda self, client, message: self.DispatchCommand(client,
-                                                                           message,
-                                                                           CommandTypes.HELP_CMD),
-            "filters": filters.command(["help"]),
-        },
-        {
-            "callback": lambda self, client, message: self.DispatchCommand(client,
-                                                                           message,
-                                                                           CommandTypes.ALIVE_CMD),
-            "filters": filters.command(["alive"]),
-        },
-        {
-            "callback": lambda self, client, message: self.DispatchCommand(client,
-                                                                           message,
-                                                                           CommandTypes.SET_TEST_MODE_CMD),
-            "filters": filters.command(["msgbot_set_test_mode"]),
-        },
-        {
-            "callback": lambda self, client, message: self.DispatchCommand(client,
-                                                                           message,
-                                                                           CommandTypes.IS_TEST_MODE_CMD),
-            "filters": filters.command(["msgbot_is_test_mode"]),
-        },
-        {
-            "callback": lambda self, client, message: self.DispatchCommand(client,
-                                                                           message,
-                                                                           CommandTypes.VERSION_CMD),
-            "filters": filters.command(["msgbot_version"]),
-        },
-        {
-            "callback": (lambda self, client, message: self.DispatchCommand(client,
-                                                                            message,
-                                                                            CommandTypes.MESSAGE_TASK_START_CMD,
-                                                                            periodic_msg_scheduler=self.periodic_msg_scheduler)),
-            "filters": filters.command(["msgbot_task_start"]),
-        },
-        {
-            "callback": (lambda self, client, message: self.DispatchCommand(client,
-                                                                            message,
-                                                                            CommandTypes.MESSAGE_TASK_STOP_CMD,
-                                                                            periodic_msg_scheduler=self.periodic_msg_scheduler)),
-            "filters": filters.command(["msgbot_task_stop"]),
-        },
-        {
-            "callback": (lambda self, client, message: self.DispatchCommand(client,
-                                                                            message,
-                                                                            CommandTypes.MESSAGE_TASK_STOP_ALL_CMD,
-                                                                            periodic_msg_scheduler=self.periodic_msg_scheduler)),
-            "filters": filters.command(["msgbot_task_stop_all"]),
-        },
-        {
-            "callback": (lambda self, client, message: self.DispatchCommand(client,
-                                                                            message,
-                                                                            CommandTypes.MESSAGE_TASK_PAUSE_CMD,
-                                                                            periodic_msg_scheduler=self.periodic_msg_scheduler)),
-            "filters": filters.command(["msgbot_task_pause"]),
-        },
-        {
-            "callback": (lambda self, client, message: self.DispatchCommand(client,
-                                                                            message,
-                                                                            CommandTypes.MESSAGE_TASK_RESUME_CMD,
-                                                                            periodic_msg_scheduler=self.periodic_msg_scheduler)),
-            "filters": filters.command(["msgbot_task_resume"]),
-        },
-        {
-            "callback": (lambda self, client, message: self.DispatchCommand(client,
-                                                                            message,
-                                                                            CommandTypes.MESSAGE_TASK_GET_CMD,
-                                                                            periodic_msg_scheduler=self.periodic_msg_scheduler)),
-            "filters": filters.command(["msgbot_task_get"]),
-        },
-        {
-            "callback": (lambda self, client, message: self.DispatchCommand(client,
-                                                                            message,
-                                                                            CommandTypes.MESSAGE_TASK_SET_CMD,
-                                                                            periodic_msg_scheduler=self.periodic_msg_scheduler)),
-            "filters": filters.command(["msgbot_task_set"]),
-        },
-        {
-            "callback": (lambda self, client, message: self.DispatchCommand(client,
-                                                                            message,
-                                                                            CommandTypes.MESSAGE_TASK_DELETE_LAST_MSG_CMD,
-                                                                            periodic_msg_scheduler=self.periodic_msg_scheduler)),
-            "filters": filters.command(["msgbot_task_delete_last_msg"]),
-        },
-        {
-            "callback": (lambda self, client, message: self.DispatchCommand(client,
-                                                                            message,
-                                                                            CommandTypes.MESSAGE_TASK_INFO_CMD,
-                                                                            periodic_msg_scheduler=self.periodic_msg_scheduler)),
-            "filters": filters.command(["msgbot_task_info"]),
-        },
         {
             "callback": (lambda self, client, message: self.HandleMessage(client,
                                                                           message,
@@ -147,4 +160,10 @@ BotHandlersConfig: BotHandlersConfigType = {
             "filters": filters.left_chat_member,
         },
     ],
+    ChatMemberUpdatedHandler: [
+        {
+            "callback": lambda self, client, update: self.HandleChatMemberUpdated(client, update),
+            "filters": filters.group,
+        },
+    ],
 }
@@ -33,3 +33,11 @@ BotHandlersConfigType = Dict[
         ]
     ],
 ]
+
+BotCommandsConfigType = Dict[
+    str,
+    Dict[
+        str,
+        Optional[Union[Callable[..., None], Filter]],
+    ],
+]
@@ -28,9 +28,9 @@ from telegram_periodic_msg_bot.command.command_data import CommandData
 from telegram_periodic_msg_bot.config.config_object import ConfigObject
 from telegram_periodic_msg_bot.logger.logger import Logger
 from telegram_periodic_msg_bot.message.message_sender import MessageSender
-from telegram_periodic_msg_bot.misc.chat_members import ChatMembersGetter
+from telegram_periodic_msg_bot.misc.chat_admins_cache import ChatAdminsCache
 from telegram_periodic_msg_bot.misc.helpers import ChatHelper, UserHelper
-from telegram_periodic_msg_bot.translator.translation_loader import TranslationLoader
+from telegram_periodic_msg_bot.translator.translation_packs import TranslationPacks
 
 
 class CommandBase(ABC):
@@ -39,35 +39,37 @@ class CommandBase(ABC):
 
     This abstract class provides common functionality for command execution,
     authorization, and message sending.
+    Commands are stateless (all data of a command execution is passed as a CommandData object),
+    so that the same instance can execute more commands concurrently.
     """
 
-    client: pyrogram.Client
     config: ConfigObject
     logger: Logger
-    translator: TranslationLoader
-    message: pyrogram.types.Message
-    cmd_data: CommandData
+    translator: TranslationPacks
     message_sender: MessageSender
+    admins_cache: ChatAdminsCache
 
     def __init__(self,
-                 client: pyrogram.Client,
                  config: ConfigObject,
                  logger: Logger,
-                 translator: TranslationLoader) -> None:
+                 translator: TranslationPacks,
+                 message_sender: MessageSender,
+                 admins_cache: ChatAdminsCache) -> None:
         """
         Initialize the command.
 
         Args:
-            client: Pyrogram client instance.
             config: Configuration object.
             logger: Logger instance.
-            translator: Translation loader instance.
+            translator: Translations of the chats.
+            message_sender: Shared message sender.
+            admins_cache: Shared cache of the chat administrators.
         """
-        self.client = client
         self.config = config
         self.logger = logger
         self.translator = translator
-        self.message_sender = MessageSender(client, logger)
+        self.message_sender = message_sender
+        self.admins_cache = admins_cache
 
     async def Execute(self,
                       message: pyrogram.types.Message,
@@ -79,104 +81,146 @@ class CommandBase(ABC):
             message: Message containing the command.
             **kwargs: Additional arguments to pass to the command implementation.
         """
-        self.message = message
-        self.cmd_data = CommandData(message)
+        cmd_data = CommandData(message)
 
-        self.__LogCommand()
+        self.__LogCommand(cmd_data)
 
 
-        if self._IsUserAnonymous() and not self._IsChannel():
+        if self._IsUserAnonymous(cmd_data) and not self._IsChannel(cmd_data):
             self.logger.GetLogger().warning("An anonymous user tried to execute the command, exiting")
             return
 
-        if not await self._IsUserAuthorized():
-            if self._IsPrivateChat():
-                await self._SendMessage(self.translator.GetSentence("AUTH_ONLY_ERR_MSG"))
+        if not await self._IsUserAuthorized(cmd_data):
+            if self._IsPrivateChat(cmd_data):
+                await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "AUTH_ONLY_ERR_MSG"))
 
             self.logger.GetLogger().warning(
-                f"User {UserHelper.GetNameOrId(self.cmd_data.User())} tried to execute the command but it's not authorized",
+                f"User {UserHelper.GetNameOrId(cmd_data.User())} tried to execute the command but it's not authorized",
             )
             return
 
         try:
-            await self._ExecuteCommand(**kwargs)
+            await self._ExecuteCommand(cmd_data, **kwargs)
         except RPCError:
-            await self._SendMessage(self.translator.GetSentence("GENERIC_ERR_MSG"))
+            await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "GENERIC_ERR_MSG"))
             self.logger.GetLogger().exception(
-                f"An error occurred while executing command {self.cmd_data.Name()}",
+                f"An error occurred while executing command {cmd_data.Name()}",
             )
 
+    def _GetSentence(self,
+                     cmd_data: CommandData,
+                     sentence_id: str,
+                     **kwargs: Any) -> str:
+        """
+        Get a sentence translated in the language of the chat.
+
+        Args:
+            cmd_data: Command data.
+            sentence_id: Sentence ID.
+            **kwargs: Keyword arguments for sentence formatting.
+
+        Returns:
+            Translated sentence.
+        """
+        return self.translator.ForChat(cmd_data.Chat().id).GetSentence(sentence_id, **kwargs)
+
     async def _SendMessage(self,
+                           cmd_data: CommandData,
                            msg: str) -> None:
         """
         Send a message to the chat.
 
         Args:
+            cmd_data: Command data.
             msg: Message text to send.
         """
-        await self.message_sender.SendMessage(self.cmd_data.Chat(), self.message.message_thread_id, msg)
+        await self.message_sender.SendMessage(cmd_data.Chat(), cmd_data.Message().message_thread_id, msg)
 
-    def _IsChannel(self) -> bool:
+    def _IsChannel(self,
+                   cmd_data: CommandData) -> bool:
         """
         Check if the chat is a channel.
 
+        Args:
+            cmd_data: Command data.
+
         Returns:
             True if the chat is a channel, False otherwise.
         """
-        return ChatHelper.IsChannel(self.cmd_data.Chat())
+        return ChatHelper.IsChannel(cmd_data.Chat())
 
-    def _IsUserAnonymous(self) -> bool:
+    def _IsUserAnonymous(self,
+                         cmd_data: CommandData) -> bool:
         """
         Check if the user is anonymous.
 
+        Args:
+            cmd_data: Command data.
+
         Returns:
             True if the user is anonymous, False otherwise.
         """
-        return self.cmd_data.User() is None
+        return cmd_data.User() is None
 
-    async def _IsUserAuthorized(self) -> bool:
+    async def _IsUserAuthorized(self,
+                                cmd_data: CommandData) -> bool:
         """
         Check if the user is authorized to execute the command.
 
+        Args:
+            cmd_data: Command data.
+
         Returns:
             True if the user is authorized, False otherwise.
         """
-        if self._IsChannel():
+        if self._IsChannel(cmd_data):
             return True
 
-        cmd_user = self.cmd_data.User()
+        cmd_user = cmd_data.User()
         if cmd_user is None:
             return False
-        if ChatHelper.IsPrivateChat(self.cmd_data.Chat(), cmd_user):
+        if ChatHelper.IsPrivateChat(cmd_data.Chat(), cmd_user):
             return True
-        admin_members = await ChatMembersGetter(self.client).GetAdmins(self.cmd_data.Chat())
-        return any(cmd_user.id == member.user.id for member in admin_members if member.user is not None)
+        return await self.admins_cache.IsAdmin(cmd_data.Chat().id, cmd_user.id)
 
-    def _IsPrivateChat(self) -> bool:
+    def _IsPrivateChat(self,
+                       cmd_data: CommandData) -> bool:
         """
         Check if the chat is a private chat.
 
+        Args:
+            cmd_data: Command data.
+
         Returns:
             True if the chat is private, False otherwise.
         """
-        cmd_user = self.cmd_data.User()
+        cmd_user = cmd_data.User()
         if cmd_user is None:
             return False
-        return ChatHelper.IsPrivateChat(self.cmd_data.Chat(), cmd_user)
+        return ChatHelper.IsPrivateChat(cmd_data.Chat(), cmd_user)
 
-    def __LogCommand(self) -> None:
-        """Log command execution details."""
-        self.logger.GetLogger().info(f"Command: {self.cmd_data.Name()}")
-        self.logger.GetLogger().info(f"Executed by user: {UserHelper.GetNameOrId(self.cmd_data.User())}")
-        self.logger.GetLogger().debug(f"Received message: {self.message}")
+    def __LogCommand(self,
+                     cmd_data: CommandData) -> None:
+        """
+        Log command execution details.
+
+        Args:
+            cmd_data: Command data.
+        """
+        self.logger.GetLogger().info(f"Command: {cmd_data.Name()}")
+        self.logger.GetLogger().info(f"Executed by user: {UserHelper.GetNameOrId(cmd_data.User())}")
+        # The message is converted to string only if debug is enabled
+        self.logger.GetLogger().debug("Received message: %s", cmd_data.Message())
 
     @abstractmethod
     async def _ExecuteCommand(self,
+                              cmd_data: CommandData,
                               **kwargs: Any) -> None:
         """
         Execute the command implementation.
 
         Args:
+            cmd_data: Command data.
             **kwargs: Additional arguments for the command.
 
         Note:
@@ -145,6 +145,7 @@ class CommandParametersList(WrappedList):
 class CommandData:
     """Data extracted from a command message."""
 
+    cmd_message: pyrogram.types.Message
     cmd_name: str
     cmd_params: CommandParametersList
     cmd_chat: pyrogram.types.Chat
@@ -164,12 +165,22 @@ class CommandData:
         if message.command is None or message.chat is None:
             raise ValueError("Invalid command")
 
+        self.cmd_message = message
         self.cmd_name = message.command[0]
         self.cmd_params = CommandParametersList()
         self.cmd_params.AddMultiple(message.command[1:])
         self.cmd_chat = message.chat
         self.cmd_user = message.from_user
 
+    def Message(self) -> pyrogram.types.Message:
+        """
+        Get the message containing the command.
+
+        Returns:
+            Message object.
+        """
+        return self.cmd_message
+
     def Name(self) -> str:
         """
         Get the command name.
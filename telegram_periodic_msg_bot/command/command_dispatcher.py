@@ -18,6 +18,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import time
 from enum import Enum, auto, unique
 from typing import Any, Dict, Type
 
@@ -26,23 +27,30 @@ import pyrogram
 from telegram_periodic_msg_bot.command.command_base import CommandBase
 from telegram_periodic_msg_bot.command.commands import (
     AliveCmd,
+    GetLangCmd,
     HelpCmd,
     IsTestModeCmd,
     MessageTaskDeleteLastMsgCmd,
     MessageTaskGetCmd,
     MessageTaskInfoCmd,
+    MessageTaskMisfirePolicyCmd,
     MessageTaskPauseCmd,
     MessageTaskResumeCmd,
     MessageTaskSetCmd,
     MessageTaskStartCmd,
     MessageTaskStopAllCmd,
+    MessageTaskStopAllTopicCmd,
     MessageTaskStopCmd,
+    SetLangCmd,
     SetTestModeCmd,
     VersionCmd,
 )
 from telegram_periodic_msg_bot.config.config_object import ConfigObject
 from telegram_periodic_msg_bot.logger.logger import Logger
-from telegram_periodic_msg_bot.translator.translation_loader import TranslationLoader
+from telegram_periodic_msg_bot.message.message_sender import MessageSender
+from telegram_periodic_msg_bot.metrics.metrics import MetricCounterFamily, MetricHistogram, MetricsConst
+from telegram_periodic_msg_bot.misc.chat_admins_cache import ChatAdminsCache
+from telegram_periodic_msg_bot.translator.translation_packs import TranslationPacks
 
 
 @unique
@@ -54,14 +62,18 @@ class CommandTypes(Enum):
     SET_TEST_MODE_CMD = auto()
     IS_TEST_MODE_CMD = auto()
     VERSION_CMD = auto()
+    SET_LANG_CMD = auto()
+    GET_LANG_CMD = auto()
     MESSAGE_TASK_START_CMD = auto()
     MESSAGE_TASK_STOP_CMD = auto()
     MESSAGE_TASK_STOP_ALL_CMD = auto()
+    MESSAGE_TASK_STOP_ALL_TOPIC_CMD = auto()
     MESSAGE_TASK_PAUSE_CMD = auto()
     MESSAGE_TASK_RESUME_CMD = auto()
     MESSAGE_TASK_GET_CMD = auto()
     MESSAGE_TASK_SET_CMD = auto()
     MESSAGE_TASK_DELETE_LAST_MSG_CMD = auto()
+    MESSAGE_TASK_MISFIRE_POLICY_CMD = auto()
     MESSAGE_TASK_INFO_CMD = auto()
 
 
@@ -75,43 +87,80 @@ class CommandDispatcherConst:
         CommandTypes.SET_TEST_MODE_CMD: SetTestModeCmd,
         CommandTypes.IS_TEST_MODE_CMD: IsTestModeCmd,
         CommandTypes.VERSION_CMD: VersionCmd,
+        CommandTypes.SET_LANG_CMD: SetLangCmd,
+        CommandTypes.GET_LANG_CMD: GetLangCmd,
         CommandTypes.MESSAGE_TASK_START_CMD: MessageTaskStartCmd,
         CommandTypes.MESSAGE_TASK_STOP_CMD: MessageTaskStopCmd,
         CommandTypes.MESSAGE_TASK_STOP_ALL_CMD: MessageTaskStopAllCmd,
+        CommandTypes.MESSAGE_TASK_STOP_ALL_TOPIC_CMD: MessageTaskStopAllTopicCmd,
         CommandTypes.MESSAGE_TASK_PAUSE_CMD: MessageTaskPauseCmd,
         CommandTypes.MESSAGE_TASK_RESUME_CMD: MessageTaskResumeCmd,
         CommandTypes.MESSAGE_TASK_GET_CMD: MessageTaskGetCmd,
         CommandTypes.MESSAGE_TASK_SET_CMD: MessageTaskSetCmd,
         CommandTypes.MESSAGE_TASK_DELETE_LAST_MSG_CMD: MessageTaskDeleteLastMsgCmd,
+        CommandTypes.MESSAGE_TASK_MISFIRE_POLICY_CMD: MessageTaskMisfirePolicyCmd,
         CommandTypes.MESSAGE_TASK_INFO_CMD: MessageTaskInfoCmd,
     }
 
 
+class CommandDispatcherStats:
+    """Statistics of the command dispatcher."""
+
+    executed_num: MetricCounterFamily
+    exec_time: MetricHistogram
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.executed_num = MetricCounterFamily("commands_executed_total", "Number of commands executed", "command")
+        self.exec_time = MetricHistogram("command_seconds",
+                                         "Time to execute a command, replies included",
+                                         MetricsConst.SLOW_OP_TIME_BUCKETS)
+
+
 class CommandDispatcher:
-    """Dispatcher for routing commands to their respective handlers."""
+    """
+    Dispatcher for routing commands to their respective handlers.
+
+    Commands are stateless, so each of them is created once and reused for all the messages.
+    """
 
-    config: ConfigObject
     logger: Logger
-    translator: TranslationLoader
+    commands: Dict[CommandTypes, CommandBase]
+    stats: CommandDispatcherStats
 
     def __init__(self,
                  config: ConfigObject,
                  logger: Logger,
-                 translator: TranslationLoader) -> None:
+                 translator: TranslationPacks,
+                 message_sender: MessageSender,
+                 admins_cache: ChatAdminsCache) -> None:
         """
         Initialize the command dispatcher.
 
         Args:
             config: Configuration object
             logger: Logger instance
-            translator: Translation loader instance
+            translator: Translations of the chats
+            message_sender: Shared message sender
+            admins_cache: Shared cache of the chat administrators
         """
-        self.config = config
         self.logger = logger
-        self.translator = translator
+        self.commands = {
+            cmd_type: cmd_class(config, logger, translator, message_sender, admins_cache)
+            for cmd_type, cmd_class in CommandDispatcherConst.CMD_TYPE_TO_CLASS.items()
+        }
+        self.stats = CommandDispatcherStats()
+
+    def GetStats(self) -> CommandDispatcherStats:
+        """
+        Get the dispatcher statistics.
+
+        Returns:
+            Dispatcher statistics.
+        """
+        return self.stats
 
     async def Dispatch(self,
-                       client: pyrogram.Client,
                        message: pyrogram.types.Message,
                        cmd_type: CommandTypes,
                        **kwargs: Any) -> None:
@@ -119,7 +168,6 @@ class CommandDispatcher:
         Dispatch a command to its handler.
 
         Args:
-            client: Pyrogram client instance
             message: Message containing the command
             cmd_type: Type of command to dispatch
             **kwargs: Additional arguments to pass to the command handler
@@ -132,11 +180,13 @@ class CommandDispatcher:
 
         self.logger.GetLogger().info(f"Dispatching command type: {cmd_type}")
 
-        if cmd_type in CommandDispatcherConst.CMD_TYPE_TO_CLASS:
-            cmd_class = CommandDispatcherConst.CMD_TYPE_TO_CLASS[cmd_type](
-                client,
-                self.config,
-                self.logger,
-                self.translator,
-            )
-            await cmd_class.Execute(message, **kwargs)
+        cmd = self.commands.get(cmd_type)
+        if cmd is None:
+            return
+
+        start_time = time.perf_counter()
+        try:
+            await cmd.Execute(message, **kwargs)
+        finally:
+            self.stats.exec_time.Observe(time.perf_counter() - start_time)
+            self.stats.executed_num.Inc(cmd_type.name.lower())
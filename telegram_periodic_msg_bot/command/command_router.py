@@ -0,0 +1,214 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import re
+from typing import Callable, List, Optional, Pattern
+
+import pyrogram
+from pyrogram.filters import Filter
+
+from telegram_periodic_msg_bot.bot.bot_handlers_config_typing import BotCommandsConfigType
+from telegram_periodic_msg_bot.metrics.metrics import MetricCounter, MetricCounterFamily
+
+
+class CommandRouterConst:
+    """Constants for command router."""
+
+    CMD_PREFIX: str = "/"
+    CMD_MENTION_SEP: str = "@"
+    # Same parameters parsing of pyrogram command filter: quoted strings or whitespace-separated words
+    PARAMS_REGEX: Pattern[str] = re.compile(r"([\"'])(.*?)(?<!\\)\1|(\S+)")
+    ESCAPED_QUOTE_REGEX: Pattern[str] = re.compile(r"\\([\"'])")
+
+
+class CommandRouterStats:
+    """Statistics of the command router."""
+
+    routed_num: MetricCounterFamily
+    ignored_num: MetricCounter
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.routed_num = MetricCounterFamily("commands_routed_total", "Number of commands routed", "command")
+        self.ignored_num = MetricCounter("commands_ignored_total",
+                                         "Number of messages ignored because not a known command")
+
+
+class CommandRouterFilter(Filter):
+    """Filter matching the messages routed by a command router."""
+
+    router: "CommandRouter"
+
+    def __init__(self,
+                 router: "CommandRouter") -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            router: Command router.
+        """
+        self.router = router
+
+    async def __call__(self,
+                       client: pyrogram.Client,
+                       update: pyrogram.types.Message) -> bool:
+        """
+        Check if the message is a command known by the router.
+
+        Args:
+            client: Pyrogram client instance.
+            update: Message to check.
+
+        Returns:
+            True if the message is a known command, False otherwise.
+        """
+        return await self.router.Match(client, update)
+
+
+class CommandRouter:
+    """
+    Router of the commands, replacing a handler with a command filter for each command.
+
+    Messages not starting with the command prefix are rejected without any parsing, the others are parsed once
+    and looked up by command name. As for the pyrogram command filter, the command name and parameters
+    are stored in the command field of the message.
+    """
+
+    commands: BotCommandsConfigType
+    stats: CommandRouterStats
+
+    def __init__(self,
+                 commands_config: BotCommandsConfigType) -> None:
+        """
+        Initialize the router.
+
+        Args:
+            commands_config: Commands configuration, mapping each command name to its callback and optional filters.
+        """
+        self.commands = {cmd_name.lower(): cmd_cfg for cmd_name, cmd_cfg in commands_config.items()}
+        self.stats = CommandRouterStats()
+
+    def GetStats(self) -> CommandRouterStats:
+        """
+        Get the statistics of the router.
+
+        Returns:
+            Router statistics.
+        """
+        return self.stats
+
+    def GetFilter(self) -> Filter:
+        """
+        Get the filter matching the messages routed by the router.
+
+        Returns:
+            Filter.
+        """
+        return CommandRouterFilter(self)
+
+    async def Match(self,
+                    client: pyrogram.Client,
+                    message: pyrogram.types.Message) -> bool:
+        """
+        Check if a message is a known command and, if so, parse it.
+
+        Args:
+            client: Pyrogram client instance.
+            message: Message to check.
+
+        Returns:
+            True if the message is a known command, False otherwise.
+        """
+        text = message.text or message.caption
+        if not text or not text.startswith(CommandRouterConst.CMD_PREFIX):
+            self.stats.ignored_num.Inc()
+            return False
+
+        cmd_and_params = text[len(CommandRouterConst.CMD_PREFIX):].split(maxsplit=1)
+        cmd_name = self.__GetCommandName(client, cmd_and_params[0]) if len(cmd_and_params) > 0 else None
+        cmd_cfg = self.commands.get(cmd_name) if cmd_name is not None else None
+        if cmd_name is None or cmd_cfg is None:
+            self.stats.ignored_num.Inc()
+            return False
+
+        cmd_filters = cmd_cfg.get("filters")
+        if isinstance(cmd_filters, Filter) and not await cmd_filters(client, message):
+            self.stats.ignored_num.Inc()
+            return False
+
+        message.command = [cmd_name] + self.__ParseParams(cmd_and_params[1] if len(cmd_and_params) > 1 else "")
+        return True
+
+    def GetCallback(self,
+                    message: pyrogram.types.Message) -> Callable[..., None]:
+        """
+        Get the callback of a command matched by the router.
+
+        Args:
+            message: Message matched by the router.
+
+        Returns:
+            Command callback.
+        """
+        assert message.command is not None
+
+        cmd_name = message.command[0]
+        callback = self.commands[cmd_name]["callback"]
+        assert callable(callback)
+
+        self.stats.routed_num.Inc(cmd_name)
+        return callback
+
+    @staticmethod
+    def __GetCommandName(client: pyrogram.Client,
+                         cmd: str) -> Optional[str]:
+        """
+        Get the command name, removing the bot mention if any.
+
+        Args:
+            client: Pyrogram client instance.
+            cmd: Command, without prefix.
+
+        Returns:
+            Command name in lower case, None if the command mentions another bot.
+        """
+        cmd_name, sep, mention = cmd.partition(CommandRouterConst.CMD_MENTION_SEP)
+        if sep:
+            username = (client.me.username if client.me is not None else None) or ""
+            if mention.lower() != username.lower():
+                return None
+        return cmd_name.lower()
+
+    @staticmethod
+    def __ParseParams(params: str) -> List[str]:
+        """
+        Parse the command parameters.
+
+        Args:
+            params: Parameters string.
+
+        Returns:
+            List of parameters.
+        """
+        return [
+            CommandRouterConst.ESCAPED_QUOTE_REGEX.sub(r"\1", match.group(2) or match.group(3) or "")
+            for match in CommandRouterConst.PARAMS_REGEX.finditer(params)
+        ]
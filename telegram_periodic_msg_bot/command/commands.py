@@ -23,9 +23,10 @@ from typing import Any, Callable, Coroutine
 from typing_extensions import override
 
 from telegram_periodic_msg_bot._version import __version__
+from telegram_periodic_msg_bot.bot.bot_config import MisfirePolicyConverter
 from telegram_periodic_msg_bot.bot.bot_config_types import BotConfigTypes
 from telegram_periodic_msg_bot.command.command_base import CommandBase
-from telegram_periodic_msg_bot.command.command_data import CommandParameterError
+from telegram_periodic_msg_bot.command.command_data import CommandData, CommandParameterError
 from telegram_periodic_msg_bot.misc.helpers import UserHelper
 from telegram_periodic_msg_bot.periodic_msg.periodic_msg_parser import PeriodicMsgParserInvalidError, PeriodicMsgParserTooLongError
 from telegram_periodic_msg_bot.periodic_msg.periodic_msg_scheduler import (
@@ -35,6 +36,14 @@ from telegram_periodic_msg_bot.periodic_msg.periodic_msg_scheduler import (
     PeriodicMsgJobMaxNumError,
     PeriodicMsgJobNotExistentError,
 )
+from telegram_periodic_msg_bot.translator.translation_packs import TranslationPacksLanguageError
+
+
+class CommandsConst:
+    """Constants for commands."""
+
+    # Parameter for resetting the chat language to the default one
+    DEF_LANG_PARAM: str = "default"
 
 
 def GroupChatOnly(exec_cmd_fct: Callable[..., Coroutine]) -> Callable[..., Coroutine]:
@@ -47,11 +56,11 @@ def GroupChatOnly(exec_cmd_fct: Callable[..., Coroutine]) -> Callable[..., Corou
     Returns:
         Decorated function that checks for group chat.
     """
-    async def decorated(self, **kwargs: Any):
-        if self._IsPrivateChat():
-            await self._SendMessage(self.translator.GetSentence("GROUP_ONLY_ERR_MSG"))
+    async def decorated(self, cmd_data: CommandData, **kwargs: Any):
+        if self._IsPrivateChat(cmd_data):
+            await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "GROUP_ONLY_ERR_MSG"))
         else:
-            await exec_cmd_fct(self, **kwargs)
+            await exec_cmd_fct(self, cmd_data, **kwargs)
 
     return decorated
 
@@ -61,12 +70,15 @@ class HelpCmd(CommandBase):
 
     @override
     async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
                         **kwargs: Any) -> None:
         """Execute the help command."""
         await self._SendMessage(
-            self.translator.GetSentence(
+            cmd_data,
+            self._GetSentence(
+                cmd_data,
                 "HELP_CMD",
-                name=UserHelper.GetName(self.cmd_data.User()),
+                name=UserHelper.GetName(cmd_data.User()),
             ),
         )
 
@@ -76,9 +88,10 @@ class AliveCmd(CommandBase):
 
     @override
     async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
                         **kwargs: Any) -> None:
         """Execute the alive command."""
-        await self._SendMessage(self.translator.GetSentence("ALIVE_CMD"))
+        await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "ALIVE_CMD"))
 
 
 class SetTestModeCmd(CommandBase):
@@ -87,19 +100,20 @@ class SetTestModeCmd(CommandBase):
     @override
     @GroupChatOnly
     async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
                         **kwargs: Any) -> None:
         """Execute the set test mode command."""
         try:
-            flag = self.cmd_data.Params().GetAsBool(0)
+            flag = cmd_data.Params().GetAsBool(0)
         except CommandParameterError:
-            await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
+            await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "PARAM_ERR_MSG"))
         else:
             self.config.SetValue(BotConfigTypes.APP_TEST_MODE, flag)
 
             if self.config.GetValue(BotConfigTypes.APP_TEST_MODE):
-                await self._SendMessage(self.translator.GetSentence("SET_TEST_MODE_EN_CMD"))
+                await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "SET_TEST_MODE_EN_CMD"))
             else:
-                await self._SendMessage(self.translator.GetSentence("SET_TEST_MODE_DIS_CMD"))
+                await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "SET_TEST_MODE_DIS_CMD"))
 
 
 class IsTestModeCmd(CommandBase):
@@ -107,12 +121,13 @@ class IsTestModeCmd(CommandBase):
 
     @override
     async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
                         **kwargs: Any) -> None:
         """Execute the is test mode command."""
         if self.config.GetValue(BotConfigTypes.APP_TEST_MODE):
-            await self._SendMessage(self.translator.GetSentence("IS_TEST_MODE_EN_CMD"))
+            await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "IS_TEST_MODE_EN_CMD"))
         else:
-            await self._SendMessage(self.translator.GetSentence("IS_TEST_MODE_DIS_CMD"))
+            await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "IS_TEST_MODE_DIS_CMD"))
 
 
 class VersionCmd(CommandBase):
@@ -120,42 +135,105 @@ class VersionCmd(CommandBase):
 
     @override
     async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
                         **kwargs: Any) -> None:
         """Execute the version command."""
         await self._SendMessage(
-            self.translator.GetSentence(
+            cmd_data,
+            self._GetSentence(
+                cmd_data,
                 "VERSION_CMD",
                 version=__version__,
             ),
         )
 
 
+class SetLangCmd(CommandBase):
+    """Command for setting the language of the chat."""
+
+    @override
+    async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
+                        **kwargs: Any) -> None:
+        """Execute the set language command."""
+        try:
+            lang = cmd_data.Params().GetAsString(0).lower()
+        except CommandParameterError:
+            await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "PARAM_ERR_MSG"))
+        else:
+            try:
+                kwargs["periodic_msg_scheduler"].SetChatLanguage(
+                    cmd_data.Chat(),
+                    lang if lang != CommandsConst.DEF_LANG_PARAM else None,
+                )
+                await self._SendMessage(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
+                        "SET_LANG_OK_CMD",
+                        lang=lang,
+                    ),
+                )
+            except TranslationPacksLanguageError:
+                await self._SendMessage(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
+                        "LANG_NOT_AVAILABLE_ERR_MSG",
+                        lang=lang,
+                        langs=", ".join(self.translator.GetLanguages()),
+                    ),
+                )
+
+
+class GetLangCmd(CommandBase):
+    """Command for showing the language of the chat."""
+
+    @override
+    async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
+                        **kwargs: Any) -> None:
+        """Execute the get language command."""
+        await self._SendMessage(
+            cmd_data,
+            self._GetSentence(
+                cmd_data,
+                "GET_LANG_CMD",
+                lang=self.translator.GetChatLanguage(cmd_data.Chat().id) or CommandsConst.DEF_LANG_PARAM,
+                langs=", ".join(self.translator.GetLanguages()),
+            ),
+        )
+
+
 class MessageTaskStartCmd(CommandBase):
     """Command for starting a periodic message task."""
 
     @override
     @GroupChatOnly
     async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
                         **kwargs: Any) -> None:
         """Execute the message task start command."""
         try:
-            msg_id = self.cmd_data.Params().GetAsString(0)
-            period_hours = self.cmd_data.Params().GetAsInt(1)
-            start_hour = self.cmd_data.Params().GetAsInt(2, 0)
+            msg_id = cmd_data.Params().GetAsString(0)
+            period_hours = cmd_data.Params().GetAsInt(1)
+            start_hour = cmd_data.Params().GetAsInt(2, 0)
         except CommandParameterError:
-            await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
+            await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "PARAM_ERR_MSG"))
         else:
             try:
                 kwargs["periodic_msg_scheduler"].Start(
-                    self.cmd_data.Chat(),
-                    self.message.message_thread_id,
+                    cmd_data.Chat(),
+                    cmd_data.Message().message_thread_id,
                     period_hours,
                     start_hour,
                     msg_id,
-                    self.message,
+                    cmd_data.Message(),
                 )
                 await self._SendMessage(
-                    self.translator.GetSentence(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
                         "MESSAGE_TASK_START_OK_CMD",
                         period=period_hours,
                         start=start_hour,
@@ -163,23 +241,27 @@ class MessageTaskStartCmd(CommandBase):
                     ),
                 )
             except PeriodicMsgJobInvalidPeriodError:
-                await self._SendMessage(self.translator.GetSentence("TASK_PERIOD_ERR_MSG"))
+                await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "TASK_PERIOD_ERR_MSG"))
             except PeriodicMsgJobInvalidStartError:
-                await self._SendMessage(self.translator.GetSentence("TASK_START_ERR_MSG"))
+                await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "TASK_START_ERR_MSG"))
             except PeriodicMsgJobMaxNumError:
-                await self._SendMessage(self.translator.GetSentence("MAX_TASK_ERR_MSG"))
+                await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "MAX_TASK_ERR_MSG"))
             except PeriodicMsgJobAlreadyExistentError:
                 await self._SendMessage(
-                    self.translator.GetSentence(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
                         "TASK_EXISTENT_ERR_MSG",
                         msg_id=msg_id,
                     ),
                 )
             except PeriodicMsgParserInvalidError:
-                await self._SendMessage(self.translator.GetSentence("MESSAGE_INVALID_ERR_MSG"))
+                await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "MESSAGE_INVALID_ERR_MSG"))
             except PeriodicMsgParserTooLongError:
                 await self._SendMessage(
-                    self.translator.GetSentence(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
                         "MESSAGE_TOO_LONG_ERR_MSG",
                         msg_max_len=self.config.GetValue(BotConfigTypes.MESSAGE_MAX_LEN),
                     ),
@@ -192,24 +274,29 @@ class MessageTaskStopCmd(CommandBase):
     @override
     @GroupChatOnly
     async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
                         **kwargs: Any) -> None:
         """Execute the message task stop command."""
         try:
-            msg_id = self.cmd_data.Params().GetAsString(0)
+            msg_id = cmd_data.Params().GetAsString(0)
         except CommandParameterError:
-            await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
+            await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "PARAM_ERR_MSG"))
         else:
             try:
-                kwargs["periodic_msg_scheduler"].Stop(self.cmd_data.Chat(), self.message.message_thread_id, msg_id)
+                kwargs["periodic_msg_scheduler"].Stop(cmd_data.Chat(), cmd_data.Message().message_thread_id, msg_id)
                 await self._SendMessage(
-                    self.translator.GetSentence(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
                         "MESSAGE_TASK_STOP_OK_CMD",
                         msg_id=msg_id,
                     ),
                 )
             except PeriodicMsgJobNotExistentError:
                 await self._SendMessage(
-                    self.translator.GetSentence(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
                         "TASK_NOT_EXISTENT_ERR_MSG",
                         msg_id=msg_id,
                     ),
@@ -222,11 +309,30 @@ class MessageTaskStopAllCmd(CommandBase):
     @override
     @GroupChatOnly
     async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
                         **kwargs: Any) -> None:
         """Execute the message task stop all command."""
-        kwargs["periodic_msg_scheduler"].StopAll(self.cmd_data.Chat())
+        kwargs["periodic_msg_scheduler"].StopAll(cmd_data.Chat())
+        await kwargs["periodic_msg_scheduler"].FlushPendingDeletions(cmd_data.Chat())
+        await self._SendMessage(
+            cmd_data,
+            self._GetSentence(cmd_data, "MESSAGE_TASK_STOP_ALL_CMD"),
+        )
+
+
+class MessageTaskStopAllTopicCmd(CommandBase):
+    """Command for stopping all periodic message tasks in a topic."""
+
+    @override
+    @GroupChatOnly
+    async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
+                        **kwargs: Any) -> None:
+        """Execute the message task stop all topic command."""
+        kwargs["periodic_msg_scheduler"].StopAllInTopic(cmd_data.Chat(), cmd_data.Message().message_thread_id)
         await self._SendMessage(
-            self.translator.GetSentence("MESSAGE_TASK_STOP_ALL_CMD"),
+            cmd_data,
+            self._GetSentence(cmd_data, "MESSAGE_TASK_STOP_ALL_TOPIC_CMD"),
         )
 
 
@@ -236,24 +342,29 @@ class MessageTaskPauseCmd(CommandBase):
     @override
     @GroupChatOnly
     async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
                         **kwargs: Any) -> None:
         """Execute the message task pause command."""
         try:
-            msg_id = self.cmd_data.Params().GetAsString(0)
+            msg_id = cmd_data.Params().GetAsString(0)
         except CommandParameterError:
-            await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
+            await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "PARAM_ERR_MSG"))
         else:
             try:
-                kwargs["periodic_msg_scheduler"].Pause(self.cmd_data.Chat(), self.message.message_thread_id, msg_id)
+                kwargs["periodic_msg_scheduler"].Pause(cmd_data.Chat(), cmd_data.Message().message_thread_id, msg_id)
                 await self._SendMessage(
-                    self.translator.GetSentence(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
                         "MESSAGE_TASK_PAUSE_OK_CMD",
                         msg_id=msg_id,
                     ),
                 )
             except PeriodicMsgJobNotExistentError:
                 await self._SendMessage(
-                    self.translator.GetSentence(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
                         "TASK_NOT_EXISTENT_ERR_MSG",
                         msg_id=msg_id,
                     ),
@@ -266,24 +377,29 @@ class MessageTaskResumeCmd(CommandBase):
     @override
     @GroupChatOnly
     async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
                         **kwargs: Any) -> None:
         """Execute the message task resume command."""
         try:
-            msg_id = self.cmd_data.Params().GetAsString(0)
+            msg_id = cmd_data.Params().GetAsString(0)
         except CommandParameterError:
-            await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
+            await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "PARAM_ERR_MSG"))
         else:
             try:
-                kwargs["periodic_msg_scheduler"].Resume(self.cmd_data.Chat(), self.message.message_thread_id, msg_id)
+                kwargs["periodic_msg_scheduler"].Resume(cmd_data.Chat(), cmd_data.Message().message_thread_id, msg_id)
                 await self._SendMessage(
-                    self.translator.GetSentence(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
                         "MESSAGE_TASK_RESUME_OK_CMD",
                         msg_id=msg_id,
                     ),
                 )
             except PeriodicMsgJobNotExistentError:
                 await self._SendMessage(
-                    self.translator.GetSentence(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
                         "TASK_NOT_EXISTENT_ERR_MSG",
                         msg_id=msg_id,
                     ),
@@ -296,21 +412,24 @@ class MessageTaskGetCmd(CommandBase):
     @override
     @GroupChatOnly
     async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
                         **kwargs: Any) -> None:
         """Execute the message task get command."""
         try:
-            msg_id = self.cmd_data.Params().GetAsString(0)
+            msg_id = cmd_data.Params().GetAsString(0)
         except CommandParameterError:
-            await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
+            await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "PARAM_ERR_MSG"))
         else:
             try:
-                msg = kwargs["periodic_msg_scheduler"].GetMessage(self.cmd_data.Chat(),
-                                                                  self.message.message_thread_id,
+                msg = kwargs["periodic_msg_scheduler"].GetMessage(cmd_data.Chat(),
+                                                                  cmd_data.Message().message_thread_id,
                                                                   msg_id)
 
                 if msg != "":
                     await self._SendMessage(
-                        self.translator.GetSentence(
+                        cmd_data,
+                        self._GetSentence(
+                            cmd_data,
                             "MESSAGE_TASK_GET_OK_CMD",
                             msg_id=msg_id,
                             msg=msg,
@@ -318,14 +437,18 @@ class MessageTaskGetCmd(CommandBase):
                     )
                 else:
                     await self._SendMessage(
-                        self.translator.GetSentence(
+                        cmd_data,
+                        self._GetSentence(
+                            cmd_data,
                             "MESSAGE_TASK_GET_NO_CMD",
                             msg_id=msg_id,
                         ),
                     )
             except PeriodicMsgJobNotExistentError:
                 await self._SendMessage(
-                    self.translator.GetSentence(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
                         "TASK_NOT_EXISTENT_ERR_MSG",
                         msg_id=msg_id,
                     ),
@@ -338,38 +461,45 @@ class MessageTaskSetCmd(CommandBase):
     @override
     @GroupChatOnly
     async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
                         **kwargs: Any) -> None:
         """Execute the message task set command."""
         try:
-            msg_id = self.cmd_data.Params().GetAsString(0)
+            msg_id = cmd_data.Params().GetAsString(0)
         except CommandParameterError:
-            await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
+            await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "PARAM_ERR_MSG"))
         else:
             try:
                 kwargs["periodic_msg_scheduler"].SetMessage(
-                    self.cmd_data.Chat(),
-                    self.message.message_thread_id,
+                    cmd_data.Chat(),
+                    cmd_data.Message().message_thread_id,
                     msg_id,
-                    self.message,
+                    cmd_data.Message(),
                 )
                 await self._SendMessage(
-                    self.translator.GetSentence(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
                         "MESSAGE_TASK_SET_OK_CMD",
                         msg_id=msg_id,
                     ),
                 )
             except PeriodicMsgJobNotExistentError:
                 await self._SendMessage(
-                    self.translator.GetSentence(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
                         "TASK_NOT_EXISTENT_ERR_MSG",
                         msg_id=msg_id,
                     ),
                 )
             except PeriodicMsgParserInvalidError:
-                await self._SendMessage(self.translator.GetSentence("MESSAGE_INVALID_ERR_MSG"))
+                await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "MESSAGE_INVALID_ERR_MSG"))
             except PeriodicMsgParserTooLongError:
                 await self._SendMessage(
-                    self.translator.GetSentence(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
                         "MESSAGE_TOO_LONG_ERR_MSG",
                         msg_max_len=self.config.GetValue(BotConfigTypes.MESSAGE_MAX_LEN),
                     ),
@@ -382,23 +512,26 @@ class MessageTaskDeleteLastMsgCmd(CommandBase):
     @override
     @GroupChatOnly
     async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
                         **kwargs: Any) -> None:
         """Execute the message task delete last message command."""
         try:
-            msg_id = self.cmd_data.Params().GetAsString(0)
-            flag = self.cmd_data.Params().GetAsBool(1)
+            msg_id = cmd_data.Params().GetAsString(0)
+            flag = cmd_data.Params().GetAsBool(1)
         except CommandParameterError:
-            await self._SendMessage(self.translator.GetSentence("PARAM_ERR_MSG"))
+            await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "PARAM_ERR_MSG"))
         else:
             try:
                 kwargs["periodic_msg_scheduler"].DeleteLastSentMessage(
-                    self.cmd_data.Chat(),
-                    self.message.message_thread_id,
+                    cmd_data.Chat(),
+                    cmd_data.Message().message_thread_id,
                     msg_id,
                     flag,
                 )
                 await self._SendMessage(
-                    self.translator.GetSentence(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
                         "MESSAGE_TASK_DELETE_LAST_MSG_OK_CMD",
                         msg_id=msg_id,
                         flag=flag,
@@ -406,7 +539,51 @@ class MessageTaskDeleteLastMsgCmd(CommandBase):
                 )
             except PeriodicMsgJobNotExistentError:
                 await self._SendMessage(
-                    self.translator.GetSentence(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
+                        "TASK_NOT_EXISTENT_ERR_MSG",
+                        msg_id=msg_id,
+                    ),
+                )
+
+
+class MessageTaskMisfirePolicyCmd(CommandBase):
+    """Command for setting the policy for the sends missed by a task."""
+
+    @override
+    @GroupChatOnly
+    async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
+                        **kwargs: Any) -> None:
+        """Execute the message task misfire policy command."""
+        try:
+            msg_id = cmd_data.Params().GetAsString(0)
+            policy = MisfirePolicyConverter.KeyToValue(cmd_data.Params().GetAsString(1))
+        except (CommandParameterError, KeyError):
+            await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "PARAM_ERR_MSG"))
+        else:
+            try:
+                kwargs["periodic_msg_scheduler"].SetMisfirePolicy(
+                    cmd_data.Chat(),
+                    cmd_data.Message().message_thread_id,
+                    msg_id,
+                    policy,
+                )
+                await self._SendMessage(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
+                        "MESSAGE_TASK_MISFIRE_POLICY_OK_CMD",
+                        msg_id=msg_id,
+                        policy=MisfirePolicyConverter.ValueToKey(policy),
+                    ),
+                )
+            except PeriodicMsgJobNotExistentError:
+                await self._SendMessage(
+                    cmd_data,
+                    self._GetSentence(
+                        cmd_data,
                         "TASK_NOT_EXISTENT_ERR_MSG",
                         msg_id=msg_id,
                     ),
@@ -419,17 +596,20 @@ class MessageTaskInfoCmd(CommandBase):
     @override
     @GroupChatOnly
     async def _ExecuteCommand(self,
+                        cmd_data: CommandData,
                         **kwargs: Any) -> None:
         """Execute the message task info command."""
-        jobs_list = kwargs["periodic_msg_scheduler"].GetJobsInChat(self.cmd_data.Chat())
+        jobs_list = kwargs["periodic_msg_scheduler"].GetJobsInChat(cmd_data.Chat())
 
         if jobs_list.Any():
             await self._SendMessage(
-                self.translator.GetSentence(
+                cmd_data,
+                self._GetSentence(
+                    cmd_data,
                     "MESSAGE_TASK_INFO_CMD",
                     tasks_num=jobs_list.Count(),
                     tasks_list=str(jobs_list),
                 ),
             )
         else:
-            await self._SendMessage(self.translator.GetSentence("MESSAGE_TASK_INFO_NO_TASK_CMD"))
+            await self._SendMessage(cmd_data, self._GetSentence(cmd_data, "MESSAGE_TASK_INFO_NO_TASK_CMD"))
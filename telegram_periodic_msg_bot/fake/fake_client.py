@@ -0,0 +1,480 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+import datetime
+import logging
+import math
+import random
+from typing import AsyncGenerator, Dict, Iterable, List, Optional, Union
+
+import pyrogram
+from pyrogram.enums import ChatMembersFilter, ChatMemberStatus, ChatType
+from pyrogram.errors import ChatWriteForbidden, FloodWait, InternalServerError, MessageDeleteForbidden, RPCError
+from pyrogram.handlers.handler import Handler
+
+from telegram_periodic_msg_bot.bot.bot_base import BotBaseConst, BotUpdateType
+from telegram_periodic_msg_bot.fake.fake_client_behavior import FakeClientBehavior, FakeRateWindow
+from telegram_periodic_msg_bot.metrics.metrics import MetricCounter, MetricCounterFamily
+from telegram_periodic_msg_bot.utils.clock import Clock
+
+
+# Chat members returned by the fake client
+FakeChatMembersType = AsyncGenerator[pyrogram.types.ChatMember, None]
+
+
+class FakeClientConst:
+    """Constants for fake client class."""
+
+    # Bot user
+    BOT_USER_ID: int = 1
+    BOT_USERNAME: str = "fake_periodic_msg_bot"
+    # Rate limit windows
+    CHAT_RATE_WINDOW_SEC: float = 60.0
+    GLOBAL_RATE_WINDOW_SEC: float = 1.0
+
+
+class FakeClientStats:
+    """Statistics of the fake client."""
+
+    calls_num: MetricCounterFamily
+    sent_num: MetricCounter
+    deleted_num: MetricCounter
+    flood_waits_num: MetricCounterFamily
+    errors_num: MetricCounterFamily
+    update_errors_num: MetricCounterFamily
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.calls_num = MetricCounterFamily("fake_client_calls_total", "Number of calls to the fake client", "method")
+        self.sent_num = MetricCounter("fake_client_messages_sent_total", "Number of messages accepted by the fake client")
+        self.deleted_num = MetricCounter("fake_client_messages_deleted_total",
+                                         "Number of messages deleted by the fake client")
+        self.flood_waits_num = MetricCounterFamily("fake_client_flood_waits_total",
+                                                   "Number of FloodWait errors raised by the fake client",
+                                                   "reason")
+        self.errors_num = MetricCounterFamily("fake_client_errors_total",
+                                              "Number of errors raised by the fake client (FloodWait included)",
+                                              "error")
+        self.update_errors_num = MetricCounterFamily("fake_client_update_errors_total",
+                                                     "Number of updates whose handling failed with an error raised by "
+                                                     "the fake client",
+                                                     "error")
+
+
+class FakeClient(pyrogram.Client):
+    """
+    Fake Telegram client, answering the requests of the bot locally without any network.
+
+    It can be used in place of the real client for load and soak tests: the calls used by the bot have a
+    configurable latency, can fail with FloodWait, permission and server errors, and the Telegram rate limits
+    are enforced. Updates are delivered to the registered handlers by feeding them to the client.
+    """
+
+    behavior: FakeClientBehavior
+    clock: Clock
+    rnd: random.Random
+    handler_groups: Dict[int, List[Handler]]
+    last_msg_ids: Dict[int, int]
+    chat_windows: Dict[int, FakeRateWindow]
+    global_window: Optional[FakeRateWindow]
+    stats: FakeClientStats
+
+    def __init__(self,
+                 behavior: Optional[FakeClientBehavior] = None,
+                 *,
+                 clock: Optional[Clock] = None) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            behavior: Behavior of the client, None for a client that answers immediately without errors.
+            clock: Clock giving the current time (optional, the system clock if not specified).
+        """
+        super().__init__(FakeClientConst.BOT_USERNAME, in_memory=True, no_updates=True)
+        self.behavior = behavior or FakeClientBehavior()
+        self.clock = clock if clock is not None else Clock()
+        self.rnd = random.Random(self.behavior.seed)
+        self.handler_groups = {}
+        self.last_msg_ids = {}
+        self.chat_windows = {}
+        self.global_window = (
+            FakeRateWindow(self.behavior.global_rate_per_sec, FakeClientConst.GLOBAL_RATE_WINDOW_SEC)
+            if self.behavior.global_rate_per_sec > 0
+            else None
+        )
+        self.stats = FakeClientStats()
+        self.me = pyrogram.types.User(id=FakeClientConst.BOT_USER_ID,
+                                      is_bot=True,
+                                      first_name="Fake",
+                                      username=FakeClientConst.BOT_USERNAME)
+
+    def GetStats(self) -> FakeClientStats:
+        """
+        Get statistics.
+
+        Returns:
+            Statistics.
+        """
+        return self.stats
+
+    async def start(self) -> "FakeClient":
+        """
+        Start the client, nothing to connect to.
+
+        Returns:
+            The client itself.
+        """
+        self.is_connected = True
+        return self
+
+    async def stop(self,
+                   block: bool = True) -> "FakeClient":
+        """
+        Stop the client.
+
+        Args:
+            block: Unused, kept for compatibility.
+
+        Returns:
+            The client itself.
+        """
+        self.is_connected = False
+        return self
+
+    def add_handler(self,
+                    handler: Handler,
+                    group: int = 0) -> tuple:
+        """
+        Register a handler, that will receive the fed updates.
+
+        Args:
+            handler: Handler.
+            group: Handler group.
+
+        Returns:
+            Handler and group.
+        """
+        self.handler_groups.setdefault(group, []).append(handler)
+        return handler, group
+
+    def remove_handler(self,
+                       handler: Handler,
+                       group: int = 0) -> None:
+        """
+        Unregister a handler.
+
+        Args:
+            handler: Handler.
+            group: Handler group.
+        """
+        self.handler_groups[group].remove(handler)
+
+    async def FeedUpdate(self,
+                         update: BotUpdateType) -> None:
+        """
+        Deliver an update to the registered handlers like the client dispatcher would do, i.e. the groups are
+        processed in order, only the first matching handler of each group is called and its errors are logged.
+        Errors raised by the fake client itself are expected, so they are only counted and logged without traceback.
+
+        Args:
+            update: Update.
+        """
+        handler_type = BotBaseConst.UPDATE_TYPE_TO_HANDLER_TYPE.get(type(update))
+        if handler_type is None:
+            return
+
+        update.bind(self)
+        try:
+            for group in sorted(self.handler_groups):
+                for handler in self.handler_groups[group]:
+                    if type(handler) is handler_type and await handler.check(self, update):
+                        try:
+                            await handler.callback(self, update)
+                        except pyrogram.ContinuePropagation:
+                            continue
+                        except pyrogram.StopPropagation:
+                            raise
+                        except RPCError as ex:
+                            # Only raised by the fake client, since there's no real Telegram behind it
+                            self.stats.update_errors_num.Inc(type(ex).__name__)
+                            logging.getLogger(__name__).warning(
+                                f"Injected error while handling update: {type(ex).__name__}"
+                            )
+                        except Exception:
+                            # Like the client dispatcher, errors are logged without stopping the delivery
+                            logging.getLogger(__name__).exception("Error while handling update")
+                        break
+        except pyrogram.StopPropagation:
+            pass
+
+    def CreateMessage(self,
+                      chat_id: int,
+                      user_id: int,
+                      text: str,
+                      topic_id: Optional[int] = None) -> pyrogram.types.Message:
+        """
+        Create a message sent by a user to a supergroup, to be fed to the client.
+
+        Args:
+            chat_id: Chat ID.
+            user_id: ID of the user sending the message.
+            text: Message text.
+            topic_id: Topic ID, None if not sent to a topic.
+
+        Returns:
+            Message.
+        """
+        return pyrogram.types.Message(id=self.__NextMessageId(chat_id),
+                                      chat=pyrogram.types.Chat(id=chat_id, type=ChatType.SUPERGROUP),
+                                      from_user=pyrogram.types.User(id=user_id, first_name=f"User {user_id}"),
+                                      date=datetime.datetime.fromtimestamp(self.clock.Time()),
+                                      text=text,
+                                      message_thread_id=topic_id)
+
+    async def send_message(self,
+                           chat_id: Union[int, str],
+                           text: str,
+                           message_thread_id: Optional[int] = None,
+                           **kwargs: object) -> pyrogram.types.Message:
+        """
+        Send a message.
+
+        Args:
+            chat_id: Chat ID.
+            text: Message text.
+            message_thread_id: Topic ID.
+            **kwargs: Unused, kept for compatibility.
+
+        Returns:
+            Sent message.
+
+        Raises:
+            ChatWriteForbidden: If the bot cannot write to the chat.
+            FloodWait: If a rate limit is exceeded or randomly.
+            InternalServerError: Randomly.
+        """
+        chat_id = int(chat_id)
+        await self.__Call("send_message", chat_id)
+        if chat_id in self.behavior.forbidden_chat_ids:
+            raise self.__Error(ChatWriteForbidden())
+        self.__CheckRateLimits(chat_id)
+
+        self.stats.sent_num.Inc()
+        return pyrogram.types.Message(id=self.__NextMessageId(chat_id),
+                                      chat=pyrogram.types.Chat(id=chat_id, type=ChatType.SUPERGROUP),
+                                      from_user=self.me,
+                                      date=datetime.datetime.fromtimestamp(self.clock.Time()),
+                                      text=text,
+                                      message_thread_id=message_thread_id)
+
+    async def delete_messages(self,
+                              chat_id: Union[int, str],
+                              message_ids: Union[int, Iterable[int]],
+                              revoke: bool = True,
+                              is_scheduled: bool = False) -> int:
+        """
+        Delete messages.
+
+        Args:
+            chat_id: Chat ID.
+            message_ids: ID of the message to delete, or list of IDs.
+            revoke: Unused, kept for compatibility.
+            is_scheduled: Unused, kept for compatibility.
+
+        Returns:
+            Number of deleted messages, i.e. the ones that were sent in the chat.
+
+        Raises:
+            MessageDeleteForbidden: If the bot cannot delete messages in the chat.
+            FloodWait: Randomly.
+            InternalServerError: Randomly.
+        """
+        chat_id = int(chat_id)
+        await self.__Call("delete_messages", chat_id)
+        if chat_id in self.behavior.forbidden_chat_ids:
+            raise self.__Error(MessageDeleteForbidden())
+
+        last_msg_id = self.last_msg_ids.get(chat_id, 0)
+        ids = [message_ids] if isinstance(message_ids, int) else list(message_ids)
+        deleted_num = sum(1 for msg_id in ids if 0 < msg_id <= last_msg_id)
+        self.stats.deleted_num.Inc(deleted_num)
+        return deleted_num
+
+    async def get_chat_member(self,
+                              chat_id: Union[int, str],
+                              user_id: Union[int, str]) -> pyrogram.types.ChatMember:
+        """
+        Get a chat member.
+
+        Args:
+            chat_id: Chat ID.
+            user_id: User ID.
+
+        Returns:
+            Chat member, administrator if the user is in the configured administrators.
+
+        Raises:
+            FloodWait: Randomly.
+            InternalServerError: Randomly.
+        """
+        await self.__Call("get_chat_member", int(chat_id))
+        return self.__CreateChatMember(int(user_id))
+
+    async def get_chat_members(self,
+                               chat_id: Union[int, str],
+                               query: str = "",
+                               limit: int = 0,
+                               filter: ChatMembersFilter = ChatMembersFilter.SEARCH) -> FakeChatMembersType:
+        """
+        Get the chat members, i.e. the configured administrators (that are members of every chat).
+
+        Args:
+            chat_id: Chat ID.
+            query: Unused, kept for compatibility.
+            limit: Maximum number of members, zero for no limit.
+            filter: Members filter.
+
+        Returns:
+            Chat members.
+
+        Raises:
+            FloodWait: Randomly.
+            InternalServerError: Randomly.
+        """
+        await self.__Call("get_chat_members", int(chat_id))
+        user_ids = sorted(self.behavior.admin_user_ids)
+        for user_id in user_ids[:limit] if limit > 0 else user_ids:
+            yield self.__CreateChatMember(user_id)
+
+    async def __Call(self,
+                     method: str,
+                     chat_id: int) -> None:
+        """
+        Simulate a call: wait for its latency and fail randomly.
+
+        Args:
+            method: Client method name.
+            chat_id: Chat ID.
+
+        Raises:
+            FloodWait: Randomly.
+            InternalServerError: Randomly.
+        """
+        self.stats.calls_num.Inc(method)
+
+        latency = self.behavior.GetLatency(method)(self.rnd)
+        if latency > 0.0:
+            await asyncio.sleep(latency)
+
+        if self.rnd.random() < self.behavior.error_prob:
+            raise self.__Error(InternalServerError())
+        if self.rnd.random() < self.behavior.flood_wait_prob:
+            self.stats.flood_waits_num.Inc("injected")
+            raise self.__Error(FloodWait(value=self.behavior.flood_wait_sec))
+
+    def __CheckRateLimits(self,
+                          chat_id: int) -> None:
+        """
+        Check the chat and global rate limits, taking a request if not exceeded.
+
+        Args:
+            chat_id: Chat ID.
+
+        Raises:
+            FloodWait: If a rate limit is exceeded.
+        """
+        now = self.clock.Monotonic()
+
+        if self.behavior.chat_rate_per_min > 0:
+            chat_window = self.chat_windows.get(chat_id)
+            if chat_window is None:
+                chat_window = FakeRateWindow(self.behavior.chat_rate_per_min, FakeClientConst.CHAT_RATE_WINDOW_SEC)
+                self.chat_windows[chat_id] = chat_window
+            wait_time = chat_window.Take(now)
+            if wait_time > 0.0:
+                self.stats.flood_waits_num.Inc("chat_rate")
+                raise self.__Error(FloodWait(value=self.__FloodWaitSec(wait_time)))
+
+        if self.global_window is not None:
+            wait_time = self.global_window.Take(now)
+            if wait_time > 0.0:
+                self.stats.flood_waits_num.Inc("global_rate")
+                raise self.__Error(FloodWait(value=self.__FloodWaitSec(wait_time)))
+
+    def __Error(self,
+                ex: RPCError) -> RPCError:
+        """
+        Count an error before raising it.
+
+        Args:
+            ex: Error.
+
+        Returns:
+            The same error.
+        """
+        self.stats.errors_num.Inc(type(ex).__name__)
+        return ex
+
+    def __NextMessageId(self,
+                        chat_id: int) -> int:
+        """
+        Get the ID of the next message of a chat.
+
+        Args:
+            chat_id: Chat ID.
+
+        Returns:
+            Message ID.
+        """
+        msg_id = self.last_msg_ids.get(chat_id, 0) + 1
+        self.last_msg_ids[chat_id] = msg_id
+        return msg_id
+
+    def __CreateChatMember(self,
+                           user_id: int) -> pyrogram.types.ChatMember:
+        """
+        Create a chat member.
+
+        Args:
+            user_id: User ID.
+
+        Returns:
+            Chat member, administrator if the user is in the configured administrators.
+        """
+        return pyrogram.types.ChatMember(
+            status=(ChatMemberStatus.ADMINISTRATOR
+                    if user_id in self.behavior.admin_user_ids
+                    else ChatMemberStatus.MEMBER),
+            user=pyrogram.types.User(id=user_id, first_name=f"User {user_id}")
+        )
+
+    @staticmethod
+    def __FloodWaitSec(wait_time: float) -> int:
+        """
+        Convert a wait time to the seconds of a FloodWait error, that are whole and at least one.
+
+        Args:
+            wait_time: Wait time in seconds.
+
+        Returns:
+            Seconds to wait.
+        """
+        return max(1, math.ceil(wait_time))
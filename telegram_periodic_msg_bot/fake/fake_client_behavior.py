@@ -0,0 +1,192 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import math
+import random
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Set
+
+
+# Latency distribution, returning a latency in seconds drawn from the given random generator
+FakeLatencyFctType = Callable[[random.Random], float]
+
+
+class FakeLatency:
+    """Latency distributions of the fake client calls."""
+
+    @staticmethod
+    def Zero() -> FakeLatencyFctType:
+        """
+        Get a latency distribution that answers immediately.
+
+        Returns:
+            Latency distribution.
+        """
+        return lambda rnd: 0.0
+
+    @staticmethod
+    def Constant(latency_sec: float) -> FakeLatencyFctType:
+        """
+        Get a constant latency distribution.
+
+        Args:
+            latency_sec: Latency in seconds.
+
+        Returns:
+            Latency distribution.
+        """
+        return lambda rnd: latency_sec
+
+    @staticmethod
+    def Uniform(min_sec: float,
+                max_sec: float) -> FakeLatencyFctType:
+        """
+        Get a uniform latency distribution.
+
+        Args:
+            min_sec: Minimum latency in seconds.
+            max_sec: Maximum latency in seconds.
+
+        Returns:
+            Latency distribution.
+        """
+        return lambda rnd: rnd.uniform(min_sec, max_sec)
+
+    @staticmethod
+    def LogNormal(median_sec: float,
+                  sigma: float) -> FakeLatencyFctType:
+        """
+        Get a log-normal latency distribution, i.e. mostly around the median with a long tail.
+
+        Args:
+            median_sec: Median latency in seconds.
+            sigma: Standard deviation of the latency logarithm (the higher, the longer the tail).
+
+        Returns:
+            Latency distribution.
+        """
+        return lambda rnd: median_sec * math.exp(rnd.gauss(0.0, sigma))
+
+
+class FakeRateWindow:
+    """Sliding window rate limit, counting the requests done in the last window like Telegram does."""
+
+    limit: int
+    window_sec: float
+    times: Deque[float]
+
+    def __init__(self,
+                 limit: int,
+                 window_sec: float) -> None:
+        """
+        Initialize the window.
+
+        Args:
+            limit: Maximum number of requests in a window.
+            window_sec: Window length in seconds.
+        """
+        self.limit = limit
+        self.window_sec = window_sec
+        self.times = deque()
+
+    def Take(self,
+             now: float) -> float:
+        """
+        Take a request, only if the limit is not exceeded.
+
+        Args:
+            now: Current monotonic time.
+
+        Returns:
+            Zero if the request is taken, otherwise the time in seconds to wait before retrying.
+        """
+        while self.times and self.times[0] <= now - self.window_sec:
+            self.times.popleft()
+        if len(self.times) >= self.limit:
+            return self.times[0] + self.window_sec - now
+        self.times.append(now)
+        return 0.0
+
+
+class FakeClientBehavior:
+    """
+    Behavior of the fake client, i.e. how it answers the requests.
+
+    Rate limits set to zero are not enforced.
+    """
+
+    latencies: Dict[str, FakeLatencyFctType]
+    flood_wait_prob: float
+    flood_wait_sec: int
+    error_prob: float
+    forbidden_chat_ids: Set[int]
+    chat_rate_per_min: int
+    global_rate_per_sec: int
+    admin_user_ids: Set[int]
+    seed: Optional[int]
+
+    def __init__(self,
+                 *,
+                 latencies: Optional[Dict[str, FakeLatencyFctType]] = None,
+                 flood_wait_prob: float = 0.0,
+                 flood_wait_sec: int = 5,
+                 error_prob: float = 0.0,
+                 forbidden_chat_ids: Optional[Set[int]] = None,
+                 chat_rate_per_min: int = 20,
+                 global_rate_per_sec: int = 30,
+                 admin_user_ids: Optional[Set[int]] = None,
+                 seed: Optional[int] = None) -> None:
+        """
+        Initialize the behavior.
+
+        Args:
+            latencies: Latency distribution of each client method (e.g. send_message), methods not present answer
+                immediately.
+            flood_wait_prob: Probability of a request failing with a random FloodWait.
+            flood_wait_sec: Seconds to wait reported by the random FloodWait errors.
+            error_prob: Probability of a request failing with an internal server error.
+            forbidden_chat_ids: Chats where the bot is not allowed to write or delete messages.
+            chat_rate_per_min: Maximum number of messages sent to a chat in a minute.
+            global_rate_per_sec: Maximum number of messages sent to all chats in a second.
+            admin_user_ids: Users that are administrators of every chat, the other ones are simple members.
+            seed: Seed of the random generator, None for a random seed.
+        """
+        self.latencies = latencies or {}
+        self.flood_wait_prob = flood_wait_prob
+        self.flood_wait_sec = flood_wait_sec
+        self.error_prob = error_prob
+        self.forbidden_chat_ids = forbidden_chat_ids or set()
+        self.chat_rate_per_min = chat_rate_per_min
+        self.global_rate_per_sec = global_rate_per_sec
+        self.admin_user_ids = admin_user_ids or set()
+        self.seed = seed
+
+    def GetLatency(self,
+                   method: str) -> FakeLatencyFctType:
+        """
+        Get the latency distribution of a client method.
+
+        Args:
+            method: Client method name.
+
+        Returns:
+            Latency distribution.
+        """
+        return self.latencies.get(method, FakeLatency.Zero())
@@ -0,0 +1,154 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+import selectors
+from typing import List, Optional, Tuple
+
+from telegram_periodic_msg_bot.utils.clock import Clock
+
+
+class FakeClockConst:
+    """Constants for fake clock class."""
+
+    # Minimum time advance, so that the time always moves forward despite the rounding of large timestamps
+    MIN_ADVANCE_SEC: float = 1e-6
+
+
+class FakeClock(Clock):
+    """
+    Virtual clock, whose time only moves forward when advanced.
+
+    The monotonic time starts from zero, so that it keeps a fine resolution (the event loop compares it
+    with a nanosecond tolerance).
+    """
+
+    start_time: float
+    now: float
+
+    def __init__(self,
+                 start_time: float) -> None:
+        """
+        Initialize the clock.
+
+        Args:
+            start_time: Initial timestamp in seconds.
+        """
+        self.start_time = start_time
+        self.now = start_time
+
+    def Time(self) -> float:
+        """
+        Get the current time.
+
+        Returns:
+            Timestamp in seconds.
+        """
+        return self.now
+
+    def Monotonic(self) -> float:
+        """
+        Get the current monotonic time.
+
+        Returns:
+            Monotonic time in seconds, elapsed since the initial time.
+        """
+        return self.now - self.start_time
+
+    def Advance(self,
+                sec: float) -> None:
+        """
+        Move the time forward.
+
+        Args:
+            sec: Seconds to advance.
+        """
+        self.now += max(sec, FakeClockConst.MIN_ADVANCE_SEC)
+
+
+class FakeClockSelector(selectors.SelectSelector):
+    """
+    Selector that, instead of blocking until the timeout, advances the clock by it.
+
+    In this way, the event loop jumps to the next scheduled callback as soon as there's nothing else to do.
+    """
+
+    clock: FakeClock
+
+    def __init__(self,
+                 clock: FakeClock) -> None:
+        """
+        Initialize the selector.
+
+        Args:
+            clock: Clock to advance.
+        """
+        super().__init__()
+        self.clock = clock
+
+    def select(self,
+               timeout: Optional[float] = None) -> List[Tuple[selectors.SelectorKey, int]]:
+        """
+        Get the ready file objects without blocking, advancing the clock if none is ready.
+
+        Args:
+            timeout: Time to wait, None for waiting indefinitely (e.g. for a thread).
+
+        Returns:
+            Ready file objects with their events.
+        """
+        if timeout is None:
+            return super().select(None)
+
+        ready = super().select(0)
+        if len(ready) == 0 and timeout > 0.0:
+            self.clock.Advance(timeout)
+        return ready
+
+
+class FakeClockEventLoop(asyncio.SelectorEventLoop):
+    """
+    Event loop running on a virtual clock, so that timers (e.g. sleeps) elapse immediately.
+
+    The code shall take the current time from the same clock, time always stands still while a callback runs.
+    """
+
+    clock: FakeClock
+
+    def __init__(self,
+                 clock: FakeClock) -> None:
+        """
+        Initialize the event loop.
+
+        Args:
+            clock: Virtual clock.
+        """
+        # Set before initializing the base class, which may already read the time
+        self.clock = clock
+        super().__init__(FakeClockSelector(clock))
+
+    def time(self) -> float:
+        """
+        Get the time of the event loop.
+
+        Returns:
+            Monotonic time of the virtual clock.
+        """
+        return self.clock.Monotonic()
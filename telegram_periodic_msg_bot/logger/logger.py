@@ -18,13 +18,30 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import atexit
+import copy
+import hashlib
 import logging
 import logging.handlers
 import os
-from typing import Union
+import queue
+import threading
+import time
+from enum import Enum, auto, unique
+from typing import Dict, List, Optional, Tuple, Union
 
 from telegram_periodic_msg_bot.bot.bot_config_types import BotConfigTypes
 from telegram_periodic_msg_bot.config.config_object import ConfigObject
+from telegram_periodic_msg_bot.metrics.metrics import MetricCounter, MetricGauge
+
+
+@unique
+class LoggerMsgBodyModes(Enum):
+    """Enumeration of the ways message bodies are logged."""
+
+    FULL = auto()
+    TRUNCATED = auto()
+    HASH = auto()
 
 
 class LoggerConst:
@@ -33,6 +50,236 @@ class LoggerConst:
     LOGGER_NAME: str = ""
     LOG_CONSOLE_FORMAT: str = "%(asctime)-15s %(levelname)s - %(message)s"
     LOG_FILE_FORMAT: str = "%(asctime)-15s %(levelname)s - [%(name)s.%(funcName)s:%(lineno)d] %(message)s"
+    # Number of hexadecimal digits of the hash logged in place of a message body
+    MSG_BODY_HASH_LEN: int = 16
+    # Number of rate limited messages above which the expired ones are removed
+    RATE_LIMIT_MAX_KEYS: int = 1024
+
+
+class LoggerStats:
+    """Statistics of the logger."""
+
+    dropped_num: MetricCounter
+    queued_num: MetricGauge
+    suppressed_num: MetricCounter
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.dropped_num = MetricCounter("log_records_dropped_total", "Number of log records dropped because the queue was full")
+        self.queued_num = MetricGauge("log_records_queued", "Number of log records waiting to be written")
+        self.suppressed_num = MetricCounter("log_records_suppressed_total", "Number of repeated log records suppressed")
+
+
+class LoggerMsgBody:
+    """Message body formatted for logging only when the record is actually emitted."""
+
+    __slots__ = ("body", "mode", "max_len")
+
+    body: str
+    mode: LoggerMsgBodyModes
+    max_len: int
+
+    def __init__(self,
+                 body: str,
+                 mode: LoggerMsgBodyModes,
+                 max_len: int) -> None:
+        """
+        Initialize the message body.
+
+        Args:
+            body: Message body.
+            mode: Way the body is logged.
+            max_len: Maximum length of the body, only used in truncated mode.
+        """
+        self.body = body
+        self.mode = mode
+        self.max_len = max_len
+
+    def __str__(self) -> str:
+        """
+        Get the message body as it shall be logged.
+
+        Returns:
+            Formatted message body.
+        """
+        if self.mode == LoggerMsgBodyModes.HASH:
+            digest = hashlib.sha256(self.body.encode("utf-8", "surrogatepass")).hexdigest()
+            return f"<sha256: {digest[:LoggerConst.MSG_BODY_HASH_LEN]}>"
+        if self.mode == LoggerMsgBodyModes.TRUNCATED and len(self.body) > self.max_len:
+            return f"{self.body[:self.max_len]}... ({len(self.body) - self.max_len} more characters)"
+        return self.body
+
+
+class LoggerRateLimitFilter(logging.Filter):
+    """
+    Filter letting through only one record per interval among identical warnings and errors logged at the same
+    call site. The number of suppressed records is added to the next record let through.
+    """
+
+    interval_sec: float
+    stats: LoggerStats
+    entries: Dict[Tuple[str, int, str], Tuple[float, int]]
+    lock: threading.Lock
+
+    def __init__(self,
+                 interval_sec: float,
+                 stats: LoggerStats) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            interval_sec: Minimum time in seconds between identical records.
+            stats: Logger statistics.
+        """
+        super().__init__()
+        self.interval_sec = interval_sec
+        self.stats = stats
+        self.entries = {}
+        # Records can be logged by more threads
+        self.lock = threading.Lock()
+
+    def filter(self,
+               record: logging.LogRecord) -> bool:
+        """
+        Check if a record shall be logged.
+
+        Args:
+            record: Log record.
+
+        Returns:
+            True if the record shall be logged, False otherwise.
+        """
+        if record.levelno < logging.WARNING:
+            return True
+
+        key = (record.pathname, record.lineno, str(record.msg))
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and now - entry[0] < self.interval_sec:
+                self.entries[key] = (entry[0], entry[1] + 1)
+                self.stats.suppressed_num.Inc()
+                return False
+
+            if entry is None and len(self.entries) >= LoggerConst.RATE_LIMIT_MAX_KEYS:
+                self.__RemoveExpired(now)
+            self.entries[key] = (now, 0)
+
+        if entry is not None and entry[1] > 0:
+            record.msg = f"{record.msg} ({entry[1]} similar message(s) suppressed)"
+        return True
+
+    def __RemoveExpired(self,
+                        now: float) -> None:
+        """
+        Remove the entries whose interval is expired.
+
+        Args:
+            now: Current time.
+        """
+        self.entries = {
+            key: entry for key, entry in self.entries.items() if now - entry[0] < self.interval_sec
+        }
+
+
+class LoggerQueueHandler(logging.handlers.QueueHandler):
+    """Handler putting log records in a bounded queue, without ever blocking the caller."""
+
+    log_queue: queue.Queue
+    stats: LoggerStats
+    pending_dropped_num: int
+
+    def __init__(self,
+                 log_queue: queue.Queue,
+                 stats: LoggerStats) -> None:
+        """
+        Initialize the handler.
+
+        Args:
+            log_queue: Bounded queue of log records.
+            stats: Logger statistics.
+        """
+        super().__init__(log_queue)
+        self.log_queue = log_queue
+        self.stats = stats
+        self.pending_dropped_num = 0
+
+    def prepare(self,
+                record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a record for the queue.
+
+        Args:
+            record: Log record.
+
+        Returns:
+            Prepared log record.
+        """
+        # Only merge the arguments, so that later changes to them don't affect the record. Formatting (including
+        # exception tracebacks) is left to the listener thread.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self,
+                record: logging.LogRecord) -> None:
+        """
+        Put a record in the queue, dropping it if the queue is full.
+
+        Args:
+            record: Log record.
+        """
+        try:
+            if self.pending_dropped_num > 0:
+                self.log_queue.put_nowait(self.__DroppedRecord(record.name))
+                self.pending_dropped_num = 0
+            self.log_queue.put_nowait(record)
+        except queue.Full:
+            self.pending_dropped_num += 1
+            self.stats.dropped_num.Inc()
+
+    def __DroppedRecord(self,
+                        name: str) -> logging.LogRecord:
+        """
+        Create a record reporting the records dropped since the queue was last full.
+
+        Args:
+            name: Logger name.
+
+        Returns:
+            Log record.
+        """
+        return logging.makeLogRecord({
+            "name": name,
+            "funcName": "enqueue",
+            "levelno": logging.WARNING,
+            "levelname": logging.getLevelName(logging.WARNING),
+            "msg": f"Log queue full, {self.pending_dropped_num} record(s) dropped",
+        })
+
+
+class LoggerQueueListener(logging.handlers.QueueListener):
+    """Listener writing the queued log records from a background thread."""
+
+    log_queue: queue.Queue
+
+    def __init__(self,
+                 log_queue: queue.Queue,
+                 handlers: List[logging.Handler]) -> None:
+        """
+        Initialize the listener.
+
+        Args:
+            log_queue: Bounded queue of log records.
+            handlers: Handlers writing the log records.
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.log_queue = log_queue
+
+    def enqueue_sentinel(self) -> None:
+        """Put the stop sentinel (None) in the queue, waiting for room so that it's never dropped."""
+        self.log_queue.put(None)
 
 
 class Logger:
@@ -40,6 +287,10 @@ class Logger:
 
     config: ConfigObject
     logger: logging.Logger
+    handlers: List[logging.Handler]
+    queue_handler: Optional[LoggerQueueHandler]
+    queue_listener: Optional[LoggerQueueListener]
+    stats: LoggerStats
 
     def __init__(self,
                  config: ConfigObject) -> None:
@@ -51,6 +302,10 @@ class Logger:
         """
         self.config = config
         self.logger = logging.getLogger(LoggerConst.LOGGER_NAME)
+        self.handlers = []
+        self.queue_handler = None
+        self.queue_listener = None
+        self.stats = LoggerStats()
         self.__Init()
 
     def GetLogger(self) -> logging.Logger:
@@ -62,27 +317,74 @@ class Logger:
         """
         return self.logger
 
+    def MsgBody(self,
+                body: str) -> LoggerMsgBody:
+        """
+        Wrap a message body for logging it according to configuration, e.g. as an argument of a log call.
+
+        Args:
+            body: Message body.
+
+        Returns:
+            Message body for logging.
+        """
+        return LoggerMsgBody(body,
+                             self.config.GetValue(BotConfigTypes.LOG_MSG_BODY_MODE),
+                             self.config.GetValue(BotConfigTypes.LOG_MSG_BODY_MAX_LEN))
+
+    def GetStats(self) -> LoggerStats:
+        """
+        Get the logger statistics.
+
+        Returns:
+            Logger statistics.
+        """
+        if self.queue_handler is not None:
+            self.stats.queued_num.Set(self.queue_handler.log_queue.qsize())
+        return self.stats
+
+    def Close(self) -> None:
+        """Write all the queued log records and stop the listener thread, if the queue is enabled."""
+        if self.queue_handler is None or self.queue_listener is None:
+            return
+
+        self.queue_listener.stop()
+        # Records logged from now on are written directly
+        self.logger.removeHandler(self.queue_handler)
+        for handler in self.handlers:
+            self.logger.addHandler(handler)
+        self.queue_handler = None
+        self.queue_listener = None
+
     def __Init(self) -> None:
         """Initialize all logger handlers based on configuration."""
         self.__ConfigureRootLogger()
+        self.__ConfigureRateLimit()
         self.__ConfigureConsoleLogger()
         self.__ConfigureFileLogger()
+        self.__ConfigureQueue()
         self.logger.info("Logger initialized")
 
     def __ConfigureRootLogger(self) -> None:
         """Configure the root logger with the specified log level."""
         self.logger.setLevel(self.config.GetValue(BotConfigTypes.LOG_LEVEL))
 
+    def __ConfigureRateLimit(self) -> None:
+        """Configure the rate limit of repeated warnings and errors if enabled in configuration."""
+        rate_limit_sec = self.config.GetValue(BotConfigTypes.LOG_RATE_LIMIT_SEC)
+        if rate_limit_sec > 0:
+            self.logger.addFilter(LoggerRateLimitFilter(rate_limit_sec, self.stats))
+
     def __ConfigureConsoleLogger(self) -> None:
-        """Configure and add console logging handler if enabled in configuration."""
+        """Configure console logging handler if enabled in configuration."""
         if self.config.GetValue(BotConfigTypes.LOG_CONSOLE_ENABLED):
             ch = logging.StreamHandler()
             ch.setLevel(self.config.GetValue(BotConfigTypes.LOG_LEVEL))
             ch.setFormatter(logging.Formatter(LoggerConst.LOG_CONSOLE_FORMAT))
-            self.logger.addHandler(ch)
+            self.handlers.append(ch)
 
     def __ConfigureFileLogger(self) -> None:
-        """Configure and add file logging handler if enabled in configuration."""
+        """Configure file logging handler if enabled in configuration."""
         if self.config.GetValue(BotConfigTypes.LOG_FILE_ENABLED):
             log_file_name = self.config.GetValue(BotConfigTypes.LOG_FILE_NAME)
             self.__MakeLogDir(log_file_name)
@@ -100,7 +402,25 @@ class Logger:
 
             fh.setLevel(self.config.GetValue(BotConfigTypes.LOG_LEVEL))
             fh.setFormatter(logging.Formatter(LoggerConst.LOG_FILE_FORMAT))
-            self.logger.addHandler(fh)
+            self.handlers.append(fh)
+
+    def __ConfigureQueue(self) -> None:
+        """
+        Add the configured handlers to the logger, behind a queue written by a background thread if enabled in
+        configuration.
+        """
+        if not self.config.GetValue(BotConfigTypes.LOG_QUEUE_ENABLED):
+            for handler in self.handlers:
+                self.logger.addHandler(handler)
+            return
+
+        log_queue: queue.Queue = queue.Queue(self.config.GetValue(BotConfigTypes.LOG_QUEUE_SIZE))
+        self.queue_handler = LoggerQueueHandler(log_queue, self.stats)
+        self.queue_listener = LoggerQueueListener(log_queue, self.handlers)
+        self.queue_listener.start()
+        self.logger.addHandler(self.queue_handler)
+        # Write the queued records also if the bot exits without being stopped
+        atexit.register(self.Close)
 
     @staticmethod
     def __MakeLogDir(file_name: str) -> None:
@@ -18,59 +18,245 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from typing import List
+import time
+from typing import Dict, List, Tuple, Type
 
 import pyrogram
-import pyrogram.errors.exceptions as pyrogram_ex
+from pyrogram.errors import FloodWait, InternalServerError, RPCError, ServiceUnavailable, SlowmodeWait
 
 from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.message.message_retry_handler import MessageRetryHandler, MessageRetryLaterError
+from telegram_periodic_msg_bot.metrics.metrics import MetricCounter, MetricCounterFamily, MetricGauge, MetricHistogram, MetricsConst
+
+
+# IDs of the messages not deleted, with the name of the error
+MessageDeleteFailuresType = Dict[int, str]
+
+
+class MessageDeleterConst:
+    """Constants for message deleter."""
+
+    # Maximum number of messages deleted by a single request (API limit)
+    MAX_IDS_PER_REQUEST: int = 100
+    # Errors after which the deletion is kept pending, since it may succeed later
+    TRANSIENT_ERRORS: Tuple[Type[RPCError], ...] = (FloodWait, SlowmodeWait, InternalServerError, ServiceUnavailable)
+
+
+class MessageDeleterStats:
+    """Statistics of the message deleter."""
+
+    deleted_num: MetricCounter
+    requests_num: MetricCounter
+    rpc_errors_num: MetricCounterFamily
+    pending_num: MetricGauge
+    delete_time: MetricHistogram
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.deleted_num = MetricCounter("messages_deleted_total", "Number of messages deleted")
+        self.requests_num = MetricCounter("message_delete_requests_total",
+                                          "Number of delete requests, each for up to 100 messages of a chat")
+        self.rpc_errors_num = MetricCounterFamily("message_delete_errors_total",
+                                                  "Number of messages not deleted because of an error",
+                                                  "error")
+        self.pending_num = MetricGauge("message_delete_pending",
+                                       "Number of messages whose deletion failed transiently, retried with the "
+                                       "next deletion in the same chat")
+        self.delete_time = MetricHistogram("message_delete_seconds",
+                                           "Time to delete a batch of messages, retries included",
+                                           MetricsConst.SLOW_OP_TIME_BUCKETS)
 
 
 class MessageDeleter:
-    """Class for deleting Telegram messages."""
+    """
+    Class for deleting Telegram messages.
+
+    Messages of a chat are deleted with a single request for up to 100 messages. Messages whose deletion
+    failed transiently (e.g. flood wait still in place after all retries) are kept pending and deleted
+    together with the next messages of the same chat, or when the chat is flushed.
+    """
 
     client: pyrogram.Client
     logger: Logger
+    retry_handler: MessageRetryHandler
+    pending_msg_ids: Dict[int, List[int]]
+    stats: MessageDeleterStats
 
     def __init__(self,
                  client: pyrogram.Client,
-                 logger: Logger) -> None:
+                 logger: Logger,
+                 retry_handler: MessageRetryHandler) -> None:
         """
         Initialize the message deleter.
 
         Args:
             client: Pyrogram client instance.
             logger: Logger instance for logging operations.
+            retry_handler: Retry handler for flood waits and transient errors.
         """
         self.client = client
         self.logger = logger
+        self.retry_handler = retry_handler
+        self.pending_msg_ids = {}
+        self.stats = MessageDeleterStats()
+
+    def GetStats(self) -> MessageDeleterStats:
+        """
+        Get the deleter statistics.
+
+        Returns:
+            Deleter statistics.
+        """
+        return self.stats
+
+    def GetPendingMessages(self,
+                           chat_id: int) -> List[int]:
+        """
+        Get the messages of a chat whose deletion is pending.
+
+        Args:
+            chat_id: ID of the chat.
+
+        Returns:
+            IDs of the pending messages.
+        """
+        return list(self.pending_msg_ids.get(chat_id, []))
 
     async def DeleteMessage(self,
-                            message: pyrogram.types.Message) -> bool:
+                            chat_id: int,
+                            message_id: int) -> bool:
         """
         Delete a single message from a chat.
 
         Args:
-            message: The message to delete.
+            chat_id: ID of the chat containing the message.
+            message_id: ID of the message to delete.
 
         Returns:
             True if the message was successfully deleted, False otherwise.
         """
-        try:
-            if message.chat is not None:
-                await self.client.delete_messages(message.chat.id, message.id)
-                return True
-        except pyrogram_ex.forbidden_403.MessageDeleteForbidden:
-            self.logger.GetLogger().exception(f"Unable to delete message {message.id}")
-        return False
+        return message_id not in await self.DeleteMessages(chat_id, [message_id])
 
     async def DeleteMessages(self,
-                             messages: List[pyrogram.types.Message]) -> None:
+                             chat_id: int,
+                             message_ids: List[int],
+                             defer_waits: bool = False) -> MessageDeleteFailuresType:
         """
-        Delete multiple messages from chats.
+        Delete multiple messages from a chat, together with the pending ones, in requests of up to 100 messages.
 
         Args:
-            messages: List of messages to delete.
+            chat_id: ID of the chat containing the messages.
+            message_ids: IDs of the messages to delete.
+            defer_waits: True for raising MessageRetryLaterError instead of waiting for a blocked chat, False to wait
+
+        Returns:
+            IDs of the messages not deleted, with the name of the error (empty if all were deleted).
+
+        Raises:
+            MessageRetryLaterError: If the chat is blocked and waits are deferred (the messages not deleted yet are
+                kept pending).
         """
-        for message in messages:
-            await self.DeleteMessage(message)
+        pending_msg_ids = self.pending_msg_ids.pop(chat_id, [])
+        self.stats.pending_num.Dec(len(pending_msg_ids))
+        # Pending messages first, since they are older
+        msg_ids = list(dict.fromkeys(pending_msg_ids + message_ids))
+
+        failures: MessageDeleteFailuresType = {}
+        for i in range(0, len(msg_ids), MessageDeleterConst.MAX_IDS_PER_REQUEST):
+            try:
+                failures.update(
+                    await self.__DeleteBatch(chat_id, msg_ids[i:i + MessageDeleterConst.MAX_IDS_PER_REQUEST], defer_waits)
+                )
+            except MessageRetryLaterError:
+                self.__AddPending(chat_id, msg_ids[i:])
+                raise
+        return failures
+
+    async def FlushPendingMessages(self,
+                                   chat_id: int) -> MessageDeleteFailuresType:
+        """
+        Delete all the pending messages of a chat.
+
+        Args:
+            chat_id: ID of the chat.
+
+        Returns:
+            IDs of the messages not deleted, with the name of the error (empty if all were deleted).
+        """
+        if chat_id not in self.pending_msg_ids:
+            return {}
+        return await self.DeleteMessages(chat_id, [])
+
+    def DiscardPendingMessages(self,
+                               chat_id: int) -> int:
+        """
+        Discard the pending messages of a chat without deleting them (e.g. when the bot left the chat).
+
+        Args:
+            chat_id: ID of the chat.
+
+        Returns:
+            Number of discarded messages.
+        """
+        discarded_num = len(self.pending_msg_ids.pop(chat_id, []))
+        self.stats.pending_num.Dec(discarded_num)
+        return discarded_num
+
+    def __AddPending(self,
+                     chat_id: int,
+                     message_ids: List[int]) -> None:
+        """
+        Add messages to the pending ones of a chat.
+
+        Args:
+            chat_id: ID of the chat containing the messages.
+            message_ids: IDs of the messages.
+        """
+        self.pending_msg_ids.setdefault(chat_id, []).extend(message_ids)
+        self.stats.pending_num.Inc(len(message_ids))
+
+    async def __DeleteBatch(self,
+                            chat_id: int,
+                            message_ids: List[int],
+                            defer_waits: bool) -> MessageDeleteFailuresType:
+        """
+        Delete a batch of messages from a chat with a single request.
+
+        Args:
+            chat_id: ID of the chat containing the messages.
+            message_ids: IDs of the messages to delete (up to 100).
+            defer_waits: True for raising MessageRetryLaterError instead of waiting for a blocked chat.
+
+        Returns:
+            IDs of the messages not deleted, with the name of the error (empty if all were deleted).
+        """
+        start_time = time.perf_counter()
+        self.stats.requests_num.Inc()
+        try:
+            deleted_num = await self.retry_handler.Run(chat_id,
+                                                       self.client.delete_messages,
+                                                       chat_id,
+                                                       message_ids,
+                                                       defer_waits=defer_waits)
+        except RPCError as ex:
+            error_name = type(ex).__name__
+            self.stats.rpc_errors_num.Inc(error_name, len(message_ids))
+            if isinstance(ex, MessageDeleterConst.TRANSIENT_ERRORS):
+                self.__AddPending(chat_id, message_ids)
+                self.logger.GetLogger().warning(
+                    f"Unable to delete messages {message_ids} in chat {chat_id} ({error_name}), kept pending"
+                )
+            else:
+                self.logger.GetLogger().exception(f"Error while deleting messages {message_ids} in chat {chat_id}")
+            return dict.fromkeys(message_ids, error_name)
+
+        self.stats.delete_time.Observe(time.perf_counter() - start_time)
+        if not isinstance(deleted_num, int):
+            deleted_num = len(message_ids)
+        self.stats.deleted_num.Inc(deleted_num)
+        # Messages not found (e.g. already deleted by an admin) are skipped by the server without errors
+        if deleted_num < len(message_ids):
+            self.logger.GetLogger().debug(
+                f"Deleted {deleted_num} of {len(message_ids)} messages in chat {chat_id}, the others were not found"
+            )
+        return {}
@@ -26,7 +26,7 @@ import pyrogram
 from telegram_periodic_msg_bot.config.config_object import ConfigObject
 from telegram_periodic_msg_bot.logger.logger import Logger
 from telegram_periodic_msg_bot.message.message_sender import MessageSender
-from telegram_periodic_msg_bot.translator.translation_loader import TranslationLoader
+from telegram_periodic_msg_bot.translator.translation_packs import TranslationPacks
 
 
 @unique
@@ -43,23 +43,27 @@ class MessageDispatcher:
 
     config: ConfigObject
     logger: Logger
-    translator: TranslationLoader
+    translator: TranslationPacks
+    message_sender: MessageSender
 
     def __init__(self,
                  config: ConfigObject,
                  logger: Logger,
-                 translator: TranslationLoader) -> None:
+                 translator: TranslationPacks,
+                 message_sender: MessageSender) -> None:
         """
         Initialize the message dispatcher.
 
         Args:
             config: Configuration object.
             logger: Logger instance for logging operations.
-            translator: Translation loader for localized messages.
+            translator: Translations of the chats.
+            message_sender: Shared message sender.
         """
         self.config = config
         self.logger = logger
         self.translator = translator
+        self.message_sender = message_sender
 
     async def Dispatch(self,
                        client: pyrogram.Client,
@@ -105,10 +109,10 @@ class MessageDispatcher:
         if message.chat is None:
             return
 
-        await MessageSender(client, self.logger).SendMessage(
+        await self.message_sender.SendMessage(
             message.chat,
             message.message_thread_id,
-            self.translator.GetSentence("BOT_WELCOME_MSG")
+            self.translator.ForChat(message.chat.id).GetSentence("BOT_WELCOME_MSG")
         )
 
     async def __OnLeftMember(self,
@@ -143,9 +147,9 @@ class MessageDispatcher:
 
         for member in message.new_chat_members:
             if member.is_self:
-                await MessageSender(client, self.logger).SendMessage(
+                await self.message_sender.SendMessage(
                     message.chat,
                     message.message_thread_id,
-                    self.translator.GetSentence("BOT_WELCOME_MSG")
+                    self.translator.ForChat(message.chat.id).GetSentence("BOT_WELCOME_MSG")
                 )
                 break
@@ -0,0 +1,238 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import asyncio
+from typing import Dict, Optional
+
+from telegram_periodic_msg_bot.metrics.metrics import MetricCounter, MetricGauge, MetricHistogram, MetricsConst
+from telegram_periodic_msg_bot.utils.clock import Clock
+
+
+class MessageRateLimiterConst:
+    """Constants for message rate limiter."""
+
+    # Minimum number of chat buckets before idle ones are evicted
+    CHAT_BUCKETS_EVICT_MIN_NUM: int = 1024
+
+
+class MessageTokenBucket:
+    """
+    Token bucket with reservations.
+
+    A token is always taken immediately, letting the bucket go below zero, and the caller is told how long
+    to wait before using it. In this way, concurrent callers are served in order without polling.
+    """
+
+    rate: float
+    burst: int
+    tokens: float
+    last_time: float
+
+    def __init__(self,
+                 rate: float,
+                 burst: int,
+                 now: float) -> None:
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Refill rate in tokens per second.
+            burst: Bucket capacity.
+            now: Current monotonic time.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last_time = now
+
+    def Reserve(self,
+                now: float) -> float:
+        """
+        Reserve a token.
+
+        Args:
+            now: Current monotonic time.
+
+        Returns:
+            Time in seconds to wait before the token can be used.
+        """
+        self.__Refill(now)
+        self.tokens -= 1.0
+        return 0.0 if self.tokens >= 0.0 else -self.tokens / self.rate
+
+    def IsFull(self,
+               now: float) -> bool:
+        """
+        Get if the bucket is full, i.e. it has not been used for long enough.
+
+        Args:
+            now: Current monotonic time.
+
+        Returns:
+            True if full, false otherwise.
+        """
+        self.__Refill(now)
+        return self.tokens >= self.burst
+
+    def __Refill(self,
+                 now: float) -> None:
+        """
+        Refill the bucket with the tokens accumulated since the last call.
+
+        Args:
+            now: Current monotonic time.
+        """
+        self.tokens = min(float(self.burst), self.tokens + (now - self.last_time) * self.rate)
+        self.last_time = now
+
+
+class MessageRateLimiterStats:
+    """Statistics of the message rate limiter."""
+
+    acquired_num: MetricCounter
+    throttled_num: MetricCounter
+    chat_buckets_num: MetricGauge
+    wait_time: MetricHistogram
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.acquired_num = MetricCounter("rate_limiter_acquired_total", "Number of acquired send tokens")
+        self.throttled_num = MetricCounter("rate_limiter_throttled_total", "Number of sends that had to wait for a token")
+        self.chat_buckets_num = MetricGauge("rate_limiter_chat_buckets", "Number of chat buckets in memory")
+        self.wait_time = MetricHistogram("rate_limiter_wait_seconds",
+                                         "Time waited by throttled sends",
+                                         MetricsConst.SLOW_OP_TIME_BUCKETS)
+
+
+class MessageRateLimiter:
+    """
+    Rate limiter for sending messages, with a global bucket and one bucket for each chat.
+
+    Buckets start full, so a send in an idle chat never waits.
+    """
+
+    clock: Clock
+    global_bucket: MessageTokenBucket
+    chat_rate: float
+    chat_burst: int
+    chat_buckets: Dict[int, MessageTokenBucket]
+    chat_buckets_evict_num: int
+    stats: MessageRateLimiterStats
+
+    def __init__(self,
+                 global_rate: float,
+                 global_burst: int,
+                 chat_rate: float,
+                 chat_burst: int,
+                 *,
+                 clock: Optional[Clock] = None) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            global_rate: Global rate in messages per second.
+            global_burst: Global burst in messages.
+            chat_rate: Rate for each chat in messages per second.
+            chat_burst: Burst for each chat in messages.
+            clock: Clock giving the current time (optional, the system clock if not specified).
+        """
+        self.clock = clock if clock is not None else Clock()
+        self.global_bucket = MessageTokenBucket(global_rate, global_burst, self.clock.Monotonic())
+        self.chat_rate = chat_rate
+        self.chat_burst = chat_burst
+        self.chat_buckets = {}
+        self.chat_buckets_evict_num = MessageRateLimiterConst.CHAT_BUCKETS_EVICT_MIN_NUM
+        self.stats = MessageRateLimiterStats()
+
+    def GetStats(self) -> MessageRateLimiterStats:
+        """
+        Get the rate limiter statistics.
+
+        Returns:
+            Rate limiter statistics.
+        """
+        return self.stats
+
+    async def Acquire(self,
+                      chat_id: int) -> None:
+        """
+        Wait until a message can be sent to the specified chat.
+
+        Args:
+            chat_id: Chat ID.
+        """
+        start_time = self.clock.Monotonic()
+        throttled = False
+
+        # Wait for the chat first, so that a busy chat does not hold global tokens while waiting
+        wait_time = self.__GetChatBucket(chat_id, start_time).Reserve(start_time)
+        if wait_time > 0.0:
+            throttled = True
+            await asyncio.sleep(wait_time)
+
+        wait_time = self.global_bucket.Reserve(self.clock.Monotonic())
+        if wait_time > 0.0:
+            throttled = True
+            await asyncio.sleep(wait_time)
+
+        self.stats.acquired_num.Inc()
+        if throttled:
+            self.stats.throttled_num.Inc()
+            self.stats.wait_time.Observe(self.clock.Monotonic() - start_time)
+
+    def __GetChatBucket(self,
+                        chat_id: int,
+                        now: float) -> MessageTokenBucket:
+        """
+        Get the bucket of the specified chat, creating it if needed.
+
+        Args:
+            chat_id: Chat ID.
+            now: Current monotonic time.
+
+        Returns:
+            Chat bucket.
+        """
+        bucket = self.chat_buckets.get(chat_id)
+        if bucket is None:
+            if len(self.chat_buckets) >= self.chat_buckets_evict_num:
+                self.__EvictIdleChatBuckets(now)
+            bucket = MessageTokenBucket(self.chat_rate, self.chat_burst, now)
+            self.chat_buckets[chat_id] = bucket
+            self.stats.chat_buckets_num.Set(len(self.chat_buckets))
+        return bucket
+
+    def __EvictIdleChatBuckets(self,
+                               now: float) -> None:
+        """
+        Evict the chat buckets that are full, since they are equivalent to new ones.
+
+        Args:
+            now: Current monotonic time.
+        """
+        self.chat_buckets = {
+            chat_id: bucket
+            for chat_id, bucket in self.chat_buckets.items()
+            if not bucket.IsFull(now)
+        }
+        # Amortize the eviction cost over the next insertions
+        self.chat_buckets_evict_num = max(MessageRateLimiterConst.CHAT_BUCKETS_EVICT_MIN_NUM,
+                                          2 * len(self.chat_buckets))
@@ -0,0 +1,351 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+from pyrogram.errors import FloodWait, InternalServerError, ServiceUnavailable, SlowmodeWait
+
+from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.metrics.metrics import MetricCounter, MetricGauge, MetricHistogram, MetricsConst
+from telegram_periodic_msg_bot.utils.clock import Clock
+
+
+# Return type of the retried function
+RetryResultType = TypeVar("RetryResultType")
+
+
+class MessageRetryLaterError(Exception):
+    """Exception raised when a request has to wait for its chat and the wait is deferred to the caller."""
+
+    wait_time: float
+
+    def __init__(self,
+                 wait_time: float) -> None:
+        """
+        Initialize the exception.
+
+        Args:
+            wait_time: Time to wait in seconds before retrying the request.
+        """
+        super().__init__(f"Retry after {wait_time}s")
+        self.wait_time = wait_time
+
+
+class MessageRetryHandlerConst:
+    """Constants for message retry handler."""
+
+    # Minimum number of chat states before expired ones are evicted
+    CHAT_STATES_EVICT_MIN_NUM: int = 1024
+    # Server errors, retried for every request
+    SERVER_ERRORS: Tuple[Type[BaseException], ...] = (InternalServerError, ServiceUnavailable)
+    # Transport errors, retried only for idempotent requests since the request may have reached the server
+    TRANSPORT_ERRORS: Tuple[Type[BaseException], ...] = (OSError, asyncio.TimeoutError)
+
+
+class MessageRetryChatState:
+    """Backoff state of a chat."""
+
+    blocked_until: float
+    failures_num: int
+    deferred_num: int
+
+    def __init__(self) -> None:
+        """Initialize the state."""
+        self.blocked_until = 0.0
+        self.failures_num = 0
+        self.deferred_num = 0
+
+
+class MessageRetryHandlerStats:
+    """Statistics of the message retry handler."""
+
+    retries_num: MetricCounter
+    flood_waits_num: MetricCounter
+    failed_num: MetricCounter
+    blocked_chats_num: MetricGauge
+    wait_time: MetricHistogram
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.retries_num = MetricCounter("retry_retries_total", "Number of retried requests")
+        self.flood_waits_num = MetricCounter("retry_flood_waits_total", "Number of flood waits received")
+        self.failed_num = MetricCounter("retry_failed_total", "Number of requests failed after all retries")
+        self.blocked_chats_num = MetricGauge("retry_blocked_chats", "Number of chats with a backoff state")
+        self.wait_time = MetricHistogram("retry_wait_seconds",
+                                         "Time waited before retrying requests",
+                                         MetricsConst.SLOW_OP_TIME_BUCKETS)
+
+
+class MessageRetryHandler:
+    """
+    Handler for retrying requests to a chat.
+
+    Flood waits block the chat for the time requested by the server, other transient errors are
+    retried with an exponential backoff. The state is kept for each chat, so that a blocked chat
+    does not delay the others.
+    Callers that cannot wait (e.g. the workers sending periodic messages) can defer the waits, in which
+    case an exception with the wait time is raised instead of waiting. Transport errors are retried only
+    for idempotent requests, since a non-idempotent one (e.g. sending a message) may have reached the server.
+    """
+
+    logger: Logger
+    clock: Clock
+    retry_max_num: int
+    backoff_base_sec: float
+    backoff_max_sec: float
+    flood_wait_max_sec: float
+    chat_states: Dict[int, MessageRetryChatState]
+    chat_states_evict_num: int
+    stats: MessageRetryHandlerStats
+
+    def __init__(self,
+                 logger: Logger,
+                 retry_max_num: int,
+                 backoff_base_sec: float,
+                 backoff_max_sec: float,
+                 flood_wait_max_sec: float,
+                 *,
+                 clock: Optional[Clock] = None) -> None:
+        """
+        Initialize the retry handler.
+
+        Args:
+            logger: Logger instance for logging operations.
+            retry_max_num: Maximum number of retries for each request.
+            backoff_base_sec: Backoff time in seconds after the first failure, doubled at each failure.
+            backoff_max_sec: Maximum backoff time in seconds.
+            flood_wait_max_sec: Maximum flood wait time in seconds that is waited, longer ones are not retried.
+            clock: Clock giving the current time (optional, the system clock if not specified).
+        """
+        self.logger = logger
+        self.clock = clock if clock is not None else Clock()
+        self.retry_max_num = retry_max_num
+        self.backoff_base_sec = backoff_base_sec
+        self.backoff_max_sec = backoff_max_sec
+        self.flood_wait_max_sec = flood_wait_max_sec
+        self.chat_states = {}
+        self.chat_states_evict_num = MessageRetryHandlerConst.CHAT_STATES_EVICT_MIN_NUM
+        self.stats = MessageRetryHandlerStats()
+
+    def GetStats(self) -> MessageRetryHandlerStats:
+        """
+        Get the retry handler statistics.
+
+        Returns:
+            Retry handler statistics.
+        """
+        return self.stats
+
+    def GetChatWaitTime(self,
+                        chat_id: int) -> float:
+        """
+        Get the time to wait before a request can be sent to the specified chat.
+
+        Args:
+            chat_id: Chat ID.
+
+        Returns:
+            Wait time in seconds, zero if the chat is not blocked.
+        """
+        chat_state = self.chat_states.get(chat_id)
+        if chat_state is None:
+            return 0.0
+        return max(0.0, chat_state.blocked_until - self.clock.Monotonic())
+
+    async def Run(self,
+                  chat_id: int,
+                  fct: Callable[..., Awaitable[RetryResultType]],
+                  *args: Any,
+                  idempotent: bool = True,
+                  defer_waits: bool = False,
+                  **kwargs: Any) -> RetryResultType:
+        """
+        Run a request to the specified chat, retrying it in case of flood wait or transient errors.
+
+        Args:
+            chat_id: Chat ID.
+            fct: Request function.
+            *args: Arguments passed to the function.
+            idempotent: True if the request can be repeated without side effects (transport errors are retried
+                only in this case)
+            defer_waits: True for raising MessageRetryLaterError instead of waiting for the chat, False to wait
+            **kwargs: Keyword arguments passed to the function.
+
+        Returns:
+            Value returned by the function.
+
+        Raises:
+            MessageRetryLaterError: If the chat has to be waited for and waits are deferred.
+            Exception: The last exception raised by the function, if all retries failed.
+        """
+        transient_errors = self.__TransientErrors(idempotent)
+        retry_num = 0
+        while True:
+            await self.__WaitChat(chat_id, defer_waits)
+            try:
+                res = await fct(*args, **kwargs)
+            except (FloodWait, SlowmodeWait) as ex:
+                self.stats.flood_waits_num.Inc()
+                wait_time = float(ex.value)  # type: ignore[arg-type]
+                self.__BlockChat(chat_id, wait_time)
+                if wait_time > self.flood_wait_max_sec or self.__RetriesExhausted(chat_id, retry_num):
+                    self.stats.failed_num.Inc()
+                    raise
+                self.logger.GetLogger().warning(f"Flood wait of {wait_time}s in chat {chat_id}, retrying")
+            except transient_errors as ex:
+                chat_state = self.__GetChatState(chat_id)
+                chat_state.failures_num += 1
+                wait_time = min(self.backoff_max_sec,
+                                self.backoff_base_sec * 2 ** (chat_state.failures_num - 1))
+                self.__BlockChat(chat_id, wait_time)
+                if self.__RetriesExhausted(chat_id, retry_num):
+                    self.stats.failed_num.Inc()
+                    raise
+                self.logger.GetLogger().warning(
+                    f"Error in chat {chat_id} ({ex.__class__.__name__}), retrying in {wait_time}s"
+                )
+            else:
+                self.__ResetChat(chat_id)
+                return res
+
+            retry_num += 1
+            self.stats.retries_num.Inc()
+            if defer_waits:
+                # The retry is done by the caller, count it in the chat state
+                self.__GetChatState(chat_id).deferred_num += 1
+                raise MessageRetryLaterError(self.GetChatWaitTime(chat_id))
+
+    def __RetriesExhausted(self,
+                           chat_id: int,
+                           retry_num: int) -> bool:
+        """
+        Get if the retries of a request are exhausted, counting the ones deferred to the caller.
+
+        Args:
+            chat_id: Chat ID.
+            retry_num: Number of retries done by the current call.
+
+        Returns:
+            True if exhausted, False otherwise.
+        """
+        chat_state = self.__GetChatState(chat_id)
+        if retry_num + chat_state.deferred_num < self.retry_max_num:
+            return False
+        chat_state.deferred_num = 0
+        return True
+
+    @staticmethod
+    def __TransientErrors(idempotent: bool) -> Tuple[Type[BaseException], ...]:
+        """
+        Get the errors retried with a backoff.
+
+        Args:
+            idempotent: True if the request is idempotent.
+
+        Returns:
+            Transient errors.
+        """
+        if idempotent:
+            return MessageRetryHandlerConst.SERVER_ERRORS + MessageRetryHandlerConst.TRANSPORT_ERRORS
+        return MessageRetryHandlerConst.SERVER_ERRORS
+
+    async def __WaitChat(self,
+                         chat_id: int,
+                         defer_waits: bool) -> None:
+        """
+        Wait until the specified chat is not blocked anymore.
+
+        Args:
+            chat_id: Chat ID.
+            defer_waits: True for raising MessageRetryLaterError instead of waiting.
+
+        Raises:
+            MessageRetryLaterError: If the chat is blocked and waits are deferred.
+        """
+        wait_time = self.GetChatWaitTime(chat_id)
+        if wait_time > 0.0:
+            if defer_waits:
+                raise MessageRetryLaterError(wait_time)
+            self.stats.wait_time.Observe(wait_time)
+            await asyncio.sleep(wait_time)
+
+    def __BlockChat(self,
+                    chat_id: int,
+                    wait_time: float) -> None:
+        """
+        Block the specified chat for the specified time.
+
+        Args:
+            chat_id: Chat ID.
+            wait_time: Wait time in seconds.
+        """
+        chat_state = self.__GetChatState(chat_id)
+        chat_state.blocked_until = max(chat_state.blocked_until, self.clock.Monotonic() + wait_time)
+
+    def __ResetChat(self,
+                    chat_id: int) -> None:
+        """
+        Reset the state of the specified chat after a successful request.
+
+        Args:
+            chat_id: Chat ID.
+        """
+        chat_state = self.chat_states.get(chat_id)
+        if chat_state is None:
+            return
+        if chat_state.blocked_until <= self.clock.Monotonic():
+            del self.chat_states[chat_id]
+            self.stats.blocked_chats_num.Set(len(self.chat_states))
+        else:
+            chat_state.deferred_num = 0
+
+    def __GetChatState(self,
+                       chat_id: int) -> MessageRetryChatState:
+        """
+        Get the state of the specified chat, creating it if needed.
+
+        Args:
+            chat_id: Chat ID.
+
+        Returns:
+            Chat state.
+        """
+        chat_state = self.chat_states.get(chat_id)
+        if chat_state is None:
+            if len(self.chat_states) >= self.chat_states_evict_num:
+                self.__EvictExpiredChatStates()
+            chat_state = MessageRetryChatState()
+            self.chat_states[chat_id] = chat_state
+            self.stats.blocked_chats_num.Set(len(self.chat_states))
+        return chat_state
+
+    def __EvictExpiredChatStates(self) -> None:
+        """Evict the states of chats that are not blocked anymore."""
+        now = self.clock.Monotonic()
+        self.chat_states = {
+            chat_id: chat_state
+            for chat_id, chat_state in self.chat_states.items()
+            if chat_state.blocked_until > now
+        }
+        # Amortize the eviction cost over the next insertions
+        self.chat_states_evict_num = max(MessageRetryHandlerConst.CHAT_STATES_EVICT_MIN_NUM,
+                                         2 * len(self.chat_states))
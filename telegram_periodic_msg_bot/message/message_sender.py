@@ -18,19 +18,37 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-import asyncio
-from typing import Any, List, Union
+import time
+from typing import Any, List, Optional, Union
 
 import pyrogram
+from pyrogram.errors import RPCError
 
 from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.message.message_rate_limiter import MessageRateLimiter
+from telegram_periodic_msg_bot.message.message_retry_handler import MessageRetryHandler
+from telegram_periodic_msg_bot.message.message_splitter import MessageSplitter
+from telegram_periodic_msg_bot.metrics.metrics import MetricCounter, MetricCounterFamily, MetricHistogram, MetricsConst
 
 
-class MessageSenderConst:
-    """Constants for message sender configuration."""
+class MessageSenderStats:
+    """Statistics of the message sender."""
 
-    MSG_MAX_LEN: int = 4096
-    SEND_MSG_SLEEP_TIME_SEC: float = 0.1
+    sent_num: MetricCounter
+    parts_sent_num: MetricCounter
+    rpc_errors_num: MetricCounterFamily
+    send_time: MetricHistogram
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.sent_num = MetricCounter("messages_sent_total", "Number of messages sent")
+        self.parts_sent_num = MetricCounter("message_parts_sent_total", "Number of message parts sent")
+        self.rpc_errors_num = MetricCounterFamily("message_send_errors_total",
+                                                  "Number of messages not sent because of an error",
+                                                  "error")
+        self.send_time = MetricHistogram("message_part_send_seconds",
+                                         "Time to send a message part, retries included",
+                                         MetricsConst.SLOW_OP_TIME_BUCKETS)
 
 
 class MessageSender:
@@ -38,19 +56,51 @@ class MessageSender:
 
     client: pyrogram.Client
     logger: Logger
+    rate_limiter: MessageRateLimiter
+    retry_handler: MessageRetryHandler
+    stats: MessageSenderStats
 
     def __init__(self,
                  client: pyrogram.Client,
-                 logger: Logger) -> None:
+                 logger: Logger,
+                 rate_limiter: MessageRateLimiter,
+                 retry_handler: MessageRetryHandler) -> None:
         """
         Initialize the message sender.
 
         Args:
             client: Pyrogram client instance.
             logger: Logger instance for logging operations.
+            rate_limiter: Rate limiter shared by all the senders.
+            retry_handler: Retry handler for flood waits and transient errors.
         """
         self.client = client
         self.logger = logger
+        self.rate_limiter = rate_limiter
+        self.retry_handler = retry_handler
+        self.stats = MessageSenderStats()
+
+    def GetStats(self) -> MessageSenderStats:
+        """
+        Get the sender statistics.
+
+        Returns:
+            Sender statistics.
+        """
+        return self.stats
+
+    def GetChatWaitTime(self,
+                        chat_id: int) -> float:
+        """
+        Get the time to wait before a message can be sent to the specified chat.
+
+        Args:
+            chat_id: Chat ID.
+
+        Returns:
+            Wait time in seconds, zero if the chat is not blocked.
+        """
+        return self.retry_handler.GetChatWaitTime(chat_id)
 
     async def SendMessage(self,
                           receiver: Union[pyrogram.types.Chat, pyrogram.types.User],
@@ -69,64 +119,61 @@ class MessageSender:
         Returns:
             List of sent message objects.
         """
-        self.logger.GetLogger().info(f"Sending message (length: {len(msg)}):\n{msg}")
-        return await self.__SendSplitMessage(receiver, topic_id, self.__SplitMessage(msg), **kwargs)
-
-    async def __SendSplitMessage(self,
-                                 receiver: Union[pyrogram.types.Chat, pyrogram.types.User],
-                                 topic_id: int,
-                                 split_msg: List[str],
-                                 **kwargs: Any) -> List[pyrogram.types.Message]:
+        self.logger.GetLogger().info("Sending message (length: %d):\n%s", len(msg), self.logger.MsgBody(msg))
+        msg_parts = MessageSplitter.Split(msg)
+        self.logger.GetLogger().info(f"Message split into {len(msg_parts)} part(s)")
+        return await self.SendMessageParts(receiver.id, topic_id, msg_parts, **kwargs)
+
+    async def SendMessageParts(self,
+                               receiver_id: int,
+                               topic_id: int,
+                               msg_parts: List[str],
+                               defer_waits: bool = False,
+                               sent_msgs: Optional[List[pyrogram.types.Message]] = None,
+                               **kwargs: Any) -> List[pyrogram.types.Message]:
         """
-        Send multiple message parts to a receiver.
+        Send a message already split into parts to a chat or user.
 
         Args:
-            receiver: The chat or user to send the messages to.
-            topic_id: Topic to send messages to.
-            split_msg: List of message parts to send.
+            receiver_id: ID of the chat or user to send the message to.
+            topic_id: Topic to send message to.
+            msg_parts: List of message parts to send.
+            defer_waits: True for raising MessageRetryLaterError instead of waiting for a blocked chat (only before
+                the first part is sent, the next parts are always waited for so that no part is sent twice)
+            sent_msgs: List the sent message objects are appended to as soon as each part is sent, so that the caller
+                knows them also if a later part fails (optional)
             **kwargs: Additional keyword arguments passed to send_message.
 
         Returns:
             List of sent message objects.
-        """
-        sent_msgs = []
 
-        for msg_part in split_msg:
-            sent_msgs.append(await self.client.send_message(receiver.id, msg_part, message_thread_id=topic_id, **kwargs))
-            await asyncio.sleep(MessageSenderConst.SEND_MSG_SLEEP_TIME_SEC)
-
-        return sent_msgs
-
-    def __SplitMessage(self,
-                       msg: str) -> List[str]:
-        """
-        Split a long message into parts that fit within Telegram's message length limit.
-
-        Attempts to split at newline characters when possible to maintain message formatting.
-
-        Args:
-            msg: The message to split.
-
-        Returns:
-            List of message parts.
+        Raises:
+            MessageRetryLaterError: If the chat is blocked before sending the first part and waits are deferred.
         """
-        msg_parts = []
-
-        while len(msg) > 0:
-            if len(msg) <= MessageSenderConst.MSG_MAX_LEN:
-                msg_parts.append(msg)
-                break
-
-            curr_part = msg[:MessageSenderConst.MSG_MAX_LEN]
-            idx = curr_part.rfind("\n")
-
-            if idx != -1:
-                msg_parts.append(curr_part[:idx])
-                msg = msg[idx + 1:]
-            else:
-                msg_parts.append(curr_part)
-                msg = msg[MessageSenderConst.MSG_MAX_LEN + 1:]
-
-        self.logger.GetLogger().info(f"Message split into {len(msg_parts)} part(s)")
-
-        return msg_parts
+        if sent_msgs is None:
+            sent_msgs = []
+        sent_parts_num = 0
+
+        for msg_part in msg_parts:
+            await self.rate_limiter.Acquire(receiver_id)
+            start_time = time.perf_counter()
+            try:
+                sent_msgs.append(
+                    await self.retry_handler.Run(receiver_id,
+                                                 self.client.send_message,
+                                                 receiver_id,
+                                                 msg_part,
+                                                 idempotent=False,
+                                                 defer_waits=defer_waits and sent_parts_num == 0,
+                                                 message_thread_id=topic_id,
+                                                 **kwargs)
+                )
+            except RPCError as ex:
+                self.stats.rpc_errors_num.Inc(type(ex).__name__)
+                raise
+            sent_parts_num += 1
+            self.stats.send_time.Observe(time.perf_counter() - start_time)
+            self.stats.parts_sent_num.Inc()
+
+        self.stats.sent_num.Inc()
+        return sent_msgs
@@ -0,0 +1,295 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import bisect
+import re
+from typing import List, Match, Optional, Pattern, Sequence, Tuple
+
+
+# Range of a message part, as start (included) and end (excluded) indexes, followed by the tags reopened
+# at the beginning of the part and the tags closed at its end
+MessagePartRange = Tuple[int, int, str, str]
+# HTML tags open at a point of a message, as (name, opening tag) pairs from the outermost one
+MessageOpenTags = Tuple[Tuple[str, str], ...]
+# Boundary where a message can be split, as part end, next part start and tags open at the boundary
+MessageSplitBoundary = Tuple[int, int, MessageOpenTags]
+
+
+class MessageSplitterConst:
+    """Constants for message splitter."""
+
+    MSG_MAX_LEN: int = 4096
+    # Tokens that a message cannot be split inside (HTML tags and entities) or that it is preferably split at
+    # (paragraph, line and word boundaries, dropped when splitting), and tags or entities cut by the end of the search
+    TOKEN_REGEX: Pattern[str] = re.compile(
+        r"(?P<tag><(?P<closing>/?)(?P<name>[a-zA-Z][\w-]*)[^<>]*>)"
+        r"|(?P<entity>&(?:#[0-9]+|#[xX][0-9a-fA-F]+|[a-zA-Z][a-zA-Z0-9]*);)"
+        r"|(?P<paragraph>\n(?:[ \t]*\n)+)"
+        r"|(?P<line>\n)"
+        r"|(?P<word>[ \t]+)"
+        r"|(?P<cut><[^<>]*\Z|&[#a-zA-Z0-9]*\Z)"
+    )
+    # Characters taking two UTF-16 code units
+    NON_BMP_REGEX: Pattern[str] = re.compile("[\U00010000-\U0010FFFF]")
+    # Boundary kinds, from the most preferred one
+    BOUNDARY_KINDS: Tuple[str, ...] = ("paragraph", "line", "word")
+    # Minimum filled fraction of a part for splitting it at a preferred boundary instead of the last one
+    BOUNDARY_MIN_FILL: float = 0.5
+
+
+class MessageSplitter:
+    """
+    Splitter of long messages into parts that fit within Telegram's message length limit.
+
+    The length is measured in UTF-16 code units like Telegram does, by precomputing the UTF-16 offset
+    of each character. Messages are split preferably at paragraph, then line, then word boundaries, and
+    never inside an HTML tag or entity. HTML tags open at a split are closed at the end of the part and
+    reopened at the beginning of the next one.
+    Parts are computed as index ranges in linear time, without copying the remaining message.
+    """
+
+    @staticmethod
+    def SplitRanges(msg: str,
+                    max_len: int = MessageSplitterConst.MSG_MAX_LEN) -> List[MessagePartRange]:
+        """
+        Get the ranges of the parts of a message.
+
+        Args:
+            msg: The message to split.
+            max_len: Maximum length of a part, in UTF-16 code units.
+
+        Returns:
+            List of part ranges.
+        """
+        offsets = MessageSplitter.__Utf16Offsets(msg)
+        ranges = []
+        start = 0
+        open_tags: MessageOpenTags = ()
+
+        while start < len(msg):
+            prefix = "".join(tag for _, tag in open_tags)
+            avail_len = max_len - MessageSplitter.__Utf16Len(prefix)
+            end, next_start, open_tags = MessageSplitter.__NextBoundary(msg, offsets, start, open_tags, avail_len)
+            ranges.append((start, end, prefix, MessageSplitter.__ClosingTags(open_tags)))
+            start = next_start
+
+        return ranges
+
+    @staticmethod
+    def Split(msg: str,
+              max_len: int = MessageSplitterConst.MSG_MAX_LEN) -> List[str]:
+        """
+        Split a message.
+
+        Args:
+            msg: The message to split.
+            max_len: Maximum length of a part, in UTF-16 code units.
+
+        Returns:
+            List of message parts.
+        """
+        return MessageSplitter.GetParts(msg, MessageSplitter.SplitRanges(msg, max_len))
+
+    @staticmethod
+    def GetParts(msg: str,
+                 ranges: List[MessagePartRange]) -> List[str]:
+        """
+        Get the parts of a message from their ranges.
+
+        Args:
+            msg: The message.
+            ranges: Part ranges, as returned by SplitRanges.
+
+        Returns:
+            List of message parts.
+        """
+        return [prefix + msg[start:end] + suffix for start, end, prefix, suffix in ranges]
+
+    @staticmethod
+    def __Utf16Len(text: str) -> int:
+        """
+        Get the length of a text in UTF-16 code units.
+
+        Args:
+            text: Text.
+
+        Returns:
+            Length in UTF-16 code units.
+        """
+        return len(text) if text.isascii() else len(text.encode("utf-16-le")) // 2
+
+    @staticmethod
+    def __Utf16Offsets(msg: str) -> Sequence[int]:
+        """
+        Get the UTF-16 offset of each character of a message, followed by the message length.
+
+        Args:
+            msg: The message.
+
+        Returns:
+            UTF-16 offsets.
+        """
+        # Characters outside the basic multilingual plane take two code units, if none the offsets are the indexes
+        if MessageSplitter.__Utf16Len(msg) == len(msg):
+            return range(len(msg) + 1)
+
+        offsets: List[int] = []
+        shift = 0
+        prev_idx = 0
+        for match in MessageSplitterConst.NON_BMP_REGEX.finditer(msg):
+            idx = match.start()
+            offsets.extend(range(prev_idx + shift, idx + shift + 1))
+            shift += 1
+            prev_idx = idx + 1
+        offsets.extend(range(prev_idx + shift, len(msg) + shift + 1))
+        return offsets
+
+    @staticmethod
+    def __NextBoundary(msg: str,
+                       offsets: Sequence[int],
+                       start: int,
+                       open_tags: MessageOpenTags,
+                       avail_len: int) -> MessageSplitBoundary:
+        """
+        Get the boundary where a part of a message ends.
+
+        Args:
+            msg: The message.
+            offsets: UTF-16 offsets of the message characters.
+            start: Start index of the part.
+            open_tags: Tags open at the start of the part.
+            avail_len: Part length available for the text and the closing tags, in UTF-16 code units.
+
+        Returns:
+            Part boundary.
+        """
+        min_boundary_offset = offsets[start] + int(avail_len * MessageSplitterConst.BOUNDARY_MIN_FILL)
+        # Tokens starting after this index cannot fit in the part, so they are not searched
+        end_pos = min(len(msg), start + max(avail_len, 0) + 1)
+
+        boundaries: List[Optional[MessageSplitBoundary]] = [None] * len(MessageSplitterConst.BOUNDARY_KINDS)
+        last_boundary: Optional[MessageSplitBoundary] = None
+        tags = open_tags
+        closing_len = MessageSplitter.__ClosingLen(tags)
+        # Text between tokens, where the part can be split at any character
+        text_start = start
+        text_end = end_pos
+
+        for match in MessageSplitterConst.TOKEN_REGEX.finditer(msg, start, end_pos):
+            token_start, token_end = match.span()
+            kind = match.lastgroup
+            # The text before the token doesn't fit or the token may not be complete, so the part ends before it
+            if (offsets[token_start] - offsets[start] + closing_len > avail_len
+                    or (kind == "cut" and end_pos < len(msg))):
+                text_end = token_start
+                break
+
+            if token_start > start:
+                last_boundary = (token_start, token_end if kind in MessageSplitterConst.BOUNDARY_KINDS else token_start,
+                                 tags)
+            if kind in MessageSplitterConst.BOUNDARY_KINDS:
+                if last_boundary is not None and offsets[token_start] >= min_boundary_offset:
+                    boundaries[MessageSplitterConst.BOUNDARY_KINDS.index(kind)] = last_boundary
+            elif kind == "tag":
+                tags = MessageSplitter.__UpdateOpenTags(tags, match)
+                closing_len = MessageSplitter.__ClosingLen(tags)
+            text_start = token_end
+        else:
+            # Only possible if the search reached the end of the message
+            if offsets[end_pos] - offsets[start] + closing_len <= avail_len:
+                return end_pos, end_pos, tags
+
+        # Split the text as late as possible, if no preferred boundary was found
+        max_offset = offsets[start] + avail_len - closing_len
+        end = bisect.bisect_right(offsets, max_offset, text_start, text_end + 1) - 1
+        text_boundary = (end, end, tags) if end > start and end >= text_start else None
+        boundary = next((b for b in (*boundaries, text_boundary, last_boundary) if b is not None), None)
+        return boundary if boundary is not None else MessageSplitter.__FirstBoundary(msg, start, open_tags)
+
+    @staticmethod
+    def __FirstBoundary(msg: str,
+                        start: int,
+                        open_tags: MessageOpenTags) -> MessageSplitBoundary:
+        """
+        Get the first boundary after the start of a part, used only if the open tags alone exceed the maximum length
+        so that the part is not empty.
+
+        Args:
+            msg: The message.
+            start: Start index of the part.
+            open_tags: Tags open at the start of the part.
+
+        Returns:
+            Part boundary, after the token or the character at the start of the part.
+        """
+        match = MessageSplitterConst.TOKEN_REGEX.match(msg, start)
+        if match is None:
+            return start + 1, start + 1, open_tags
+        tags = MessageSplitter.__UpdateOpenTags(open_tags, match) if match.lastgroup == "tag" else open_tags
+        return match.end(), match.end(), tags
+
+    @staticmethod
+    def __UpdateOpenTags(tags: MessageOpenTags,
+                         match: Match[str]) -> MessageOpenTags:
+        """
+        Update the open tags with a tag.
+
+        Args:
+            tags: Open tags.
+            match: Match of the tag.
+
+        Returns:
+            Updated open tags.
+        """
+        name = match.group("name").lower()
+        if not match.group("closing"):
+            # Self-closing tags don't need to be closed
+            return tags if match.group("tag").endswith("/>") else tags + ((name, match.group("tag")),)
+        # Close the innermost tag with the same name, ignoring unmatched closing tags
+        for i in range(len(tags) - 1, -1, -1):
+            if tags[i][0] == name:
+                return tags[:i]
+        return tags
+
+    @staticmethod
+    def __ClosingTags(tags: MessageOpenTags) -> str:
+        """
+        Get the closing tags of the open tags.
+
+        Args:
+            tags: Open tags.
+
+        Returns:
+            Closing tags, from the innermost one.
+        """
+        return "".join(f"</{name}>" for name, _ in reversed(tags))
+
+    @staticmethod
+    def __ClosingLen(tags: MessageOpenTags) -> int:
+        """
+        Get the length of the closing tags of the open tags.
+
+        Args:
+            tags: Open tags.
+
+        Returns:
+            Length of the closing tags, in UTF-16 code units (tag names are ASCII).
+        """
+        return sum(len(name) + 3 for name, _ in tags)
@@ -0,0 +1,332 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import bisect
+from typing import Dict, List, Sequence
+
+
+class MetricsConst:
+    """Constants for metrics."""
+
+    # Buckets (in seconds) suitable for fast in-process operations
+    FAST_OP_TIME_BUCKETS: List[float] = [
+        1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0,
+    ]
+    # Buckets (in seconds) suitable for waiting times and network operations
+    SLOW_OP_TIME_BUCKETS: List[float] = [
+        0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0,
+    ]
+
+
+class MetricBase:
+    """Base class for metrics."""
+
+    name: str
+    description: str
+
+    def __init__(self,
+                 name: str,
+                 description: str) -> None:
+        """
+        Initialize the metric.
+
+        Args:
+            name: Metric name.
+            description: Metric description.
+        """
+        self.name = name
+        self.description = description
+
+    def Name(self) -> str:
+        """
+        Get the metric name.
+
+        Returns:
+            Metric name.
+        """
+        return self.name
+
+    def Description(self) -> str:
+        """
+        Get the metric description.
+
+        Returns:
+            Metric description.
+        """
+        return self.description
+
+
+class MetricCounter(MetricBase):
+    """Monotonically increasing counter."""
+
+    value: float
+
+    def __init__(self,
+                 name: str,
+                 description: str) -> None:
+        """
+        Initialize the counter.
+
+        Args:
+            name: Metric name.
+            description: Metric description.
+        """
+        super().__init__(name, description)
+        self.value = 0
+
+    def Inc(self,
+            amount: float = 1) -> None:
+        """
+        Increment the counter.
+
+        Args:
+            amount: Amount to increment by.
+        """
+        self.value += amount
+
+    def Value(self) -> float:
+        """
+        Get the counter value.
+
+        Returns:
+            Counter value.
+        """
+        return self.value
+
+
+class MetricCounterFamily(MetricBase):
+    """Family of counters, one for each value of a label."""
+
+    label: str
+    values: Dict[str, float]
+
+    def __init__(self,
+                 name: str,
+                 description: str,
+                 label: str) -> None:
+        """
+        Initialize the counter family.
+
+        Args:
+            name: Metric name.
+            description: Metric description.
+            label: Label name.
+        """
+        super().__init__(name, description)
+        self.label = label
+        self.values = {}
+
+    def Label(self) -> str:
+        """
+        Get the label name.
+
+        Returns:
+            Label name.
+        """
+        return self.label
+
+    def Inc(self,
+            label_value: str,
+            amount: float = 1) -> None:
+        """
+        Increment the counter of a label value.
+
+        Args:
+            label_value: Label value.
+            amount: Amount to increment by.
+        """
+        self.values[label_value] = self.values.get(label_value, 0) + amount
+
+    def Value(self,
+              label_value: str) -> float:
+        """
+        Get the counter value of a label value.
+
+        Args:
+            label_value: Label value.
+
+        Returns:
+            Counter value, zero if never incremented.
+        """
+        return self.values.get(label_value, 0)
+
+    def Values(self) -> Dict[str, float]:
+        """
+        Get the counter values of all the label values.
+
+        Returns:
+            Counter values by label value.
+        """
+        return dict(self.values)
+
+
+class MetricGauge(MetricBase):
+    """Value that can go up and down."""
+
+    value: float
+
+    def __init__(self,
+                 name: str,
+                 description: str) -> None:
+        """
+        Initialize the gauge.
+
+        Args:
+            name: Metric name.
+            description: Metric description.
+        """
+        super().__init__(name, description)
+        self.value = 0
+
+    def Set(self,
+            value: float) -> None:
+        """
+        Set the gauge value.
+
+        Args:
+            value: Value to set.
+        """
+        self.value = value
+
+    def Inc(self,
+            amount: float = 1) -> None:
+        """
+        Increment the gauge.
+
+        Args:
+            amount: Amount to increment by.
+        """
+        self.value += amount
+
+    def Dec(self,
+            amount: float = 1) -> None:
+        """
+        Decrement the gauge.
+
+        Args:
+            amount: Amount to decrement by.
+        """
+        self.value -= amount
+
+    def Value(self) -> float:
+        """
+        Get the gauge value.
+
+        Returns:
+            Gauge value.
+        """
+        return self.value
+
+
+class MetricHistogram(MetricBase):
+    """Histogram with fixed buckets."""
+
+    buckets: List[float]
+    counts: List[int]
+    count: int
+    sum: float
+    max: float
+
+    def __init__(self,
+                 name: str,
+                 description: str,
+                 buckets: Sequence[float]) -> None:
+        """
+        Initialize the histogram.
+
+        Args:
+            name: Metric name.
+            description: Metric description.
+            buckets: Upper bounds of the buckets, an additional +Inf bucket is always added.
+        """
+        super().__init__(name, description)
+        self.buckets = sorted(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def Observe(self,
+                value: float) -> None:
+        """
+        Observe a value.
+
+        Args:
+            value: Value to observe.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def Buckets(self) -> List[float]:
+        """
+        Get the bucket upper bounds (+Inf bucket excluded).
+
+        Returns:
+            Bucket upper bounds.
+        """
+        return self.buckets
+
+    def BucketCounts(self) -> List[int]:
+        """
+        Get the number of observations in each bucket (not cumulative, +Inf bucket included).
+
+        Returns:
+            Bucket counts.
+        """
+        return self.counts
+
+    def Count(self) -> int:
+        """
+        Get the number of observations.
+
+        Returns:
+            Number of observations.
+        """
+        return self.count
+
+    def Sum(self) -> float:
+        """
+        Get the sum of the observed values.
+
+        Returns:
+            Sum of observed values.
+        """
+        return self.sum
+
+    def Max(self) -> float:
+        """
+        Get the maximum observed value.
+
+        Returns:
+            Maximum observed value.
+        """
+        return self.max
+
+    def Mean(self) -> float:
+        """
+        Get the mean of the observed values.
+
+        Returns:
+            Mean of observed values, zero if nothing was observed.
+        """
+        return self.sum / self.count if self.count > 0 else 0.0
@@ -0,0 +1,148 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import math
+from typing import Iterable, List
+
+from telegram_periodic_msg_bot.metrics.metrics import (
+    MetricBase,
+    MetricCounter,
+    MetricCounterFamily,
+    MetricGauge,
+    MetricHistogram,
+)
+
+
+class MetricsPrometheusConst:
+    """Constants for Prometheus formatter."""
+
+    METRIC_PREFIX: str = "msgbot_"
+    CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsPrometheusFormatter:
+    """Formatter of metrics in the Prometheus text exposition format."""
+
+    @staticmethod
+    def Format(metrics: Iterable[MetricBase]) -> str:
+        """
+        Format metrics.
+
+        Args:
+            metrics: Metrics to format.
+
+        Returns:
+            Formatted metrics.
+        """
+        lines: List[str] = []
+        for metric in metrics:
+            name = MetricsPrometheusConst.METRIC_PREFIX + metric.Name()
+            lines.append(f"# HELP {name} {MetricsPrometheusFormatter.__EscapeHelp(metric.Description())}")
+
+            if isinstance(metric, MetricCounter):
+                lines.append(f"# TYPE {name} counter")
+                lines.append(f"{name} {MetricsPrometheusFormatter.__FormatValue(metric.Value())}")
+            elif isinstance(metric, MetricCounterFamily):
+                lines.append(f"# TYPE {name} counter")
+                for label_value, value in sorted(metric.Values().items()):
+                    lines.append(
+                        f"{name}{{{metric.Label()}=\"{MetricsPrometheusFormatter.__EscapeLabel(label_value)}\"}} "
+                        f"{MetricsPrometheusFormatter.__FormatValue(value)}"
+                    )
+            elif isinstance(metric, MetricGauge):
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name} {MetricsPrometheusFormatter.__FormatValue(metric.Value())}")
+            elif isinstance(metric, MetricHistogram):
+                lines.append(f"# TYPE {name} histogram")
+                lines.extend(MetricsPrometheusFormatter.__FormatHistogram(name, metric))
+            else:
+                lines.append(f"# TYPE {name} untyped")
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def __FormatHistogram(name: str,
+                          metric: MetricHistogram) -> List[str]:
+        """
+        Format the samples of a histogram.
+
+        Args:
+            name: Metric name.
+            metric: Histogram.
+
+        Returns:
+            Formatted samples.
+        """
+        lines = []
+        # Prometheus buckets are cumulative
+        cumulative_count = 0
+        bucket_counts = metric.BucketCounts()
+        for bucket, bucket_count in zip(metric.Buckets() + [math.inf], bucket_counts):
+            cumulative_count += bucket_count
+            lines.append(
+                f"{name}_bucket{{le=\"{MetricsPrometheusFormatter.__FormatValue(bucket)}\"}} {cumulative_count}"
+            )
+        lines.append(f"{name}_sum {MetricsPrometheusFormatter.__FormatValue(metric.Sum())}")
+        lines.append(f"{name}_count {metric.Count()}")
+        return lines
+
+    @staticmethod
+    def __FormatValue(value: float) -> str:
+        """
+        Format a sample value.
+
+        Args:
+            value: Value.
+
+        Returns:
+            Formatted value.
+        """
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if math.isnan(value):
+            return "NaN"
+        return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+    @staticmethod
+    def __EscapeHelp(text: str) -> str:
+        """
+        Escape the text of a HELP line.
+
+        Args:
+            text: Text.
+
+        Returns:
+            Escaped text.
+        """
+        return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+    @staticmethod
+    def __EscapeLabel(text: str) -> str:
+        """
+        Escape a label value.
+
+        Args:
+            text: Label value.
+
+        Returns:
+            Escaped label value.
+        """
+        return text.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
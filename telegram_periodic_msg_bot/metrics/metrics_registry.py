@@ -0,0 +1,67 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from typing import Any, Callable, List, Optional
+
+from telegram_periodic_msg_bot.metrics.metrics import MetricBase
+
+
+# Getter of a statistics object, i.e. an object whose attributes are metrics (None if not available)
+MetricsStatsGetterType = Callable[[], Optional[Any]]
+
+
+class MetricsRegistry:
+    """
+    Registry of the statistics objects to be exposed.
+
+    Getters are registered instead of the statistics objects, so that values computed on request
+    (e.g. gauges updated by GetStats) are up to date when collected.
+    """
+
+    stats_getters: List[MetricsStatsGetterType]
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self.stats_getters = []
+
+    def Register(self,
+                 stats_getter: MetricsStatsGetterType) -> None:
+        """
+        Register a statistics object.
+
+        Args:
+            stats_getter: Getter of the statistics object.
+        """
+        self.stats_getters.append(stats_getter)
+
+    def Collect(self) -> List[MetricBase]:
+        """
+        Collect the metrics of all the registered statistics objects.
+
+        Returns:
+            List of metrics.
+        """
+        metrics: List[MetricBase] = []
+        for stats_getter in self.stats_getters:
+            stats = stats_getter()
+            if stats is not None:
+                metrics.extend(metric for metric in vars(stats).values() if isinstance(metric, MetricBase))
+        return metrics
@@ -0,0 +1,156 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import asyncio
+from typing import Optional, Tuple
+
+from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.metrics.metrics_prometheus import MetricsPrometheusConst, MetricsPrometheusFormatter
+from telegram_periodic_msg_bot.metrics.metrics_registry import MetricsRegistry
+
+
+class MetricsServerConst:
+    """Constants for metrics server."""
+
+    METRICS_PATHS: Tuple[str, ...] = ("/", "/metrics")
+    # Maximum time in seconds for receiving a request
+    REQUEST_TIMEOUT_SEC: float = 5.0
+    # Maximum number of header lines of a request
+    REQUEST_MAX_HEADERS: int = 100
+
+
+class MetricsServer:
+    """
+    Minimal HTTP server exposing the metrics of a registry in the Prometheus text format.
+
+    It runs in the event loop of the bot, so metrics are collected without locking.
+    """
+
+    logger: Logger
+    registry: MetricsRegistry
+    host: str
+    port: int
+    server: Optional[asyncio.AbstractServer]
+
+    def __init__(self,
+                 logger: Logger,
+                 registry: MetricsRegistry,
+                 host: str,
+                 port: int) -> None:
+        """
+        Initialize the server.
+
+        Args:
+            logger: Logger instance for logging operations.
+            registry: Registry of the metrics to expose.
+            host: Host to listen on.
+            port: Port to listen on.
+        """
+        self.logger = logger
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.server = None
+
+    async def Start(self) -> None:
+        """Start listening."""
+        if self.server is not None:
+            return
+
+        self.server = await asyncio.start_server(self.__HandleConnection, self.host, self.port)
+        self.logger.GetLogger().info(f"Metrics server listening on {self.host}:{self.port}")
+
+    async def Stop(self) -> None:
+        """Stop listening."""
+        if self.server is None:
+            return
+
+        self.server.close()
+        await self.server.wait_closed()
+        self.server = None
+        self.logger.GetLogger().info("Metrics server stopped")
+
+    async def __HandleConnection(self,
+                                 reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        """
+        Handle a connection, answering a single request.
+
+        Args:
+            reader: Stream reader.
+            writer: Stream writer.
+        """
+        try:
+            request_line = await asyncio.wait_for(self.__ReadRequest(reader), MetricsServerConst.REQUEST_TIMEOUT_SEC)
+            await self.__SendResponse(writer, request_line)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def __ReadRequest(reader: asyncio.StreamReader) -> str:
+        """
+        Read a request, ignoring its headers.
+
+        Args:
+            reader: Stream reader.
+
+        Returns:
+            Request line.
+        """
+        request_line = (await reader.readuntil(b"\n")).decode("latin-1").strip()
+        for _ in range(MetricsServerConst.REQUEST_MAX_HEADERS):
+            if (await reader.readuntil(b"\n")).strip() == b"":
+                break
+        return request_line
+
+    async def __SendResponse(self,
+                             writer: asyncio.StreamWriter,
+                             request_line: str) -> None:
+        """
+        Send the response to a request.
+
+        Args:
+            writer: Stream writer.
+            request_line: Request line.
+        """
+        request_parts = request_line.split()
+        method = request_parts[0] if len(request_parts) > 0 else ""
+        if len(request_parts) < 2 or method not in ("GET", "HEAD"):
+            status, body = "405 Method Not Allowed", ""
+        elif request_parts[1].split("?", 1)[0] not in MetricsServerConst.METRICS_PATHS:
+            status, body = "404 Not Found", ""
+        else:
+            status, body = "200 OK", MetricsPrometheusFormatter.Format(self.registry.Collect())
+
+        body_bytes = body.encode("utf-8")
+        header = (
+            f"HTTP/1.0 {status}\r\n"
+            f"Content-Type: {MetricsPrometheusConst.CONTENT_TYPE}\r\n"
+            f"Content-Length: {len(body_bytes)}\r\n"
+            "Connection: close\r\n"
+            "\r\n"
+        )
+        writer.write(header.encode("latin-1"))
+        if method == "GET":
+            writer.write(body_bytes)
+        await writer.drain()
@@ -0,0 +1,286 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import time
+from typing import Dict, Optional, Tuple
+
+import pyrogram
+from pyrogram.enums import ChatMemberStatus
+from pyrogram.errors import RPCError, UserNotParticipant
+
+from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.metrics.metrics import MetricCounter, MetricGauge, MetricHistogram, MetricsConst
+
+
+class ChatAdminsCacheConst:
+    """Constants for chat admins cache."""
+
+    ADMIN_STATUSES: Tuple[ChatMemberStatus, ...] = (ChatMemberStatus.OWNER, ChatMemberStatus.ADMINISTRATOR)
+    # Minimum number of entries before expired ones are evicted
+    ENTRIES_EVICT_MIN_NUM: int = 1024
+
+
+class ChatAdminsCacheStats:
+    """Statistics of the chat admins cache."""
+
+    hits_num: MetricCounter
+    misses_num: MetricCounter
+    invalidated_num: MetricCounter
+    evicted_num: MetricCounter
+    lookup_errors_num: MetricCounter
+    entries_num: MetricGauge
+    hit_rate: MetricGauge
+    lookup_time: MetricHistogram
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.hits_num = MetricCounter("admins_cache_hits_total", "Number of admin checks answered by the cache")
+        self.misses_num = MetricCounter("admins_cache_misses_total", "Number of admin checks requiring a member lookup")
+        self.invalidated_num = MetricCounter("admins_cache_invalidated_total", "Number of entries invalidated by member updates")
+        self.evicted_num = MetricCounter("admins_cache_evicted_total", "Number of expired entries evicted")
+        self.lookup_errors_num = MetricCounter("admins_cache_lookup_errors_total", "Number of member lookups failed with an error")
+        self.entries_num = MetricGauge("admins_cache_entries", "Number of cached entries")
+        self.hit_rate = MetricGauge("admins_cache_hit_rate", "Ratio between hits and total admin checks")
+        self.lookup_time = MetricHistogram("admins_cache_lookup_seconds",
+                                           "Time to look up a chat member",
+                                           MetricsConst.SLOW_OP_TIME_BUCKETS)
+
+
+class ChatAdminsCache:
+    """
+    Cache of the admin status of chat members, used for authorizing commands.
+
+    Each user is looked up on its own (instead of listing all the chat administrators), and the result is kept
+    for a limited time, unless the member is updated in the meantime.
+    Expired entries are evicted each time the number of entries doubles, so that the cache never grows
+    beyond twice the valid entries.
+    A lookup failed with an error is considered not authorized and not cached.
+    """
+
+    client: pyrogram.Client
+    logger: Logger
+    ttl_sec: float
+    entries: Dict[int, Dict[int, Tuple[bool, float]]]
+    entries_num: int
+    entries_evict_num: int
+    stats: ChatAdminsCacheStats
+
+    def __init__(self,
+                 client: pyrogram.Client,
+                 logger: Logger,
+                 ttl_sec: float) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            client: Pyrogram client instance.
+            logger: Logger instance for logging operations.
+            ttl_sec: Time in seconds an entry is valid, zero to disable caching.
+        """
+        self.client = client
+        self.logger = logger
+        self.ttl_sec = ttl_sec
+        self.entries = {}
+        self.entries_num = 0
+        self.entries_evict_num = ChatAdminsCacheConst.ENTRIES_EVICT_MIN_NUM
+        self.stats = ChatAdminsCacheStats()
+
+    def GetStats(self) -> ChatAdminsCacheStats:
+        """
+        Get the statistics of the cache.
+
+        Returns:
+            Cache statistics.
+        """
+        return self.stats
+
+    async def IsAdmin(self,
+                      chat_id: int,
+                      user_id: int) -> bool:
+        """
+        Get if a user is an administrator of a chat, looking it up only if not cached.
+
+        Args:
+            chat_id: Chat ID.
+            user_id: User ID.
+
+        Returns:
+            True if the user is an administrator (or the owner) of the chat, False otherwise.
+        """
+        now = time.monotonic()
+
+        is_admin = self.__GetEntry(chat_id, user_id, now)
+        if is_admin is not None:
+            self.stats.hits_num.Inc()
+            self.__UpdateHitRate()
+            return is_admin
+
+        self.stats.misses_num.Inc()
+        self.__UpdateHitRate()
+
+        is_admin = await self.__LookupMember(chat_id, user_id)
+        if is_admin is None:
+            return False
+        if self.ttl_sec > 0:
+            self.__SetEntry(chat_id, user_id, is_admin, now)
+
+        return is_admin
+
+    def Invalidate(self,
+                   chat_id: int,
+                   user_id: Optional[int] = None) -> None:
+        """
+        Invalidate the entry of a user, or all the entries of a chat if no user is specified.
+
+        Args:
+            chat_id: Chat ID.
+            user_id: User ID, None for all the users of the chat.
+        """
+        chat_entries = self.entries.get(chat_id)
+        if chat_entries is None:
+            return
+
+        if user_id is None:
+            removed_num = len(chat_entries)
+            del self.entries[chat_id]
+        else:
+            if chat_entries.pop(user_id, None) is None:
+                return
+            removed_num = 1
+            if len(chat_entries) == 0:
+                del self.entries[chat_id]
+
+        self.entries_num -= removed_num
+        self.stats.invalidated_num.Inc(removed_num)
+        self.stats.entries_num.Set(self.entries_num)
+
+    def __GetEntry(self,
+                   chat_id: int,
+                   user_id: int,
+                   now: float) -> Optional[bool]:
+        """
+        Get the cached admin status of a user, removing it if expired.
+
+        Args:
+            chat_id: Chat ID.
+            user_id: User ID.
+            now: Current monotonic time.
+
+        Returns:
+            Cached admin status, None if not cached or expired.
+        """
+        chat_entries = self.entries.get(chat_id)
+        if chat_entries is None:
+            return None
+        entry = chat_entries.get(user_id)
+        if entry is None:
+            return None
+
+        is_admin, expires_at = entry
+        if expires_at <= now:
+            del chat_entries[user_id]
+            if len(chat_entries) == 0:
+                del self.entries[chat_id]
+            self.entries_num -= 1
+            self.stats.entries_num.Set(self.entries_num)
+            return None
+        return is_admin
+
+    def __SetEntry(self,
+                   chat_id: int,
+                   user_id: int,
+                   is_admin: bool,
+                   now: float) -> None:
+        """
+        Cache the admin status of a user.
+
+        Args:
+            chat_id: Chat ID.
+            user_id: User ID.
+            is_admin: Admin status.
+            now: Current monotonic time.
+        """
+        chat_entries = self.entries.get(chat_id)
+        if chat_entries is None or user_id not in chat_entries:
+            if self.entries_num >= self.entries_evict_num:
+                self.__EvictExpiredEntries(now)
+            chat_entries = self.entries.setdefault(chat_id, {})
+            self.entries_num += 1
+            self.stats.entries_num.Set(self.entries_num)
+        chat_entries[user_id] = (is_admin, now + self.ttl_sec)
+
+    def __EvictExpiredEntries(self,
+                              now: float) -> None:
+        """
+        Evict the expired entries.
+
+        Args:
+            now: Current monotonic time.
+        """
+        entries = {}
+        entries_num = 0
+        for chat_id, chat_entries in self.entries.items():
+            valid_entries = {user_id: entry for user_id, entry in chat_entries.items() if entry[1] > now}
+            if len(valid_entries) > 0:
+                entries[chat_id] = valid_entries
+                entries_num += len(valid_entries)
+
+        self.stats.evicted_num.Inc(self.entries_num - entries_num)
+        self.entries = entries
+        self.entries_num = entries_num
+        self.stats.entries_num.Set(self.entries_num)
+        # Amortize the eviction cost over the next insertions
+        self.entries_evict_num = max(ChatAdminsCacheConst.ENTRIES_EVICT_MIN_NUM, 2 * self.entries_num)
+
+    async def __LookupMember(self,
+                             chat_id: int,
+                             user_id: int) -> Optional[bool]:
+        """
+        Look up the admin status of a single chat member.
+
+        Args:
+            chat_id: Chat ID.
+            user_id: User ID.
+
+        Returns:
+            True if the user is an administrator (or the owner) of the chat, False otherwise,
+            None if the lookup failed.
+        """
+        start_time = time.perf_counter()
+        try:
+            member = await self.client.get_chat_member(chat_id, user_id)
+        except UserNotParticipant:
+            return False
+        except RPCError as ex:
+            # E.g. flood wait, missing permissions or server errors, the user is looked up again the next time
+            self.stats.lookup_errors_num.Inc()
+            self.logger.GetLogger().warning(
+                f"Unable to look up member {user_id} of chat {chat_id} ({ex.__class__.__name__}), considered not authorized"
+            )
+            return None
+        finally:
+            self.stats.lookup_time.Observe(time.perf_counter() - start_time)
+        return member.status in ChatAdminsCacheConst.ADMIN_STATUSES
+
+    def __UpdateHitRate(self) -> None:
+        """Update the hit rate."""
+        hits_num = self.stats.hits_num.Value()
+        self.stats.hit_rate.Set(hits_num / (hits_num + self.stats.misses_num.Value()))
@@ -0,0 +1,250 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import hashlib
+import zlib
+from typing import Dict, List, Union
+
+from telegram_periodic_msg_bot.message.message_splitter import MessagePartRange, MessageSplitter
+from telegram_periodic_msg_bot.metrics.metrics import MetricGauge
+
+
+# Handle of a body in the store (content hash)
+PeriodicMsgBodyKey = bytes
+
+
+class PeriodicMsgBodyStoreConst:
+    """Constants for periodic message body store."""
+
+    ENCODING: str = "utf-8"
+    COMPRESSION_LEVEL: int = 6
+
+
+class PeriodicMsgBodyStoreStats:
+    """Statistics of the periodic message body store."""
+
+    bodies_num: MetricGauge
+    refs_num: MetricGauge
+    compressed_num: MetricGauge
+    logical_bytes: MetricGauge
+    stored_bytes: MetricGauge
+    dedup_ratio: MetricGauge
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.bodies_num = MetricGauge("body_store_bodies", "Number of distinct bodies stored")
+        self.refs_num = MetricGauge("body_store_refs", "Number of references to the stored bodies")
+        self.compressed_num = MetricGauge("body_store_compressed_bodies", "Number of bodies stored compressed")
+        self.logical_bytes = MetricGauge("body_store_logical_bytes",
+                                         "Bytes that would be used by the bodies without deduplication and compression")
+        self.stored_bytes = MetricGauge("body_store_stored_bytes", "Bytes actually used by the stored bodies")
+        self.dedup_ratio = MetricGauge("body_store_dedup_ratio", "Ratio between logical and stored bytes")
+
+
+class PeriodicMsgBodyEntry:
+    """Body stored once, shared by all its references."""
+
+    __slots__ = ("data", "raw_len", "part_ranges", "refs")
+
+    data: Union[str, bytes]
+    raw_len: int
+    part_ranges: List[MessagePartRange]
+    refs: int
+
+    def __init__(self,
+                 data: Union[str, bytes],
+                 raw_len: int,
+                 part_ranges: List[MessagePartRange]) -> None:
+        """
+        Initialize the entry.
+
+        Args:
+            data: Body text, or compressed body bytes.
+            raw_len: Length of the encoded body in bytes.
+            part_ranges: Ranges of the parts the body is split into when sent.
+        """
+        self.data = data
+        self.raw_len = raw_len
+        self.part_ranges = part_ranges
+        self.refs = 0
+
+    def StoredLen(self) -> int:
+        """
+        Get the number of stored bytes.
+
+        Returns:
+            Number of stored bytes.
+        """
+        return len(self.data) if isinstance(self.data, bytes) else self.raw_len
+
+
+class PeriodicMsgBodyStore:
+    """
+    Store of message bodies, keyed by content hash and reference counted, so that identical bodies
+    are kept in memory once.
+
+    Bodies whose encoded length is at least the compression threshold are kept compressed and
+    decompressed only when read.
+    """
+
+    compress_min_bytes: int
+    entries: Dict[PeriodicMsgBodyKey, PeriodicMsgBodyEntry]
+    stats: PeriodicMsgBodyStoreStats
+
+    def __init__(self,
+                 compress_min_bytes: int) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            compress_min_bytes: Minimum encoded length for compressing a body, 0 to never compress.
+        """
+        self.compress_min_bytes = compress_min_bytes
+        self.entries = {}
+        self.stats = PeriodicMsgBodyStoreStats()
+
+    def GetStats(self) -> PeriodicMsgBodyStoreStats:
+        """
+        Get the store statistics.
+
+        Returns:
+            Store statistics.
+        """
+        return self.stats
+
+    def Acquire(self,
+                body: str) -> PeriodicMsgBodyKey:
+        """
+        Add a reference to a body, storing it if not already present.
+
+        Args:
+            body: Body text.
+
+        Returns:
+            Body key.
+        """
+        raw = body.encode(PeriodicMsgBodyStoreConst.ENCODING)
+        key = hashlib.sha256(raw).digest()
+
+        entry = self.entries.get(key)
+        if entry is None:
+            # The body is split once here, since it doesn't change until released
+            part_ranges = MessageSplitter.SplitRanges(body)
+            # Keep the compressed bytes only if they're actually smaller
+            if 0 < self.compress_min_bytes <= len(raw):
+                compressed = zlib.compress(raw, PeriodicMsgBodyStoreConst.COMPRESSION_LEVEL)
+                entry = PeriodicMsgBodyEntry(compressed if len(compressed) < len(raw) else body, len(raw), part_ranges)
+            else:
+                entry = PeriodicMsgBodyEntry(body, len(raw), part_ranges)
+            self.entries[key] = entry
+            self.__UpdateStats(entry, 1, 0)
+
+        entry.refs += 1
+        self.__UpdateStats(entry, 0, 1)
+        return key
+
+    def Release(self,
+                key: PeriodicMsgBodyKey) -> None:
+        """
+        Remove a reference to a body, deleting it when no more referenced.
+
+        Args:
+            key: Body key.
+
+        Raises:
+            KeyError: If the body is not stored.
+        """
+        entry = self.entries[key]
+        entry.refs -= 1
+        self.__UpdateStats(entry, 0, -1)
+        if entry.refs == 0:
+            del self.entries[key]
+            self.__UpdateStats(entry, -1, 0)
+
+    def Get(self,
+            key: PeriodicMsgBodyKey) -> str:
+        """
+        Get a body.
+
+        Args:
+            key: Body key.
+
+        Returns:
+            Body text.
+
+        Raises:
+            KeyError: If the body is not stored.
+        """
+        return self.__GetBody(self.entries[key])
+
+    def GetParts(self,
+                 key: PeriodicMsgBodyKey) -> List[str]:
+        """
+        Get the parts a body is split into when sent.
+
+        Args:
+            key: Body key.
+
+        Returns:
+            Body parts.
+
+        Raises:
+            KeyError: If the body is not stored.
+        """
+        entry = self.entries[key]
+        return MessageSplitter.GetParts(self.__GetBody(entry), entry.part_ranges)
+
+    @staticmethod
+    def __GetBody(entry: PeriodicMsgBodyEntry) -> str:
+        """
+        Get the body of an entry, decompressing it if needed.
+
+        Args:
+            entry: Body entry.
+
+        Returns:
+            Body text.
+        """
+        if isinstance(entry.data, bytes):
+            return zlib.decompress(entry.data).decode(PeriodicMsgBodyStoreConst.ENCODING)
+        return entry.data
+
+    def __UpdateStats(self,
+                      entry: PeriodicMsgBodyEntry,
+                      bodies_delta: int,
+                      refs_delta: int) -> None:
+        """
+        Update the statistics after adding or removing a body or a reference to it.
+
+        Args:
+            entry: Entry of the body.
+            bodies_delta: 1 if the body was added, -1 if deleted, 0 otherwise.
+            refs_delta: 1 if a reference was added, -1 if removed, 0 otherwise.
+        """
+        self.stats.bodies_num.Inc(bodies_delta)
+        self.stats.stored_bytes.Inc(bodies_delta * entry.StoredLen())
+        if isinstance(entry.data, bytes):
+            self.stats.compressed_num.Inc(bodies_delta)
+        self.stats.refs_num.Inc(refs_delta)
+        self.stats.logical_bytes.Inc(refs_delta * entry.raw_len)
+
+        stored_bytes = self.stats.stored_bytes.Value()
+        self.stats.dedup_ratio.Set(self.stats.logical_bytes.Value() / stored_bytes if stored_bytes > 0 else 1.0)
@@ -0,0 +1,525 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import asyncio
+import heapq
+import time
+from enum import Enum, auto, unique
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple
+
+from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.metrics.metrics import MetricCounter, MetricGauge, MetricHistogram, MetricsConst
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_trigger import PeriodicMsgTrigger
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_worker_pool import PeriodicMsgWorkerPool
+from telegram_periodic_msg_bot.utils.clock import Clock
+
+
+# Function called for each fired job with: job ID, last scheduled fire time, number of misfires
+PeriodicMsgEngineFireFct = Callable[[str, float, int], None]
+
+
+@unique
+class PeriodicMsgMisfirePolicies(Enum):
+    """Enumeration of policies for fire times missed by more than the grace time."""
+
+    SKIP = auto()
+    RUN_LATE = auto()
+    COALESCE = auto()
+
+
+class PeriodicMsgEngineConst:
+    """Constants for periodic message engine."""
+
+    # Jobs due within this time are considered due, to absorb the event loop timer resolution
+    DUE_TOLERANCE_SEC: float = 0.01
+    # The heap is rebuilt when stale entries exceed this number and the number of valid ones
+    HEAP_COMPACT_MIN_STALE: int = 1024
+    # Maximum number of missed fire times that are counted for a job
+    MISFIRE_COUNT_MAX_NUM: int = 1000
+
+
+class PeriodicMsgEngineStats:
+    """Statistics of the periodic message engine."""
+
+    jobs_num: MetricGauge
+    fired_num: MetricCounter
+    misfired_num: MetricCounter
+    lateness: MetricHistogram
+    add_time: MetricHistogram
+    remove_time: MetricHistogram
+    tick_time: MetricHistogram
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.jobs_num = MetricGauge("engine_jobs", "Number of jobs in the engine")
+        self.fired_num = MetricCounter("engine_fired_total", "Number of fired jobs")
+        self.misfired_num = MetricCounter("engine_misfired_total", "Number of fire times missed by more than the grace time")
+        self.lateness = MetricHistogram("engine_lateness_seconds",
+                                        "Difference between the actual and the scheduled fire time of jobs",
+                                        MetricsConst.SLOW_OP_TIME_BUCKETS)
+        self.add_time = MetricHistogram("engine_add_seconds",
+                                        "Time to add or resume a job",
+                                        MetricsConst.FAST_OP_TIME_BUCKETS)
+        self.remove_time = MetricHistogram("engine_remove_seconds",
+                                           "Time to remove or pause a job",
+                                           MetricsConst.FAST_OP_TIME_BUCKETS)
+        self.tick_time = MetricHistogram("engine_tick_seconds",
+                                         "Time to process a wakeup of the engine",
+                                         MetricsConst.FAST_OP_TIME_BUCKETS)
+
+
+class PeriodicMsgEngineJob:
+    """Job registered in the periodic message engine."""
+
+    __slots__ = ("job_id", "trigger", "callback", "args", "misfire_policy", "paused", "next_fire_time", "heap_seq")
+
+    job_id: str
+    trigger: PeriodicMsgTrigger
+    callback: Callable[..., Coroutine]
+    args: Tuple[Any, ...]
+    misfire_policy: PeriodicMsgMisfirePolicies
+    paused: bool
+    next_fire_time: Optional[float]
+    heap_seq: int
+
+    def __init__(self,
+                 job_id: str,
+                 trigger: PeriodicMsgTrigger,
+                 callback: Callable[..., Coroutine],
+                 args: Tuple[Any, ...],
+                 misfire_policy: PeriodicMsgMisfirePolicies) -> None:
+        """
+        Initialize the job.
+
+        Args:
+            job_id: Unique job identifier.
+            trigger: Job trigger.
+            callback: Coroutine function called when the job fires.
+            args: Arguments of the callback.
+            misfire_policy: Policy for missed fire times.
+        """
+        self.job_id = job_id
+        self.trigger = trigger
+        self.callback = callback
+        self.args = args
+        self.misfire_policy = misfire_policy
+        self.paused = False
+        self.next_fire_time = None
+        self.heap_seq = -1
+
+
+class PeriodicMsgEngine:
+    """
+    Engine for dispatching periodic message jobs.
+
+    The next fire times of all jobs are kept in a single min-heap and the engine sleeps once
+    until the earliest one. Removed or paused jobs are discarded lazily when they reach the top of the heap.
+    All the jobs due in the same wakeup are submitted as a single batch to the worker pool.
+    Fire times missed by more than the grace time (e.g. because the event loop was blocked or the bot was down)
+    are handled according to the misfire policy of the job.
+    """
+
+    logger: Logger
+    clock: Clock
+    worker_pool: PeriodicMsgWorkerPool
+    misfire_grace_sec: float
+    fire_fct: Optional[PeriodicMsgEngineFireFct]
+    jobs: Dict[str, PeriodicMsgEngineJob]
+    heap: List[Tuple[float, int, PeriodicMsgEngineJob]]
+    heap_seq: int
+    timer_handle: Optional[asyncio.TimerHandle]
+    timer_fire_time: Optional[float]
+    running: bool
+    stats: PeriodicMsgEngineStats
+
+    def __init__(self,
+                 logger: Logger,
+                 worker_pool: PeriodicMsgWorkerPool,
+                 misfire_grace_sec: float,
+                 fire_fct: Optional[PeriodicMsgEngineFireFct] = None,
+                 *,
+                 clock: Optional[Clock] = None) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            logger: Logger instance for logging operations.
+            worker_pool: Worker pool for executing the fired jobs.
+            misfire_grace_sec: Maximum lateness in seconds for a fire time not to be considered missed.
+            fire_fct: Function called each time a job fires, even if its run is skipped (optional).
+            clock: Clock giving the current time (optional, the system clock if not specified).
+        """
+        self.logger = logger
+        self.clock = clock if clock is not None else Clock()
+        self.worker_pool = worker_pool
+        self.misfire_grace_sec = misfire_grace_sec
+        self.fire_fct = fire_fct
+        self.jobs = {}
+        self.heap = []
+        self.heap_seq = 0
+        self.timer_handle = None
+        self.timer_fire_time = None
+        self.running = False
+        self.stats = PeriodicMsgEngineStats()
+
+    def Start(self) -> None:
+        """Start the engine."""
+        if self.running:
+            return
+
+        # Jobs added before starting are only appended, so the heap is built in a single pass
+        heapq.heapify(self.heap)
+        self.running = True
+        self.__ArmTimer()
+        self.logger.GetLogger().info(f"Periodic message engine started, number of jobs: {len(self.jobs)}")
+
+    def Stop(self) -> None:
+        """Stop the engine."""
+        if not self.running:
+            return
+
+        self.running = False
+        self.__CancelTimer()
+        self.logger.GetLogger().info("Periodic message engine stopped")
+
+    def GetStats(self) -> PeriodicMsgEngineStats:
+        """
+        Get the engine statistics.
+
+        Returns:
+            Engine statistics.
+        """
+        return self.stats
+
+    def HasJob(self,
+               job_id: str) -> bool:
+        """
+        Get whether a job is registered.
+
+        Args:
+            job_id: Unique job identifier.
+
+        Returns:
+            True if the job is registered, False otherwise.
+        """
+        return job_id in self.jobs
+
+    def GetNextFireTime(self,
+                        job_id: str) -> Optional[float]:
+        """
+        Get the next fire time of a job.
+
+        Args:
+            job_id: Unique job identifier.
+
+        Returns:
+            Timestamp of the next fire time, None if the job is paused.
+
+        Raises:
+            KeyError: If the job is not registered.
+        """
+        return self.jobs[job_id].next_fire_time
+
+    def AddJob(self,
+               job_id: str,
+               trigger: PeriodicMsgTrigger,
+               callback: Callable[..., Coroutine],
+               args: Tuple[Any, ...],
+               *,
+               misfire_policy: PeriodicMsgMisfirePolicies = PeriodicMsgMisfirePolicies.COALESCE,
+               paused: bool = False,
+               last_fire_time: Optional[float] = None) -> None:
+        """
+        Add a job.
+
+        Args:
+            job_id: Unique job identifier.
+            trigger: Job trigger.
+            callback: Coroutine function called when the job fires.
+            args: Arguments of the callback.
+            misfire_policy: Policy for missed fire times.
+            paused: True to add the job as paused, False otherwise.
+            last_fire_time: Last fire time of the job, if any. The fire times missed since then are
+                            immediately due and handled according to the misfire policy.
+
+        Raises:
+            KeyError: If the job is already registered.
+        """
+        if job_id in self.jobs:
+            raise KeyError(f"Job '{job_id}' already registered")
+
+        start_time = time.perf_counter()
+
+        job = PeriodicMsgEngineJob(job_id, trigger, callback, args, misfire_policy)
+        job.paused = paused
+        self.jobs[job_id] = job
+        if not paused:
+            self.__PushJob(job, trigger.NextFireTime(last_fire_time if last_fire_time is not None else self.clock.Time()))
+
+        self.stats.jobs_num.Set(len(self.jobs))
+        self.stats.add_time.Observe(time.perf_counter() - start_time)
+
+    def SetMisfirePolicy(self,
+                         job_id: str,
+                         misfire_policy: PeriodicMsgMisfirePolicies) -> None:
+        """
+        Set the misfire policy of a job.
+
+        Args:
+            job_id: Unique job identifier.
+            misfire_policy: Policy for missed fire times.
+
+        Raises:
+            KeyError: If the job is not registered.
+        """
+        self.jobs[job_id].misfire_policy = misfire_policy
+
+    def RemoveJob(self,
+                  job_id: str) -> None:
+        """
+        Remove a job.
+
+        Args:
+            job_id: Unique job identifier.
+
+        Raises:
+            KeyError: If the job is not registered.
+        """
+        start_time = time.perf_counter()
+
+        job = self.jobs.pop(job_id)
+        self.__InvalidateJob(job)
+
+        self.stats.jobs_num.Set(len(self.jobs))
+        self.stats.remove_time.Observe(time.perf_counter() - start_time)
+
+    def RemoveAllJobs(self) -> None:
+        """Remove all the jobs."""
+        self.__CancelTimer()
+        self.jobs = {}
+        self.heap = []
+        self.stats.jobs_num.Set(0)
+
+    def PauseJob(self,
+                 job_id: str) -> None:
+        """
+        Pause a job.
+
+        Args:
+            job_id: Unique job identifier.
+
+        Raises:
+            KeyError: If the job is not registered.
+        """
+        start_time = time.perf_counter()
+
+        job = self.jobs[job_id]
+        job.paused = True
+        self.__InvalidateJob(job)
+
+        self.stats.remove_time.Observe(time.perf_counter() - start_time)
+
+    def ResumeJob(self,
+                  job_id: str) -> None:
+        """
+        Resume a paused job.
+
+        Args:
+            job_id: Unique job identifier.
+
+        Raises:
+            KeyError: If the job is not registered.
+        """
+        job = self.jobs[job_id]
+        if not job.paused:
+            return
+
+        start_time = time.perf_counter()
+
+        job.paused = False
+        self.__PushJob(job, job.trigger.NextFireTime(self.clock.Time()))
+
+        self.stats.add_time.Observe(time.perf_counter() - start_time)
+
+    def __PushJob(self,
+                  job: PeriodicMsgEngineJob,
+                  fire_time: float) -> None:
+        """
+        Push a job to the heap.
+
+        Args:
+            job: Job to push.
+            fire_time: Timestamp of the next fire time.
+        """
+        self.heap_seq += 1
+        job.heap_seq = self.heap_seq
+        job.next_fire_time = fire_time
+
+        if not self.running:
+            self.heap.append((fire_time, job.heap_seq, job))
+            return
+
+        heapq.heappush(self.heap, (fire_time, job.heap_seq, job))
+        # Re-arm the timer only if the job is due before the current wakeup
+        if self.timer_fire_time is None or fire_time < self.timer_fire_time:
+            self.__ArmTimer()
+
+    def __InvalidateJob(self,
+                        job: PeriodicMsgEngineJob) -> None:
+        """
+        Invalidate the heap entry of a job, which will be discarded when popped.
+
+        Args:
+            job: Job to invalidate.
+        """
+        job.heap_seq = -1
+        job.next_fire_time = None
+
+        if len(self.heap) - len(self.jobs) > max(PeriodicMsgEngineConst.HEAP_COMPACT_MIN_STALE, len(self.jobs)):
+            self.__CompactHeap()
+
+    def __CompactHeap(self) -> None:
+        """Rebuild the heap without stale entries."""
+        self.heap = [entry for entry in self.heap if entry[1] == entry[2].heap_seq]
+        heapq.heapify(self.heap)
+
+    def __ArmTimer(self) -> None:
+        """Arm the timer to wake up at the earliest fire time."""
+        self.__CancelTimer()
+
+        heap = self.heap
+        while len(heap) > 0 and heap[0][1] != heap[0][2].heap_seq:
+            heapq.heappop(heap)
+        if len(heap) == 0:
+            return
+
+        loop = asyncio.get_event_loop()
+        self.timer_fire_time = heap[0][0]
+        self.timer_handle = loop.call_at(loop.time() + max(0.0, self.timer_fire_time - self.clock.Time()), self.__Tick)
+
+    def __CancelTimer(self) -> None:
+        """Cancel the timer, if any."""
+        if self.timer_handle is not None:
+            self.timer_handle.cancel()
+        self.timer_handle = None
+        self.timer_fire_time = None
+
+    def __Tick(self) -> None:
+        """Fire all the due jobs and re-arm the timer."""
+        self.timer_handle = None
+        self.timer_fire_time = None
+
+        start_time = time.perf_counter()
+
+        now = self.clock.Time()
+        due_jobs = self.__PopDueJobs(now)
+
+        items = []
+        for job, fire_times in due_jobs:
+            runs_num = self.__GetRunsNum(job, fire_times, now)
+            items.extend([(job.job_id, job.callback, job.args)] * runs_num)
+            self.stats.fired_num.Inc(runs_num)
+        if len(items) > 0:
+            self.worker_pool.SubmitBatch(items)
+
+        self.__ArmTimer()
+        self.stats.tick_time.Observe(time.perf_counter() - start_time)
+
+    def __PopDueJobs(self,
+                     now: float) -> List[Tuple[PeriodicMsgEngineJob, List[float]]]:
+        """
+        Pop all the due jobs from the heap and push them back with their next fire time.
+
+        Args:
+            now: Current timestamp.
+
+        Returns:
+            List of due jobs, each one with its fire times up to now.
+        """
+        heap = self.heap
+        due_time = now + PeriodicMsgEngineConst.DUE_TOLERANCE_SEC
+
+        due_jobs = []
+        while len(heap) > 0 and heap[0][0] <= due_time:
+            fire_time, heap_seq, job = heapq.heappop(heap)
+            if heap_seq != job.heap_seq:
+                continue
+            due_jobs.append((job, [fire_time]))
+
+        # Push back after popping, so that a job is never fired twice in the same tick
+        for job, fire_times in due_jobs:
+            next_fire_time = job.trigger.NextFireTime(fire_times[0])
+            # Collect the other fire times up to now, if the job is late
+            while next_fire_time <= due_time:
+                if len(fire_times) >= PeriodicMsgEngineConst.MISFIRE_COUNT_MAX_NUM:
+                    next_fire_time = job.trigger.NextFireTime(now)
+                    break
+                fire_times.append(next_fire_time)
+                next_fire_time = job.trigger.NextFireTime(next_fire_time)
+
+            self.heap_seq += 1
+            job.heap_seq = self.heap_seq
+            job.next_fire_time = next_fire_time
+            heapq.heappush(heap, (next_fire_time, job.heap_seq, job))
+
+        return due_jobs
+
+    def __GetRunsNum(self,
+                     job: PeriodicMsgEngineJob,
+                     fire_times: List[float],
+                     now: float) -> int:
+        """
+        Get the number of runs of a due job, according to its misfire policy.
+
+        Args:
+            job: Due job.
+            fire_times: Fire times of the job up to now.
+            now: Current timestamp.
+
+        Returns:
+            Number of runs.
+        """
+        for fire_time in fire_times:
+            self.stats.lateness.Observe(max(0.0, now - fire_time))
+
+        # Only the last fire time can be on time, the previous ones have been missed for sure
+        is_last_on_time = now - fire_times[-1] <= self.misfire_grace_sec
+        misfires_num = len(fire_times) - 1 if is_last_on_time else len(fire_times)
+
+        if misfires_num == 0:
+            runs_num = 1
+        else:
+            self.stats.misfired_num.Inc(misfires_num)
+            self.logger.GetLogger().warning(
+                f"Job '{job.job_id}' missed {misfires_num} fire time(s), policy: {job.misfire_policy.name.lower()}"
+            )
+
+            if job.misfire_policy == PeriodicMsgMisfirePolicies.SKIP:
+                runs_num = 1 if is_last_on_time else 0
+            else:
+                # Missed fire times are never replayed one by one: with the run late policy, the late run is merged
+                # into the on-time one (if any), so that the same message is not sent twice in a row
+                runs_num = 1
+
+        if self.fire_fct is not None:
+            self.fire_fct(job.job_id, fire_times[-1], misfires_num)
+
+        return runs_num
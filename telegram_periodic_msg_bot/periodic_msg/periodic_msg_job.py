@@ -18,25 +18,34 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-import pyrogram
+from typing import List, Optional
+
+from pyrogram.errors import RPCError
 
 from telegram_periodic_msg_bot.logger.logger import Logger
-from telegram_periodic_msg_bot.misc.helpers import ChatHelper
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_body_store import PeriodicMsgBodyKey, PeriodicMsgBodyStore
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_engine import PeriodicMsgMisfirePolicies
 from telegram_periodic_msg_bot.periodic_msg.periodic_msg_sender import PeriodicMsgSender
 
 
 class PeriodicMsgJobData:
     """Data container for a periodic message job."""
 
-    chat: pyrogram.types.Chat
+    __slots__ = ("chat_id", "topic_id", "period_hours", "start_hour", "msg_id",
+                 "running", "spread_offset", "misfire_policy", "last_fire_time")
+
+    chat_id: int
     topic_id: int
     period_hours: int
     start_hour: int
     msg_id: str
     running: bool
+    spread_offset: Optional[int]
+    misfire_policy: Optional[PeriodicMsgMisfirePolicies]
+    last_fire_time: Optional[float]
 
     def __init__(self,
-                 chat: pyrogram.types.Chat,
+                 chat_id: int,
                  topic_id: int,
                  period_hours: int,
                  start_hour: int,
@@ -45,27 +54,30 @@ class PeriodicMsgJobData:
         Initialize the job data.
 
         Args:
-            chat: The chat where the job runs.
+            chat_id: ID of the chat where the job runs.
             topic_id: The topic where the job runs.
             period_hours: Period in hours between message sends.
             start_hour: Starting hour for the job.
             msg_id: Unique identifier for the message.
         """
-        self.chat = chat
+        self.chat_id = chat_id
         self.topic_id = topic_id
         self.period_hours = period_hours
         self.start_hour = start_hour
         self.msg_id = msg_id
         self.running = True
+        self.spread_offset = None
+        self.misfire_policy = None
+        self.last_fire_time = None
 
-    def Chat(self) -> pyrogram.types.Chat:
+    def ChatId(self) -> int:
         """
         Get the chat associated with this job.
 
         Returns:
-            The chat object.
+            The Telegram chat ID.
         """
-        return self.chat
+        return self.chat_id
 
     def TopicId(self) -> int:
         """
@@ -122,31 +134,99 @@ class PeriodicMsgJobData:
         """
         return self.running
 
+    def SetSpreadOffset(self,
+                        offset: Optional[int]) -> None:
+        """
+        Set the offset of the job within its slot.
+
+        Args:
+            offset: Offset in seconds within an hour slot, None if not spread.
+        """
+        self.spread_offset = offset
+
+    def SpreadOffset(self) -> Optional[int]:
+        """
+        Get the offset of the job within its slot.
+
+        Returns:
+            Offset in seconds within an hour slot, None if not spread.
+        """
+        return self.spread_offset
+
+    def SetMisfirePolicy(self,
+                         policy: Optional[PeriodicMsgMisfirePolicies]) -> None:
+        """
+        Set the misfire policy of the job.
+
+        Args:
+            policy: Misfire policy, None to use the default one.
+        """
+        self.misfire_policy = policy
+
+    def MisfirePolicy(self) -> Optional[PeriodicMsgMisfirePolicies]:
+        """
+        Get the misfire policy of the job.
+
+        Returns:
+            Misfire policy, None if the default one is used.
+        """
+        return self.misfire_policy
+
+    def SetLastFireTime(self,
+                        fire_time: Optional[float]) -> None:
+        """
+        Set the last fire time of the job.
+
+        Args:
+            fire_time: Timestamp of the last scheduled fire time, None if never fired.
+        """
+        self.last_fire_time = fire_time
+
+    def LastFireTime(self) -> Optional[float]:
+        """
+        Get the last fire time of the job.
+
+        Returns:
+            Timestamp of the last scheduled fire time, None if never fired.
+        """
+        return self.last_fire_time
+
 
 class PeriodicMsgJob:
     """Periodic message job that sends messages at scheduled intervals."""
 
+    __slots__ = ("data", "logger", "body_store", "message_sender", "message_key",
+                 "delete_last_sent_msg", "last_sent_msg_ids")
+
     data: PeriodicMsgJobData
     logger: Logger
-    message: str
+    body_store: PeriodicMsgBodyStore
     message_sender: PeriodicMsgSender
+    message_key: Optional[PeriodicMsgBodyKey]
+    delete_last_sent_msg: bool
+    last_sent_msg_ids: Optional[List[int]]
 
     def __init__(self,
-                 client: pyrogram.Client,
                  logger: Logger,
+                 message_sender: PeriodicMsgSender,
+                 body_store: PeriodicMsgBodyStore,
                  data: PeriodicMsgJobData) -> None:
         """
         Initialize the periodic message job.
 
         Args:
-            client: Pyrogram client instance
             logger: Logger instance for logging operations
+            message_sender: Periodic message sender shared by all the jobs
+            body_store: Shared store of the message bodies
             data: Job data containing configuration
         """
         self.data = data
         self.logger = logger
-        self.message = ""
-        self.message_sender = PeriodicMsgSender(client, logger)
+        self.body_store = body_store
+        self.message_sender = message_sender
+        self.message_key = None
+        self.delete_last_sent_msg = True
+        self.last_sent_msg_ids = None
 
     def Data(self) -> PeriodicMsgJobData:
         """
@@ -175,7 +255,16 @@ class PeriodicMsgJob:
         Args:
             flag: True to delete last message before sending new one, False otherwise
         """
-        self.message_sender.DeleteLastSentMessage(flag)
+        self.delete_last_sent_msg = flag
+
+    def IsDeleteLastSentMessageEnabled(self) -> bool:
+        """
+        Get whether the last sent message is deleted before sending a new one.
+
+        Returns:
+            True if the last message is deleted, False otherwise
+        """
+        return self.delete_last_sent_msg
 
     def GetMessage(self) -> str:
         """
@@ -184,7 +273,7 @@ class PeriodicMsgJob:
         Returns:
             The message text
         """
-        return self.message
+        return self.body_store.Get(self.message_key) if self.message_key is not None else ""
 
     def SetMessage(self,
                    message: str) -> None:
@@ -194,22 +283,43 @@ class PeriodicMsgJob:
         Args:
             message: The message text to send
         """
-        self.message = message
-
-    async def DoJob(self,
-                    chat: pyrogram.types.Chat,
-                    topic_id: int) -> None:
-        """
-        Execute the job by sending the periodic message.
-
-        Args:
-            chat: The chat to send the message to
-            topic_id: The topic to send the message to
-        """
-        self.logger.GetLogger().info(
-            f"Periodic message job started in chat '{ChatHelper.GetTitleOrId(chat)}' ({topic_id})"
-        )
-        if self.message == "":
+        new_key = self.body_store.Acquire(message) if message != "" else None
+        self.ClearMessage()
+        self.message_key = new_key
+
+    def ClearMessage(self) -> None:
+        """Clear the message, releasing it from the body store."""
+        if self.message_key is not None:
+            self.body_store.Release(self.message_key)
+            self.message_key = None
+
+    async def DoJob(self) -> None:
+        """Execute the job by sending the periodic message."""
+        chat_id = self.data.ChatId()
+        topic_id = self.data.TopicId()
+
+        self.logger.GetLogger().info(f"Periodic message job started in chat {chat_id} ({topic_id})")
+        if self.message_key is None:
             self.logger.GetLogger().info("No message set, exiting...")
             return
-        await self.message_sender.SendMessage(chat, topic_id, self.message)
+        msg_ids_to_delete = None
+        if self.delete_last_sent_msg:
+            # Handed over to the deleter, that keeps them pending if their deletion has to be retried (also when
+            # the job is put back in the worker pool because the chat is blocked)
+            msg_ids_to_delete = self.last_sent_msg_ids if self.last_sent_msg_ids is not None else []
+            self.last_sent_msg_ids = None
+        sent_msg_ids: List[int] = []
+        try:
+            await self.message_sender.SendMessage(
+                chat_id,
+                topic_id,
+                self.body_store.GetParts(self.message_key),
+                msg_ids_to_delete,
+                sent_msg_ids
+            )
+        except RPCError:
+            self.logger.GetLogger().exception(f"Unable to send periodic message in chat {chat_id} ({topic_id})")
+        finally:
+            # Kept also when a later part failed, so that the parts already sent are deleted by the next run
+            if len(sent_msg_ids) > 0:
+                self.last_sent_msg_ids = sent_msg_ids
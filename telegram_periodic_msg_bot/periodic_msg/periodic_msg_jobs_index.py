@@ -0,0 +1,105 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from typing import Dict, List
+
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_job import PeriodicMsgJob
+
+
+class PeriodicMsgJobsIndex:
+    """Index of periodic message jobs by chat ID, topic ID and message ID."""
+
+    index: Dict[int, Dict[int, Dict[str, PeriodicMsgJob]]]
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self.index = {}
+
+    def Add(self,
+            chat_id: int,
+            topic_id: int,
+            msg_id: str,
+            job: PeriodicMsgJob) -> None:
+        """
+        Add a job to the index.
+
+        Args:
+            chat_id: Chat ID of the job.
+            topic_id: Topic ID of the job.
+            msg_id: Message ID of the job.
+            job: Job to add.
+        """
+        self.index.setdefault(chat_id, {}).setdefault(topic_id, {})[msg_id] = job
+
+    def Remove(self,
+               chat_id: int,
+               topic_id: int,
+               msg_id: str) -> None:
+        """
+        Remove a job from the index, if present.
+
+        Args:
+            chat_id: Chat ID of the job.
+            topic_id: Topic ID of the job.
+            msg_id: Message ID of the job.
+        """
+        chat_jobs = self.index.get(chat_id)
+        if chat_jobs is None:
+            return
+        topic_jobs = chat_jobs.get(topic_id)
+        if topic_jobs is None:
+            return
+
+        topic_jobs.pop(msg_id, None)
+        if len(topic_jobs) == 0:
+            del chat_jobs[topic_id]
+        if len(chat_jobs) == 0:
+            del self.index[chat_id]
+
+    def GetInChat(self,
+                  chat_id: int) -> List[PeriodicMsgJob]:
+        """
+        Get all the jobs in a chat.
+
+        Args:
+            chat_id: Chat ID.
+
+        Returns:
+            List of jobs in the chat, topics included.
+        """
+        return [job
+                for topic_jobs in self.index.get(chat_id, {}).values()
+                for job in topic_jobs.values()]
+
+    def GetInTopic(self,
+                   chat_id: int,
+                   topic_id: int) -> List[PeriodicMsgJob]:
+        """
+        Get all the jobs in a topic.
+
+        Args:
+            chat_id: Chat ID.
+            topic_id: Topic ID.
+
+        Returns:
+            List of jobs in the topic.
+        """
+        return list(self.index.get(chat_id, {}).get(topic_id, {}).values())
@@ -0,0 +1,245 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import asyncio
+import os
+import socket
+import sqlite3
+from typing import Callable, Optional
+
+from telegram_periodic_msg_bot.bot.bot_config_types import BotConfigTypes
+from telegram_periodic_msg_bot.config.config_object import ConfigObject
+from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.metrics.metrics import MetricCounter, MetricGauge
+from telegram_periodic_msg_bot.utils.clock import Clock
+
+
+# Function called when the lease is acquired or lost
+PeriodicMsgLeaseChangeFct = Callable[[], None]
+
+
+class PeriodicMsgLeaseStats:
+    """Statistics of the periodic message lease."""
+
+    is_leader: MetricGauge
+    acquired_num: MetricCounter
+    lost_num: MetricCounter
+    renew_failed_num: MetricCounter
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.is_leader = MetricGauge("lease_is_leader", "1 if the instance holds the lease, 0 otherwise")
+        self.acquired_num = MetricCounter("lease_acquired_total", "Number of times the lease was acquired")
+        self.lost_num = MetricCounter("lease_lost_total", "Number of times the lease was lost")
+        self.renew_failed_num = MetricCounter("lease_renew_failed_total", "Number of failed lease renewals")
+
+
+class PeriodicMsgLease:
+    """
+    Lease stored in the tasks database, electing the instance that runs the jobs when more instances share it.
+
+    The holder renews the lease periodically and steps down if it can't renew it two periods before the
+    expiration, so that it stops sending before another instance can acquire the lease.
+    """
+
+    config: ConfigObject
+    logger: Logger
+    clock: Clock
+    name: str
+    holder: str
+    acquired_fct: PeriodicMsgLeaseChangeFct
+    lost_fct: PeriodicMsgLeaseChangeFct
+    db_conn: Optional[sqlite3.Connection]
+    held_until: Optional[float]
+    renew_handle: Optional[asyncio.TimerHandle]
+    stats: PeriodicMsgLeaseStats
+
+    def __init__(self,
+                 config: ConfigObject,
+                 logger: Logger,
+                 name: str,
+                 acquired_fct: PeriodicMsgLeaseChangeFct,
+                 lost_fct: PeriodicMsgLeaseChangeFct,
+                 *,
+                 clock: Optional[Clock] = None) -> None:
+        """
+        Initialize the lease.
+
+        Args:
+            config: Configuration object.
+            logger: Logger instance for logging operations.
+            name: Lease name, instances competing for the same lease shall use the same name.
+            acquired_fct: Function called when the lease is acquired by the periodic renewal.
+            lost_fct: Function called when the lease is lost.
+            clock: Clock giving the current time (optional, the system clock if not specified).
+        """
+        self.config = config
+        self.logger = logger
+        self.clock = clock if clock is not None else Clock()
+        self.name = name
+        self.holder = f"{socket.gethostname()}:{os.getpid()}"
+        self.acquired_fct = acquired_fct
+        self.lost_fct = lost_fct
+        self.db_conn = None
+        self.held_until = None
+        self.renew_handle = None
+        self.stats = PeriodicMsgLeaseStats()
+
+    def Open(self) -> None:
+        """Open the database, whose schema shall be already created by the storage."""
+        # Keep the lock timeout short, since the event loop is blocked meanwhile and the renewal shall not be delayed
+        self.db_conn = sqlite3.connect(self.config.GetValue(BotConfigTypes.TASKS_DB_FILE_NAME),
+                                       timeout=self.config.GetValue(BotConfigTypes.HA_LEASE_RENEW_SEC) / 2)
+
+    def Close(self) -> None:
+        """Stop renewing the lease and release it, so that a standby instance can take over immediately."""
+        if self.renew_handle is not None:
+            self.renew_handle.cancel()
+            self.renew_handle = None
+        if self.db_conn is None:
+            return
+
+        if self.IsHeld():
+            try:
+                with self.db_conn:
+                    self.db_conn.execute("DELETE FROM lease WHERE name = ? AND holder = ?", (self.name, self.holder))
+            except sqlite3.Error:
+                self.logger.GetLogger().exception(f"Unable to release lease '{self.name}'")
+            else:
+                self.logger.GetLogger().info(f"Lease '{self.name}' released")
+            self.held_until = None
+            self.stats.is_leader.Set(0)
+
+        self.db_conn.close()
+        self.db_conn = None
+
+    def GetStats(self) -> PeriodicMsgLeaseStats:
+        """
+        Get the lease statistics.
+
+        Returns:
+            Lease statistics.
+        """
+        return self.stats
+
+    def IsHeld(self) -> bool:
+        """
+        Get whether the lease is held by this instance.
+
+        Returns:
+            True if held, False otherwise.
+        """
+        return self.held_until is not None
+
+    def Acquire(self) -> bool:
+        """
+        Try to acquire the lease once, without calling the acquired function.
+
+        Returns:
+            True if acquired, False otherwise.
+        """
+        if self.__TryAcquire(self.clock.Time()):
+            self.logger.GetLogger().info(f"Lease '{self.name}' acquired, running as leader")
+            return True
+
+        self.logger.GetLogger().info(f"Lease '{self.name}' held by another instance, running as standby")
+        return False
+
+    def Start(self) -> None:
+        """Start renewing (or trying to acquire) the lease periodically."""
+        if self.renew_handle is None:
+            self.__ScheduleRenew()
+
+    def __Renew(self) -> None:
+        """Renew the lease if held, try to acquire it otherwise."""
+        self.__ScheduleRenew()
+
+        was_held = self.IsHeld()
+        acquired = self.__TryAcquire(self.clock.Time())
+        if not was_held:
+            if acquired:
+                self.logger.GetLogger().warning(f"Lease '{self.name}' acquired, taking over as leader")
+                self.acquired_fct()
+            return
+        if acquired:
+            return
+
+        assert self.held_until is not None
+        # Step down while the lease is still valid, so that the jobs are never run by two instances
+        self.stats.renew_failed_num.Inc()
+        if self.clock.Time() + 2 * self.config.GetValue(BotConfigTypes.HA_LEASE_RENEW_SEC) >= self.held_until:
+            self.logger.GetLogger().error(f"Unable to renew lease '{self.name}', stepping down to standby")
+            self.__SetHeldUntil(None)
+            self.lost_fct()
+
+    def __TryAcquire(self,
+                     now: float) -> bool:
+        """
+        Acquire or renew the lease, if it's free, expired or already held by this instance.
+
+        Args:
+            now: Current timestamp.
+
+        Returns:
+            True if acquired or renewed, False otherwise.
+        """
+        assert self.db_conn is not None
+
+        expires_at = now + self.config.GetValue(BotConfigTypes.HA_LEASE_TTL_SEC)
+        try:
+            with self.db_conn:
+                cursor = self.db_conn.execute(
+                    "INSERT INTO lease (name, holder, expires_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET holder = excluded.holder, expires_at = excluded.expires_at "
+                    "WHERE lease.holder = excluded.holder OR lease.expires_at <= ?",
+                    (self.name, self.holder, expires_at, now)
+                )
+        except sqlite3.Error:
+            self.logger.GetLogger().exception(f"Unable to access lease '{self.name}'")
+            return False
+
+        if cursor.rowcount == 0:
+            return False
+
+        if self.held_until is None:
+            self.stats.acquired_num.Inc()
+        self.__SetHeldUntil(expires_at)
+        return True
+
+    def __SetHeldUntil(self,
+                       held_until: Optional[float]) -> None:
+        """
+        Set the expiration of the held lease.
+
+        Args:
+            held_until: Expiration timestamp, None if the lease is not held.
+        """
+        if held_until is None and self.held_until is not None:
+            self.stats.lost_num.Inc()
+        self.held_until = held_until
+        self.stats.is_leader.Set(0 if held_until is None else 1)
+
+    def __ScheduleRenew(self) -> None:
+        """Schedule the next renewal."""
+        self.renew_handle = asyncio.get_event_loop().call_later(
+            self.config.GetValue(BotConfigTypes.HA_LEASE_RENEW_SEC),
+            self.__Renew
+        )
@@ -18,18 +18,41 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from typing import Dict
+from typing import Dict, List, Optional
 
 import pyrogram
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
+from telegram_periodic_msg_bot.bot.bot_config import MisfirePolicyConverter
 from telegram_periodic_msg_bot.bot.bot_config_types import BotConfigTypes
 from telegram_periodic_msg_bot.config.config_object import ConfigObject
 from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.message.message_deleter import MessageDeleter
+from telegram_periodic_msg_bot.message.message_sender import MessageSender
+from telegram_periodic_msg_bot.metrics.metrics import MetricCounterFamily, MetricGauge
 from telegram_periodic_msg_bot.misc.helpers import ChatHelper
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_body_store import PeriodicMsgBodyStore, PeriodicMsgBodyStoreStats
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_engine import (
+    PeriodicMsgEngine,
+    PeriodicMsgEngineStats,
+    PeriodicMsgMisfirePolicies,
+)
 from telegram_periodic_msg_bot.periodic_msg.periodic_msg_job import PeriodicMsgJob, PeriodicMsgJobData
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_jobs_index import PeriodicMsgJobsIndex
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_lease import PeriodicMsgLease, PeriodicMsgLeaseStats
 from telegram_periodic_msg_bot.periodic_msg.periodic_msg_parser import PeriodicMsgParser
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_sender import PeriodicMsgSender, PeriodicMsgSenderStats
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_spreader import PeriodicMsgSpreader
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_storage import PeriodicMsgStorage, PeriodicMsgStorageRecord
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_trigger import PeriodicMsgTrigger, PeriodicMsgTriggerFactory
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_worker_pool import (
+    PeriodicMsgWorkerPool,
+    PeriodicMsgWorkerPoolStats,
+    PeriodicMsgWorkItem,
+)
+from telegram_periodic_msg_bot.shard.shard_info import ShardInfo
 from telegram_periodic_msg_bot.translator.translation_loader import TranslationLoader
+from telegram_periodic_msg_bot.translator.translation_packs import TranslationPacks, TranslationPacksLanguageError
+from telegram_periodic_msg_bot.utils.clock import Clock
 from telegram_periodic_msg_bot.utils.wrapped_list import WrappedList
 
 
@@ -91,6 +114,8 @@ class PeriodicMsgJobsList(WrappedList):
                                          topic_id=job_data.TopicId(),
                                          period=job_data.PeriodHours(),
                                          start=job_data.StartHour(),
+                                         offset_min=(job_data.SpreadOffset() or 0) // 60,
+                                         offset_sec=(job_data.SpreadOffset() or 0) % 60,
                                          state=(self.translator.GetSentence("TASK_RUNNING_MSG")
                                                 if job_data.IsRunning()
                                                 else self.translator.GetSentence("TASK_PAUSED_MSG"))
@@ -108,37 +133,193 @@ class PeriodicMsgJobsList(WrappedList):
         return self.ToString()
 
 
+class PeriodicMsgSchedulerStats:
+    """Statistics of the periodic message scheduler."""
+
+    misfires_num: MetricCounterFamily
+    active_num: MetricGauge
+    paused_num: MetricGauge
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.misfires_num = MetricCounterFamily("scheduler_misfires_total",
+                                                "Number of fire times missed by more than the grace time",
+                                                "chat_id")
+        self.active_num = MetricGauge("scheduler_tasks_active", "Number of running tasks")
+        self.paused_num = MetricGauge("scheduler_tasks_paused", "Number of paused tasks")
+
+
 class PeriodicMsgScheduler:
     """Scheduler for managing periodic message jobs across multiple chats."""
 
-    client: pyrogram.Client
     config: ConfigObject
     logger: Logger
-    translator: TranslationLoader
+    translator: TranslationPacks
+    message_sender: MessageSender
+    message_deleter: MessageDeleter
+    periodic_msg_sender: PeriodicMsgSender
     jobs: Dict[str, PeriodicMsgJob]
-    scheduler: AsyncIOScheduler
+    jobs_index: PeriodicMsgJobsIndex
+    body_store: PeriodicMsgBodyStore
+    trigger_factory: PeriodicMsgTriggerFactory
+    worker_pool: PeriodicMsgWorkerPool
+    spreader: PeriodicMsgSpreader
+    engine: PeriodicMsgEngine
+    shard_info: Optional[ShardInfo]
+    storage: Optional[PeriodicMsgStorage]
+    lease: Optional[PeriodicMsgLease]
+    stats: PeriodicMsgSchedulerStats
 
     def __init__(self,
-                 client: pyrogram.Client,
                  config: ConfigObject,
                  logger: Logger,
-                 translator: TranslationLoader) -> None:
+                 translator: TranslationPacks,
+                 message_sender: MessageSender,
+                 message_deleter: MessageDeleter,
+                 *,
+                 shard_info: Optional[ShardInfo] = None,
+                 clock: Optional[Clock] = None) -> None:
         """
         Initialize the periodic message scheduler.
 
         Args:
-            client: Pyrogram client instance.
             config: Configuration object.
             logger: Logger instance for logging operations.
-            translator: Translation loader for localized messages.
+            translator: Translations of the chats, whose languages are persisted with the jobs.
+            message_sender: Message sender shared by all the jobs.
+            message_deleter: Message deleter shared by all the jobs.
+            shard_info: Information about the shard, only its jobs are restored (None to restore all of them).
+            clock: Clock giving the current time (optional, the system clock if not specified).
         """
-        self.client = client
         self.config = config
+        self.shard_info = shard_info
         self.logger = logger
         self.translator = translator
+        self.message_sender = message_sender
+        self.message_deleter = message_deleter
+        self.periodic_msg_sender = PeriodicMsgSender(logger, message_sender, message_deleter)
         self.jobs = {}
-        self.scheduler = AsyncIOScheduler()
-        self.scheduler.start()
+        self.jobs_index = PeriodicMsgJobsIndex()
+        self.body_store = PeriodicMsgBodyStore(config.GetValue(BotConfigTypes.TASKS_MSG_COMPRESS_MIN_BYTES))
+        self.trigger_factory = PeriodicMsgTriggerFactory()
+        self.worker_pool = PeriodicMsgWorkerPool(logger,
+                                                 config.GetValue(BotConfigTypes.TASKS_WORKERS_NUM),
+                                                 self.__GetWorkItemDelay,
+                                                 clock=clock)
+        self.spreader = PeriodicMsgSpreader(config.GetValue(BotConfigTypes.TASKS_SPREAD_MODE))
+        self.engine = PeriodicMsgEngine(logger,
+                                        self.worker_pool,
+                                        config.GetValue(BotConfigTypes.TASKS_MISFIRE_GRACE_SEC),
+                                        self.__OnJobFired,
+                                        clock=clock)
+        self.storage = None
+        self.lease = None
+        self.stats = PeriodicMsgSchedulerStats()
+        if self.config.GetValue(BotConfigTypes.TASKS_DB_ENABLED):
+            self.storage = PeriodicMsgStorage(config, logger)
+            self.storage.Open()
+            if self.config.GetValue(BotConfigTypes.HA_ENABLED):
+                self.lease = PeriodicMsgLease(config,
+                                              logger,
+                                              shard_info.AddSuffix("scheduler") if shard_info is not None else "scheduler",
+                                              self.__OnLeaseAcquired,
+                                              self.__OnLeaseLost,
+                                              clock=clock)
+                self.lease.Open()
+            # Jobs are restored also by a standby instance, so that it's ready to take over
+            self.__RestoreJobs()
+            self.__RestoreChatLangs()
+
+    def Open(self) -> None:
+        """
+        Start running the jobs, including the ones missed while the bot was down.
+
+        It shall be called only after the client is connected, otherwise the missed jobs would fire right away
+        and fail to send.
+        """
+        self.worker_pool.Start()
+        if self.lease is not None:
+            self.lease.Acquire()
+        if self.IsLeader():
+            self.engine.Start()
+        if self.lease is not None:
+            self.lease.Start()
+
+    def Close(self) -> None:
+        """Stop the scheduler and write any pending change to storage."""
+        self.engine.Stop()
+        self.worker_pool.Stop()
+        if self.storage is not None:
+            self.storage.Close()
+        # Release the lease only after writing the pending changes, so that the next leader reads them
+        if self.lease is not None:
+            self.lease.Close()
+
+    def IsLeader(self) -> bool:
+        """
+        Get whether the scheduler runs the jobs, i.e. if HA is disabled or it holds the lease.
+
+        Returns:
+            True if leader, False if standby.
+        """
+        return self.lease is None or self.lease.IsHeld()
+
+    def GetStats(self) -> PeriodicMsgSchedulerStats:
+        """
+        Get the statistics of the scheduler.
+
+        Returns:
+            Scheduler statistics.
+        """
+        running_num = sum(1 for job in self.jobs.values() if job.Data().IsRunning())
+        self.stats.active_num.Set(running_num)
+        self.stats.paused_num.Set(len(self.jobs) - running_num)
+        return self.stats
+
+    def GetSenderStats(self) -> PeriodicMsgSenderStats:
+        """
+        Get the statistics of the periodic message sender, i.e. of the sends of all the jobs.
+
+        Returns:
+            Sender statistics.
+        """
+        return self.periodic_msg_sender.GetStats()
+
+    def GetBodyStoreStats(self) -> PeriodicMsgBodyStoreStats:
+        """
+        Get the statistics of the message body store.
+
+        Returns:
+            Body store statistics.
+        """
+        return self.body_store.GetStats()
+
+    def GetEngineStats(self) -> PeriodicMsgEngineStats:
+        """
+        Get the statistics of the engine.
+
+        Returns:
+            Engine statistics.
+        """
+        return self.engine.GetStats()
+
+    def GetLeaseStats(self) -> Optional[PeriodicMsgLeaseStats]:
+        """
+        Get the statistics of the lease.
+
+        Returns:
+            Lease statistics, None if HA is disabled.
+        """
+        return self.lease.GetStats() if self.lease is not None else None
+
+    def GetWorkerPoolStats(self) -> PeriodicMsgWorkerPoolStats:
+        """
+        Get the statistics of the worker pool.
+
+        Returns:
+            Worker pool statistics.
+        """
+        return self.worker_pool.GetStats()
 
     def GetJobsInChat(self,
                       chat: pyrogram.types.Chat) -> PeriodicMsgJobsList:
@@ -151,10 +332,8 @@ class PeriodicMsgScheduler:
         Returns:
             List of active jobs in the chat.
         """
-        chat_id_str = str(chat.id)
-
-        jobs_list = PeriodicMsgJobsList(self.translator)
-        jobs_list.AddMultiple([job.Data() for (job_id, job) in self.jobs.items() if job_id.startswith(chat_id_str)])
+        jobs_list = PeriodicMsgJobsList(self.translator.ForChat(chat.id))
+        jobs_list.AddMultiple([job.Data() for job in self.jobs_index.GetInChat(chat.id)])
 
         return jobs_list
 
@@ -173,8 +352,8 @@ class PeriodicMsgScheduler:
         Returns:
             True if the job is active, False otherwise.
         """
-        job_id = self.__GetJobId(chat, topic_id, msg_id)
-        return job_id in self.jobs and self.scheduler.get_job(job_id) is not None
+        job_id = self.__GetJobId(chat.id, topic_id, msg_id)
+        return job_id in self.jobs and self.engine.HasJob(job_id)
 
     def Start(self,
               chat: pyrogram.types.Chat,
@@ -200,7 +379,7 @@ class PeriodicMsgScheduler:
             PeriodicMsgJobInvalidStartError: If start hour is invalid.
             PeriodicMsgJobMaxNumError: If maximum number of jobs reached.
         """
-        job_id = self.__GetJobId(chat, topic_id, msg_id)
+        job_id = self.__GetJobId(chat.id, topic_id, msg_id)
 
         if self.IsActiveInChat(chat, topic_id, msg_id):
             self.logger.GetLogger().error(
@@ -227,6 +406,7 @@ class PeriodicMsgScheduler:
 
         self.__CreateJob(job_id, chat, topic_id, period_hours, start_hour, msg_id, message)
         self.__AddJob(job_id, chat, topic_id, period_hours, start_hour, msg_id)
+        self.__SaveJob(job_id)
 
     def GetMessage(self,
                    chat: pyrogram.types.Chat,
@@ -246,7 +426,7 @@ class PeriodicMsgScheduler:
         Raises:
             PeriodicMsgJobNotExistentError: If job does not exist.
         """
-        job_id = self.__GetJobId(chat, topic_id, msg_id)
+        job_id = self.__GetJobId(chat.id, topic_id, msg_id)
 
         if not self.IsActiveInChat(chat, topic_id, msg_id):
             self.logger.GetLogger().error(
@@ -273,7 +453,7 @@ class PeriodicMsgScheduler:
         Raises:
             PeriodicMsgJobNotExistentError: If job does not exist.
         """
-        job_id = self.__GetJobId(chat, topic_id, msg_id)
+        job_id = self.__GetJobId(chat.id, topic_id, msg_id)
 
         if not self.IsActiveInChat(chat, topic_id, msg_id):
             self.logger.GetLogger().error(
@@ -284,8 +464,10 @@ class PeriodicMsgScheduler:
         msg = PeriodicMsgParser(self.config).Parse(message)
 
         self.jobs[job_id].SetMessage(msg)
+        self.__SaveJob(job_id)
         self.logger.GetLogger().info(
-            f"Set message to job '{job_id}' in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id}): {msg}"
+            "Set message to job '%s' in chat %s (%s): %s",
+            job_id, ChatHelper.GetTitleOrId(chat), topic_id, self.logger.MsgBody(msg)
         )
 
     def Stop(self,
@@ -303,7 +485,7 @@ class PeriodicMsgScheduler:
         Raises:
             PeriodicMsgJobNotExistentError: If job does not exist.
         """
-        job_id = self.__GetJobId(chat, topic_id, msg_id)
+        job_id = self.__GetJobId(chat.id, topic_id, msg_id)
 
         if not self.IsActiveInChat(chat, topic_id, msg_id):
             self.logger.GetLogger().error(
@@ -311,8 +493,7 @@ class PeriodicMsgScheduler:
             )
             raise PeriodicMsgJobNotExistentError()
 
-        self.scheduler.remove_job(job_id)
-        self.jobs.pop(job_id, None)
+        self.__RemoveJob(job_id)
 
         self.logger.GetLogger().info(
             f"Stopped job '{job_id}' in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id}), "
@@ -327,22 +508,53 @@ class PeriodicMsgScheduler:
         Args:
             chat: The chat to stop all jobs in.
         """
-        chat_id_str = str(chat.id)
-        job_ids = [job_id for job_id in self.jobs.keys() if job_id.startswith(chat_id_str)]
-        if len(job_ids) == 0:
+        jobs = self.jobs_index.GetInChat(chat.id)
+        if len(jobs) == 0:
             self.logger.GetLogger().info(
                 f"No job to stop in chat {ChatHelper.GetTitleOrId(chat)}, exiting..."
             )
             return
 
-        for job_id in job_ids:
-            self.scheduler.remove_job(job_id)
-            self.jobs.pop(job_id, None)
+        self.__StopJobs(chat, jobs)
+        self.logger.GetLogger().info(
+            f"Removed all jobs in chat {ChatHelper.GetTitleOrId(chat)}, number of active jobs: {self.__GetTotalJobCount()}"
+        )
+
+    async def FlushPendingDeletions(self,
+                                    chat: pyrogram.types.Chat) -> None:
+        """
+        Delete the messages of a chat whose deletion is still pending, in a single pass.
+
+        Args:
+            chat: The chat to flush.
+        """
+        failures = await self.message_deleter.FlushPendingMessages(chat.id)
+        if len(failures) > 0:
+            self.logger.GetLogger().warning(
+                f"Unable to delete {len(failures)} pending message(s) in chat {ChatHelper.GetTitleOrId(chat)}"
+            )
+
+    def StopAllInTopic(self,
+                       chat: pyrogram.types.Chat,
+                       topic_id: int) -> None:
+        """
+        Stop all jobs in a topic.
+
+        Args:
+            chat: The chat containing the topic.
+            topic_id: The topic to stop all jobs in.
+        """
+        jobs = self.jobs_index.GetInTopic(chat.id, topic_id)
+        if len(jobs) == 0:
             self.logger.GetLogger().info(
-                f"Stopped job '{job_id}' in chat {ChatHelper.GetTitleOrId(chat)}"
+                f"No job to stop in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id}), exiting..."
             )
+            return
+
+        self.__StopJobs(chat, jobs)
         self.logger.GetLogger().info(
-            f"Removed all jobs in chat {ChatHelper.GetTitleOrId(chat)}, number of active jobs: {self.__GetTotalJobCount()}"
+            f"Removed all jobs in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id}), "
+            f"number of active jobs: {self.__GetTotalJobCount()}"
         )
 
     def ChatLeft(self,
@@ -357,6 +569,37 @@ class PeriodicMsgScheduler:
             f"Left chat {ChatHelper.GetTitleOrId(chat)}, stopping all jobs..."
         )
         self.StopAll(chat)
+        # Messages cannot be deleted anymore after leaving
+        discarded_num = self.message_deleter.DiscardPendingMessages(chat.id)
+        if discarded_num > 0:
+            self.logger.GetLogger().info(
+                f"Discarded {discarded_num} pending message deletion(s) in chat {ChatHelper.GetTitleOrId(chat)}"
+            )
+        self.SetChatLanguage(chat, None)
+
+    def SetChatLanguage(self,
+                        chat: pyrogram.types.Chat,
+                        lang: Optional[str]) -> None:
+        """
+        Set the language of a chat.
+
+        Args:
+            chat: The chat.
+            lang: Language, None for the default one.
+
+        Raises:
+            TranslationPacksLanguageError: If the language is not available
+        """
+        if self.translator.GetChatLanguage(chat.id) == lang:
+            return
+
+        self.translator.SetChatLanguage(chat.id, lang)
+        if self.storage is not None:
+            self.storage.SaveChatLang(chat.id, lang)
+
+        self.logger.GetLogger().info(
+            f"Set language of chat {ChatHelper.GetTitleOrId(chat)} to: {lang if lang is not None else 'default'}"
+        )
 
     def Pause(self,
               chat: pyrogram.types.Chat,
@@ -373,7 +616,7 @@ class PeriodicMsgScheduler:
         Raises:
             PeriodicMsgJobNotExistentError: If job does not exist.
         """
-        job_id = self.__GetJobId(chat, topic_id, msg_id)
+        job_id = self.__GetJobId(chat.id, topic_id, msg_id)
 
         if not self.IsActiveInChat(chat, topic_id, msg_id):
             self.logger.GetLogger().error(
@@ -382,7 +625,8 @@ class PeriodicMsgScheduler:
             raise PeriodicMsgJobNotExistentError()
 
         self.jobs[job_id].SetRunning(False)
-        self.scheduler.pause_job(job_id)
+        self.engine.PauseJob(job_id)
+        self.__SaveJob(job_id)
         self.logger.GetLogger().info(f"Paused job '{job_id}' in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id})")
 
     def Resume(self,
@@ -400,7 +644,7 @@ class PeriodicMsgScheduler:
         Raises:
             PeriodicMsgJobNotExistentError: If job does not exist.
         """
-        job_id = self.__GetJobId(chat, topic_id, msg_id)
+        job_id = self.__GetJobId(chat.id, topic_id, msg_id)
 
         if not self.IsActiveInChat(chat, topic_id, msg_id):
             self.logger.GetLogger().error(
@@ -409,7 +653,8 @@ class PeriodicMsgScheduler:
             raise PeriodicMsgJobNotExistentError()
 
         self.jobs[job_id].SetRunning(True)
-        self.scheduler.resume_job(job_id)
+        self.engine.ResumeJob(job_id)
+        self.__SaveJob(job_id)
         self.logger.GetLogger().info(f"Resumed job '{job_id}' in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id})")
 
     def DeleteLastSentMessage(self,
@@ -429,7 +674,7 @@ class PeriodicMsgScheduler:
         Raises:
             PeriodicMsgJobNotExistentError: If job does not exist.
         """
-        job_id = self.__GetJobId(chat, topic_id, msg_id)
+        job_id = self.__GetJobId(chat.id, topic_id, msg_id)
 
         if not self.IsActiveInChat(chat, topic_id, msg_id):
             self.logger.GetLogger().error(
@@ -438,10 +683,44 @@ class PeriodicMsgScheduler:
             raise PeriodicMsgJobNotExistentError()
 
         self.jobs[job_id].DeleteLastSentMessage(flag)
+        self.__SaveJob(job_id)
         self.logger.GetLogger().info(
             f"Set delete last message to {flag} for job '{job_id}' in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id})"
         )
 
+    def SetMisfirePolicy(self,
+                         chat: pyrogram.types.Chat,
+                         topic_id: int,
+                         msg_id: str,
+                         policy: PeriodicMsgMisfirePolicies) -> None:
+        """
+        Set the policy for the fire times missed by a job.
+
+        Args:
+            chat: The chat containing the job.
+            topic_id: The topic containing the job.
+            msg_id: The message ID of the job.
+            policy: Misfire policy.
+
+        Raises:
+            PeriodicMsgJobNotExistentError: If job does not exist.
+        """
+        job_id = self.__GetJobId(chat.id, topic_id, msg_id)
+
+        if not self.IsActiveInChat(chat, topic_id, msg_id):
+            self.logger.GetLogger().error(
+                f"Job '{job_id}' not active in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id})"
+            )
+            raise PeriodicMsgJobNotExistentError()
+
+        self.jobs[job_id].Data().SetMisfirePolicy(policy)
+        self.engine.SetMisfirePolicy(job_id, policy)
+        self.__SaveJob(job_id)
+        self.logger.GetLogger().info(
+            f"Set misfire policy to {MisfirePolicyConverter.ValueToKey(policy)} for job '{job_id}' in chat "
+            f"{ChatHelper.GetTitleOrId(chat)} ({topic_id})"
+        )
+
     def __CreateJob(self,
                     job_id: str,
                     chat: pyrogram.types.Chat,
@@ -463,10 +742,14 @@ class PeriodicMsgScheduler:
             message: The message to send.
         """
         msg = PeriodicMsgParser(self.config).Parse(message)
-        self.jobs[job_id] = PeriodicMsgJob(self.client,
-                                           self.logger,
-                                           PeriodicMsgJobData(chat, topic_id, period, start, msg_id))
-        self.jobs[job_id].SetMessage(msg)
+        job = PeriodicMsgJob(self.logger,
+                             self.periodic_msg_sender,
+                             self.body_store,
+                             PeriodicMsgJobData(chat.id, topic_id, period, start, msg_id))
+        job.SetMessage(msg)
+
+        self.jobs[job_id] = job
+        self.jobs_index.Add(chat.id, topic_id, msg_id, job)
 
     def __AddJob(self,
                  job_id: str,
@@ -476,7 +759,7 @@ class PeriodicMsgScheduler:
                  start: int,
                  msg_id: str) -> None:
         """
-        Add a job to the scheduler with cron configuration.
+        Add a job to the engine and log it.
 
         Args:
             job_id: Unique job identifier.
@@ -487,41 +770,264 @@ class PeriodicMsgScheduler:
             msg_id: Message identifier.
         """
         is_test_mode = self.config.GetValue(BotConfigTypes.APP_TEST_MODE)
-        cron_str = self.__BuildCronString(period, start, is_test_mode)
-        if is_test_mode:
-            self.scheduler.add_job(self.jobs[job_id].DoJob,
-                                   "cron",
-                                   args=(chat,topic_id,),
-                                   minute=cron_str,
-                                   id=job_id)
-        else:
-            self.scheduler.add_job(self.jobs[job_id].DoJob,
-                                   "cron",
-                                   args=(chat,topic_id,),
-                                   hour=cron_str,
-                                   id=job_id)
+        trigger = self.__ScheduleJob(job_id, True)
         per_sym = "minute(s)" if is_test_mode else "hour(s)"
         self.logger.GetLogger().info(
             f"Started job '{job_id}' in chat {ChatHelper.GetTitleOrId(chat)} ({topic_id}) ({period} {per_sym}, "
-            f"{msg_id}), number of active jobs: {self.__GetTotalJobCount()}, cron: {cron_str}"
+            f"{msg_id}), number of active jobs: {self.__GetTotalJobCount()}, slots: {trigger}, "
+            f"offset: {trigger.OffsetSec()}s"
+        )
+
+    def __GetWorkItemDelay(self,
+                           item: PeriodicMsgWorkItem) -> float:
+        """
+        Get the time a job shall be delayed before being executed, because its chat is blocked by flood wait.
+
+        Args:
+            item: Work item of the job.
+
+        Returns:
+            Delay in seconds.
+        """
+        job = item[2][0]
+        return self.message_sender.GetChatWaitTime(job.Data().ChatId())
+
+    def __ScheduleJob(self,
+                      job_id: str,
+                      running: bool) -> PeriodicMsgTrigger:
+        """
+        Add an existing job to the engine.
+
+        Args:
+            job_id: Unique job identifier.
+            running: True to schedule the job as running, False to schedule it as paused.
+
+        Returns:
+            Job trigger.
+        """
+        job = self.jobs[job_id]
+        job_data = job.Data()
+        job_data.SetSpreadOffset(self.spreader.Assign(job_id, job_data.SpreadOffset()))
+
+        # Triggers are shared by all the jobs with the same schedule
+        trigger = self.trigger_factory.Get(job_data.PeriodHours(),
+                                           job_data.StartHour(),
+                                           self.config.GetValue(BotConfigTypes.APP_TEST_MODE),
+                                           job_data.SpreadOffset() or 0)
+        self.engine.AddJob(job_id,
+                           trigger,
+                           PeriodicMsgJob.DoJob,
+                           (job,),
+                           misfire_policy=self.__GetMisfirePolicy(job_data),
+                           paused=not running,
+                           last_fire_time=job_data.LastFireTime())
+        return trigger
+
+    def __GetMisfirePolicy(self,
+                           job_data: PeriodicMsgJobData) -> PeriodicMsgMisfirePolicies:
+        """
+        Get the misfire policy of a job, falling back to the default one.
+
+        Args:
+            job_data: Job data.
+
+        Returns:
+            Misfire policy.
+        """
+        policy = job_data.MisfirePolicy()
+        return policy if policy is not None else self.config.GetValue(BotConfigTypes.TASKS_MISFIRE_POLICY)
+
+    def __OnJobFired(self,
+                     job_id: str,
+                     fire_time: float,
+                     misfires_num: int) -> None:
+        """
+        Called by the engine each time a job fires.
+
+        Args:
+            job_id: Unique job identifier.
+            fire_time: Timestamp of the last scheduled fire time.
+            misfires_num: Number of missed fire times.
+        """
+        job = self.jobs.get(job_id)
+        if job is None:
+            return
+
+        job_data = job.Data()
+        if misfires_num > 0:
+            self.stats.misfires_num.Inc(str(job_data.ChatId()), misfires_num)
+        # Save the fire time, so that the fire times missed while the bot is down can be detected at restart
+        job_data.SetLastFireTime(fire_time)
+        self.__SaveJob(job_id)
+        # With HA, write the fire time before the message is sent, so that a new leader doesn't send it again
+        if self.lease is not None and self.storage is not None:
+            self.storage.FlushSoon()
+
+    def __OnLeaseAcquired(self) -> None:
+        """Called when the lease is acquired from another instance, it reloads the jobs and starts running them."""
+        self.__ReloadJobs()
+        self.engine.Start()
+
+    def __OnLeaseLost(self) -> None:
+        """Called when the lease is lost, it stops running the jobs."""
+        self.engine.Stop()
+        if self.storage is not None:
+            self.storage.Flush()
+
+    def __ReloadJobs(self) -> None:
+        """Reload all the jobs and chat languages from storage, to get the changes made by the previous leader."""
+        self.engine.RemoveAllJobs()
+        for job in self.jobs.values():
+            job.ClearMessage()
+        self.jobs = {}
+        self.jobs_index = PeriodicMsgJobsIndex()
+        self.spreader = PeriodicMsgSpreader(self.config.GetValue(BotConfigTypes.TASKS_SPREAD_MODE))
+        self.__RestoreJobs()
+        self.translator.ClearChatLanguages()
+        self.__RestoreChatLangs()
+
+    def __RestoreJobs(self) -> None:
+        """Restore all the jobs from storage in a single pass, before starting the engine."""
+        assert self.storage is not None
+
+        for record in self.storage.LoadAll():
+            # The jobs of the other shards are run by other processes, sharing the same database
+            if self.shard_info is not None and not self.shard_info.OwnsChat(record.chat_id):
+                continue
+
+            job = PeriodicMsgJob(
+                self.logger,
+                self.periodic_msg_sender,
+                self.body_store,
+                PeriodicMsgJobData(record.chat_id,
+                                   record.topic_id,
+                                   record.period_hours,
+                                   record.start_hour,
+                                   record.msg_id)
+            )
+            job.SetMessage(record.message)
+            job.SetRunning(bool(record.running))
+            job.DeleteLastSentMessage(bool(record.delete_last_msg))
+            job.Data().SetSpreadOffset(record.spread_offset)
+            job.Data().SetMisfirePolicy(
+                MisfirePolicyConverter.KeyToValue(record.misfire_policy) if record.misfire_policy is not None else None
+            )
+            job.Data().SetLastFireTime(record.last_fire_time)
+
+            self.jobs[record.job_id] = job
+            self.jobs_index.Add(record.chat_id, record.topic_id, record.msg_id, job)
+            self.__ScheduleJob(record.job_id, bool(record.running))
+            # Persist the offset if it was assigned now, so that it doesn't change at the next restart
+            if job.Data().SpreadOffset() != record.spread_offset:
+                self.__SaveJob(record.job_id)
+
+        self.logger.GetLogger().info(f"Restored jobs, number of active jobs: {self.__GetTotalJobCount()}")
+
+    def __RestoreChatLangs(self) -> None:
+        """Restore the languages of all chats from storage."""
+        assert self.storage is not None
+
+        for chat_id, lang in self.storage.LoadChatLangs().items():
+            if self.shard_info is not None and not self.shard_info.OwnsChat(chat_id):
+                continue
+            try:
+                self.translator.SetChatLanguage(chat_id, lang)
+            except TranslationPacksLanguageError:
+                self.logger.GetLogger().warning(f"Language '{lang}' of chat {chat_id} is no longer available")
+
+    def __StopJobs(self,
+                   chat: pyrogram.types.Chat,
+                   jobs: List[PeriodicMsgJob]) -> None:
+        """
+        Stop the specified jobs.
+
+        Args:
+            chat: The chat containing the jobs.
+            jobs: Jobs to stop.
+        """
+        for job in jobs:
+            job_data = job.Data()
+            job_id = self.__GetJobId(job_data.ChatId(), job_data.TopicId(), job_data.MessageId())
+            self.__RemoveJob(job_id)
+            self.logger.GetLogger().info(
+                f"Stopped job '{job_id}' in chat {ChatHelper.GetTitleOrId(chat)}"
+            )
+
+    def __RemoveJob(self,
+                    job_id: str) -> None:
+        """
+        Remove a job from the engine, the index and the storage.
+
+        Args:
+            job_id: Unique job identifier.
+        """
+        job = self.jobs.pop(job_id)
+        job.ClearMessage()
+        job_data = job.Data()
+        self.jobs_index.Remove(job_data.ChatId(), job_data.TopicId(), job_data.MessageId())
+        self.spreader.Release(job_data.SpreadOffset())
+        self.engine.RemoveJob(job_id)
+        self.__DeleteJob(job_id)
+
+    def __SaveJob(self,
+                  job_id: str) -> None:
+        """
+        Save a job to storage, if enabled.
+
+        Args:
+            job_id: Unique job identifier.
+        """
+        if self.storage is None:
+            return
+
+        job = self.jobs[job_id]
+        job_data = job.Data()
+        self.storage.Save(
+            PeriodicMsgStorageRecord(
+                job_id=job_id,
+                chat_id=job_data.ChatId(),
+                topic_id=job_data.TopicId(),
+                period_hours=job_data.PeriodHours(),
+                start_hour=job_data.StartHour(),
+                msg_id=job_data.MessageId(),
+                message=job.GetMessage(),
+                running=job_data.IsRunning(),
+                delete_last_msg=job.IsDeleteLastSentMessageEnabled(),
+                spread_offset=job_data.SpreadOffset(),
+                misfire_policy=(MisfirePolicyConverter.ValueToKey(job_data.MisfirePolicy())
+                                if job_data.MisfirePolicy() is not None
+                                else None),
+                last_fire_time=job_data.LastFireTime(),
+            )
         )
 
+    def __DeleteJob(self,
+                    job_id: str) -> None:
+        """
+        Delete a job from storage, if enabled.
+
+        Args:
+            job_id: Unique job identifier.
+        """
+        if self.storage is not None:
+            self.storage.Delete(job_id)
+
     @staticmethod
-    def __GetJobId(chat: pyrogram.types.Chat,
+    def __GetJobId(chat_id: int,
                    topic_id: int,
                    msg_id: str) -> str:
         """
         Generate a unique job ID from chat and message IDs.
 
         Args:
-            chat: The chat.
+            chat_id: The chat ID.
             topic_id: The topic.
             msg_id: The message ID.
 
         Returns:
             The generated job ID.
         """
-        return f"{chat.id}-{topic_id}-{msg_id}"
+        return f"{chat_id}-{topic_id}-{msg_id}"
 
     def __GetTotalJobCount(self) -> int:
         """
@@ -531,33 +1037,3 @@ class PeriodicMsgScheduler:
             Total number of active jobs.
         """
         return len(self.jobs)
-
-    @staticmethod
-    def __BuildCronString(period: int,
-                          start_val: int,
-                          is_test_mode: bool) -> str:
-        """
-        Build a cron string for the job schedule.
-
-        Args:
-            period: Period between executions.
-            start_val: Starting value.
-            is_test_mode: True for minute-based testing, False for hour-based.
-
-        Returns:
-            Comma-separated cron schedule string.
-        """
-        max_val = 24 if not is_test_mode else 60
-
-        cron_str = ""
-
-        loop_cnt = max_val // period
-        if max_val % period != 0:
-            loop_cnt += 1
-
-        t = start_val
-        for _ in range(loop_cnt):
-            cron_str += f"{t},"
-            t = (t + period) % max_val
-
-        return cron_str[:-1]
@@ -18,70 +18,102 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+
+import time
 from typing import List, Optional
 
 import pyrogram
+from pyrogram.errors import RPCError
 
 from telegram_periodic_msg_bot.logger.logger import Logger
 from telegram_periodic_msg_bot.message.message_deleter import MessageDeleter
 from telegram_periodic_msg_bot.message.message_sender import MessageSender
+from telegram_periodic_msg_bot.metrics.metrics import MetricCounter, MetricHistogram, MetricsConst
+
+
+class PeriodicMsgSenderStats:
+    """Statistics of the periodic message sender, i.e. of all the jobs."""
+
+    sent_num: MetricCounter
+    failed_num: MetricCounter
+    send_time: MetricHistogram
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.sent_num = MetricCounter("tasks_sent_total", "Number of periodic messages sent")
+        self.failed_num = MetricCounter("tasks_failed_total", "Number of periodic messages not sent because of an error")
+        self.send_time = MetricHistogram("task_send_seconds",
+                                         "Time to send a periodic message, deletion of the previous one included",
+                                         MetricsConst.SLOW_OP_TIME_BUCKETS)
 
 
 class PeriodicMsgSender:
-    """Sender for periodic messages with optional deletion of previous messages."""
+    """
+    Sender for periodic messages with optional deletion of previous messages.
+
+    It's stateless and shared by all the jobs, that keep the IDs of their last sent messages.
+    """
 
     logger: Logger
-    delete_last_sent_msg: bool
-    last_sent_msgs: Optional[List[pyrogram.types.Message]]
     message_deleter: MessageDeleter
     message_sender: MessageSender
+    stats: PeriodicMsgSenderStats
 
     def __init__(self,
-                 client: pyrogram.Client,
-                 logger: Logger) -> None:
+                 logger: Logger,
+                 message_sender: MessageSender,
+                 message_deleter: MessageDeleter) -> None:
         """
         Initialize the periodic message sender.
 
         Args:
-            client: Pyrogram client instance.
             logger: Logger instance for logging operations.
+            message_sender: Shared message sender.
+            message_deleter: Shared message deleter.
         """
         self.logger = logger
-        self.delete_last_sent_msg = True
-        self.last_sent_msgs = None
-        self.message_deleter = MessageDeleter(client, logger)
-        self.message_sender = MessageSender(client, logger)
+        self.message_deleter = message_deleter
+        self.message_sender = message_sender
+        self.stats = PeriodicMsgSenderStats()
 
-    def DeleteLastSentMessage(self,
-                              flag: bool) -> None:
+    def GetStats(self) -> PeriodicMsgSenderStats:
         """
-        Configure whether to delete the last sent message before sending a new one.
+        Get the sender statistics.
 
-        Args:
-            flag: True to delete last message, False to keep it.
+        Returns:
+            Sender statistics.
         """
-        self.delete_last_sent_msg = flag
+        return self.stats
 
     async def SendMessage(self,
-                          chat: pyrogram.types.Chat,
+                          chat_id: int,
                           topic_id: int,
-                          msg: str) -> None:
+                          msg_parts: List[str],
+                          msg_ids_to_delete: Optional[List[int]],
+                          sent_msg_ids: List[int]) -> None:
         """
         Send a periodic message to a chat.
 
         Args:
-            chat: The chat to send the message to.
+            chat_id: ID of the chat to send the message to.
             topic_id: The topic to send the message to.
-            msg: The message text to send.
+            msg_parts: The parts of the message to send, already split.
+            msg_ids_to_delete: IDs of the messages to delete before sending, None to not delete any message.
+            sent_msg_ids: List the IDs of the sent messages are appended to, also the ones of the parts sent
+                before an error.
         """
-        if self.delete_last_sent_msg:
-            await self.__DeleteLastSentMessage()
-
-        self.last_sent_msgs = await self.message_sender.SendMessage(chat, topic_id, msg)
+        start_time = time.perf_counter()
+        sent_msgs: List[pyrogram.types.Message] = []
+        try:
+            if msg_ids_to_delete is not None:
+                await self.message_deleter.DeleteMessages(chat_id, msg_ids_to_delete, defer_waits=True)
 
-    async def __DeleteLastSentMessage(self) -> None:
-        """Delete the last sent messages if any exist."""
-        if self.last_sent_msgs is not None:
-            await self.message_deleter.DeleteMessages(self.last_sent_msgs)
+            await self.message_sender.SendMessageParts(chat_id, topic_id, msg_parts, defer_waits=True, sent_msgs=sent_msgs)
+        except RPCError:
+            self.stats.failed_num.Inc()
+            raise
+        finally:
+            sent_msg_ids.extend(msg.id for msg in sent_msgs)
 
-        self.last_sent_msgs = None
+        self.stats.send_time.Observe(time.perf_counter() - start_time)
+        self.stats.sent_num.Inc()
@@ -0,0 +1,153 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import zlib
+from enum import Enum, auto, unique
+from typing import List, Optional
+
+
+@unique
+class PeriodicMsgSpreadModes(Enum):
+    """Enumeration of spread modes of jobs within their slot."""
+
+    NONE = auto()
+    HASH = auto()
+    BALANCED = auto()
+
+
+class PeriodicMsgSpreaderConst:
+    """Constants for periodic message spreader."""
+
+    # Offsets are expressed in seconds within an hour slot
+    OFFSET_MAX_SEC: int = 3600
+    # Balanced mode: one bucket for each minute of the slot
+    BUCKETS_NUM: int = 60
+    BUCKET_SEC: int = 60
+
+
+class PeriodicMsgSpreader:
+    """
+    Spreader of periodic message jobs within their slot.
+
+    Each job is given a stable offset from the beginning of its slot, so that jobs sharing the same slot
+    do not fire all at the same second. Offsets are either derived from a hash of the job ID or assigned
+    to the least loaded minute of the slot.
+    """
+
+    mode: PeriodicMsgSpreadModes
+    bucket_counts: List[int]
+
+    def __init__(self,
+                 mode: PeriodicMsgSpreadModes) -> None:
+        """
+        Initialize the spreader.
+
+        Args:
+            mode: Spread mode.
+        """
+        self.mode = mode
+        self.bucket_counts = [0] * PeriodicMsgSpreaderConst.BUCKETS_NUM
+
+    def Assign(self,
+               job_id: str,
+               offset: Optional[int]) -> Optional[int]:
+        """
+        Assign the offset to a job.
+
+        Args:
+            job_id: Unique job identifier.
+            offset: Offset previously assigned to the job, None if not assigned.
+
+        Returns:
+            Offset in seconds within an hour slot, None if spreading is disabled.
+        """
+        if self.mode == PeriodicMsgSpreadModes.NONE:
+            return None
+
+        # Keep a previously assigned offset, so that a job doesn't move when others are added or removed
+        if offset is None:
+            offset = (self.__Hash(job_id) % PeriodicMsgSpreaderConst.OFFSET_MAX_SEC
+                      if self.mode == PeriodicMsgSpreadModes.HASH
+                      else self.__GetBalancedOffset(job_id))
+
+        self.bucket_counts[self.__GetBucket(offset)] += 1
+        return offset
+
+    def Release(self,
+                offset: Optional[int]) -> None:
+        """
+        Release the offset of a removed job.
+
+        Args:
+            offset: Offset of the job, None if not assigned.
+        """
+        if offset is None:
+            return
+
+        bucket = self.__GetBucket(offset)
+        if self.bucket_counts[bucket] > 0:
+            self.bucket_counts[bucket] -= 1
+
+    def __GetBalancedOffset(self,
+                            job_id: str) -> int:
+        """
+        Get the offset in the least loaded bucket.
+
+        Args:
+            job_id: Unique job identifier.
+
+        Returns:
+            Offset in seconds within an hour slot.
+        """
+        job_hash = self.__Hash(job_id)
+        buckets_num = PeriodicMsgSpreaderConst.BUCKETS_NUM
+
+        # Start the search from a hashed bucket, so that ties don't always go to the first minutes
+        start = job_hash % buckets_num
+        bucket = min(range(start, start + buckets_num),
+                     key=lambda i: self.bucket_counts[i % buckets_num]) % buckets_num
+        return bucket * PeriodicMsgSpreaderConst.BUCKET_SEC + (job_hash >> 16) % PeriodicMsgSpreaderConst.BUCKET_SEC
+
+    @staticmethod
+    def __GetBucket(offset: int) -> int:
+        """
+        Get the bucket of an offset.
+
+        Args:
+            offset: Offset in seconds within an hour slot.
+
+        Returns:
+            Bucket index.
+        """
+        return (offset // PeriodicMsgSpreaderConst.BUCKET_SEC) % PeriodicMsgSpreaderConst.BUCKETS_NUM
+
+    @staticmethod
+    def __Hash(job_id: str) -> int:
+        """
+        Get a hash of the job ID that is stable across restarts.
+
+        Args:
+            job_id: Unique job identifier.
+
+        Returns:
+            Hash value.
+        """
+        return zlib.crc32(job_id.encode("utf-8"))
@@ -0,0 +1,300 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import asyncio
+import os
+import sqlite3
+from typing import Dict, List, NamedTuple, Optional
+
+from telegram_periodic_msg_bot.bot.bot_config_types import BotConfigTypes
+from telegram_periodic_msg_bot.config.config_object import ConfigObject
+from telegram_periodic_msg_bot.logger.logger import Logger
+
+
+class PeriodicMsgStorageConst:
+    """Constants for periodic message storage."""
+
+    FLUSH_MAX_PENDING: int = 1000
+    SCHEMA: List[str] = [
+        # Version 1
+        """
+        CREATE TABLE IF NOT EXISTS tasks (
+            job_id TEXT PRIMARY KEY,
+            chat_id INTEGER NOT NULL,
+            topic_id INTEGER,
+            period_hours INTEGER NOT NULL,
+            start_hour INTEGER NOT NULL,
+            msg_id TEXT NOT NULL,
+            message TEXT NOT NULL,
+            running INTEGER NOT NULL,
+            delete_last_msg INTEGER NOT NULL
+        )
+        """,
+        # Version 2
+        """
+        ALTER TABLE tasks ADD COLUMN spread_offset INTEGER
+        """,
+        # Version 3
+        """
+        ALTER TABLE tasks ADD COLUMN misfire_policy TEXT
+        """,
+        # Version 4
+        """
+        ALTER TABLE tasks ADD COLUMN last_fire_time REAL
+        """,
+        # Version 5
+        """
+        CREATE TABLE IF NOT EXISTS lease (
+            name TEXT PRIMARY KEY,
+            holder TEXT NOT NULL,
+            expires_at REAL NOT NULL
+        )
+        """,
+        # Version 6
+        """
+        CREATE TABLE IF NOT EXISTS chat_langs (
+            chat_id INTEGER PRIMARY KEY,
+            lang TEXT NOT NULL
+        )
+        """,
+    ]
+
+
+class PeriodicMsgStorageRecord(NamedTuple):
+    """Persisted data of a periodic message job."""
+
+    job_id: str
+    chat_id: int
+    topic_id: int
+    period_hours: int
+    start_hour: int
+    msg_id: str
+    message: str
+    running: bool
+    delete_last_msg: bool
+    spread_offset: Optional[int]
+    misfire_policy: Optional[str]
+    last_fire_time: Optional[float]
+
+
+class PeriodicMsgStorage:
+    """
+    SQLite storage for periodic message jobs.
+
+    Mutations are queued and written in a single transaction, either after the configured
+    flush interval or as soon as the number of pending mutations reaches a threshold.
+    """
+
+    config: ConfigObject
+    logger: Logger
+    db_conn: Optional[sqlite3.Connection]
+    pending: Dict[str, Optional[PeriodicMsgStorageRecord]]
+    pending_langs: Dict[int, Optional[str]]
+    flush_handle: Optional[asyncio.Handle]
+
+    def __init__(self,
+                 config: ConfigObject,
+                 logger: Logger) -> None:
+        """
+        Initialize the storage.
+
+        Args:
+            config: Configuration object.
+            logger: Logger instance for logging operations.
+        """
+        self.config = config
+        self.logger = logger
+        self.db_conn = None
+        self.pending = {}
+        self.pending_langs = {}
+        self.flush_handle = None
+
+    def Open(self) -> None:
+        """Open the database file, creating or upgrading the schema if needed."""
+        file_name = self.config.GetValue(BotConfigTypes.TASKS_DB_FILE_NAME)
+        self.__MakeDbDir(file_name)
+
+        self.db_conn = sqlite3.connect(file_name)
+        self.db_conn.execute("PRAGMA journal_mode=WAL")
+        self.db_conn.execute("PRAGMA synchronous=NORMAL")
+        self.__UpgradeSchema()
+
+        self.logger.GetLogger().info(f"Tasks database '{file_name}' opened")
+
+    def Close(self) -> None:
+        """Flush any pending mutation and close the database."""
+        if self.db_conn is None:
+            return
+
+        self.Flush()
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        self.db_conn.close()
+        self.db_conn = None
+        self.logger.GetLogger().info("Tasks database closed")
+
+    def LoadAll(self) -> List[PeriodicMsgStorageRecord]:
+        """
+        Load all the stored jobs.
+
+        Returns:
+            List of stored jobs.
+        """
+        assert self.db_conn is not None
+
+        cursor = self.db_conn.execute(
+            "SELECT job_id, chat_id, topic_id, period_hours, start_hour, "
+            "msg_id, message, running, delete_last_msg, spread_offset, "
+            "misfire_policy, last_fire_time FROM tasks"
+        )
+        records = [PeriodicMsgStorageRecord._make(row) for row in cursor.fetchall()]
+
+        self.logger.GetLogger().info(f"Loaded {len(records)} job(s) from tasks database")
+
+        return records
+
+    def LoadChatLangs(self) -> Dict[int, str]:
+        """
+        Load the languages of all chats.
+
+        Returns:
+            Dictionary from chat ID to language.
+        """
+        assert self.db_conn is not None
+
+        cursor = self.db_conn.execute("SELECT chat_id, lang FROM chat_langs")
+        return dict(cursor.fetchall())
+
+    def SaveChatLang(self,
+                     chat_id: int,
+                     lang: Optional[str]) -> None:
+        """
+        Queue the update of the language of a chat.
+
+        Args:
+            chat_id: Chat ID.
+            lang: Language, None to delete it.
+        """
+        self.pending_langs[chat_id] = lang
+        self.__ScheduleFlush()
+
+    def Save(self,
+             record: PeriodicMsgStorageRecord) -> None:
+        """
+        Queue the insertion or update of a job.
+
+        Args:
+            record: Job to save.
+        """
+        self.pending[record.job_id] = record
+        self.__ScheduleFlush()
+
+    def Delete(self,
+               job_id: str) -> None:
+        """
+        Queue the deletion of a job.
+
+        Args:
+            job_id: ID of the job to delete.
+        """
+        self.pending[job_id] = None
+        self.__ScheduleFlush()
+
+    def Flush(self) -> None:
+        """Write all pending mutations in a single transaction."""
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+
+        if self.db_conn is None or (len(self.pending) == 0 and len(self.pending_langs) == 0):
+            return
+
+        to_delete = [(job_id,) for job_id, record in self.pending.items() if record is None]
+        to_save = [record for record in self.pending.values() if record is not None]
+        langs_to_delete = [(chat_id,) for chat_id, lang in self.pending_langs.items() if lang is None]
+        langs_to_save = [(chat_id, lang) for chat_id, lang in self.pending_langs.items() if lang is not None]
+
+        # The pending mutations are cleared only once written, the transaction is synchronous so no newer ones
+        # can be queued meanwhile
+        try:
+            with self.db_conn:
+                self.db_conn.executemany("DELETE FROM tasks WHERE job_id = ?", to_delete)
+                self.db_conn.executemany(
+                    "INSERT OR REPLACE INTO tasks (job_id, chat_id, topic_id, period_hours, start_hour, "
+                    "msg_id, message, running, delete_last_msg, spread_offset, misfire_policy, last_fire_time) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    to_save
+                )
+                self.db_conn.executemany("DELETE FROM chat_langs WHERE chat_id = ?", langs_to_delete)
+                self.db_conn.executemany("INSERT OR REPLACE INTO chat_langs (chat_id, lang) VALUES (?, ?)", langs_to_save)
+        except sqlite3.Error:
+            self.logger.GetLogger().exception("Unable to write to tasks database, retrying later")
+            self.flush_handle = asyncio.get_event_loop().call_later(
+                self.config.GetValue(BotConfigTypes.TASKS_DB_FLUSH_INTERVAL_SEC),
+                self.Flush
+            )
+        else:
+            self.pending = {}
+            self.pending_langs = {}
+            self.logger.GetLogger().debug(
+                "Tasks database flushed (%d saved, %d deleted)", len(to_save), len(to_delete)
+            )
+
+    def FlushSoon(self) -> None:
+        """Write all pending mutations at the next iteration of the event loop, without waiting the flush interval."""
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+        self.flush_handle = asyncio.get_event_loop().call_soon(self.Flush)
+
+    def __ScheduleFlush(self) -> None:
+        """Schedule a flush of the pending mutations."""
+        if len(self.pending) + len(self.pending_langs) >= PeriodicMsgStorageConst.FLUSH_MAX_PENDING:
+            self.Flush()
+        elif self.flush_handle is None:
+            self.flush_handle = asyncio.get_event_loop().call_later(
+                self.config.GetValue(BotConfigTypes.TASKS_DB_FLUSH_INTERVAL_SEC),
+                self.Flush
+            )
+
+    def __UpgradeSchema(self) -> None:
+        """Create the schema or apply the missing upgrades to it."""
+        assert self.db_conn is not None
+
+        with self.db_conn:
+            # Lock the database before reading the version, in case more instances share it
+            self.db_conn.execute("BEGIN IMMEDIATE")
+            version = self.db_conn.execute("PRAGMA user_version").fetchone()[0]
+            for stmt in PeriodicMsgStorageConst.SCHEMA[version:]:
+                self.db_conn.execute(stmt)
+            self.db_conn.execute(f"PRAGMA user_version = {len(PeriodicMsgStorageConst.SCHEMA)}")
+
+    @staticmethod
+    def __MakeDbDir(file_name: str) -> None:
+        """
+        Create the directory for the database file if it doesn't exist.
+
+        Args:
+            file_name: Path to the database file.
+        """
+        dir_name = os.path.dirname(file_name)
+        if dir_name != "":
+            os.makedirs(dir_name, exist_ok=True)
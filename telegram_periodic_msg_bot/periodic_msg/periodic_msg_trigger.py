@@ -0,0 +1,220 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from datetime import datetime, timedelta
+from typing import Dict, Tuple
+
+
+class PeriodicMsgTriggerConst:
+    """Constants for periodic message trigger."""
+
+    # Normal mode: one slot per hour of the day
+    HOUR_SLOTS_NUM: int = 24
+    HOUR_SLOT_SEC: int = 3600
+    # Test mode: one slot per minute of the hour
+    MINUTE_SLOTS_NUM: int = 60
+    MINUTE_SLOT_SEC: int = 60
+
+
+class PeriodicMsgTrigger:
+    """
+    Trigger of a periodic message job.
+
+    The schedule is stored as a bit mask with one bit for each slot, i.e. a 24-bit mask of the hours
+    of the day (or a 60-bit mask of the minutes of the hour in test mode).
+    The trigger fires at the beginning of each slot, delayed by an optional offset.
+    Triggers are immutable, so they can be shared by all the jobs with the same schedule.
+    """
+
+    __slots__ = ("mask", "is_test_mode", "slots_num", "slot_sec", "offset_sec")
+
+    mask: int
+    is_test_mode: bool
+    slots_num: int
+    slot_sec: int
+    offset_sec: int
+
+    def __init__(self,
+                 period: int,
+                 start: int,
+                 is_test_mode: bool,
+                 offset: int = 0) -> None:
+        """
+        Initialize the trigger.
+
+        Args:
+            period: Period between executions, in slots.
+            start: Starting slot.
+            is_test_mode: True for minute-based slots, False for hour-based slots.
+            offset: Offset in seconds within an hour slot, scaled to the slot length in test mode.
+        """
+        self.is_test_mode = is_test_mode
+        if is_test_mode:
+            self.slots_num = PeriodicMsgTriggerConst.MINUTE_SLOTS_NUM
+            self.slot_sec = PeriodicMsgTriggerConst.MINUTE_SLOT_SEC
+        else:
+            self.slots_num = PeriodicMsgTriggerConst.HOUR_SLOTS_NUM
+            self.slot_sec = PeriodicMsgTriggerConst.HOUR_SLOT_SEC
+        self.mask = self.__BuildMask(period, start, self.slots_num)
+        self.offset_sec = (offset * self.slot_sec // PeriodicMsgTriggerConst.HOUR_SLOT_SEC) % self.slot_sec
+
+    def Mask(self) -> int:
+        """
+        Get the slots mask.
+
+        Returns:
+            Slots mask.
+        """
+        return self.mask
+
+    def IsTestMode(self) -> bool:
+        """
+        Get whether the trigger uses minute-based slots.
+
+        Returns:
+            True if minute-based, False if hour-based.
+        """
+        return self.is_test_mode
+
+    def OffsetSec(self) -> int:
+        """
+        Get the offset from the beginning of the slot.
+
+        Returns:
+            Offset in seconds.
+        """
+        return self.offset_sec
+
+    def NextFireTime(self,
+                     after: float) -> float:
+        """
+        Get the first fire time strictly after the specified time.
+
+        Args:
+            after: Timestamp to start from.
+
+        Returns:
+            Timestamp of the next fire time.
+        """
+        # Shift the time, so that slots are computed as if they started at the offset
+        after_dt = datetime.fromtimestamp(after - self.offset_sec)
+        if self.is_test_mode:
+            slot_dt = after_dt.replace(second=0, microsecond=0)
+            curr_slot = after_dt.minute
+        else:
+            slot_dt = after_dt.replace(minute=0, second=0, microsecond=0)
+            curr_slot = after_dt.hour
+
+        # Rotate the mask so that bit 0 is the slot following the current one
+        shift = curr_slot + 1
+        rot_mask = ((self.mask >> shift) | (self.mask << (self.slots_num - shift))) & ((1 << self.slots_num) - 1)
+        slots_to_next = (rot_mask & -rot_mask).bit_length()
+
+        return (slot_dt + timedelta(seconds=slots_to_next * self.slot_sec)).timestamp() + self.offset_sec
+
+    def ToString(self) -> str:
+        """
+        Convert the trigger to a string.
+
+        Returns:
+            Comma-separated list of the slots in which the trigger fires.
+        """
+        return ",".join(str(slot) for slot in range(self.slots_num) if self.mask & (1 << slot))
+
+    def __str__(self) -> str:
+        """
+        Convert the trigger to a string.
+
+        Returns:
+            Comma-separated list of the slots in which the trigger fires.
+        """
+        return self.ToString()
+
+    @staticmethod
+    def __BuildMask(period: int,
+                    start: int,
+                    slots_num: int) -> int:
+        """
+        Build the slots mask.
+
+        Args:
+            period: Period between executions, in slots.
+            start: Starting slot.
+            slots_num: Number of slots.
+
+        Returns:
+            Slots mask.
+        """
+        mask = 0
+
+        loop_cnt = slots_num // period
+        if slots_num % period != 0:
+            loop_cnt += 1
+
+        slot = start
+        for _ in range(loop_cnt):
+            mask |= 1 << slot
+            slot = (slot + period) % slots_num
+
+        return mask
+
+
+class PeriodicMsgTriggerFactory:
+    """Factory of periodic message triggers, returning the same instance for the same schedule (flyweight)."""
+
+    triggers: Dict[Tuple[int, int, bool, int], PeriodicMsgTrigger]
+
+    def __init__(self) -> None:
+        """Initialize the factory."""
+        self.triggers = {}
+
+    def Get(self,
+            period: int,
+            start: int,
+            is_test_mode: bool,
+            offset: int = 0) -> PeriodicMsgTrigger:
+        """
+        Get the trigger for the specified schedule, creating it if not existent.
+
+        Args:
+            period: Period between executions, in slots.
+            start: Starting slot.
+            is_test_mode: True for minute-based slots, False for hour-based slots.
+            offset: Offset in seconds within an hour slot, scaled to the slot length in test mode.
+
+        Returns:
+            Trigger.
+        """
+        key = (period, start, is_test_mode, offset)
+        trigger = self.triggers.get(key)
+        if trigger is None:
+            trigger = PeriodicMsgTrigger(period, start, is_test_mode, offset)
+            self.triggers[key] = trigger
+        return trigger
+
+    def Count(self) -> int:
+        """
+        Get the number of distinct triggers.
+
+        Returns:
+            Number of triggers.
+        """
+        return len(self.triggers)
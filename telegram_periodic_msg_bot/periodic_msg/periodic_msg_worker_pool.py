@@ -0,0 +1,194 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import asyncio
+from typing import Any, Callable, Coroutine, List, Optional, Tuple
+
+from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.message.message_retry_handler import MessageRetryLaterError
+from telegram_periodic_msg_bot.metrics.metrics import MetricCounter, MetricGauge, MetricHistogram, MetricsConst
+from telegram_periodic_msg_bot.utils.clock import Clock
+
+
+# Work item: job ID, coroutine function, arguments
+PeriodicMsgWorkItem = Tuple[str, Callable[..., Coroutine], Tuple[Any, ...]]
+# Function returning the delay in seconds before a work item can be executed
+PeriodicMsgWorkItemDelayFct = Callable[[PeriodicMsgWorkItem], float]
+
+
+class PeriodicMsgWorkerPoolStats:
+    """Statistics of the periodic message worker pool."""
+
+    queue_depth: MetricGauge
+    queue_depth_max: MetricGauge
+    wait_time: MetricHistogram
+    done_num: MetricCounter
+    failed_num: MetricCounter
+    parked_num: MetricCounter
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.queue_depth = MetricGauge("worker_pool_queue_depth", "Number of jobs waiting for a worker")
+        self.queue_depth_max = MetricGauge("worker_pool_queue_depth_max", "Maximum number of jobs waiting for a worker")
+        self.wait_time = MetricHistogram("worker_pool_wait_seconds",
+                                         "Time waited by jobs before being dispatched to a worker",
+                                         MetricsConst.SLOW_OP_TIME_BUCKETS)
+        self.done_num = MetricCounter("worker_pool_done_total", "Number of completed jobs")
+        self.failed_num = MetricCounter("worker_pool_failed_total", "Number of jobs that raised an exception")
+        self.parked_num = MetricCounter("worker_pool_parked_total", "Number of jobs delayed before being executed")
+
+
+class PeriodicMsgWorkerPool:
+    """Pool of workers executing periodic message jobs with bounded concurrency."""
+
+    logger: Logger
+    clock: Clock
+    workers_num: int
+    delay_fct: Optional[PeriodicMsgWorkItemDelayFct]
+    queue: asyncio.Queue
+    workers: List[asyncio.Task]
+    stats: PeriodicMsgWorkerPoolStats
+
+    def __init__(self,
+                 logger: Logger,
+                 workers_num: int,
+                 delay_fct: Optional[PeriodicMsgWorkItemDelayFct] = None,
+                 *,
+                 clock: Optional[Clock] = None) -> None:
+        """
+        Initialize the worker pool.
+
+        Args:
+            logger: Logger instance for logging operations.
+            workers_num: Number of workers.
+            delay_fct: Function returning the delay of a job (optional).
+                       Delayed jobs are parked outside the queue, so that they don't occupy a worker while waiting.
+            clock: Clock giving the current time (optional, the system clock if not specified).
+        """
+        self.logger = logger
+        self.clock = clock if clock is not None else Clock()
+        self.workers_num = workers_num
+        self.delay_fct = delay_fct
+        self.queue = asyncio.Queue()
+        self.workers = []
+        self.stats = PeriodicMsgWorkerPoolStats()
+
+    def Start(self) -> None:
+        """Start the workers."""
+        if len(self.workers) > 0:
+            return
+
+        loop = asyncio.get_event_loop()
+        self.workers = [loop.create_task(self.__Worker()) for _ in range(self.workers_num)]
+        self.logger.GetLogger().info(f"Worker pool started, number of workers: {self.workers_num}")
+
+    def Stop(self) -> None:
+        """Stop the workers, jobs still in the queue are not executed."""
+        for worker in self.workers:
+            worker.cancel()
+        self.workers = []
+        self.logger.GetLogger().info("Worker pool stopped")
+
+    def GetStats(self) -> PeriodicMsgWorkerPoolStats:
+        """
+        Get the worker pool statistics.
+
+        Returns:
+            Worker pool statistics.
+        """
+        return self.stats
+
+    def SubmitBatch(self,
+                    items: List[PeriodicMsgWorkItem]) -> None:
+        """
+        Submit a batch of jobs.
+
+        Args:
+            items: Jobs to submit.
+        """
+        enqueue_time = self.clock.Monotonic()
+        for item in items:
+            self.queue.put_nowait((enqueue_time, item))
+        self.__UpdateQueueDepth()
+
+    def __Park(self,
+               delay: float,
+               enqueue_time: float,
+               item: PeriodicMsgWorkItem) -> None:
+        """
+        Park a job outside the queue, putting it back after a delay.
+
+        Args:
+            delay: Delay in seconds.
+            enqueue_time: Time when the job was first submitted.
+            item: Job to park.
+        """
+        self.stats.parked_num.Inc()
+        asyncio.get_event_loop().call_later(delay, self.__Requeue, enqueue_time, item)
+
+    def __Requeue(self,
+                  enqueue_time: float,
+                  item: PeriodicMsgWorkItem) -> None:
+        """
+        Put back a parked job in the queue.
+
+        Args:
+            enqueue_time: Time when the job was first submitted.
+            item: Job to put back.
+        """
+        self.queue.put_nowait((enqueue_time, item))
+        self.__UpdateQueueDepth()
+
+    def __UpdateQueueDepth(self) -> None:
+        """Update the queue depth statistics."""
+        queue_depth = self.queue.qsize()
+        self.stats.queue_depth.Set(queue_depth)
+        self.stats.queue_depth_max.Set(max(self.stats.queue_depth_max.Value(), queue_depth))
+
+    async def __Worker(self) -> None:
+        """Worker loop."""
+        while True:
+            enqueue_time, item = await self.queue.get()
+            self.stats.queue_depth.Set(self.queue.qsize())
+
+            delay = self.delay_fct(item) if self.delay_fct is not None else 0.0
+            if delay > 0.0:
+                self.__Park(delay, enqueue_time, item)
+                self.queue.task_done()
+                continue
+
+            job_id, callback, args = item
+            self.stats.wait_time.Observe(self.clock.Monotonic() - enqueue_time)
+
+            try:
+                await callback(*args)
+            except asyncio.CancelledError:
+                raise
+            except MessageRetryLaterError as ex:
+                # The chat got blocked while executing the job, wait outside the worker
+                self.__Park(ex.wait_time, enqueue_time, item)
+            except Exception:
+                self.stats.failed_num.Inc()
+                self.logger.GetLogger().exception(f"Job '{job_id}' raised an exception")
+            else:
+                self.stats.done_num.Inc()
+            finally:
+                self.queue.task_done()
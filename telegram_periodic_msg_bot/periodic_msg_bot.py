@@ -18,10 +18,18 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+from typing import Any, Optional
+
+import pyrogram
+
 from telegram_periodic_msg_bot.bot.bot_base import BotBase
 from telegram_periodic_msg_bot.bot.bot_config import BotConfig
-from telegram_periodic_msg_bot.bot.bot_handlers_config import BotHandlersConfig
+from telegram_periodic_msg_bot.bot.bot_handlers_config import BotCommandsConfig, BotHandlersConfig
+from telegram_periodic_msg_bot.command.command_dispatcher import CommandTypes
+from telegram_periodic_msg_bot.message.message_dispatcher import MessageTypes
 from telegram_periodic_msg_bot.periodic_msg.periodic_msg_scheduler import PeriodicMsgScheduler
+from telegram_periodic_msg_bot.shard.shard_info import ShardInfo
+from telegram_periodic_msg_bot.utils.clock import Clock
 
 
 class PeriodicMsgBot(BotBase):
@@ -30,21 +38,85 @@ class PeriodicMsgBot(BotBase):
     periodic_msg_scheduler: PeriodicMsgScheduler
 
     def __init__(self,
-                 config_file: str) -> None:
+                 config_file: str,
+                 shard_info: Optional[ShardInfo] = None,
+                 *,
+                 client: Optional[pyrogram.Client] = None,
+                 clock: Optional[Clock] = None) -> None:
         """
         Initialize the periodic message bot.
 
         Args:
             config_file: Path to the configuration file
+            shard_info: Information about the shard run by the bot, None if not sharded
+            client: Client to use in place of the Telegram one (e.g. a fake client for load tests), None to
+                create it from the configuration
+            clock: Clock giving the current time to the scheduler and the message sender (optional, the system clock
+                if not specified)
         """
         super().__init__(
             config_file,
             BotConfig,
-            BotHandlersConfig
+            BotCommandsConfig,
+            BotHandlersConfig,
+            shard_info,
+            client=client,
+            clock=clock
         )
         self.periodic_msg_scheduler = PeriodicMsgScheduler(
-            self.client,
             self.config,
             self.logger,
-            self.translator
+            self.translator,
+            self.message_sender,
+            self.message_deleter,
+            shard_info=shard_info,
+            clock=clock
         )
+        self.metrics_registry.Register(self.periodic_msg_scheduler.GetStats)
+        self.metrics_registry.Register(self.periodic_msg_scheduler.GetSenderStats)
+        self.metrics_registry.Register(self.periodic_msg_scheduler.GetEngineStats)
+        self.metrics_registry.Register(self.periodic_msg_scheduler.GetWorkerPoolStats)
+        self.metrics_registry.Register(self.periodic_msg_scheduler.GetBodyStoreStats)
+        self.metrics_registry.Register(self.periodic_msg_scheduler.GetLeaseStats)
+
+    def _OnStart(self) -> None:
+        """Start running the scheduled jobs once the client is connected."""
+        self.periodic_msg_scheduler.Open()
+
+    def _OnStop(self) -> None:
+        """Close the scheduler when the bot stops."""
+        self.periodic_msg_scheduler.Close()
+
+    async def DispatchCommand(self,
+                              client: pyrogram.Client,
+                              message: pyrogram.types.Message,
+                              cmd_type: CommandTypes,
+                              **kwargs: Any) -> None:
+        """
+        Dispatch a command, only if the scheduler is the leader (a standby instance ignores it).
+
+        Args:
+            client: Pyrogram client instance
+            message: Message containing the command
+            cmd_type: Type of command to dispatch
+            **kwargs: Additional arguments to pass to the command handler
+        """
+        if self.periodic_msg_scheduler.IsLeader():
+            await super().DispatchCommand(client, message, cmd_type, **kwargs)
+
+    async def HandleMessage(self,
+                            client: pyrogram.Client,
+                            message: pyrogram.types.Message,
+                            msg_type: MessageTypes,
+                            **kwargs: Any) -> None:
+        """
+        Handle a message, only if the scheduler is the leader (a standby instance ignores it).
+
+        Args:
+            client: Pyrogram client instance
+            message: Message to handle
+            msg_type: Type of message to handle
+            **kwargs: Additional arguments to pass to the message handler
+        """
+        if self.periodic_msg_scheduler.IsLeader():
+            await super().HandleMessage(client, message, msg_type, **kwargs)
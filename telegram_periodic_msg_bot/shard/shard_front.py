@@ -0,0 +1,205 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import multiprocessing
+import multiprocessing.process
+import pickle
+from typing import List, Optional
+
+import pyrogram
+from pyrogram import Client, idle
+from pyrogram.handlers import ChatMemberUpdatedHandler, MessageHandler
+
+from telegram_periodic_msg_bot.bot.bot_base import BotUpdateType
+from telegram_periodic_msg_bot.bot.bot_config import BotConfig
+from telegram_periodic_msg_bot.bot.bot_config_types import BotConfigTypes
+from telegram_periodic_msg_bot.config.config_file_sections_loader import ConfigFileSectionsLoader
+from telegram_periodic_msg_bot.config.config_object import ConfigObject
+from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.metrics.metrics import MetricCounter, MetricCounterFamily
+from telegram_periodic_msg_bot.metrics.metrics_registry import MetricsRegistry
+from telegram_periodic_msg_bot.metrics.metrics_server import MetricsServer
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_storage import PeriodicMsgStorage
+from telegram_periodic_msg_bot.shard.shard_info import ShardInfo
+from telegram_periodic_msg_bot.shard.shard_worker import ShardWorker
+
+
+class ShardFrontConst:
+    """Constants for shard front."""
+
+    # Time to wait for a worker to stop before terminating it, in seconds
+    WORKER_JOIN_TIMEOUT_SEC: float = 30.0
+
+
+class ShardFrontStats:
+    """Statistics of the shard front."""
+
+    forwarded_num: MetricCounterFamily
+    failed_num: MetricCounter
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.forwarded_num = MetricCounterFamily("shard_updates_forwarded_total",
+                                                 "Number of updates forwarded to the worker processes",
+                                                 "shard")
+        self.failed_num = MetricCounter("shard_updates_failed_total", "Number of updates that could not be forwarded")
+
+
+class ShardFront:
+    """
+    Front process of the sharded mode.
+
+    It receives all the updates and forwards each of them to the worker process owning the chat, so that
+    each worker only handles (and schedules the tasks of) its own partition of chats.
+    """
+
+    config_file: str
+    shards_num: int
+    config: ConfigObject
+    logger: Logger
+    client: pyrogram.Client
+    updates_queues: List[multiprocessing.Queue]
+    workers: List[multiprocessing.process.BaseProcess]
+    stats: ShardFrontStats
+    metrics_registry: MetricsRegistry
+    metrics_server: Optional[MetricsServer]
+
+    def __init__(self,
+                 config_file: str,
+                 shards_num: int) -> None:
+        """
+        Initialize the front process.
+
+        Args:
+            config_file: Path to the configuration file.
+            shards_num: Number of worker processes.
+        """
+        self.config_file = config_file
+        self.shards_num = shards_num
+        self.config = ConfigFileSectionsLoader.Load(config_file, BotConfig)
+        self.logger = Logger(self.config)
+        self.client = Client(
+            self.config.GetValue(BotConfigTypes.SESSION_NAME),
+            api_id=self.config.GetValue(BotConfigTypes.API_ID),
+            api_hash=self.config.GetValue(BotConfigTypes.API_HASH),
+            bot_token=self.config.GetValue(BotConfigTypes.BOT_TOKEN),
+        )
+        self.client.add_handler(MessageHandler(self.__ForwardUpdate))
+        self.client.add_handler(ChatMemberUpdatedHandler(self.__ForwardUpdate))
+        self.updates_queues = []
+        self.workers = []
+        self.stats = ShardFrontStats()
+        self.metrics_registry = MetricsRegistry()
+        self.metrics_registry.Register(self.logger.GetStats)
+        self.metrics_registry.Register(self.GetStats)
+        self.metrics_server = (
+            MetricsServer(self.logger,
+                          self.metrics_registry,
+                          self.config.GetValue(BotConfigTypes.METRICS_HOST),
+                          self.config.GetValue(BotConfigTypes.METRICS_PORT))
+            if self.config.GetValue(BotConfigTypes.METRICS_ENABLED)
+            else None
+        )
+        self.logger.GetLogger().info(f"Front initialization completed, number of shards: {shards_num}")
+
+    def GetStats(self) -> ShardFrontStats:
+        """
+        Get the statistics of the front process.
+
+        Returns:
+            Front process statistics.
+        """
+        return self.stats
+
+    async def Run(self) -> None:
+        """Start the worker processes and forward the updates to them, until the bot is stopped."""
+        self.__PrepareStorage()
+        self.__StartWorkers()
+        try:
+            self.logger.GetLogger().info("Bot started!\n")
+            async with self.client:
+                if self.metrics_server is not None:
+                    await self.metrics_server.Start()
+                await idle()
+        finally:
+            if self.metrics_server is not None:
+                await self.metrics_server.Stop()
+            self.__StopWorkers()
+            self.logger.Close()
+
+    async def __ForwardUpdate(self,
+                              _client: pyrogram.Client,
+                              update: BotUpdateType) -> None:
+        """
+        Forward an update to the worker owning its chat.
+
+        Args:
+            _client: Pyrogram client instance.
+            update: Received update.
+        """
+        if update.chat is None:
+            return
+
+        shard_idx = ShardInfo.GetShardIndex(update.chat.id, self.shards_num)
+        try:
+            self.updates_queues[shard_idx].put_nowait(pickle.dumps(update))
+        except (pickle.PicklingError, TypeError, ValueError):
+            self.stats.failed_num.Inc()
+            self.logger.GetLogger().exception(f"Unable to forward update to shard {shard_idx}")
+        else:
+            self.stats.forwarded_num.Inc(str(shard_idx))
+
+    def __PrepareStorage(self) -> None:
+        """Create or upgrade the tasks database once, before the workers share it."""
+        if self.config.GetValue(BotConfigTypes.TASKS_DB_ENABLED):
+            storage = PeriodicMsgStorage(self.config, self.logger)
+            storage.Open()
+            storage.Close()
+
+    def __StartWorkers(self) -> None:
+        """Start the worker processes."""
+        # Spawn fresh interpreters, so that workers don't inherit the event loop and the client of the front process
+        mp_ctx = multiprocessing.get_context("spawn")
+        for shard_idx in range(self.shards_num):
+            updates_queue = mp_ctx.Queue()
+            worker = mp_ctx.Process(
+                target=ShardWorker(self.config_file, ShardInfo(shard_idx, self.shards_num), updates_queue).Run,
+                name=f"shard{shard_idx}"
+            )
+            worker.start()
+            self.updates_queues.append(updates_queue)
+            self.workers.append(worker)
+            self.logger.GetLogger().info(f"Started shard {shard_idx} (PID: {worker.pid})")
+
+    def __StopWorkers(self) -> None:
+        """Stop the worker processes, letting them write their pending changes."""
+        for updates_queue in self.updates_queues:
+            updates_queue.put(None)
+        for shard_idx, worker in enumerate(self.workers):
+            worker.join(ShardFrontConst.WORKER_JOIN_TIMEOUT_SEC)
+            if worker.is_alive():
+                self.logger.GetLogger().warning(f"Shard {shard_idx} did not stop in time, terminating it")
+                worker.terminate()
+                worker.join()
+            else:
+                self.logger.GetLogger().info(f"Stopped shard {shard_idx} (exit code: {worker.exitcode})")
+        self.updates_queues = []
+        self.workers = []
@@ -0,0 +1,102 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import os
+
+
+class ShardInfo:
+    """Information about the shard run by a worker process."""
+
+    index: int
+    shards_num: int
+
+    def __init__(self,
+                 index: int,
+                 shards_num: int) -> None:
+        """
+        Initialize the shard information.
+
+        Args:
+            index: Shard index.
+            shards_num: Total number of shards.
+        """
+        self.index = index
+        self.shards_num = shards_num
+
+    def Index(self) -> int:
+        """
+        Get the shard index.
+
+        Returns:
+            Shard index.
+        """
+        return self.index
+
+    def ShardsNum(self) -> int:
+        """
+        Get the total number of shards.
+
+        Returns:
+            Total number of shards.
+        """
+        return self.shards_num
+
+    def OwnsChat(self,
+                 chat_id: int) -> bool:
+        """
+        Get whether the specified chat belongs to this shard.
+
+        Args:
+            chat_id: Chat ID.
+
+        Returns:
+            True if the chat belongs to this shard, False otherwise.
+        """
+        return self.GetShardIndex(chat_id, self.shards_num) == self.index
+
+    def AddSuffix(self,
+                  file_name: str) -> str:
+        """
+        Add the shard suffix to a file name, so that each shard uses its own file.
+
+        Args:
+            file_name: File name.
+
+        Returns:
+            File name with the shard suffix (before the extension, if any).
+        """
+        root, ext = os.path.splitext(file_name)
+        return f"{root}_shard{self.index}{ext}"
+
+    @staticmethod
+    def GetShardIndex(chat_id: int,
+                      shards_num: int) -> int:
+        """
+        Get the index of the shard owning the specified chat.
+
+        Args:
+            chat_id: Chat ID.
+            shards_num: Total number of shards.
+
+        Returns:
+            Shard index.
+        """
+        return chat_id % shards_num
@@ -0,0 +1,111 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import asyncio
+import multiprocessing
+import pickle
+from typing import Awaitable, Callable, Union
+
+import pyrogram
+
+from telegram_periodic_msg_bot.logger.logger import Logger
+
+
+# Function handling an update received from the front process
+ShardUpdateHandleFct = Callable[[Union[pyrogram.types.Message, pyrogram.types.ChatMemberUpdated]], Awaitable[None]]
+
+
+class ShardUpdatesConsumerConst:
+    """Constants for shard updates consumer."""
+
+    # Number of updates handled concurrently, like the handler workers of a client
+    HANDLERS_NUM: int = 4
+
+
+class ShardUpdatesConsumer:
+    """
+    Consumer of the updates forwarded by the front process to a worker process.
+
+    Updates are read from the inter-process queue in a separate thread and handled concurrently,
+    until the stop sentinel (None) is received.
+    """
+
+    logger: Logger
+    updates_queue: multiprocessing.Queue
+    handle_fct: ShardUpdateHandleFct
+    local_queue: asyncio.Queue
+
+    def __init__(self,
+                 logger: Logger,
+                 updates_queue: multiprocessing.Queue,
+                 handle_fct: ShardUpdateHandleFct) -> None:
+        """
+        Initialize the consumer.
+
+        Args:
+            logger: Logger instance for logging operations.
+            updates_queue: Queue of pickled updates written by the front process.
+            handle_fct: Function handling an update.
+        """
+        self.logger = logger
+        self.updates_queue = updates_queue
+        self.handle_fct = handle_fct
+        self.local_queue = asyncio.Queue()
+
+    async def Run(self) -> None:
+        """Consume the updates until the front process stops the shard."""
+        handlers = [asyncio.ensure_future(self.__Handler()) for _ in range(ShardUpdatesConsumerConst.HANDLERS_NUM)]
+        try:
+            await self.__Reader()
+            await self.local_queue.join()
+        finally:
+            for handler in handlers:
+                handler.cancel()
+
+    async def __Reader(self) -> None:
+        """Read the updates from the inter-process queue."""
+        loop = asyncio.get_event_loop()
+        while True:
+            data = await loop.run_in_executor(None, self.updates_queue.get)
+            if data is None:
+                self.logger.GetLogger().info("Stop requested by front process")
+                return
+
+            try:
+                update = pickle.loads(data)
+            except (pickle.UnpicklingError, AttributeError, EOFError, ImportError, IndexError):
+                self.logger.GetLogger().exception("Unable to decode update from front process")
+            else:
+                self.local_queue.put_nowait(update)
+
+    async def __Handler(self) -> None:
+        """Handle the updates read from the queue."""
+        while True:
+            update = await self.local_queue.get()
+            try:
+                await self.handle_fct(update)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger.GetLogger().exception("An error occurred while handling an update")
+            finally:
+                self.local_queue.task_done()
+
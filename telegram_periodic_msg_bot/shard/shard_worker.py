@@ -0,0 +1,62 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import asyncio
+import multiprocessing
+import signal
+
+from telegram_periodic_msg_bot.periodic_msg_bot import PeriodicMsgBot
+from telegram_periodic_msg_bot.shard.shard_info import ShardInfo
+
+
+class ShardWorker:
+    """Entry point of a worker process, running the bot for a single shard."""
+
+    config_file: str
+    shard_info: ShardInfo
+    updates_queue: multiprocessing.Queue
+
+    def __init__(self,
+                 config_file: str,
+                 shard_info: ShardInfo,
+                 updates_queue: multiprocessing.Queue) -> None:
+        """
+        Initialize the worker.
+
+        Args:
+            config_file: Path to the configuration file.
+            shard_info: Information about the shard run by the worker.
+            updates_queue: Queue of the updates forwarded by the front process.
+        """
+        self.config_file = config_file
+        self.shard_info = shard_info
+        self.updates_queue = updates_queue
+
+    def Run(self) -> None:
+        """Run the worker, until the front process stops it."""
+        # Ctrl+C is handled by the front process, that stops the workers in order
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        asyncio.run(self.__Run())
+
+    async def __Run(self) -> None:
+        """Create and run the bot for the shard."""
+        bot = PeriodicMsgBot(self.config_file, self.shard_info)
+        await bot.RunShard(self.updates_queue)
@@ -19,13 +19,18 @@
 # THE SOFTWARE.
 
 import os
-from typing import Any, Dict, Optional
+import string
+from typing import Any, Dict, FrozenSet, Optional, Set
 
 from defusedxml import ElementTree
 
 from telegram_periodic_msg_bot.logger.logger import Logger
 
 
+class TranslationLoaderInvalidError(Exception):
+    """Exception raised when a language file contains an invalid sentence."""
+
+
 class TranslationLoaderConst:
     """Constants for translation loader configuration."""
 
@@ -35,10 +40,17 @@ class TranslationLoaderConst:
 
 
 class TranslationLoader:
-    """Loader for localized translation strings from XML files."""
+    """
+    Loader for localized translation strings from XML files.
+
+    Sentences are compiled when loaded: the ones without placeholders are formatted once and returned as they are,
+    the others are validated against the placeholders of the same sentence in the default language file.
+    """
 
     logger: Logger
-    sentences: Dict[str, str]
+    constants: Dict[str, str]
+    templates: Dict[str, str]
+    placeholders: Dict[str, FrozenSet[str]]
 
     def __init__(self,
                  logger: Logger) -> None:
@@ -49,32 +61,38 @@ class TranslationLoader:
             logger: Logger instance for logging operations.
         """
         self.logger = logger
-        self.sentences = {}
+        self.constants = {}
+        self.templates = {}
+        self.placeholders = {}
 
     def Load(self,
              file_name: Optional[str] = None) -> None:
         """
         Load a translation file, falling back to default if file is not found.
+        Sentences missing from the translation file are taken from the default language file.
 
         Args:
             file_name: Optional path to the translation file. If None, loads default language file.
+
+        Raises:
+            TranslationLoaderInvalidError: If the translation file contains an invalid sentence
         """
         def_file_path = os.path.join(os.path.dirname(__file__),
                                      TranslationLoaderConst.DEF_LANG_FOLDER,
                                      TranslationLoaderConst.DEF_FILE_NAME)
 
+        # The default language file is always loaded, since it defines the placeholders of each sentence
+        self.logger.GetLogger().info("Loading default language file...")
+        self.__LoadFile(def_file_path, False)
+
         if file_name is not None:
             try:
                 self.logger.GetLogger().info(f"Loading language file '{file_name}'...")
-                self.__LoadFile(file_name)
+                self.__LoadFile(file_name, True)
             except FileNotFoundError:
                 self.logger.GetLogger().error(
-                    f"Language file '{file_name}' not found, loading default language..."
+                    f"Language file '{file_name}' not found, using default language..."
                 )
-                self.__LoadFile(def_file_path)
-        else:
-            self.logger.GetLogger().info("Loading default language file...")
-            self.__LoadFile(def_file_path)
 
     def GetSentence(self,
                     sentence_id: str,
@@ -92,28 +110,103 @@ class TranslationLoader:
         Raises:
             KeyError: If the sentence ID is not found
         """
-        return self.sentences[sentence_id].format(**kwargs)
+        sentence = self.constants.get(sentence_id)
+        if sentence is not None:
+            return sentence
+        return self.templates[sentence_id].format_map(kwargs)
 
     def __LoadFile(self,
-                   file_name: str) -> None:
+                   file_name: str,
+                   validate: bool) -> None:
         """
         Load and parse a translation XML file.
 
         Args:
             file_name: Path to the XML translation file
+            validate: True to validate the sentences against the already loaded ones, False otherwise
+
+        Raises:
+            TranslationLoaderInvalidError: If the translation file contains an invalid sentence
         """
         tree = ElementTree.parse(file_name)
         root = tree.getroot()
 
+        sentences_num = 0
         for child in root:
             if child.tag == TranslationLoaderConst.SENTENCE_XML_TAG and child.text is not None:
                 sentence_id = child.attrib["id"]
-                self.sentences[sentence_id] = child.text.replace("\\n", "\n")
+                if validate and sentence_id not in self.placeholders:
+                    self.logger.GetLogger().warning(f"Unknown sentence '{sentence_id}', skipped")
+                    continue
 
-                self.logger.GetLogger().debug(
-                    f"Loaded sentence '{sentence_id}': {self.sentences[sentence_id]}"
-                )
+                self.__AddSentence(sentence_id, child.text.replace("\\n", "\n"), validate)
+                sentences_num += 1
 
         self.logger.GetLogger().info(
-            f"Language file successfully loaded, number of sentences: {len(self.sentences)}"
+            f"Language file successfully loaded, number of sentences: {sentences_num}"
         )
+
+    def __AddSentence(self,
+                      sentence_id: str,
+                      sentence: str,
+                      validate: bool) -> None:
+        """
+        Compile a sentence and add it.
+
+        Args:
+            sentence_id: Sentence ID
+            sentence: Sentence text
+            validate: True to validate the placeholders against the ones of the already loaded sentence, False otherwise
+
+        Raises:
+            TranslationLoaderInvalidError: If the sentence is invalid
+        """
+        try:
+            placeholders = frozenset(self.__GetPlaceholders(sentence))
+        except ValueError as ex:
+            raise TranslationLoaderInvalidError(f"Invalid sentence '{sentence_id}': {ex}") from ex
+
+        if validate:
+            unknown_placeholders = placeholders - self.placeholders[sentence_id]
+            if len(unknown_placeholders) > 0:
+                raise TranslationLoaderInvalidError(
+                    f"Invalid sentence '{sentence_id}', unknown placeholders: {', '.join(sorted(unknown_placeholders))}"
+                )
+
+        self.constants.pop(sentence_id, None)
+        self.templates.pop(sentence_id, None)
+        if len(placeholders) == 0:
+            self.constants[sentence_id] = sentence.format()
+        else:
+            self.templates[sentence_id] = sentence
+        if not validate:
+            self.placeholders[sentence_id] = placeholders
+
+        self.logger.GetLogger().debug("Loaded sentence '%s': %s", sentence_id, sentence)
+
+    @staticmethod
+    def __GetPlaceholders(sentence: str) -> Set[str]:
+        """
+        Get the placeholders of a sentence, also the ones nested in format specifications.
+
+        Args:
+            sentence: Sentence text
+
+        Returns:
+            Placeholder names
+
+        Raises:
+            ValueError: If the sentence is not a valid format string or it contains positional placeholders
+        """
+        placeholders = set()
+        for _, field_name, format_spec, _ in string.Formatter().parse(sentence):
+            if field_name is None:
+                continue
+            # Only the first part of the field is passed as argument (e.g. "a" for "a.b" or "a[0]")
+            name = field_name.split(".", 1)[0].split("[", 1)[0]
+            if name == "" or name.isdigit():
+                raise ValueError("positional placeholders are not allowed")
+            placeholders.add(name)
+            if format_spec:
+                placeholders |= TranslationLoader.__GetPlaceholders(format_spec)
+        return placeholders
@@ -0,0 +1,260 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Type
+from xml.etree import ElementTree
+
+from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.metrics.metrics import MetricCounter, MetricGauge
+from telegram_periodic_msg_bot.translator.translation_loader import TranslationLoader, TranslationLoaderInvalidError
+
+
+class TranslationPacksLanguageError(Exception):
+    """Exception raised when a language is not available."""
+
+
+class TranslationPacksConst:
+    """Constants for translation packs."""
+
+    # Language of the default language file, always available
+    DEF_LANG: str = "en"
+    LANG_FILE_PREFIX: str = "lang_"
+    LANG_FILE_EXT: str = ".xml"
+    # Errors of an invalid language file
+    INVALID_FILE_ERRORS: Tuple[Type[Exception], ...] = (TranslationLoaderInvalidError, ElementTree.ParseError)
+
+
+class TranslationPacksStats:
+    """Statistics of the translation packs."""
+
+    loaded_num: MetricGauge
+    loads_num: MetricCounter
+    evictions_num: MetricCounter
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.loaded_num = MetricGauge("translation_packs_loaded", "Number of language packs kept in memory")
+        self.loads_num = MetricCounter("translation_packs_loads_total", "Number of language packs loaded from file")
+        self.evictions_num = MetricCounter("translation_packs_evictions_total",
+                                           "Number of language packs evicted from memory because not recently used")
+
+
+class TranslationPacks:
+    """
+    Translations for each chat.
+
+    Chats without a language use the default translation (the one of the language file in the configuration),
+    the other ones use the pack of their language. Packs are the language files found in the language folder,
+    they are loaded the first time they are used and kept in a LRU cache of limited size.
+    Language files are validated at startup and the invalid ones are not available, so that they cannot be set
+    for a chat. A file that becomes invalid later makes its language unavailable the first time it's loaded.
+    """
+
+    logger: Logger
+    default: TranslationLoader
+    lang_files: Dict[str, Optional[str]]
+    cache_size: int
+    packs: "OrderedDict[str, TranslationLoader]"
+    chat_langs: Dict[int, str]
+    stats: TranslationPacksStats
+
+    def __init__(self,
+                 logger: Logger,
+                 def_lang_file: Optional[str],
+                 lang_folder: Optional[str],
+                 cache_size: int) -> None:
+        """
+        Initialize the translation packs.
+
+        Args:
+            logger: Logger instance for logging operations.
+            def_lang_file: Path of the default language file, None for the default English one.
+            lang_folder: Path of the folder containing the language files (named lang_LANG.xml), None for none.
+            cache_size: Maximum number of language packs kept in memory.
+
+        Raises:
+            TranslationLoaderInvalidError: If the default language file contains an invalid sentence
+        """
+        self.logger = logger
+        self.default = TranslationLoader(logger)
+        self.default.Load(def_lang_file)
+        self.lang_files = {TranslationPacksConst.DEF_LANG: None}
+        self.cache_size = cache_size
+        self.packs = OrderedDict()
+        self.chat_langs = {}
+        self.stats = TranslationPacksStats()
+        if lang_folder is not None:
+            self.lang_files.update(self.__FindLangFiles(lang_folder))
+            self.__ValidateLangFiles()
+
+        self.logger.GetLogger().info(f"Available languages: {', '.join(self.GetLanguages())}")
+
+    def GetStats(self) -> TranslationPacksStats:
+        """
+        Get the statistics of the translation packs.
+
+        Returns:
+            Translation packs statistics.
+        """
+        return self.stats
+
+    def GetLanguages(self) -> List[str]:
+        """
+        Get the available languages.
+
+        Returns:
+            Sorted list of available languages.
+        """
+        return sorted(self.lang_files.keys())
+
+    def Default(self) -> TranslationLoader:
+        """
+        Get the default translation.
+
+        Returns:
+            Default translation.
+        """
+        return self.default
+
+    def ForChat(self,
+                chat_id: int) -> TranslationLoader:
+        """
+        Get the translation of a chat.
+
+        Args:
+            chat_id: Chat ID.
+
+        Returns:
+            Translation of the chat language, the default one if the chat has no language or its pack is invalid.
+        """
+        lang = self.chat_langs.get(chat_id)
+        if lang is None or lang not in self.lang_files:
+            return self.default
+
+        try:
+            return self.__GetPack(lang)
+        except TranslationPacksConst.INVALID_FILE_ERRORS:
+            # The file changed after being validated, make the language unavailable so that it's not loaded again
+            del self.lang_files[lang]
+            self.logger.GetLogger().exception(f"Invalid language pack '{lang}', no longer available, using default language")
+            return self.default
+
+    def GetChatLanguage(self,
+                        chat_id: int) -> Optional[str]:
+        """
+        Get the language of a chat.
+
+        Args:
+            chat_id: Chat ID.
+
+        Returns:
+            Chat language, None if the chat uses the default translation.
+        """
+        return self.chat_langs.get(chat_id)
+
+    def SetChatLanguage(self,
+                        chat_id: int,
+                        lang: Optional[str]) -> None:
+        """
+        Set the language of a chat (its pack is loaded the first time it's used).
+
+        Args:
+            chat_id: Chat ID.
+            lang: Language, None for the default translation.
+
+        Raises:
+            TranslationPacksLanguageError: If the language is not available
+        """
+        if lang is None:
+            self.chat_langs.pop(chat_id, None)
+            return
+
+        if lang not in self.lang_files:
+            raise TranslationPacksLanguageError(f"Language '{lang}' is not available")
+        self.chat_langs[chat_id] = lang
+
+    def ClearChatLanguages(self) -> None:
+        """Clear the languages of all chats."""
+        self.chat_langs = {}
+
+    def __GetPack(self,
+                  lang: str) -> TranslationLoader:
+        """
+        Get the pack of a language, loading it if not in cache and evicting the least recently used one if needed.
+
+        Args:
+            lang: Language.
+
+        Returns:
+            Language pack.
+
+        Raises:
+            TranslationLoaderInvalidError: If the language pack contains an invalid sentence
+        """
+        pack = self.packs.get(lang)
+        if pack is not None:
+            self.packs.move_to_end(lang)
+            return pack
+
+        pack = TranslationLoader(self.logger)
+        pack.Load(self.lang_files[lang])
+        self.stats.loads_num.Inc()
+
+        self.packs[lang] = pack
+        if len(self.packs) > self.cache_size:
+            evicted_lang, _ = self.packs.popitem(last=False)
+            self.stats.evictions_num.Inc()
+            self.logger.GetLogger().info(f"Language pack '{evicted_lang}' evicted")
+        self.stats.loaded_num.Set(len(self.packs))
+
+        return pack
+
+    def __ValidateLangFiles(self) -> None:
+        """Load all the language files, removing the invalid ones and caching the valid ones while there's room."""
+        for lang in self.GetLanguages():
+            if self.lang_files[lang] is None:
+                continue
+            try:
+                self.__GetPack(lang)
+            except TranslationPacksConst.INVALID_FILE_ERRORS:
+                del self.lang_files[lang]
+                self.logger.GetLogger().exception(f"Invalid language pack '{lang}', not available")
+
+    @staticmethod
+    def __FindLangFiles(lang_folder: str) -> Dict[str, Optional[str]]:
+        """
+        Find the language files in a folder.
+
+        Args:
+            lang_folder: Path of the folder.
+
+        Returns:
+            Dictionary from language to language file path.
+        """
+        lang_files: Dict[str, Optional[str]] = {}
+        for file_name in os.listdir(lang_folder):
+            if (file_name.startswith(TranslationPacksConst.LANG_FILE_PREFIX)
+                    and file_name.endswith(TranslationPacksConst.LANG_FILE_EXT)):
+                lang = file_name[len(TranslationPacksConst.LANG_FILE_PREFIX):-len(TranslationPacksConst.LANG_FILE_EXT)]
+                lang_files[lang.lower()] = os.path.join(lang_folder, file_name)
+        return lang_files
@@ -0,0 +1,53 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import configparser
+import os
+
+import pytest
+
+from telegram_periodic_msg_bot.bot.bot_config import BotConfig
+from telegram_periodic_msg_bot.config.config_object import ConfigObject
+from telegram_periodic_msg_bot.config.config_sections_loader import ConfigSectionsLoader
+from telegram_periodic_msg_bot.logger.logger import Logger
+
+
+CONFIG_FILE: str = os.path.join(os.path.dirname(__file__), os.pardir, "app", "conf", "config.ini")
+
+
+@pytest.fixture
+def config() -> ConfigObject:
+    """Sample configuration, logging only warnings and errors to console."""
+    config_parser = configparser.ConfigParser()
+    config_parser.read(CONFIG_FILE, encoding="utf-8")
+    config_parser.read_dict({
+        "logging": {
+            "log_level": "WARNING",
+            "log_console_enabled": "True",
+            "log_file_enabled": "False",
+        },
+    })
+    return ConfigSectionsLoader(config_parser).LoadSections(BotConfig)
+
+
+@pytest.fixture
+def logger(config: ConfigObject) -> Logger:
+    """Logger for the configuration."""
+    return Logger(config)
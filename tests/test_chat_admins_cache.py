@@ -0,0 +1,110 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+from typing import Any, Optional, cast
+
+import pyrogram
+import pytest
+from pyrogram.enums import ChatMemberStatus
+from pyrogram.errors import ChatAdminRequired, FloodWait, InternalServerError, RPCError, UserNotParticipant
+
+from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.misc.chat_admins_cache import ChatAdminsCache, ChatAdminsCacheConst
+
+
+class StubClient:
+    """Client answering member lookups with a fixed status or error."""
+
+    status: ChatMemberStatus
+    error: Optional[RPCError]
+    lookups_num: int
+
+    def __init__(self,
+                 status: ChatMemberStatus,
+                 error: Optional[RPCError] = None) -> None:
+        """Initialize the client."""
+        self.status = status
+        self.error = error
+        self.lookups_num = 0
+
+    async def get_chat_member(self,
+                              chat_id: int,
+                              user_id: int) -> Any:
+        """Look up a chat member."""
+        self.lookups_num += 1
+        if self.error is not None:
+            raise self.error
+        return pyrogram.types.ChatMember(status=self.status)
+
+
+def is_admin_twice(admins_cache: ChatAdminsCache) -> bool:
+    """Check the same user twice, returning the last result."""
+    async def run() -> bool:
+        await admins_cache.IsAdmin(-100, 1)
+        return await admins_cache.IsAdmin(-100, 1)
+
+    return asyncio.run(run())
+
+
+def test_cached(logger: Logger) -> None:
+    """Test that a looked up member is cached."""
+    client = StubClient(ChatMemberStatus.ADMINISTRATOR)
+    admins_cache = ChatAdminsCache(cast(pyrogram.Client, client), logger, 300.0)
+
+    assert is_admin_twice(admins_cache)
+    assert client.lookups_num == 1
+
+
+def test_not_participant(logger: Logger) -> None:
+    """Test that a user not in the chat is not authorized and cached."""
+    client = StubClient(ChatMemberStatus.MEMBER, UserNotParticipant())
+    admins_cache = ChatAdminsCache(cast(pyrogram.Client, client), logger, 300.0)
+
+    assert not is_admin_twice(admins_cache)
+    assert client.lookups_num == 1
+
+
+@pytest.mark.parametrize("error", [ChatAdminRequired(), InternalServerError(), FloodWait(value=5)])
+def test_lookup_error(logger: Logger,
+                      error: RPCError) -> None:
+    """Test that a failed lookup is not authorized and not cached."""
+    client = StubClient(ChatMemberStatus.ADMINISTRATOR, error)
+    admins_cache = ChatAdminsCache(cast(pyrogram.Client, client), logger, 300.0)
+
+    assert not is_admin_twice(admins_cache)
+    assert client.lookups_num == 2
+    assert admins_cache.GetStats().lookup_errors_num.Value() == 2
+
+
+def test_expired_entries_evicted(logger: Logger) -> None:
+    """Test that expired entries are evicted even if they are never looked up again."""
+    client = StubClient(ChatMemberStatus.MEMBER)
+    # Entries expire right after being added
+    admins_cache = ChatAdminsCache(cast(pyrogram.Client, client), logger, 1e-9)
+
+    async def run() -> None:
+        for user_id in range(4 * ChatAdminsCacheConst.ENTRIES_EVICT_MIN_NUM):
+            await admins_cache.IsAdmin(-100 - user_id % 10, user_id)
+
+    asyncio.run(run())
+
+    assert admins_cache.entries_num <= ChatAdminsCacheConst.ENTRIES_EVICT_MIN_NUM
+    assert sum(len(chat_entries) for chat_entries in admins_cache.entries.values()) == admins_cache.entries_num
@@ -0,0 +1,117 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+import os
+from typing import Any, Callable, Coroutine, List
+
+import pytest
+
+from telegram_periodic_msg_bot.bot.bot_config import BotConfig
+from telegram_periodic_msg_bot.bot.bot_config_types import BotConfigTypes
+from telegram_periodic_msg_bot.config.config_file_sections_loader import ConfigFileSectionsLoader
+from telegram_periodic_msg_bot.fake.fake_clock import FakeClock, FakeClockEventLoop
+from telegram_periodic_msg_bot.message.message_rate_limiter import MessageRateLimiter
+
+
+# Telegram limits
+GLOBAL_LIMIT_PER_SEC: int = 30
+CHAT_LIMIT_PER_MIN: int = 20
+# Tolerance on the window end, so that a send exactly at the end is counted in the window
+WINDOW_TOLERANCE_SEC: float = 1e-6
+
+CONFIG_FILE: str = os.path.join(os.path.dirname(__file__), os.pardir, "app", "conf", "config.ini")
+
+
+def default_value(config_type: BotConfigTypes) -> Any:
+    """Get the default value of a configuration field."""
+    for section in BotConfig.values():
+        for field in section:
+            if field["type"] == config_type:
+                return field["def_val"]
+    raise KeyError(config_type)
+
+
+def default_rate_limiter(clock: FakeClock) -> MessageRateLimiter:
+    """Create a rate limiter with the default configuration."""
+    return MessageRateLimiter(default_value(BotConfigTypes.MESSAGE_RATE_GLOBAL_PER_SEC),
+                              default_value(BotConfigTypes.MESSAGE_RATE_GLOBAL_BURST),
+                              default_value(BotConfigTypes.MESSAGE_RATE_CHAT_PER_MIN) / 60.0,
+                              default_value(BotConfigTypes.MESSAGE_RATE_CHAT_BURST),
+                              clock=clock)
+
+
+def sample_rate_limiter(clock: FakeClock) -> MessageRateLimiter:
+    """Create a rate limiter with the sample configuration file."""
+    config = ConfigFileSectionsLoader.Load(CONFIG_FILE, BotConfig)
+    return MessageRateLimiter(config.GetValue(BotConfigTypes.MESSAGE_RATE_GLOBAL_PER_SEC),
+                              config.GetValue(BotConfigTypes.MESSAGE_RATE_GLOBAL_BURST),
+                              config.GetValue(BotConfigTypes.MESSAGE_RATE_CHAT_PER_MIN) / 60.0,
+                              config.GetValue(BotConfigTypes.MESSAGE_RATE_CHAT_BURST),
+                              clock=clock)
+
+
+RATE_LIMITER_FACTORIES: List[Callable[[FakeClock], MessageRateLimiter]] = [
+    default_rate_limiter,
+    sample_rate_limiter,
+]
+
+
+def run_on_fake_clock(clock: FakeClock,
+                      coro: Coroutine[Any, Any, List[float]]) -> List[float]:
+    """Run a coroutine on an event loop driven by the virtual clock."""
+    loop = FakeClockEventLoop(clock)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+async def acquire_all(rate_limiter: MessageRateLimiter,
+                      clock: FakeClock,
+                      chat_ids: List[int]) -> List[float]:
+    """Acquire a send token for each chat concurrently, returning the time each one was acquired at."""
+    async def acquire(chat_id: int) -> float:
+        await rate_limiter.Acquire(chat_id)
+        return clock.Monotonic()
+
+    return list(await asyncio.gather(*(acquire(chat_id) for chat_id in chat_ids)))
+
+
+@pytest.mark.parametrize("rate_limiter_factory", RATE_LIMITER_FACTORIES)
+def test_global_first_second(rate_limiter_factory: Callable[[FakeClock], MessageRateLimiter]) -> None:
+    """Test that a full global bucket does not let more sends through than allowed in the first second."""
+    clock = FakeClock(0.0)
+    rate_limiter = rate_limiter_factory(clock)
+
+    send_times = run_on_fake_clock(clock, acquire_all(rate_limiter, clock, list(range(100))))
+
+    assert sum(1 for t in send_times if t <= 1.0 + WINDOW_TOLERANCE_SEC) <= GLOBAL_LIMIT_PER_SEC
+
+
+@pytest.mark.parametrize("rate_limiter_factory", RATE_LIMITER_FACTORIES)
+def test_chat_first_minute(rate_limiter_factory: Callable[[FakeClock], MessageRateLimiter]) -> None:
+    """Test that a full chat bucket does not let more sends through than allowed in the first minute."""
+    clock = FakeClock(0.0)
+    rate_limiter = rate_limiter_factory(clock)
+
+    send_times = run_on_fake_clock(clock, acquire_all(rate_limiter, clock, [-100] * 50))
+
+    assert sum(1 for t in send_times if t <= 60.0 + WINDOW_TOLERANCE_SEC) <= CHAT_LIMIT_PER_MIN
@@ -0,0 +1,110 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+from typing import List
+
+import pytest
+
+from telegram_periodic_msg_bot.fake.fake_clock import FakeClock, FakeClockEventLoop
+from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_engine import PeriodicMsgEngine, PeriodicMsgMisfirePolicies
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_trigger import PeriodicMsgTrigger
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_worker_pool import PeriodicMsgWorkerPool, PeriodicMsgWorkItem
+
+
+# Timestamp at the beginning of a minute
+START_TIME: float = 1_700_000_040.0
+MISFIRE_GRACE_SEC: float = 10.0
+# Number of fire times since the last one, with a trigger firing every minute
+MISSED_MIN: int = 30
+
+
+class RecordingWorkerPool(PeriodicMsgWorkerPool):
+    """Worker pool recording the submitted jobs instead of running them."""
+
+    submitted_items: List[PeriodicMsgWorkItem]
+
+    def __init__(self,
+                 logger: Logger) -> None:
+        """Initialize the worker pool."""
+        super().__init__(logger, 1)
+        self.submitted_items = []
+
+    def SubmitBatch(self,
+                    items: List[PeriodicMsgWorkItem]) -> None:
+        """Record a batch of jobs."""
+        self.submitted_items.extend(items)
+
+
+async def job_callback() -> None:
+    """Job callback, never called."""
+
+
+def runs_after_downtime(logger: Logger,
+                        misfire_policy: PeriodicMsgMisfirePolicies,
+                        late_sec: float) -> int:
+    """Get the number of runs of a job restored after the bot was down for some time."""
+    clock = FakeClock(START_TIME + late_sec)
+    loop = FakeClockEventLoop(clock)
+    worker_pool = RecordingWorkerPool(logger)
+    engine = PeriodicMsgEngine(logger, worker_pool, MISFIRE_GRACE_SEC, clock=clock)
+
+    async def run() -> None:
+        engine.AddJob("job",
+                      PeriodicMsgTrigger(1, 0, True),
+                      job_callback,
+                      (),
+                      misfire_policy=misfire_policy,
+                      last_fire_time=START_TIME - MISSED_MIN * 60)
+        engine.Start()
+        # Less than a minute, so that only the fire times missed during the downtime are due
+        await asyncio.sleep(1.0)
+        engine.Stop()
+
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+    return len(worker_pool.submitted_items)
+
+
+@pytest.mark.parametrize("misfire_policy, runs_num", [
+    (PeriodicMsgMisfirePolicies.SKIP, 1),
+    (PeriodicMsgMisfirePolicies.RUN_LATE, 1),
+    (PeriodicMsgMisfirePolicies.COALESCE, 1),
+])
+def test_misfire_last_on_time(logger: Logger,
+                              misfire_policy: PeriodicMsgMisfirePolicies,
+                              runs_num: int) -> None:
+    """Test the runs of a job whose fire times were missed, except the last one."""
+    assert runs_after_downtime(logger, misfire_policy, 0.0) == runs_num
+
+
+@pytest.mark.parametrize("misfire_policy, runs_num", [
+    (PeriodicMsgMisfirePolicies.SKIP, 0),
+    (PeriodicMsgMisfirePolicies.RUN_LATE, 1),
+    (PeriodicMsgMisfirePolicies.COALESCE, 1),
+])
+def test_misfire_all_late(logger: Logger,
+                          misfire_policy: PeriodicMsgMisfirePolicies,
+                          runs_num: int) -> None:
+    """Test the runs of a job whose fire times were all missed, which are never replayed one by one."""
+    assert runs_after_downtime(logger, misfire_policy, 2 * MISFIRE_GRACE_SEC) == runs_num
@@ -0,0 +1,103 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+from typing import Any, List, cast
+
+import pyrogram
+from pyrogram.errors import InternalServerError
+
+from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.message.message_deleter import MessageDeleter
+from telegram_periodic_msg_bot.message.message_rate_limiter import MessageRateLimiter
+from telegram_periodic_msg_bot.message.message_retry_handler import MessageRetryHandler
+from telegram_periodic_msg_bot.message.message_sender import MessageSender
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_body_store import PeriodicMsgBodyStore
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_job import PeriodicMsgJob, PeriodicMsgJobData
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_sender import PeriodicMsgSender
+
+
+CHAT_ID: int = -100
+# Split into two parts
+MESSAGE: str = "word " * 1000
+
+
+class StubClient:
+    """Client whose sends fail from a given one on."""
+
+    failing_send_num: int
+    sends_num: int
+    deleted_msg_ids: List[int]
+
+    def __init__(self,
+                 failing_send_num: int) -> None:
+        """Initialize the client."""
+        self.failing_send_num = failing_send_num
+        self.sends_num = 0
+        self.deleted_msg_ids = []
+
+    async def send_message(self,
+                           chat_id: int,
+                           text: str,
+                           **kwargs: Any) -> pyrogram.types.Message:
+        """Send a message."""
+        self.sends_num += 1
+        if self.sends_num >= self.failing_send_num:
+            raise InternalServerError()
+        return pyrogram.types.Message(id=self.sends_num)
+
+    async def delete_messages(self,
+                              chat_id: int,
+                              message_ids: List[int]) -> int:
+        """Delete messages."""
+        self.deleted_msg_ids.extend(message_ids)
+        return len(message_ids)
+
+
+def create_job(logger: Logger,
+               client: StubClient) -> PeriodicMsgJob:
+    """Create a job sending a message in two parts and deleting the last sent one."""
+    pyrogram_client = cast(pyrogram.Client, client)
+    # No retries nor backoff, so that a failed part fails the job immediately without blocking the chat
+    retry_handler = MessageRetryHandler(logger, 0, 0.0, 0.0, 0)
+    message_sender = PeriodicMsgSender(logger,
+                                       MessageSender(pyrogram_client,
+                                                     logger,
+                                                     MessageRateLimiter(1000.0, 1000, 1000.0, 1000),
+                                                     retry_handler),
+                                       MessageDeleter(pyrogram_client, logger, retry_handler))
+    job = PeriodicMsgJob(logger, message_sender, PeriodicMsgBodyStore(0), PeriodicMsgJobData(CHAT_ID, 0, 1, 0, "msg"))
+    job.SetMessage(MESSAGE)
+    job.DeleteLastSentMessage(True)
+    return job
+
+
+def test_parts_sent_before_error_deleted(logger: Logger) -> None:
+    """Test that the parts sent before a failed part are deleted by the next run."""
+    client = StubClient(2)
+    job = create_job(logger, client)
+
+    asyncio.run(job.DoJob())
+    assert job.last_sent_msg_ids == [1]
+
+    client.failing_send_num = 100
+    asyncio.run(job.DoJob())
+    assert client.deleted_msg_ids == [1]
+    assert job.last_sent_msg_ids == [3, 4]
@@ -0,0 +1,61 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+
+import pyrogram
+
+from telegram_periodic_msg_bot.bot.bot_config_types import BotConfigTypes
+from telegram_periodic_msg_bot.config.config_object import ConfigObject
+from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.message.message_deleter import MessageDeleter
+from telegram_periodic_msg_bot.message.message_rate_limiter import MessageRateLimiter
+from telegram_periodic_msg_bot.message.message_retry_handler import MessageRetryHandler
+from telegram_periodic_msg_bot.message.message_sender import MessageSender
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_scheduler import PeriodicMsgScheduler
+from telegram_periodic_msg_bot.translator.translation_packs import TranslationPacks
+
+
+def test_jobs_run_only_when_opened(config: ConfigObject,
+                                   logger: Logger) -> None:
+    """Test that jobs are not run until the scheduler is opened, i.e. the client is connected."""
+    config.SetValue(BotConfigTypes.TASKS_DB_ENABLED, False)
+    config.SetValue(BotConfigTypes.HA_ENABLED, False)
+    # Never connected
+    client = pyrogram.Client("test", in_memory=True, no_updates=True)
+    retry_handler = MessageRetryHandler(logger, 0, 1.0, 1.0, 0)
+
+    async def run() -> None:
+        scheduler = PeriodicMsgScheduler(config,
+                                         logger,
+                                         TranslationPacks(logger, None, None, 1),
+                                         MessageSender(client, logger, MessageRateLimiter(1.0, 1, 1.0, 1), retry_handler),
+                                         MessageDeleter(client, logger, retry_handler))
+        assert not scheduler.engine.running
+        assert len(scheduler.worker_pool.workers) == 0
+
+        scheduler.Open()
+        try:
+            assert scheduler.engine.running
+            assert len(scheduler.worker_pool.workers) > 0
+        finally:
+            scheduler.Close()
+
+    asyncio.run(run())
@@ -0,0 +1,97 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+import pathlib
+from typing import List
+
+from telegram_periodic_msg_bot.bot.bot_config_types import BotConfigTypes
+from telegram_periodic_msg_bot.config.config_object import ConfigObject
+from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.periodic_msg.periodic_msg_storage import PeriodicMsgStorage, PeriodicMsgStorageRecord
+
+
+RECORD: PeriodicMsgStorageRecord = PeriodicMsgStorageRecord(
+    job_id="-100_0_msg",
+    chat_id=-100,
+    topic_id=0,
+    period_hours=8,
+    start_hour=2,
+    msg_id="msg",
+    message="Hello",
+    running=True,
+    delete_last_msg=False,
+    spread_offset=None,
+    misfire_policy="run_late",
+    last_fire_time=1_700_000_000.0,
+)
+
+
+def test_save_and_load(config: ConfigObject,
+                       logger: Logger,
+                       tmp_path: pathlib.Path) -> None:
+    """Test that saved jobs are loaded back with all their fields."""
+    config.SetValue(BotConfigTypes.TASKS_DB_FILE_NAME, str(tmp_path / "tasks.db"))
+
+    async def save() -> None:
+        storage = PeriodicMsgStorage(config, logger)
+        storage.Open()
+        storage.Save(RECORD)
+        storage.Close()
+
+    asyncio.run(save())
+
+    storage = PeriodicMsgStorage(config, logger)
+    storage.Open()
+    try:
+        records: List[PeriodicMsgStorageRecord] = storage.LoadAll()
+    finally:
+        storage.Close()
+
+    assert len(records) == 1
+    assert records[0]._replace(running=bool(records[0].running),
+                               delete_last_msg=bool(records[0].delete_last_msg)) == RECORD
+
+
+def test_failed_flush_retried(config: ConfigObject,
+                              logger: Logger,
+                              tmp_path: pathlib.Path) -> None:
+    """Test that the mutations of a failed flush are kept and written by the next one."""
+    config.SetValue(BotConfigTypes.TASKS_DB_FILE_NAME, str(tmp_path / "tasks.db"))
+
+    async def save() -> List[PeriodicMsgStorageRecord]:
+        storage = PeriodicMsgStorage(config, logger)
+        storage.Open()
+        try:
+            assert storage.db_conn is not None
+            storage.db_conn.execute("CREATE TRIGGER fail BEFORE INSERT ON tasks BEGIN SELECT RAISE(ABORT, 'full'); END")
+            storage.Save(RECORD)
+            storage.Flush()
+            assert storage.LoadAll() == []
+
+            storage.db_conn.execute("DROP TRIGGER fail")
+            storage.Flush()
+            return storage.LoadAll()
+        finally:
+            storage.Close()
+
+    records = asyncio.run(save())
+
+    assert [record.job_id for record in records] == [RECORD.job_id]
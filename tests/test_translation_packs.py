@@ -0,0 +1,68 @@
+# Copyright (c) 2026 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import pathlib
+
+import pytest
+
+from telegram_periodic_msg_bot.logger.logger import Logger
+from telegram_periodic_msg_bot.translator.translation_packs import TranslationPacks, TranslationPacksLanguageError
+
+
+VALID_FILE: str = "<?xml version='1.0'?><root><sentence id=\"ALIVE_CMD\">Sono vivo</sentence></root>"
+# Placeholder not defined by the default sentence
+INVALID_SENTENCE_FILE: str = "<?xml version='1.0'?><root><sentence id=\"ALIVE_CMD\">{unknown}</sentence></root>"
+MALFORMED_FILE: str = "<?xml version='1.0'?><root><sentence id=\"ALIVE_CMD\">"
+
+
+def write_lang_files(lang_folder: pathlib.Path) -> None:
+    """Write a valid language file and two invalid ones."""
+    (lang_folder / "lang_it.xml").write_text(VALID_FILE, encoding="utf-8")
+    (lang_folder / "lang_fr.xml").write_text(INVALID_SENTENCE_FILE, encoding="utf-8")
+    (lang_folder / "lang_de.xml").write_text(MALFORMED_FILE, encoding="utf-8")
+
+
+def test_invalid_files_not_available(logger: Logger,
+                                     tmp_path: pathlib.Path) -> None:
+    """Test that invalid language files are rejected at startup and cannot be set for a chat."""
+    write_lang_files(tmp_path)
+    translator = TranslationPacks(logger, None, str(tmp_path), 4)
+
+    assert translator.GetLanguages() == ["en", "it"]
+    translator.SetChatLanguage(-100, "it")
+    for lang in ("fr", "de"):
+        with pytest.raises(TranslationPacksLanguageError):
+            translator.SetChatLanguage(-100, lang)
+
+
+def test_file_invalid_after_startup(logger: Logger,
+                                    tmp_path: pathlib.Path) -> None:
+    """Test that a file becoming invalid after startup makes its language unavailable."""
+    write_lang_files(tmp_path)
+    # No pack kept in memory, so that each use loads the file
+    translator = TranslationPacks(logger, None, str(tmp_path), 0)
+    translator.SetChatLanguage(-100, "it")
+    (tmp_path / "lang_it.xml").write_text(MALFORMED_FILE, encoding="utf-8")
+
+    assert translator.ForChat(-100) is translator.Default()
+    assert translator.GetLanguages() == ["en"]
+    # Not loaded again, even if fixed
+    (tmp_path / "lang_it.xml").write_text(VALID_FILE, encoding="utf-8")
+    assert translator.ForChat(-100) is translator.Default()